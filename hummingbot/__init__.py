@@ -120,6 +120,7 @@ def init_logging(conf_filename: str,
     import pandas as pd
     from ruamel.yaml import YAML
 
+    from hummingbot.logger.log_writer import LogWriter, route_loggers_through_log_writer
     from hummingbot.logger.struct_logger import StructLogger, StructLogRecord
     global STRUCT_LOGGER_SET
     if not STRUCT_LOGGER_SET:
@@ -143,7 +144,13 @@ def init_logging(conf_filename: str,
             for logger in config_dict["loggers"]:
                 if logger in client_config_map.logger_override_whitelist:
                     config_dict["loggers"][logger]["level"] = override_log_level
+        log_writer_config: Optional[Dict] = config_dict.pop("log_writer", None)
+        # The records queued for the current handlers are written before dictConfig closes them
+        LogWriter.stop_shared_instance()
         logging.config.dictConfig(config_dict)
+        if log_writer_config is not None:
+            log_writer: LogWriter = LogWriter.start_shared_instance(**log_writer_config)
+            route_loggers_through_log_writer(config_dict.get("loggers", {}).keys(), log_writer)
 
 
 def get_strategy_list() -> List[str]:
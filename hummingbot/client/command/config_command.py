@@ -440,6 +440,15 @@ class ConfigCommand:
                 self.notify("Inventory price not updated due to bad input")
                 return
 
+            # A running strategy keeps the inventory cost in memory, so it is updated through the strategy delegate
+            inventory_cost_price_delegate = (self.strategy.inventory_cost_price_delegate
+                                             if isinstance(self.strategy, PureMarketMakingStrategy) else None)
+            if (inventory_cost_price_delegate is not None
+                    and inventory_cost_price_delegate.base_asset == base_asset
+                    and inventory_cost_price_delegate.quote_asset == quote_asset):
+                inventory_cost_price_delegate.set_inventory_cost(balances[base_asset], quote_volume)
+                return
+
             with self.trade_fill_db.get_new_session() as session:
                 with session.begin():
                     InventoryCost.add_volume(
@@ -94,6 +94,9 @@ class ExportCommand:
                                  session: Session,
                                  number_of_rows: Optional[int] = None,
                                  config_file_path: str = None) -> List[TradeFill]:
+        if self.markets_recorder is not None:
+            # Make sure the fills queued by the recorder are already in the database
+            self.markets_recorder.flush()
 
         filters = [TradeFill.timestamp >= start_timestamp]
         if config_file_path is not None:
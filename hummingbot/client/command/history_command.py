@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
 import pandas as pd
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, PerformanceTracker
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -40,6 +40,16 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        performance_tracker = self._session_performance_tracker() if days <= 0 else None
+        if performance_tracker is not None:
+            if performance_tracker.num_trades == 0:
+                self.notify("\n  No past trades to report.")
+                return
+            if verbose:
+                self.list_trades(start_time)
+            if self.strategy_name != "celo_arb":
+                safe_ensure_future(self.history_report(start_time, None, precision))
+            return
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -53,17 +63,36 @@ class HistoryCommand:
             if self.strategy_name != "celo_arb":
                 safe_ensure_future(self.history_report(start_time, trades, precision))
 
+    def _session_performance_tracker(self,  # type: HummingbotApplication
+                                     ) -> Optional[PerformanceTracker]:
+        """
+        Returns the performance tracker of the running markets recorder, if it records the fills of the current
+        strategy config
+        """
+        if (self.markets_recorder is not None
+                and self.markets_recorder.config_file_path == self.strategy_file_name):
+            return self.markets_recorder.performance_tracker
+        return None
+
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             trades: Optional[List[TradeFill]],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        """
+        Reports the performance of each market and trading pair with trades and returns the average return.
+        If trades is None the performance of the current session is read from the markets recorder performance
+        tracker.
+        """
+        performance_tracker = self._session_performance_tracker() if trades is None else None
+        if trades is None:
+            market_info: List[Tuple[str, str]] = performance_tracker.markets if performance_tracker is not None else []
+        else:
+            market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
         if display_report:
             self.report_header(start_time)
         return_pcts = []
         for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -72,7 +101,11 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            if performance_tracker is not None:
+                perf = await performance_tracker.performance_metrics(market, symbol, cur_balances)
+            else:
+                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -192,6 +225,9 @@ class HistoryCommand:
 
         start_time = self.init_time
 
+        if self._session_performance_tracker() is not None:
+            return await self.history_report(start_time, None, display_report=False)
+
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
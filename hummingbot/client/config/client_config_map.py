@@ -173,12 +173,32 @@ class PaperTradeConfigMap(BaseClientModel):
         ),
     )
 
+    paper_trade_queue_position_fills: bool = Field(
+        default=False,
+        description="Fill paper trade limit orders according to their simulated position in the order book queue",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Would you like paper trade limit orders to be filled partially, according to their simulated "
+                "position in the order book queue? (Yes/No)"
+            ),
+        ),
+    )
+
     @validator("paper_trade_account_balance", pre=True)
     def validate_paper_trade_account_balance(cls, v: Union[str, Dict[str, float]]):
         if isinstance(v, str):
             v = json.loads(v)
         return v
 
+    @validator("paper_trade_queue_position_fills", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
 
 class KillSwitchMode(BaseClientModel, ABC):
     @abstractmethod
@@ -839,6 +859,28 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    max_logged_order_fills: int = Field(
+        default=10000,
+        gt=0,
+        description="The number of most recent order fills kept in memory by each connector for the strategies"
+                    "\ntrades. Older fills are only kept in the trades database.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How many of the most recent order fills do you want to keep in memory for each connector?"
+            ),
+        ),
+    )
+    fetch_pairs_from_all_exchanges: bool = Field(
+        default=False,
+        description="Fetch the trading pairs of all the exchanges at startup for the autocompletion and validation"
+                    "\nof trading pairs. When disabled only the pairs of the connected exchanges are fetched at"
+                    "\nstartup, the pairs of other exchanges are fetched when first used.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Would you like to fetch the trading pairs of all the exchanges at startup? (Yes/No)"
+            ),
+        ),
+    )
 
     class Config:
         title = "client_config_map"
@@ -873,7 +915,7 @@ class ClientConfigMap(BaseClientModel):
             sub_model = TELEGRAM_MODES[v].construct()
         return sub_model
 
-    @validator("send_error_logs", pre=True)
+    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", pre=True)
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
         if isinstance(v, str):
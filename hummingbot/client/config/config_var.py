@@ -83,3 +83,20 @@ class ConfigVar:
             elif inspect.isfunction(self._on_validated):
                 self._on_validated(value)
         return err_msg
+
+
+class FeeOverrideConfigVar(ConfigVar):
+    """
+    ConfigVar of a trade fee override. Every change of a fee override value increments the shared version, which
+    invalidates the fee schemas compiled with the overrides (see TradeFeeSchemaLoader).
+    """
+    version: int = 0
+
+    @property
+    def value(self) -> any:
+        return self._value
+
+    @value.setter
+    def value(self, value: any):
+        self._value = value
+        FeeOverrideConfigVar.version += 1
@@ -1,5 +1,8 @@
+import copy
 from decimal import Decimal
+from typing import Dict, Optional, Tuple
 
+from hummingbot.client.config.config_var import FeeOverrideConfigVar
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema, TokenAmount
@@ -9,16 +12,37 @@ class TradeFeeSchemaLoader:
     """
     Utility class that contains the requried logic to load fee schemas applying any override the user
     might have configured.
+
+    The configured schema of each exchange is compiled once and cached. It is compiled again when the connector
+    settings are reloaded or when any fee override changes (see FeeOverrideConfigVar).
     """
+    # exchange name -> (connector settings schema, fee overrides version, configured schema)
+    _configured_schemas: Dict[str, Tuple[TradeFeeSchema, int, TradeFeeSchema]] = {}
 
     @classmethod
     def configured_schema_for_exchange(cls, exchange_name: str) -> TradeFeeSchema:
-        if exchange_name not in AllConnectorSettings.get_connector_settings():
+        connector_settings = AllConnectorSettings.get_connector_settings()
+        if exchange_name not in connector_settings:
             raise Exception(f"Invalid connector. {exchange_name} does not exist in AllConnectorSettings")
-        trade_fee_schema = AllConnectorSettings.get_connector_settings()[exchange_name].trade_fee_schema
-        trade_fee_schema = cls._superimpose_overrides(exchange_name, trade_fee_schema)
+        settings_schema = connector_settings[exchange_name].trade_fee_schema
+        cached = cls._configured_schemas.get(exchange_name)
+        if cached is not None and cached[0] is settings_schema and cached[1] == FeeOverrideConfigVar.version:
+            return cached[2]
+        # The overrides are applied to a copy, the connector settings schema keeps the exchange defaults
+        trade_fee_schema = cls._superimpose_overrides(exchange_name, copy.deepcopy(settings_schema))
+        cls._configured_schemas[exchange_name] = (settings_schema, FeeOverrideConfigVar.version, trade_fee_schema)
         return trade_fee_schema
 
+    @classmethod
+    def invalidate(cls, exchange_name: Optional[str] = None):
+        """
+        Discards the cached configured schema of the exchange (of all the exchanges if not specified).
+        """
+        if exchange_name is None:
+            cls._configured_schemas.clear()
+        else:
+            cls._configured_schemas.pop(exchange_name, None)
+
     @classmethod
     def _superimpose_overrides(cls, exchange: str, trade_fee_schema: TradeFeeSchema):
         trade_fee_schema.percent_fee_token = (
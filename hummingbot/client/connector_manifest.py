@@ -0,0 +1,51 @@
+"""
+The connector manifest lists the settings of the connectors (type, example pair, default fees, config keys, other
+domains...) as defined in their utils modules, so the connector settings can be created at startup without importing
+the connector code. Each entry keeps the hash of the utils module it was generated from, the settings of a connector
+whose utils module has changed since are created from the utils module instead.
+
+Regenerate the manifest after changing the settings of a connector:
+python -m hummingbot.client.connector_manifest
+"""
+
+import hashlib
+import json
+from os.path import exists, join
+from typing import Any, Dict, Optional
+
+from hummingbot import root_path
+
+CONNECTOR_MANIFEST_PATH = root_path() / "hummingbot" / "connector" / "connector_manifest.json"
+
+
+def utils_module_hash(connector_dir_path: str, connector_name: str) -> Optional[str]:
+    utils_module_file_path = join(connector_dir_path, f"{connector_name}_utils.py")
+    if not exists(utils_module_file_path):
+        return None
+    with open(utils_module_file_path, "rb") as fd:
+        return hashlib.sha1(fd.read()).hexdigest()
+
+
+def load_connector_manifest(manifest_path: str = CONNECTOR_MANIFEST_PATH) -> Dict[str, Dict[str, Any]]:
+    if not exists(manifest_path):
+        return {}
+    with open(manifest_path) as fd:
+        return json.load(fd)
+
+
+def save_connector_manifest(manifest: Dict[str, Dict[str, Any]], manifest_path: str = CONNECTOR_MANIFEST_PATH):
+    with open(manifest_path, "w") as fd:
+        json.dump(manifest, fd, indent=2, sort_keys=True)
+        fd.write("\n")
+
+
+def main():
+    from hummingbot.client.settings import AllConnectorSettings
+
+    manifest = AllConnectorSettings.generate_connector_manifest()
+    save_connector_manifest(manifest)
+    print(f"Saved the settings of {len(manifest)} connectors to {CONNECTOR_MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -299,6 +299,8 @@ class HummingbotApplication(*commands):
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
+            write_behind=True,
+            session_start_time=self.init_time,
         )
         self.markets_recorder.start()
 
@@ -71,6 +71,14 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_accumulator(cls,
+                                      accumulator: "PerformanceAccumulator",
+                                      current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_accumulator(accumulator, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -194,6 +202,11 @@ class PerformanceMetrics:
                 self.s_vol_base += Decimal(str(trade.amount)) * Decimal("-1")
                 self.s_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price))
 
+        self._calculate_volume_totals()
+
+        return buys, sells
+
+    def _calculate_volume_totals(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -204,8 +217,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     async def _calculate_fees(self, quote: str, trades: List[Any]):
         for trade in trades:
             fee_percent = None
@@ -230,6 +241,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -284,15 +298,55 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        self.start_price = Decimal(str(trades[0].price))
+        await self._calculate_values(trading_pair, current_balances, Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self._calculate_total_pnl()
+
+    async def _initialize_metrics_from_accumulator(self,
+                                                   accumulator: "PerformanceAccumulator",
+                                                   current_balances: Dict[str, Decimal]):
+        """
+        Calculates the same metrics as _initialize_metrics, reading the trades figures from a performance accumulator
+        instead of iterating over the trades
+        :param accumulator: the running figures of the trades of one trading pair in one market
+        :param current_balances: current user account balance
+        """
+        quote = split_hb_trading_pair(accumulator.trading_pair)[1]
+
+        self.num_buys = accumulator.num_buys
+        self.num_sells = accumulator.num_sells
+        self.num_trades = self.num_buys + self.num_sells
+        self.b_vol_base = accumulator.b_vol_base
+        self.s_vol_base = accumulator.s_vol_base
+        self.b_vol_quote = accumulator.b_vol_quote
+        self.s_vol_quote = accumulator.s_vol_quote
+        self._calculate_volume_totals()
+
+        self.start_price = accumulator.start_price
+        await self._calculate_values(accumulator.trading_pair, current_balances, accumulator.last_price)
+        self.trade_pnl = (accumulator.derivative_pnl
+                          if accumulator.is_derivative
+                          else self.cur_value - self.hold_value)
+
+        self.fees.update(accumulator.fees)
+        await self._calculate_fee_in_quote(quote)
+
+        self._calculate_total_pnl()
+
+    async def _calculate_values(self, trading_pair: str, current_balances: Dict[str, Decimal], last_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, 0)
         self.cur_quote_bal = current_balances.get(quote, 0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -300,9 +354,234 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
 
+    def _calculate_total_pnl(self):
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+
+class _AggregatedPositionOrder:
+    """
+    The fills of one order of a derivative position, aggregated as PerformanceMetrics.aggregate_orders does
+    (simple average of the fill prices, total amount)
+    """
+    __slots__ = ("index", "position", "prices_sum", "fills_count", "amount")
+
+    def __init__(self, index: int, position: str):
+        self.index: int = index
+        self.position: str = position
+        self.prices_sum: Decimal = s_decimal_0
+        self.fills_count: int = 0
+        self.amount: Decimal = s_decimal_0
+
+    @property
+    def price(self) -> Decimal:
+        return self.prices_sum / self.fills_count
+
+
+class PerformanceAccumulator:
+    """
+    Running figures of the trades of one trading pair in one market (volumes, fees per token and realized PnL of
+    derivative positions), updated in O(1) with each fill.
+    PerformanceMetrics.create_from_accumulator calculates from them the same metrics PerformanceMetrics.create
+    calculates from the list of trades.
+    """
+
+    def __init__(self, market: str, trading_pair: str):
+        self.market: str = market
+        self.trading_pair: str = trading_pair
+        self._quote: str = split_hb_trading_pair(trading_pair)[1]
+
+        self.num_fills: int = 0
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.start_price: Decimal = s_decimal_0
+        self.last_price: Decimal = s_decimal_0
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self.derivative_pnl: Decimal = s_decimal_0
+
+        self._start_timestamp: Optional[int] = None
+        self._last_timestamp: Optional[int] = None
+        self._buys_without_position: int = 0
+        self._sells_without_position: int = 0
+        self._position_orders: Dict[Tuple[str, str], _AggregatedPositionOrder] = {}
+        self._position_orders_by_type: Dict[Tuple[str, str], List[_AggregatedPositionOrder]] = {
+            (TradeType.BUY.name, PositionAction.OPEN.value): [],
+            (TradeType.BUY.name, PositionAction.CLOSE.value): [],
+            (TradeType.SELL.name, PositionAction.OPEN.value): [],
+            (TradeType.SELL.name, PositionAction.CLOSE.value): [],
+        }
+
+    @property
+    def is_derivative(self) -> bool:
+        """
+        True if the PnL is calculated from the derivative positions, as PerformanceMetrics does when all the buys or all
+        the sells have a position
+        """
+        return ((self.num_buys > 0 and self._buys_without_position == 0)
+                or (self.num_sells > 0 and self._sells_without_position == 0))
+
+    def add_trade_fill(self, trade_fill: TradeFill):
+        self.add_fill(order_id=trade_fill.order_id,
+                      trade_type=trade_fill.trade_type,
+                      position=trade_fill.position,
+                      price=Decimal(str(trade_fill.price)),
+                      amount=Decimal(str(trade_fill.amount)),
+                      trade_fee=trade_fill.trade_fee,
+                      timestamp=trade_fill.timestamp)
+
+    def add_fill(self,
+                 order_id: str,
+                 trade_type: str,
+                 position: Optional[str],
+                 price: Decimal,
+                 amount: Decimal,
+                 trade_fee: Dict[str, Any],
+                 timestamp: int):
+        """
+        Updates the figures with one fill
+        :param order_id: the client order id of the filled order
+        :param trade_type: the name of the trade type (BUY or SELL)
+        :param position: the position action of the fill (OPEN, CLOSE or NIL)
+        :param price: the fill price
+        :param amount: the fill amount
+        :param trade_fee: the fill fee, in the JSON format stored in the TradeFill records
+        :param timestamp: the fill timestamp in milliseconds
+        """
+        self.num_fills += 1
+        if self._start_timestamp is None or timestamp < self._start_timestamp:
+            self._start_timestamp = timestamp
+            self.start_price = price
+        if self._last_timestamp is None or timestamp >= self._last_timestamp:
+            self._last_timestamp = timestamp
+            self.last_price = price
+
+        trade_type = trade_type.upper()
+        if trade_type == TradeType.BUY.name:
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote -= amount * price
+            if position == PositionAction.NIL.value:
+                self._buys_without_position += 1
+        elif trade_type == TradeType.SELL.name:
+            self.num_sells += 1
+            self.s_vol_base -= amount
+            self.s_vol_quote += amount * price
+            if position == PositionAction.NIL.value:
+                self._sells_without_position += 1
+        else:
+            return
+
+        self._add_fee(price, amount, trade_fee)
+        self._add_position_fill(order_id, trade_type, position, price, amount)
+
+    def _add_fee(self, price: Decimal, amount: Decimal, trade_fee: Dict[str, Any]):
+        if trade_fee.get("percent") is not None and Decimal(trade_fee["percent"]) > 0:
+            self.fees[self._quote] += price * amount * Decimal(str(trade_fee["percent"]))
+        for flat_fee in trade_fee.get("flat_fees", []):
+            self.fees[flat_fee["token"]] += Decimal(flat_fee["amount"])
+
+    def _add_position_fill(self, order_id: str, trade_type: str, position: str, price: Decimal, amount: Decimal):
+        order = self._position_orders.get((trade_type, order_id))
+        if order is None:
+            # The position of an order is the position of its first fill
+            same_type_orders = self._position_orders_by_type.get((trade_type, position))
+            if same_type_orders is None:
+                return
+            order = _AggregatedPositionOrder(index=len(same_type_orders), position=position)
+            same_type_orders.append(order)
+            self._position_orders[(trade_type, order_id)] = order
+            previous_pnl = s_decimal_0
+        else:
+            previous_pnl = self._paired_position_pnl(trade_type, order)
+
+        order.prices_sum += price
+        order.fills_count += 1
+        order.amount += amount
+        self.derivative_pnl += self._paired_position_pnl(trade_type, order) - previous_pnl
+
+    def _paired_position_pnl(self, trade_type: str, order: _AggregatedPositionOrder) -> Decimal:
+        """
+        PnL of the position the order is part of, if it has been paired already. As PerformanceMetrics.position_order
+        does, the n-th order opening a long (short) position is paired with the n-th order closing a long (short)
+        position.
+        """
+        other_trade_type = TradeType.SELL.name if trade_type == TradeType.BUY.name else TradeType.BUY.name
+        other_position = (PositionAction.CLOSE.value
+                          if order.position == PositionAction.OPEN.value
+                          else PositionAction.OPEN.value)
+        counterparts = self._position_orders_by_type[(other_trade_type, other_position)]
+        if order.index >= len(counterparts):
+            return s_decimal_0
+        counterpart = counterparts[order.index]
+        if order.position == PositionAction.OPEN.value:
+            open_order, close_order, open_trade_type = order, counterpart, trade_type
+        else:
+            open_order, close_order, open_trade_type = counterpart, order, other_trade_type
+        if open_trade_type == TradeType.BUY.name:
+            return (close_order.price - open_order.price) * close_order.amount
+        return (open_order.price - close_order.price) * close_order.amount
+
+
+class PerformanceTracker:
+    """
+    Keeps a PerformanceAccumulator for each market and trading pair with fills, so the performance of the current
+    session can be read without loading and processing all its trades.
+    """
+
+    def __init__(self):
+        self._accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+        self._num_trades: int = 0
+
+    @property
+    def num_trades(self) -> int:
+        return self._num_trades
+
+    @property
+    def markets(self) -> List[Tuple[str, str]]:
+        """
+        The (market, trading pair) tuples with fills, in the order of their first fill
+        """
+        return list(self._accumulators.keys())
+
+    def accumulator(self, market: str, trading_pair: str) -> PerformanceAccumulator:
+        key = (market, trading_pair)
+        accumulator = self._accumulators.get(key)
+        if accumulator is None:
+            accumulator = PerformanceAccumulator(market=market, trading_pair=trading_pair)
+            self._accumulators[key] = accumulator
+        return accumulator
+
+    def add_trade_fill(self, trade_fill: TradeFill):
+        self._num_trades += 1
+        self.accumulator(trade_fill.market, trade_fill.symbol).add_trade_fill(trade_fill)
+
+    def add_fill(self,
+                 market: str,
+                 trading_pair: str,
+                 order_id: str,
+                 trade_type: str,
+                 position: Optional[str],
+                 price: Decimal,
+                 amount: Decimal,
+                 trade_fee: Dict[str, Any],
+                 timestamp: int):
+        self._num_trades += 1
+        self.accumulator(market, trading_pair).add_fill(order_id=order_id,
+                                                        trade_type=trade_type,
+                                                        position=position,
+                                                        price=price,
+                                                        amount=amount,
+                                                        trade_fee=trade_fee,
+                                                        timestamp=timestamp)
+
+    async def performance_metrics(self,
+                                  market: str,
+                                  trading_pair: str,
+                                  current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        return await PerformanceMetrics.create_from_accumulator(self.accumulator(market, trading_pair),
+                                                                current_balances)
@@ -4,11 +4,12 @@ from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join, realpath
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
 from hummingbot import get_strategy_list, root_path
+from hummingbot.client.connector_manifest import load_connector_manifest, utils_module_hash
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
 if TYPE_CHECKING:
@@ -164,11 +165,58 @@ class ConnectorSetting(NamedTuple):
     parent_name: Optional[str]
     domain_parameter: Optional[str]
     use_eth_gas_lookup: bool
+    # (utils module path, other domain name) to load the config keys from, used when they have not been loaded yet
+    config_keys_source: Optional[Tuple[str, Optional[str]]] = None
     """
     This class has metadata data about Exchange connections. The name of the connection and the file path location of
     the connector file.
     """
 
+    @classmethod
+    def from_manifest(cls, data: Dict[str, Any], util_module_path: str) -> "ConnectorSetting":
+        # The config keys are defined in the connector utils module, they are loaded when first used
+        config_keys_source = None
+        if data["has_config_keys"]:
+            config_keys_source = (util_module_path, data["name"] if data["is_sub_domain"] else None)
+        return ConnectorSetting(
+            name=data["name"],
+            type=ConnectorType[data["type"]],
+            example_pair=data["example_pair"],
+            centralised=data["centralised"],
+            use_ethereum_wallet=data["use_ethereum_wallet"],
+            trade_fee_schema=TradeFeeSchema.from_json(data["trade_fee_schema"]),
+            config_keys=None,
+            is_sub_domain=data["is_sub_domain"],
+            parent_name=data["parent_name"],
+            domain_parameter=data["domain_parameter"],
+            use_eth_gas_lookup=data["use_eth_gas_lookup"],
+            config_keys_source=config_keys_source,
+        )
+
+    def to_manifest(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.type.name,
+            "example_pair": self.example_pair,
+            "centralised": self.centralised,
+            "use_ethereum_wallet": self.use_ethereum_wallet,
+            "trade_fee_schema": self.trade_fee_schema.to_json(),
+            "has_config_keys": self.get_config_keys() is not None,
+            "is_sub_domain": self.is_sub_domain,
+            "parent_name": self.parent_name,
+            "domain_parameter": self.domain_parameter,
+            "use_eth_gas_lookup": self.use_eth_gas_lookup,
+        }
+
+    def get_config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        if self.config_keys is None and self.config_keys_source is not None:
+            util_module_path, domain = self.config_keys_source
+            util_module = importlib.import_module(util_module_path)
+            if domain is None:
+                return getattr(util_module, "KEYS", None)
+            return getattr(util_module, "OTHER_DOMAINS_KEYS")[domain]
+        return self.config_keys
+
     def uses_gateway_generic_connector(self) -> bool:
         none_gateway_connectors_types = [ConnectorType.Exchange, ConnectorType.Derivative, ConnectorType.Connector]
         return True if self.type not in none_gateway_connectors_types else False
@@ -207,8 +255,9 @@ class ConnectorSetting(NamedTuple):
         api_keys = api_keys or {}
         if self.uses_gateway_generic_connector():  # init parameters for gateway connectors
             params = {}
-            if self.config_keys is not None:
-                params: Dict[str, Any] = {k: v.value for k, v in self.config_keys.items()}
+            config_keys = self.get_config_keys()
+            if config_keys is not None:
+                params: Dict[str, Any] = {k: v.value for k, v in config_keys.items()}
             connector_spec: Dict[str, str] = GatewayConnectionSetting.get_connector_spec_from_market_name(self.name)
             params.update(
                 connector_name=connector_spec["connector"],
@@ -247,16 +296,17 @@ class ConnectorSetting(NamedTuple):
 
         trading_pairs = trading_pairs or []
         connector_class = getattr(importlib.import_module(self.module_path()), self.class_name())
+        config_keys = self.get_config_keys()
         kwargs = {}
-        if isinstance(self.config_keys, Dict):
-            kwargs = {key: (config.value or "") for key, config in self.config_keys.items()}  # legacy
-        elif self.config_keys is not None:
+        if isinstance(config_keys, Dict):
+            kwargs = {key: (config.value or "") for key, config in config_keys.items()}  # legacy
+        elif config_keys is not None:
             kwargs = {
                 traverse_item.attr: traverse_item.value.get_secret_value()
                 if isinstance(traverse_item.value, SecretStr)
                 else traverse_item.value or ""
                 for traverse_item
-                in ClientConfigAdapter(self.config_keys).traverse()
+                in ClientConfigAdapter(config_keys).traverse()
                 if traverse_item.attr != "connector"
             }
         kwargs = self.conn_init_parameters(kwargs)
@@ -272,71 +322,43 @@ class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
 
     @classmethod
-    def create_connector_settings(cls):
+    def create_connector_settings(cls, use_manifest: bool = True):
         """
         Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+
+        The settings of the connectors listed in the connector manifest are created from the manifest, without
+        importing the connector code. The utils module of a connector is only imported when it is missing from the
+        manifest or has changed since the manifest was generated.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
+        manifest: Dict[str, Dict[str, Any]] = load_connector_manifest() if use_manifest else {}
+
+        for type_dir, connector_dir in cls._connector_dirs():
+            if connector_dir.name in cls.all_connector_settings:
+                raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+            util_module_path: str = cls._util_module_path(type_dir.name, connector_dir.name)
+            util_module_hash: Optional[str] = utils_module_hash(connector_dir.path, connector_dir.name)
+            if util_module_hash is None:
                 continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+            manifest_entry: Optional[Dict[str, Any]] = manifest.get(connector_dir.name)
+            if (
+                manifest_entry is not None
+                and manifest_entry["utils_module"] == util_module_path
+                and manifest_entry["utils_hash"] == util_module_hash
+            ):
+                connector_settings = [
+                    ConnectorSetting.from_manifest(settings, util_module_path)
+                    for settings in manifest_entry["settings"]
+                ]
+            else:
                 try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
+                    connector_settings = cls._connector_settings_from_utils_module(
+                        type_dir.name, connector_dir.name, util_module_path
+                    )
                 except ModuleNotFoundError:
                     continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+            for connector_setting in connector_settings:
+                cls.all_connector_settings[connector_setting.name] = connector_setting
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -361,6 +383,98 @@ class AllConnectorSettings:
 
         return cls.all_connector_settings
 
+    @classmethod
+    def generate_connector_manifest(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Imports the utils modules of all the connectors to create the connector manifest (see connector_manifest).
+        """
+        manifest: Dict[str, Dict[str, Any]] = {}
+        for type_dir, connector_dir in cls._connector_dirs():
+            util_module_path: str = cls._util_module_path(type_dir.name, connector_dir.name)
+            try:
+                connector_settings = cls._connector_settings_from_utils_module(
+                    type_dir.name, connector_dir.name, util_module_path
+                )
+            except ModuleNotFoundError:
+                continue
+            manifest[connector_dir.name] = {
+                "utils_module": util_module_path,
+                "utils_hash": utils_module_hash(connector_dir.path, connector_dir.name),
+                "settings": [connector_setting.to_manifest() for connector_setting in connector_settings],
+            }
+        return manifest
+
+    @staticmethod
+    def _util_module_path(type_dir_name: str, connector_name: str) -> str:
+        return f"hummingbot.connector.{type_dir_name}.{connector_name}.{connector_name}_utils"
+
+    @classmethod
+    def _connector_dirs(cls) -> List[Tuple[DirEntry, DirEntry]]:
+        """
+        Returns the (type directory, connector directory) pairs of the connectors that are not gateway connectors.
+        """
+        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        connector_dirs: List[Tuple[DirEntry, DirEntry]] = []
+
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_TYPES
+        ]
+        for type_dir in type_dirs:
+            if type_dir.name == 'gateway':
+                continue
+            connector_dirs.extend(
+                (type_dir, cast(DirEntry, f)) for f in scandir(type_dir.path)
+                if f.is_dir() and exists(join(f.path, "__init__.py"))
+                and not f.name.startswith("_") and f.name not in connector_exceptions
+            )
+        return connector_dirs
+
+    @classmethod
+    def _connector_settings_from_utils_module(
+            cls, type_dir_name: str, connector_name: str, util_module_path: str) -> List[ConnectorSetting]:
+        """
+        Imports the utils module of the connector and creates the settings of the connector and its other domains.
+        """
+        util_module = importlib.import_module(util_module_path)
+        trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(connector_name, trade_fee_settings)
+        parent = ConnectorSetting(
+            name=connector_name,
+            type=ConnectorType[type_dir_name.capitalize()],
+            centralised=getattr(util_module, "CENTRALIZED", True),
+            example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+            use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+            trade_fee_schema=trade_fee_schema,
+            config_keys=getattr(util_module, "KEYS", None),
+            is_sub_domain=False,
+            parent_name=None,
+            domain_parameter=None,
+            use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            config_keys_source=(util_module_path, None),
+        )
+        connector_settings = [parent]
+        # Adds other domains of connector
+        other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+        for domain in other_domains:
+            trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+            trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+            connector_settings.append(ConnectorSetting(
+                name=domain,
+                type=parent.type,
+                centralised=parent.centralised,
+                example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                use_ethereum_wallet=parent.use_ethereum_wallet,
+                trade_fee_schema=trade_fee_schema,
+                config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
+                is_sub_domain=True,
+                parent_name=parent.name,
+                domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                use_eth_gas_lookup=parent.use_eth_gas_lookup,
+                config_keys_source=(util_module_path, domain),
+            ))
+        return connector_settings
+
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         for e in paper_trade_exchanges:
@@ -378,6 +492,7 @@ class AllConnectorSettings:
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
                     use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
+                    config_keys_source=base_connector_settings.config_keys_source,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
@@ -406,12 +521,12 @@ class AllConnectorSettings:
 
     @classmethod
     def get_connector_config_keys(cls, connector: str) -> Optional["BaseConnectorConfigMap"]:
-        return cls.get_connector_settings()[connector].config_keys
+        return cls.get_connector_settings()[connector].get_config_keys()
 
     @classmethod
     def reset_connector_config_keys(cls, connector: str):
         current_settings = cls.get_connector_settings()[connector]
-        current_keys = current_settings.config_keys
+        current_keys = current_settings.get_config_keys()
         new_keys = (
             current_keys if current_keys is None else current_keys.__class__.construct()
         )
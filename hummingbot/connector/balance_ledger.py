@@ -0,0 +1,157 @@
+import heapq
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+
+from hummingbot.connector.constants import s_decimal_0
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+
+if TYPE_CHECKING:
+    from hummingbot.connector.connector_base import ConnectorBase
+    from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+
+# (asset, balance change) of the base and the quote assets of a fill
+FillBalanceChanges = Tuple[Tuple[str, Decimal], Tuple[str, Decimal]]
+
+
+class BalanceLedger(EventListener):
+    """
+    Keeps the balance changes since the last balance snapshot of a connector without real time balance updates
+    incrementally, so the estimated available balance is a lookup instead of a scan of the fill events and the in
+    flight orders on each call (see ConnectorBase.apply_balance_update_since_snapshot for the full calculation):
+
+    - The balances locked in the in flight orders of the snapshot are calculated once per snapshot.
+    - The balances locked in the current in flight orders are updated with the events of each order. Orders added or
+      removed without events (detected by the number of in flight orders) are reconciled on the next lookup.
+    - The balance changes of the orders filled since the snapshot are updated with the fill events, and the fills
+      older than a new snapshot are discarded.
+
+    The ledger is synchronized with the connector on its first lookup, and again if the snapshot timestamp moves back.
+    """
+    ORDER_EVENTS = [
+        MarketEvent.BuyOrderCreated,
+        MarketEvent.SellOrderCreated,
+        MarketEvent.OrderFilled,
+        MarketEvent.OrderCancelled,
+        MarketEvent.OrderFailure,
+        MarketEvent.OrderExpired,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted,
+    ]
+
+    def __init__(self, connector: "ConnectorBase"):
+        super().__init__()
+        self._connector = connector
+        self._synced = False
+        self._snapshot: Optional[Mapping[str, "InFlightOrderBase"]] = None
+        self._snapshot_timestamp = 0.0
+        self._snapshot_balances: Dict[str, Decimal] = {}
+        self._order_balances: Dict[str, Tuple[str, Decimal]] = {}
+        self._in_flight_balances: Dict[str, Decimal] = {}
+        # Heap of (timestamp, sequence number, balance changes) of the fills since the snapshot
+        self._fills: List[Tuple[float, int, FillBalanceChanges]] = []
+        self._fills_count = 0
+        self._filled_balances: Dict[str, Decimal] = {}
+
+    @property
+    def synced(self) -> bool:
+        return self._synced
+
+    def reset(self):
+        """
+        Synchronizes the ledger with the connector again on the next lookup.
+        """
+        self._synced = False
+
+    def balance_change_since_snapshot(self, currency: str) -> Decimal:
+        """
+        Returns the change of the available balance of the currency since the balance snapshot, i.e. the value
+        apply_balance_update_since_snapshot adds to the snapshot available balance.
+        """
+        self._sync()
+        return (self._snapshot_balances.get(currency, s_decimal_0)
+                - self._in_flight_balances.get(currency, s_decimal_0)
+                + self._filled_balances.get(currency, s_decimal_0))
+
+    def __call__(self, event: Any):
+        if not self._synced:
+            return
+        if isinstance(event, OrderFilledEvent) and event.timestamp > self._snapshot_timestamp:
+            self._add_fill(event.timestamp, self._fill_balance_changes(event))
+        self._update_order(event.order_id, self._connector.in_flight_orders.get(event.order_id))
+
+    def _sync(self):
+        connector = self._connector
+        snapshot_timestamp = connector.in_flight_orders_snapshot_timestamp
+        if not self._synced:
+            self._snapshot = None
+            self._reset_fills(snapshot_timestamp)
+            self._reset_orders()
+            self._synced = True
+        elif snapshot_timestamp < self._snapshot_timestamp:
+            self._reset_fills(snapshot_timestamp)
+        elif snapshot_timestamp > self._snapshot_timestamp:
+            self._discard_fills(snapshot_timestamp)
+
+        snapshot = connector.in_flight_orders_snapshot
+        if snapshot is not self._snapshot:
+            self._snapshot = snapshot
+            self._snapshot_balances = connector.in_flight_asset_balances(snapshot)
+        in_flight_orders = connector.in_flight_orders
+        if len(in_flight_orders) != len(self._order_balances):
+            self._reconcile_orders(in_flight_orders)
+
+    def _reset_orders(self):
+        self._order_balances = {}
+        self._in_flight_balances = {}
+        for order_id, order in self._connector.in_flight_orders.items():
+            self._update_order(order_id, order)
+
+    def _reconcile_orders(self, in_flight_orders: Mapping[str, "InFlightOrderBase"]):
+        for order_id in [order_id for order_id in self._order_balances if order_id not in in_flight_orders]:
+            self._update_order(order_id, None)
+        for order_id, order in in_flight_orders.items():
+            if order_id not in self._order_balances:
+                self._update_order(order_id, order)
+
+    def _update_order(self, order_id: str, order: Optional["InFlightOrderBase"]):
+        previous = self._order_balances.pop(order_id, None)
+        if previous is not None:
+            asset, amount = previous
+            self._in_flight_balances[asset] -= amount
+        if order is not None:
+            asset, amount = self._connector.in_flight_order_locked_balance(order)
+            if order.is_done or order.is_failure or order.is_cancelled:
+                amount = s_decimal_0
+            self._order_balances[order_id] = (asset, amount)
+            self._in_flight_balances[asset] = self._in_flight_balances.get(asset, s_decimal_0) + amount
+
+    def _reset_fills(self, snapshot_timestamp: float):
+        self._snapshot_timestamp = snapshot_timestamp
+        self._fills = []
+        self._filled_balances = {}
+        for event in self._connector.event_logs:
+            if isinstance(event, OrderFilledEvent) and event.timestamp > snapshot_timestamp:
+                self._add_fill(event.timestamp, self._fill_balance_changes(event))
+
+    def _discard_fills(self, snapshot_timestamp: float):
+        self._snapshot_timestamp = snapshot_timestamp
+        while len(self._fills) > 0 and self._fills[0][0] <= snapshot_timestamp:
+            _, _, changes = heapq.heappop(self._fills)
+            for asset, change in changes:
+                self._filled_balances[asset] -= change
+
+    def _add_fill(self, timestamp: float, changes: FillBalanceChanges):
+        self._fills_count += 1
+        heapq.heappush(self._fills, (timestamp, self._fills_count, changes))
+        for asset, change in changes:
+            self._filled_balances[asset] = self._filled_balances.get(asset, s_decimal_0) + change
+
+    @staticmethod
+    def _fill_balance_changes(event: OrderFilledEvent) -> FillBalanceChanges:
+        base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
+        quote_value = event.price * event.amount
+        if event.trade_type is TradeType.BUY:
+            return (base, event.amount), (quote, -quote_value)
+        return (base, -event.amount), (quote, quote_value)
@@ -1,8 +1,9 @@
 import asyncio
 import logging
-from collections import defaultdict
+from collections import ChainMap, defaultdict
 from decimal import Decimal
-from typing import Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
 
 from cachetools import TTLCache
 
@@ -55,6 +56,22 @@ class ClientOrderTracker:
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
         self._lost_orders: Dict[str, InFlightOrder] = {}
 
+        # Secondary indexes. The exchange order id index can contain orders no longer tracked, and orders whose
+        # exchange order id was not known when they were indexed are kept apart until it is
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._active_orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = defaultdict(dict)
+
+        # Read-only views, created once to avoid building new dictionaries on each access
+        self._cached_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(self._cached_orders)
+        self._lost_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(self._lost_orders)
+        self._all_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(
+            ChainMap(self._cached_orders, self._in_flight_orders))
+        self._all_fillable_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(
+            ChainMap(self._lost_orders, self._cached_orders, self._in_flight_orders))
+        self._all_updatable_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(
+            ChainMap(self._lost_orders, self._in_flight_orders))
+
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
@@ -67,32 +84,33 @@ class ClientOrderTracker:
         return self._in_flight_orders
 
     @property
-    def cached_orders(self) -> Dict[str, InFlightOrder]:
+    def cached_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns orders that are no longer actively tracked.
+        Returns a read-only view of the orders that are no longer actively tracked.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        return self._cached_orders_view
 
     @property
-    def all_orders(self) -> Dict[str, InFlightOrder]:
+    def all_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns both active and cached order.
+        Returns a read-only view of both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        return self._all_orders_view
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
+        Returns a read-only view of all orders that could still be impacted by trades: active orders, cached orders
+        and lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return self._all_fillable_orders_view
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns all orders that could receive status updates
+        Returns a read-only view of all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return self._all_updatable_orders_view
 
     @property
     def current_timestamp(self) -> int:
@@ -102,19 +120,34 @@ class ClientOrderTracker:
         return self._connector.current_timestamp
 
     @property
-    def lost_orders(self) -> Dict[str, InFlightOrder]:
+    def lost_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns a dictionary of all orders marked as failed after not being found more times than the configured limit
+        Returns a read-only view of all orders marked as failed after not being found more times than the configured
+        limit
         """
-        return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
+        return self._lost_orders_view
+
+    def active_orders_for_trading_pair(self, trading_pair: str) -> Mapping[str, InFlightOrder]:
+        """
+        Returns a read-only view of the orders actively tracked for the trading pair
+        """
+        return MappingProxyType(self._active_orders_by_trading_pair.get(trading_pair, {}))
 
     def start_tracking_order(self, order: InFlightOrder):
+        self._cached_orders.pop(order.client_order_id, None)
         self._in_flight_orders[order.client_order_id] = order
+        self._active_orders_by_trading_pair[order.trading_pair][order.client_order_id] = order
+        self._index_exchange_order_id(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
-            self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
-            del self._in_flight_orders[client_order_id]
+            order = self._in_flight_orders.pop(client_order_id)
+            self._cached_orders[client_order_id] = order
+            pair_orders = self._active_orders_by_trading_pair.get(order.trading_pair)
+            if pair_orders is not None:
+                pair_orders.pop(client_order_id, None)
+                if len(pair_orders) == 0:
+                    del self._active_orders_by_trading_pair[order.trading_pair]
 
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
@@ -137,12 +170,27 @@ class ClientOrderTracker:
     ) -> Optional[InFlightOrder]:
         found_order = None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if client_order_id is not None:
+            found_order = self._in_flight_orders.get(client_order_id)
+            if found_order is None:
+                found_order = self._cached_orders.get(client_order_id)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._fetch_order_by_exchange_order_id(exchange_order_id, self._all_orders_view)
+
+        return found_order
+
+    def fetch_fillable_order(
+        self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
+    ) -> Optional[InFlightOrder]:
+        """
+        Same as fetch_order, but also considering the lost orders (all orders that could still be impacted by trades)
+        """
+        found_order = None
+
+        if client_order_id is not None:
+            found_order = self._all_fillable_orders_view.get(client_order_id)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._fetch_order_by_exchange_order_id(exchange_order_id, self._all_fillable_orders_view)
 
         return found_order
 
@@ -152,7 +200,7 @@ class ClientOrderTracker:
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = self._all_fillable_orders_view.get(client_order_id)
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
@@ -219,6 +267,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                self._index_exchange_order_id(tracked_order)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
 
@@ -229,6 +278,55 @@ class ClientOrderTracker:
         else:
             self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _index_exchange_order_id(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            self._orders_without_exchange_order_id[order.client_order_id] = order
+        else:
+            self._orders_without_exchange_order_id.pop(order.client_order_id, None)
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+
+        max_index_size = 2 * (len(self._in_flight_orders) + len(self._lost_orders) + self.MAX_CACHE_SIZE)
+        if (len(self._orders_by_exchange_order_id) > max_index_size
+                or len(self._orders_without_exchange_order_id) > max_index_size):
+            self._purge_exchange_order_id_index()
+
+    def _purge_exchange_order_id_index(self):
+        """
+        Removes from the exchange order id index the orders no longer tracked (for example the cached orders that
+        expired). The size of the index is kept proportional to the number of tracked orders, so the cost of the
+        purges is amortized over the indexed orders.
+        """
+        self._orders_by_exchange_order_id = {
+            exchange_order_id: order
+            for exchange_order_id, order in self._orders_by_exchange_order_id.items()
+            if self._all_fillable_orders_view.get(order.client_order_id) is order
+        }
+        self._orders_without_exchange_order_id = {
+            client_order_id: order
+            for client_order_id, order in self._orders_without_exchange_order_id.items()
+            if self._all_fillable_orders_view.get(client_order_id) is order
+        }
+
+    def _fetch_order_by_exchange_order_id(
+            self, exchange_order_id: str, orders: Mapping[str, InFlightOrder]) -> Optional[InFlightOrder]:
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is None:
+            # The exchange order id could have been assigned to the order without notifying the tracker
+            for pending_order in list(self._orders_without_exchange_order_id.values()):
+                if pending_order.exchange_order_id is not None:
+                    self._index_exchange_order_id(pending_order)
+                elif self._all_fillable_orders_view.get(pending_order.client_order_id) is not pending_order:
+                    del self._orders_without_exchange_order_id[pending_order.client_order_id]
+            order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        elif order.exchange_order_id != exchange_order_id:
+            del self._orders_by_exchange_order_id[exchange_order_id]
+            self._index_exchange_order_id(order)
+            order = None
+
+        if order is not None and orders.get(order.client_order_id) is not order:
+            order = None
+        return order
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
@@ -4,6 +4,7 @@ from decimal import Decimal
 from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
+from hummingbot.connector.balance_ledger import BalanceLedger
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.connector.utils import split_hb_trading_pair, TradeFillOrderDetails
 from hummingbot.connector.constants import s_decimal_NaN, s_decimal_0
@@ -46,10 +47,15 @@ cdef class ConnectorBase(NetworkIterator):
         super().__init__()
 
         self._event_reporter = EventReporter(event_source=self.display_name)
-        self._event_logger = EventLogger(event_source=self.display_name)
+        self._event_logger = EventLogger(event_source=self.display_name,
+                                         max_order_filled_events=client_config_map.max_logged_order_fills)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
+        # Incremental balance changes since the last balance snapshot, see get_available_balance
+        self._balance_ledger = BalanceLedger(self)
+        for event_tag in BalanceLedger.ORDER_EVENTS:
+            self.c_add_listener(event_tag.value, self._balance_ledger)
 
         self._account_balances = {}  # Dict[asset_name:str, Decimal]
         self._account_available_balances = {}  # Dict[asset_name:str, Decimal]
@@ -106,6 +112,22 @@ cdef class ConnectorBase(NetworkIterator):
     def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
         return split_hb_trading_pair(trading_pair)
 
+    def in_flight_order_locked_balance(self, order: InFlightOrderBase) -> Tuple[str, Decimal]:
+        """
+        Calculates the asset balance locked in an in-flight order including fee (estimated)
+        For BUY order, this is the quote asset balance locked in the order
+        For SELL order, this is the base asset balance locked in the order
+        :param order: the in-flight order
+        :return The token and its balance locked in the order
+        """
+        outstanding_amount = order.amount - order.executed_amount_base
+        if order.trade_type is TradeType.BUY:
+            outstanding_value = outstanding_amount * order.price
+            fee = self.estimate_fee_pct(True)
+            outstanding_value *= Decimal(1) + fee
+            return order.quote_asset, outstanding_value
+        return order.base_asset, outstanding_amount
+
     def in_flight_asset_balances(self, in_flight_orders: Dict[str, InFlightOrderBase]) -> Dict[str, Decimal]:
         """
         Calculates total asset balances locked in in_flight_orders including fee (estimated)
@@ -118,18 +140,8 @@ cdef class ConnectorBase(NetworkIterator):
         if in_flight_orders is None:
             return asset_balances
         for order in (o for o in in_flight_orders.values() if not (o.is_done or o.is_failure or o.is_cancelled)):
-            outstanding_amount = order.amount - order.executed_amount_base
-            if order.trade_type is TradeType.BUY:
-                outstanding_value = outstanding_amount * order.price
-                if order.quote_asset not in asset_balances:
-                    asset_balances[order.quote_asset] = s_decimal_0
-                fee = self.estimate_fee_pct(True)
-                outstanding_value *= Decimal(1) + fee
-                asset_balances[order.quote_asset] += outstanding_value
-            else:
-                if order.base_asset not in asset_balances:
-                    asset_balances[order.base_asset] = s_decimal_0
-                asset_balances[order.base_asset] += outstanding_amount
+            asset, locked_balance = self.in_flight_order_locked_balance(order)
+            asset_balances[asset] = asset_balances.get(asset, s_decimal_0) + locked_balance
         return asset_balances
 
     def order_filled_balances(self, starting_timestamp = 0) -> Dict[str, Decimal]:
@@ -185,6 +197,10 @@ cdef class ConnectorBase(NetworkIterator):
     def event_logs(self) -> List[any]:
         return self._event_logger.event_log
 
+    @property
+    def balance_ledger(self) -> BalanceLedger:
+        return self._balance_ledger
+
     @property
     def ready(self) -> bool:
         """
@@ -351,7 +367,8 @@ cdef class ConnectorBase(NetworkIterator):
         """
         available_balance = self._account_available_balances.get(currency, s_decimal_0)
         if not self._real_time_balance_update:
-            available_balance = self.apply_balance_update_since_snapshot(currency, available_balance)
+            # Same result as apply_balance_update_since_snapshot, kept incrementally by the balance ledger
+            available_balance += self._balance_ledger.balance_change_since_snapshot(currency)
         balance_limits = self.get_exchange_limit_config(self.name)
         if currency in balance_limits:
             balance_limit = Decimal(str(balance_limits[currency]))
@@ -458,8 +475,12 @@ cdef class ConnectorBase(NetworkIterator):
                (exchange_order_id in set(self._exchange_order_ids.keys()))
 
     def trade_fee_schema(self):
+        """
+        The fee schema of the connector with the user fee overrides, unless a schema was assigned to the connector
+        """
         if self._trade_fee_schema is None:
-            self._trade_fee_schema = TradeFeeSchemaLoader.configured_schema_for_exchange(exchange_name=self.name)
+            # Cached by the loader until the fee overrides change
+            return TradeFeeSchemaLoader.configured_schema_for_exchange(exchange_name=self.name)
         return self._trade_fee_schema
 
     async def all_trading_pairs(self) -> List[str]:
@@ -11,6 +11,8 @@ from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RES
 
 
 class BinanceAuth(AuthBase):
+    authenticates_unserialized_data = True
+
     def __init__(self, api_key: str, secret_key: str, time_provider: TimeSynchronizer):
         self.api_key = api_key
         self.secret_key = secret_key
@@ -23,7 +25,8 @@ class BinanceAuth(AuthBase):
         :param request: the request to be configured for authenticated interaction
         """
         if request.method == RESTMethod.POST:
-            request.data = self.add_auth_to_params(params=json.loads(request.data))
+            data = json.loads(request.data) if isinstance(request.data, str) else request.data
+            request.data = self.add_auth_to_params(params=data)
         else:
             request.params = self.add_auth_to_params(params=request.params)
 
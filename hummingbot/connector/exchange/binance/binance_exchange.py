@@ -34,6 +34,8 @@ s_logger = None
 
 class BinanceExchange(ExchangePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    # Minimum number of orders in a trading pair to update them with one request for the whole pair
+    BULK_ORDER_UPDATES_MIN_ORDERS = 2
 
     web_utils = web_utils
 
@@ -448,28 +450,58 @@ class BinanceExchange(ExchangePyBase):
                 limit_id=CONSTANTS.MY_TRADES_PATH_URL)
 
             for trade in all_fills_response:
-                exchange_order_id = str(trade["orderId"])
-                fee = TradeFeeBase.new_spot_fee(
-                    fee_schema=self.trade_fee_schema(),
-                    trade_type=order.trade_type,
-                    percent_token=trade["commissionAsset"],
-                    flat_fees=[TokenAmount(amount=Decimal(trade["commission"]), token=trade["commissionAsset"])]
-                )
-                trade_update = TradeUpdate(
-                    trade_id=str(trade["id"]),
-                    client_order_id=order.client_order_id,
-                    exchange_order_id=exchange_order_id,
-                    trading_pair=trading_pair,
-                    fee=fee,
-                    fill_base_amount=Decimal(trade["qty"]),
-                    fill_quote_amount=Decimal(trade["quoteQty"]),
-                    fill_price=Decimal(trade["price"]),
-                    fill_timestamp=trade["time"] * 1e-3,
-                )
-                trade_updates.append(trade_update)
+                trade_updates.append(self._create_trade_update(order=order, trade=trade, symbol=trading_pair))
 
         return trade_updates
 
+    async def _all_trade_updates_for_orders(
+            self, orders: List[InFlightOrder]) -> Tuple[List[TradeUpdate], List[InFlightOrder]]:
+        """
+        Requests the trades of each trading pair with several orders to update since the creation of the oldest of
+        those orders, with one request per trading pair instead of one per order.
+        Only the orders created within the maximum time range of a trades request are included, the older orders and
+        the orders without exchange order id are updated one by one. If the response reaches the maximum number of
+        trades all the orders of the pair are updated one by one.
+        """
+        trade_updates = []
+        remaining_orders = []
+        # One minute of margin, so the time range is still valid when the request reaches the exchange
+        min_creation_timestamp = self.current_timestamp - CONSTANTS.MAX_MY_TRADES_TIME_RANGE + 60
+        for trading_pair, pair_orders in self._orders_by_trading_pair(orders).items():
+            bulk_orders = []
+            for order in pair_orders:
+                if order.exchange_order_id is not None and order.creation_timestamp >= min_creation_timestamp:
+                    bulk_orders.append(order)
+                else:
+                    remaining_orders.append(order)
+            if len(bulk_orders) < self.BULK_ORDER_UPDATES_MIN_ORDERS:
+                remaining_orders.extend(bulk_orders)
+                continue
+
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            start_time = min(order.creation_timestamp for order in bulk_orders)
+            all_fills_response = await self._api_get(
+                path_url=CONSTANTS.MY_TRADES_PATH_URL,
+                params={
+                    "symbol": symbol,
+                    "startTime": int(start_time * 1e3),
+                    "limit": CONSTANTS.MAX_MY_TRADES_LIMIT,
+                },
+                is_auth_required=True,
+                limit_id=CONSTANTS.MY_TRADES_PATH_URL)
+
+            if len(all_fills_response) >= CONSTANTS.MAX_MY_TRADES_LIMIT:
+                remaining_orders.extend(bulk_orders)
+                continue
+
+            orders_by_exchange_id = {order.exchange_order_id: order for order in bulk_orders}
+            for trade in all_fills_response:
+                order = orders_by_exchange_id.get(str(trade["orderId"]))
+                if order is not None:
+                    trade_updates.append(self._create_trade_update(order=order, trade=trade, symbol=symbol))
+
+        return trade_updates, remaining_orders
+
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         trading_pair = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
         updated_order_data = await self._api_get(
@@ -479,18 +511,74 @@ class BinanceExchange(ExchangePyBase):
                 "origClientOrderId": tracked_order.client_order_id},
             is_auth_required=True)
 
-        new_state = CONSTANTS.ORDER_STATE[updated_order_data["status"]]
+        return self._create_order_update(tracked_order=tracked_order, order_data=updated_order_data)
+
+    async def _request_orders_status(
+            self, orders: List[InFlightOrder]) -> Tuple[List[OrderUpdate], List[InFlightOrder]]:
+        """
+        Requests the open orders of each trading pair with several orders to update, with one request per trading
+        pair instead of one per order. The orders not open in the exchange any more are updated one by one.
+        """
+        order_updates = []
+        remaining_orders = []
+        for trading_pair, pair_orders in self._orders_by_trading_pair(orders).items():
+            if len(pair_orders) < self.BULK_ORDER_UPDATES_MIN_ORDERS:
+                remaining_orders.extend(pair_orders)
+                continue
+
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            open_orders_response = await self._api_get(
+                path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+                params={"symbol": symbol},
+                is_auth_required=True,
+                limit_id=CONSTANTS.OPEN_ORDERS_PATH_URL)
+
+            open_orders = {order_data["clientOrderId"]: order_data for order_data in open_orders_response}
+            for order in pair_orders:
+                order_data = open_orders.get(order.client_order_id)
+                if order_data is None:
+                    remaining_orders.append(order)
+                else:
+                    order_updates.append(self._create_order_update(tracked_order=order, order_data=order_data))
+
+        return order_updates, remaining_orders
 
-        order_update = OrderUpdate(
+    @staticmethod
+    def _orders_by_trading_pair(orders: List[InFlightOrder]) -> Dict[str, List[InFlightOrder]]:
+        orders_by_trading_pair = {}
+        for order in orders:
+            orders_by_trading_pair.setdefault(order.trading_pair, []).append(order)
+        return orders_by_trading_pair
+
+    def _create_trade_update(self, order: InFlightOrder, trade: Dict[str, Any], symbol: str) -> TradeUpdate:
+        fee = TradeFeeBase.new_spot_fee(
+            fee_schema=self.trade_fee_schema(),
+            trade_type=order.trade_type,
+            percent_token=trade["commissionAsset"],
+            flat_fees=[TokenAmount(amount=Decimal(trade["commission"]), token=trade["commissionAsset"])]
+        )
+        return TradeUpdate(
+            trade_id=str(trade["id"]),
+            client_order_id=order.client_order_id,
+            exchange_order_id=str(trade["orderId"]),
+            trading_pair=symbol,
+            fee=fee,
+            fill_base_amount=Decimal(trade["qty"]),
+            fill_quote_amount=Decimal(trade["quoteQty"]),
+            fill_price=Decimal(trade["price"]),
+            fill_timestamp=trade["time"] * 1e-3,
+        )
+
+    @staticmethod
+    def _create_order_update(tracked_order: InFlightOrder, order_data: Dict[str, Any]) -> OrderUpdate:
+        return OrderUpdate(
             client_order_id=tracked_order.client_order_id,
-            exchange_order_id=str(updated_order_data["orderId"]),
+            exchange_order_id=str(order_data["orderId"]),
             trading_pair=tracked_order.trading_pair,
-            update_timestamp=updated_order_data["updateTime"] * 1e-3,
-            new_state=new_state,
+            update_timestamp=order_data["updateTime"] * 1e-3,
+            new_state=CONSTANTS.ORDER_STATE[order_data["status"]],
         )
 
-        return order_update
-
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
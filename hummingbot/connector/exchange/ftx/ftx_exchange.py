@@ -178,9 +178,7 @@ class FtxExchange(ExchangePyBase):
                 data: Dict[str, Any] = event_message["data"]
                 if channel == CONSTANTS.WS_PRIVATE_FILLS_CHANNEL:
                     exchange_order_id = str(data["orderId"])
-                    order = next((order for order in self._order_tracker.all_fillable_orders.values()
-                                  if order.exchange_order_id == exchange_order_id),
-                                 None)
+                    order = self._order_tracker.fetch_fillable_order(exchange_order_id=exchange_order_id)
                     if order is not None:
                         trade_update = self._create_trade_update_with_order_fill_data(
                             order_fill_msg=data,
@@ -3,6 +3,7 @@ from typing import List
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.backtesting.backtest_order_book_tracker import BacktestOrderBookTracker
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
 
@@ -22,3 +23,16 @@ def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfi
                               tracker,
                               get_connector_class(exchange_name),
                               exchange_name=exchange_name)
+
+
+def create_backtest_paper_trade_market(exchange_name: str,
+                                       client_config_map: ClientConfigAdapter,
+                                       trading_pairs: List[str]) -> PaperTradeExchange:
+    """
+    Creates a paper trade market without network connection, with empty order books to be fed by the backtest replay
+    engine. Fees and trading pair conversions are the ones of the given exchange.
+    """
+    return PaperTradeExchange(client_config_map,
+                              BacktestOrderBookTracker(trading_pairs),
+                              get_connector_class(exchange_name),
+                              exchange_name=exchange_name)
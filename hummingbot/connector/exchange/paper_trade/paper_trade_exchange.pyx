@@ -14,6 +14,10 @@ from libcpp.vector cimport vector
 
 from hummingbot.connector.budget_checker import BudgetChecker
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector
+from hummingbot.connector.exchange.paper_trade.queue_position_simulator import (
+    QueuePositionSimulator,
+    SimulatedLimitOrder,
+)
 from hummingbot.connector.exchange.paper_trade.trading_pair import TradingPair
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock cimport Clock
@@ -173,6 +177,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
+        self._queue_position_simulator = (QueuePositionSimulator()
+                                          if client_config_map.paper_trade.paper_trade_queue_position_fills
+                                          else None)
 
         # Trade volume metrics should never be gather for paper trade connector
         self._trade_volume_metric_collector = DummyMetricsCollector()
@@ -181,6 +188,26 @@ cdef class PaperTradeExchange(ExchangeBase):
     def budget_checker(self) -> BudgetChecker:
         return self._budget_checker
 
+    @property
+    def queue_position_fills(self) -> bool:
+        return self._queue_position_simulator is not None
+
+    @property
+    def queue_position_simulator(self) -> Optional[QueuePositionSimulator]:
+        return self._queue_position_simulator
+
+    def set_queue_position_fills(self, enabled: bool):
+        """
+        Enables or disables the simulation of the limit orders position in the order book queue. When enabled, a
+        trade at the price of a limit order fills it (possibly partially) only after the amount ahead of it in the
+        queue has been traded. It can only be changed when there are no limit orders.
+        """
+        if enabled == self.queue_position_fills:
+            return
+        if len(self.limit_orders) > 0:
+            raise ValueError("The queue position fills can't be changed while there are limit orders.")
+        self._queue_position_simulator = QueuePositionSimulator() if enabled else None
+
     @classmethod
     def random_order_id(cls, order_side: str, trading_pair: str) -> str:
         vals = [random.choice(range(0, 256)) for i in range(0, 13)]
@@ -274,10 +301,14 @@ cdef class PaperTradeExchange(ExchangeBase):
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            # Partially filled orders only hold the balance of their remaining quantity
+            remaining_quantity = (limit_order.quantity - limit_order.filled_quantity
+                                  if isinstance(limit_order.filled_quantity, Decimal)
+                                  else limit_order.quantity)
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += remaining_quantity * limit_order.price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[limit_order.base_currency] += remaining_quantity
         return _on_hold_balances
 
     @property
@@ -314,6 +345,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
         self.c_process_market_orders()
+        if self._queue_position_simulator is not None:
+            self.c_update_queue_positions()
         self.c_process_crossed_limit_orders()
 
     cdef str c_buy(self,
@@ -364,6 +397,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 int(self._current_timestamp * 1e6),
                 0
             ))
+            if self._queue_position_simulator is not None:
+                self.c_add_simulated_limit_order(order_id, trading_pair_str, True, quantized_price, quantized_amount)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -422,6 +457,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 int(self._current_timestamp * 1e6),
                 0
             ))
+            if self._queue_position_simulator is not None:
+                self.c_add_simulated_limit_order(order_id, trading_pair_str, False, quantized_price, quantized_amount)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -621,6 +658,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            if self._queue_position_simulator is not None:
+                self._queue_position_simulator.remove_order(deref(orders_it).getClientOrderID().decode("utf8"))
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -632,7 +671,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
@@ -643,6 +683,13 @@ cdef class PaperTradeExchange(ExchangeBase):
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
+            object simulated_order = (self._queue_position_simulator.get_order(order_id)
+                                      if self._queue_position_simulator is not None
+                                      else None)
+            object filled_amount = simulated_order.filled_amount if simulated_order is not None else s_decimal_0
+
+        if fill_amount is None:
+            fill_amount = amount - filled_amount
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -650,7 +697,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             is_maker=False,
             order_type=OrderType.LIMIT,
             order_side=TradeType.BUY,
-            amount=amount,
+            amount=fill_amount,
             price=price,
             from_total_balances=True
         )
@@ -702,12 +749,22 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.BUY,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                fill_amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        if simulated_order is not None:
+            simulated_order.filled_amount += fill_amount
+            simulated_order.collateral_amount += paid_amount
+            simulated_order.returns_amount += acquired_amount
+            if simulated_order.filled_amount < amount:
+                self.c_update_partially_filled_limit_order(map_it_ptr, orders_it, simulated_order.filled_amount)
+                return
+            paid_amount = simulated_order.collateral_amount
+            acquired_amount = simulated_order.returns_amount
+
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(
@@ -724,7 +781,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
@@ -735,6 +793,13 @@ cdef class PaperTradeExchange(ExchangeBase):
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
+            object simulated_order = (self._queue_position_simulator.get_order(order_id)
+                                      if self._queue_position_simulator is not None
+                                      else None)
+            object filled_amount = simulated_order.filled_amount if simulated_order is not None else s_decimal_0
+
+        if fill_amount is None:
+            fill_amount = amount - filled_amount
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -742,7 +807,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             is_maker=True,
             order_type=OrderType.LIMIT,
             order_side=TradeType.SELL,
-            amount=amount,
+            amount=fill_amount,
             price=price,
             from_total_balances=True
         )
@@ -793,12 +858,22 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.SELL,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                fill_amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        if simulated_order is not None:
+            simulated_order.filled_amount += fill_amount
+            simulated_order.collateral_amount += sold_amount
+            simulated_order.returns_amount += acquired_amount
+            if simulated_order.filled_amount < amount:
+                self.c_update_partially_filled_limit_order(map_it_ptr, orders_it, simulated_order.filled_amount)
+                return
+            sold_amount = simulated_order.collateral_amount
+            acquired_amount = simulated_order.returns_amount
+
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(
@@ -812,16 +887,47 @@ cdef class PaperTradeExchange(ExchangeBase):
             ))
         self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
 
+    cdef c_update_partially_filled_limit_order(self,
+                                               LimitOrdersIterator *map_it_ptr,
+                                               SingleTradingPairLimitOrdersIterator orders_it,
+                                               object filled_amount):
+        """
+        Replaces a limit order with a copy that has the given filled quantity (the orders of the set can't be
+        modified). The copy keeps the position of the order in the set, which is sorted by price and order id.
+        """
+        cdef:
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            CPPLimitOrder cpp_limit_order = deref(orders_it)
+        orders_collection_ptr.erase(orders_it)
+        orders_collection_ptr.insert(CPPLimitOrder(
+            cpp_limit_order.getClientOrderID(),
+            cpp_limit_order.getTradingPair(),
+            cpp_limit_order.getIsBuy(),
+            cpp_limit_order.getBaseCurrency(),
+            cpp_limit_order.getQuoteCurrency(),
+            cpp_limit_order.getPrice(),
+            cpp_limit_order.getQuantity(),
+            <PyObject *> filled_amount,
+            cpp_limit_order.getCreationTimestamp(),
+            cpp_limit_order.getStatus()
+        ))
+
     cdef c_process_limit_order(self,
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=None):
+        """
+        Fills a limit order, completely by default.
+
+        :param fill_amount: the amount to fill, the remaining amount of the order if None
+        """
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
@@ -905,6 +1011,10 @@ cdef class PaperTradeExchange(ExchangeBase):
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
+        if self._queue_position_simulator is not None:
+            self.c_match_trade_to_queued_limit_orders(order_book_trade_event)
+            return
+
         if map_it == limit_orders_map_ptr.end():
             return
 
@@ -930,6 +1040,70 @@ cdef class PaperTradeExchange(ExchangeBase):
         for orders_it in process_order_its:
             self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
 
+    cdef c_match_trade_to_queued_limit_orders(self, object order_book_trade_event):
+        """
+        Fills the limit orders reached by a trade according to their simulated position in the order book queue.
+
+        :param order_book_trade_event: trade event from order book
+        """
+        cdef:
+            str trading_pair = order_book_trade_event.trading_pair
+            string cpp_trading_pair = trading_pair.encode("utf8")
+            bint is_maker_buy = order_book_trade_event.type is TradeType.SELL
+            LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
+                                                 if is_maker_buy
+                                                 else address(self._ask_limit_orders))
+            LimitOrdersIterator map_it
+            SingleTradingPairLimitOrders *orders_collection_ptr = NULL
+            SingleTradingPairLimitOrdersIterator orders_it
+            object order_price
+            object order_amount
+
+        fills = self._queue_position_simulator.match_trade(trading_pair,
+                                                           is_maker_buy,
+                                                           float(order_book_trade_event.price),
+                                                           float(order_book_trade_event.amount))
+        for simulated_order, fill_amount in fills:
+            if fill_amount < simulated_order.remaining_amount:
+                fill_amount = self.c_quantize_order_amount(trading_pair, fill_amount)
+                if fill_amount <= s_decimal_0:
+                    continue
+            map_it = limit_orders_map_ptr.find(cpp_trading_pair)
+            if map_it == limit_orders_map_ptr.end():
+                return
+            # The orders are sorted by price and order id, the other fields are not used to find them
+            order_price = simulated_order.price
+            order_amount = simulated_order.amount
+            orders_collection_ptr = address(deref(map_it).second)
+            orders_it = orders_collection_ptr.find(CPPLimitOrder(
+                simulated_order.order_id.encode("utf8"),
+                cpp_trading_pair,
+                is_maker_buy,
+                b"",
+                b"",
+                <PyObject *> order_price,
+                <PyObject *> order_amount
+            ))
+            if orders_it != orders_collection_ptr.end():
+                self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it, fill_amount)
+
+    cdef c_add_simulated_limit_order(self, str order_id, str trading_pair, bint is_buy, object price, object amount):
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+        # The order is queued behind the amount already at its price level
+        self._queue_position_simulator.add_order(SimulatedLimitOrder(
+            order_id,
+            trading_pair,
+            is_buy,
+            price,
+            amount,
+            order_book.c_get_amount_at_price(is_buy, float(price))
+        ))
+
+    cdef c_update_queue_positions(self):
+        for trading_pair in self._queue_position_simulator.trading_pairs:
+            self._queue_position_simulator.update_queue_positions(trading_pair, self.c_get_order_book(trading_pair))
+
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
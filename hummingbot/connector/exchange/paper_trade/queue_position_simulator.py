@@ -0,0 +1,159 @@
+from bisect import bisect_left, bisect_right, insort
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+s_decimal_0 = Decimal(0)
+
+
+class SimulatedLimitOrder:
+    """
+    A paper trade limit order, with its position in the queue of its order book price level.
+    """
+    __slots__ = ("order_id", "trading_pair", "is_buy", "price", "amount", "queue_ahead", "filled_amount",
+                 "collateral_amount", "returns_amount")
+
+    def __init__(self,
+                 order_id: str,
+                 trading_pair: str,
+                 is_buy: bool,
+                 price: Decimal,
+                 amount: Decimal,
+                 queue_ahead: float):
+        self.order_id = order_id
+        self.trading_pair = trading_pair
+        self.is_buy = is_buy
+        self.price = price
+        self.amount = amount
+        # Amount of the order book level (in base currency) that has to be traded before the order is filled
+        self.queue_ahead = queue_ahead
+        self.filled_amount = s_decimal_0
+        # Totals of the partial fills: the currency paid (quote for buys, base for sells) and acquired, fees included
+        self.collateral_amount = s_decimal_0
+        self.returns_amount = s_decimal_0
+
+    @property
+    def remaining_amount(self) -> Decimal:
+        return self.amount - self.filled_amount
+
+    def __repr__(self) -> str:
+        return (f"SimulatedLimitOrder('{self.order_id}', '{self.trading_pair}', {self.is_buy}, {self.price}, "
+                f"{self.amount}, queue_ahead={self.queue_ahead}, filled_amount={self.filled_amount})")
+
+
+class QueuePositionSimulator:
+    """
+    Simulates the position of paper trade limit orders in the queue of their order book price level, to fill them
+    partially as the trades consume the orders ahead of them instead of filling them completely as soon as a trade
+    reaches their price.
+
+    - A new order is queued behind the amount of its price level in the order book.
+    - The amount ahead of an order never exceeds the amount of its level in the order book (when the level shrinks,
+      the orders ahead were either filled or cancelled).
+    - A trade at the price of an order consumes the amount ahead of it first, and then fills the order. Orders at the
+      same price are filled in creation order.
+    - A trade at a worse price than an order (e.g. a sell trade below a buy order price) fills it completely, since
+      the whole level was traded.
+
+    The orders are indexed by trading pair, side and price level, so trades and order book updates only visit the
+    levels they affect.
+    """
+
+    def __init__(self):
+        self._orders: Dict[str, SimulatedLimitOrder] = {}
+        # (trading pair, is buy) -> price level -> orders in creation order
+        self._levels: Dict[Tuple[str, bool], Dict[float, List[SimulatedLimitOrder]]] = {}
+        # (trading pair, is buy) -> sorted price levels
+        self._level_prices: Dict[Tuple[str, bool], List[float]] = {}
+
+    @property
+    def orders(self) -> Dict[str, SimulatedLimitOrder]:
+        return self._orders
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        """
+        The trading pairs with simulated orders
+        """
+        return list({trading_pair for trading_pair, _ in self._levels})
+
+    def get_order(self, order_id: str) -> Optional[SimulatedLimitOrder]:
+        return self._orders.get(order_id)
+
+    def add_order(self, order: SimulatedLimitOrder):
+        key = (order.trading_pair, order.is_buy)
+        price = float(order.price)
+        self._orders[order.order_id] = order
+        levels = self._levels.setdefault(key, {})
+        if price not in levels:
+            levels[price] = []
+            insort(self._level_prices.setdefault(key, []), price)
+        levels[price].append(order)
+
+    def remove_order(self, order_id: str) -> Optional[SimulatedLimitOrder]:
+        order = self._orders.pop(order_id, None)
+        if order is not None:
+            key = (order.trading_pair, order.is_buy)
+            price = float(order.price)
+            levels = self._levels[key]
+            levels[price].remove(order)
+            if len(levels[price]) == 0:
+                del levels[price]
+                level_prices = self._level_prices[key]
+                del level_prices[bisect_left(level_prices, price)]
+                if len(level_prices) == 0:
+                    del self._levels[key]
+                    del self._level_prices[key]
+        return order
+
+    def update_queue_positions(self, trading_pair: str, order_book: OrderBook):
+        """
+        Caps the amount ahead of each order of the trading pair to the current amount of its order book level.
+        """
+        for is_buy in (True, False):
+            levels = self._levels.get((trading_pair, is_buy))
+            if levels is None:
+                continue
+            for price, orders in levels.items():
+                level_amount = order_book.get_amount_at_price(is_buy, price)
+                for order in orders:
+                    if order.queue_ahead > level_amount:
+                        order.queue_ahead = level_amount
+
+    def match_trade(self,
+                    trading_pair: str,
+                    is_maker_buy: bool,
+                    price: float,
+                    amount: float) -> List[Tuple[SimulatedLimitOrder, Decimal]]:
+        """
+        Updates the queue positions with a trade and returns the orders filled by it, with the amount filled.
+
+        :param trading_pair: the trading pair of the trade
+        :param is_maker_buy: True if the trade took buy orders (sell trade), False if it took sell orders
+        :param price: the trade price
+        :param amount: the trade amount
+        """
+        key = (trading_pair, is_maker_buy)
+        levels = self._levels.get(key)
+        if levels is None:
+            return []
+        level_prices = self._level_prices[key]
+        fills = []
+        if is_maker_buy:
+            traded_through = level_prices[bisect_right(level_prices, price):]
+        else:
+            traded_through = level_prices[:bisect_left(level_prices, price)]
+        for level_price in traded_through:
+            for order in levels[level_price]:
+                order.queue_ahead = 0
+                fills.append((order, order.remaining_amount))
+
+        available_amount = amount
+        for order in levels.get(price, ()):
+            fill_amount = min(order.remaining_amount, Decimal(str(max(0.0, available_amount - order.queue_ahead))))
+            order.queue_ahead = max(0.0, order.queue_ahead - available_amount)
+            if fill_amount > s_decimal_0:
+                fills.append((order, fill_amount))
+                available_amount -= float(fill_amount)
+        return fills
@@ -1,9 +1,10 @@
 import asyncio
 import copy
 import logging
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
 
@@ -13,8 +14,8 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -44,6 +45,9 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    ORDER_BOOK_INIT_MAX_CONCURRENCY = 10
+    ORDER_BOOK_COALESCE_DIFFS = True
+    ORDER_UPDATES_MAX_CONCURRENCY = 10
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -59,9 +63,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._status_polling_cycle_time: Optional[float] = None
+        self._order_reconciliation_cycle_time: Optional[float] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
+        self._throttler = SlidingWindowThrottler(
             rate_limits=self.rate_limits_rules,
             limits_share_percentage=client_config_map.rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
@@ -75,7 +81,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            max_concurrent_initializations=self.ORDER_BOOK_INIT_MAX_CONCURRENCY,
+            coalesce_diffs=self.ORDER_BOOK_COALESCE_DIFFS))
 
         # init UserStream Data Source and Tracker
         self._userstream_ds = self._create_user_stream_data_source()
@@ -203,6 +211,21 @@ class ExchangePyBase(ExchangeBase, ABC):
             if not value.is_done
         }
 
+    @property
+    def status_polling_cycle_time(self) -> Optional[float]:
+        """
+        Returns the duration in seconds of the last completed status polling cycle (None if no cycle completed yet)
+        """
+        return self._status_polling_cycle_time
+
+    @property
+    def order_reconciliation_cycle_time(self) -> Optional[float]:
+        """
+        Returns the duration in seconds of the last reconciliation of the in flight orders status and fills with the
+        exchange (None if no reconciliation completed yet)
+        """
+        return self._order_reconciliation_cycle_time
+
     @abstractmethod
     def supported_order_types(self) -> List[OrderType]:
         raise NotImplementedError
@@ -765,11 +788,13 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._poll_notifier.wait()
+                cycle_start = time.perf_counter()
                 await self._update_time_synchronizer()
 
                 # the following method is implementation-specific
                 await self._status_polling_loop_fetch_updates()
 
+                self._status_polling_cycle_time = time.perf_counter() - cycle_start
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
             except asyncio.CancelledError:
@@ -913,62 +938,139 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._in_flight_orders_snapshot_timestamp = self.current_timestamp
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}")
+        orders = self._orders_by_recent_activity(orders)
+        try:
+            trade_updates, orders = await self._all_trade_updates_for_orders(orders=orders)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for several orders at once. Error: {request_error}")
+        await self._execute_for_orders(orders=orders, order_function=self._update_fills_for_order)
+
+    async def _update_fills_for_order(self, order: InFlightOrder):
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}")
 
     async def _update_orders(self):
-        orders_to_update = self.in_flight_orders.copy()
-        for client_order_id, order in orders_to_update.items():
-            try:
-                order_update = await self._request_order_status(tracked_order=order)
-                if client_order_id in self.in_flight_orders:
+        orders = self._orders_by_recent_activity(list(self.in_flight_orders.values()))
+        try:
+            order_updates, orders = await self._request_orders_status(orders=orders)
+            for order_update in order_updates:
+                if order_update.client_order_id in self.in_flight_orders:
                     self._order_tracker.process_order_update(order_update)
-            except asyncio.CancelledError:
-                raise
-            except asyncio.TimeoutError:
-                self.logger().debug(
-                    f"Tracked order {client_order_id} does not have an exchange id. "
-                    f"Attempting fetch in next polling interval."
-                )
-                await self._order_tracker.process_order_not_found(client_order_id)
-            except Exception as request_error:
-                self.logger().network(
-                    f"Error fetching status update for the order {order.client_order_id}: {request_error}.",
-                    app_warning_msg=f"Failed to fetch status update for the order {order.client_order_id}.",
-                )
-                await self._order_tracker.process_order_not_found(order.client_order_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch status updates for several orders at once. Error: {request_error}")
+        await self._execute_for_orders(orders=orders, order_function=self._update_status_for_order)
+
+    async def _update_status_for_order(self, order: InFlightOrder):
+        client_order_id = order.client_order_id
+        try:
+            order_update = await self._request_order_status(tracked_order=order)
+            if client_order_id in self.in_flight_orders:
+                self._order_tracker.process_order_update(order_update)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self.logger().debug(
+                f"Tracked order {client_order_id} does not have an exchange id. "
+                f"Attempting fetch in next polling interval."
+            )
+            await self._order_tracker.process_order_not_found(client_order_id)
+        except Exception as request_error:
+            self.logger().network(
+                f"Error fetching status update for the order {order.client_order_id}: {request_error}.",
+                app_warning_msg=f"Failed to fetch status update for the order {order.client_order_id}.",
+            )
+            await self._order_tracker.process_order_not_found(order.client_order_id)
 
     async def _update_lost_orders(self):
-        orders_to_update = self._order_tracker.lost_orders.copy()
-        for client_order_id, order in orders_to_update.items():
-            try:
-                order_update = await self._request_order_status(tracked_order=order)
-                if client_order_id in self._order_tracker.lost_orders:
+        orders = self._orders_by_recent_activity(list(self._order_tracker.lost_orders.values()))
+        try:
+            order_updates, orders = await self._request_orders_status(orders=orders)
+            for order_update in order_updates:
+                if order_update.client_order_id in self._order_tracker.lost_orders:
                     self._order_tracker.process_order_update(order_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Error fetching status update for lost order {order.client_order_id}: {request_error}.")
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch status updates for several lost orders at once. Error: {request_error}")
+        await self._execute_for_orders(orders=orders, order_function=self._update_status_for_lost_order)
+
+    async def _update_status_for_lost_order(self, order: InFlightOrder):
+        try:
+            order_update = await self._request_order_status(tracked_order=order)
+            if order.client_order_id in self._order_tracker.lost_orders:
+                self._order_tracker.process_order_update(order_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Error fetching status update for lost order {order.client_order_id}: {request_error}.")
 
     async def _update_order_status(self):
+        reconciliation_start = time.perf_counter()
         await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
         await self._update_orders()
+        self._order_reconciliation_cycle_time = time.perf_counter() - reconciliation_start
 
     async def _update_lost_orders_status(self):
         await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
         await self._update_lost_orders()
 
+    @staticmethod
+    def _orders_by_recent_activity(orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Sorts the orders to reconcile the most recently updated (or created) ones first, since they are the most
+        likely to have new fills or status changes
+        """
+        return sorted(orders, key=lambda order: order.last_update_timestamp, reverse=True)
+
+    async def _execute_for_orders(self,
+                                  orders: List[InFlightOrder],
+                                  order_function: Callable[[InFlightOrder], Awaitable[None]]):
+        """
+        Executes the function for each order concurrently, with at most ORDER_UPDATES_MAX_CONCURRENCY executions in
+        flight. The executions start in the same order as the orders list, and the pace of the requests is controlled
+        by the connector throttler.
+
+        :param orders: the orders to process, in priority order
+        :param order_function: the function processing one order. It is expected to handle its own errors
+        """
+        if len(orders) <= 1 or self.ORDER_UPDATES_MAX_CONCURRENCY <= 1:
+            for order in orders:
+                await order_function(order)
+            return
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.ORDER_UPDATES_MAX_CONCURRENCY)
+
+        async def _execute(order: InFlightOrder):
+            async with semaphore:
+                await order_function(order)
+
+        tasks: List[asyncio.Task] = [safe_ensure_future(_execute(order)) for order in orders]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
     async def _cancel_lost_orders(self):
-        for _, lost_order in self._order_tracker.lost_orders.items():
+        for lost_order in list(self._order_tracker.lost_orders.values()):
             await self._execute_order_cancel(order=lost_order)
 
     # Methods tied to specific API data formats
@@ -997,6 +1099,28 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _all_trade_updates_for_orders(
+            self, orders: List[InFlightOrder]) -> Tuple[List[TradeUpdate], List[InFlightOrder]]:
+        """
+        Requests the trade updates of several orders with fewer requests than one per order (for example requesting
+        the recent trades of each trading pair). Connectors whose exchange supports it should override this method.
+
+        :param orders: the orders to update, sorted by priority
+        :return: the trade updates obtained, and the orders that still have to be updated one by one
+        """
+        return [], orders
+
+    async def _request_orders_status(
+            self, orders: List[InFlightOrder]) -> Tuple[List[OrderUpdate], List[InFlightOrder]]:
+        """
+        Requests the status of several orders with fewer requests than one per order (for example requesting the
+        open orders of each trading pair). Connectors whose exchange supports it should override this method.
+
+        :param orders: the orders to update, sorted by priority
+        :return: the order updates obtained, and the orders that still have to be updated one by one
+        """
+        return [], orders
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -1,16 +1,20 @@
 import asyncio
+import functools
+import logging
 import os.path
+import queue
 import threading
 import time
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
+from hummingbot.client.performance import PerformanceTracker
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.trades_csv_writer import TradesCSVWriter
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
@@ -30,6 +34,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.logger import HummingbotLogger
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
@@ -41,16 +46,42 @@ from hummingbot.model.trade_fill import TradeFill
 
 
 class MarketsRecorder:
+    WRITE_BATCH_MAX_SIZE = 500
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
 
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 write_behind: bool = False,
+                 csv_flush_interval: Optional[float] = None,
+                 session_start_time: Optional[float] = None):
+        """
+        :param sql: the connection manager of the trades database
+        :param markets: the connectors whose events are recorded
+        :param config_file_path: the strategy config file the records are associated to
+        :param strategy_name: the strategy name the records are associated to
+        :param write_behind: if True the records are queued and written in batched transactions by a dedicated writer
+            thread, and the market states are saved once per batch for each market, instead of writing each event
+            synchronously in the event loop
+        :param csv_flush_interval: minimum number of seconds between flushes of the trades CSV export file. If None
+            every fill is flushed immediately
+        :param session_start_time: the timestamp (in seconds) the performance tracker starts counting fills from. The
+            fills of the config file already stored since then are loaded once, when the recorder is created. If None
+            the tracker only counts the fills recorded from now on
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -59,6 +90,15 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._write_behind: bool = write_behind
+        self._write_queue: "queue.Queue[Optional[Tuple[str, Any]]]" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._markets_with_pending_states: Dict[str, ConnectorBase] = {}
+        self._market_states_capture_scheduled: bool = False
+        self._csv_writer: TradesCSVWriter = TradesCSVWriter(flush_interval=csv_flush_interval)
+        self._performance_tracker: PerformanceTracker = PerformanceTracker()
+        if session_start_time is not None:
+            self._load_session_fills_into_performance_tracker(session_start_time)
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -102,6 +142,13 @@ class MarketsRecorder:
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
 
+    @property
+    def performance_tracker(self) -> PerformanceTracker:
+        """
+        The running performance of the fills of the session, updated with each recorded fill
+        """
+        return self._performance_tracker
+
     @property
     def config_file_path(self) -> str:
         return self._config_file_path
@@ -114,7 +161,14 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind(self) -> bool:
+        return self._write_behind
+
     def start(self):
+        if self._write_behind and self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._writer_loop, name="MarketsRecorderWriter", daemon=True)
+            self._writer_thread.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -123,6 +177,23 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        if self._writer_thread is not None:
+            self._capture_market_states()
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+        self._csv_writer.close()
+
+    def flush(self):
+        """
+        Blocks until all the records queued in write behind mode have been written to the database.
+        Must be called from the main thread.
+        """
+        if self._write_behind:
+            self._capture_market_states()
+            if self._writer_thread is not None:
+                self._write_queue.join()
+        self._csv_writer.flush()
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -152,18 +223,43 @@ class MarketsRecorder:
             else:
                 return query.limit(number_of_rows).all()
 
+    def _load_session_fills_into_performance_tracker(self, session_start_time: float):
+        with self._sql_manager.get_new_session() as session:
+            query: Query = (session
+                            .query(TradeFill)
+                            .filter(TradeFill.timestamp >= int(session_start_time * 1e3),
+                                    TradeFill.config_file_path.like(f"%{self._config_file_path}%"))
+                            .order_by(TradeFill.timestamp))
+            for trade_fill in query.yield_per(1000):
+                self._performance_tracker.add_trade_fill(trade_fill)
+
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        self._save_market_states(config_file_path=config_file_path,
+                                 market_name=market.display_name,
+                                 tracking_states=market.tracking_states,
+                                 timestamp=self.db_timestamp,
+                                 session=session)
+
+    def _save_market_states(self,
+                            config_file_path: str,
+                            market_name: str,
+                            tracking_states: Dict[str, Any],
+                            timestamp: int,
+                            session: Session):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -196,31 +292,31 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        def _write(session: Session):
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=self._config_file_path,
+                                        strategy=self._strategy_name,
+                                        market=market.display_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=Decimal(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                        position=evt.position if evt.position else PositionAction.NIL.value,
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._record(_write, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -234,48 +330,68 @@ class MarketsRecorder:
         timestamp: int = int(evt.timestamp * 1e3) if evt.timestamp is not None else self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=Decimal(
-                        evt.price) if evt.price == evt.price else Decimal(0),
-                    amount=Decimal(evt.amount),
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        price: Decimal = Decimal(evt.price) if evt.price == evt.price else Decimal(0)
+        amount: Decimal = Decimal(evt.amount)
+        trade_fee: Dict[str, Any] = evt.trade_fee.to_json()
+        position: str = evt.position if evt.position else PositionAction.NIL.value
+        trade_fill_records: List[TradeFill] = []
+
+        def _write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+
+            trade_fill_record: TradeFill = TradeFill(
+                config_file_path=self.config_file_path,
+                strategy=self.strategy_name,
+                market=market.display_name,
+                symbol=evt.trading_pair,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                timestamp=timestamp,
+                order_id=order_id,
+                trade_type=evt.trade_type.name,
+                order_type=evt.order_type.name,
+                price=price,
+                amount=amount,
+                leverage=evt.leverage if evt.leverage else 1,
+                trade_fee=trade_fee,
+                exchange_trade_id=evt.exchange_trade_id,
+                position=position,
+            )
+            session.add(order_status)
+            session.add(trade_fill_record)
+            trade_fill_records.append(trade_fill_record)
+
+        def _on_commit():
+            # The fill is exported and counted only once it is stored, so the CSV file and the performance tracker
+            # never have fills missing in the database (e.g. duplicated fills rejected by the database)
+            for trade_fill_record in trade_fill_records:
                 self.append_to_csv(trade_fill_record)
+            self._call_on_event_loop(functools.partial(self._performance_tracker.add_fill,
+                                                       market=market.display_name,
+                                                       trading_pair=evt.trading_pair,
+                                                       order_id=order_id,
+                                                       trade_type=evt.trade_type.name,
+                                                       position=position,
+                                                       price=price,
+                                                       amount=amount,
+                                                       trade_fee=trade_fee,
+                                                       timestamp=timestamp))
+
+        # The connector uses the recorded fills to reconcile duplicated fills, so it has to be notified immediately
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        self._record(_write, market, on_commit=_on_commit)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -287,24 +403,24 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        def _write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market.display_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._record(_write)
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        return TradesCSVWriter.file_matches_header(file_path, header)
 
     def append_to_csv(self, trade: TradeFill):
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
@@ -320,14 +436,7 @@ class MarketsRecorder:
         field_names += ("age",)
         field_data += (age,)
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        self._csv_writer.write_row(csv_path, field_names, field_data)
 
     def _update_order_status(self,
                              event_tag: int,
@@ -345,18 +454,19 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        def _write(session: Session) -> bool:
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
 
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+            return order_record is not None
+
+        self._record(_write, market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -392,15 +502,15 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def _write(session: Session):
+            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                                 timestamp=timestamp,
+                                                                 tx_hash=evt.exchange_order_id,
+                                                                 token_id=evt.token_id,
+                                                                 trade_fee=evt.trade_fee.to_json())
+            session.add(rp_update)
+
+        self._record(_write, connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -410,14 +520,109 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
+        def _write(session: Session):
+            rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                             strategy=self._strategy_name,
+                                                                             token_id=evt.token_id,
+                                                                             token_0=evt.token_0,
+                                                                             token_1=evt.token_1,
+                                                                             claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                             claimed_fee_1=Decimal(evt.claimed_fee_1))
+            session.add(rp_fees)
+
+        self._record(_write, connector)
+
+    def _record(self,
+                write_function: Callable[[Session], Optional[bool]],
+                market: Optional[ConnectorBase] = None,
+                on_commit: Optional[Callable[[], None]] = None):
+        """
+        Persists a record. In synchronous mode the record is written in its own transaction, together with the market
+        states. In write behind mode it is queued for the writer thread, and the market states are captured once per
+        event loop iteration.
+
+        :param write_function: function adding the record to the session. If it returns False the market states are
+            not saved
+        :param market: the market whose states have to be saved with the record
+        :param on_commit: function called once the transaction with the record is committed, with the session still
+            open. It is not called if the record could not be written
+        """
+        if self._write_behind:
+            self._write_queue.put(("record", (write_function, on_commit)))
+            if market is not None:
+                self._markets_with_pending_states[market.display_name] = market
+                if not self._market_states_capture_scheduled:
+                    self._market_states_capture_scheduled = True
+                    self._ev_loop.call_soon(self._capture_market_states)
+        else:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    should_save_states = write_function(session) is not False
+                    if market is not None and should_save_states:
+                        self.save_market_states(self._config_file_path, market, session=session)
+                if on_commit is not None:
+                    on_commit()
+
+    def _call_on_event_loop(self, callback: Callable[[], None]):
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(callback)
+            return
+        callback()
+
+    def _capture_market_states(self):
+        self._market_states_capture_scheduled = False
+        timestamp: int = self.db_timestamp
+        for market_name, market in self._markets_with_pending_states.items():
+            self._write_queue.put(("market_states", (market_name, market.tracking_states, timestamp)))
+        self._markets_with_pending_states.clear()
+
+    def _writer_loop(self):
+        stop_requested = False
+        while not stop_requested:
+            batch: List[Optional[Tuple[str, Any]]] = [self._write_queue.get()]
+            while len(batch) < self.WRITE_BATCH_MAX_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop_requested = None in batch
+            try:
+                self._write_batch([item for item in batch if item is not None])
+            except Exception:
+                self.logger().error("Unexpected error writing records to the trades database.", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
+    def _write_batch(self, batch: List[Tuple[str, Any]]):
+        if len(batch) == 0:
+            return
+        # Only the last captured states of each market in the batch are saved
+        market_states: Dict[str, Tuple[Dict[str, Any], int]] = {}
+        commit_callbacks: List[Callable[[], None]] = []
         with self._sql_manager.get_new_session() as session:
             with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+                for item_type, item in batch:
+                    if item_type == "record":
+                        write_function, on_commit = item
+                        # Each record is written in its own savepoint, so a record that fails only loses itself and
+                        # not the rest of the batch. The whole batch is still committed in a single transaction.
+                        try:
+                            with session.begin_nested():
+                                write_function(session)
+                            if on_commit is not None:
+                                commit_callbacks.append(on_commit)
+                        except Exception:
+                            self.logger().error("Unexpected error writing a record to the trades database.",
+                                                exc_info=True)
+                    else:
+                        market_name, tracking_states, timestamp = item
+                        market_states[market_name] = (tracking_states, timestamp)
+                for market_name, (tracking_states, timestamp) in market_states.items():
+                    self._save_market_states(config_file_path=self._config_file_path,
+                                             market_name=market_name,
+                                             tracking_states=tracking_states,
+                                             timestamp=timestamp,
+                                             session=session)
+            for on_commit in commit_callbacks:
+                on_commit()
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Awaitable, Deque
+from typing import Awaitable, Deque, Optional
 
 import numpy
 
@@ -22,6 +22,7 @@ class TimeSynchronizer:
 
     def __init__(self):
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        self._estimated_time_offset_ms: Optional[float] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -34,17 +35,23 @@ class TimeSynchronizer:
         if not self._time_offset_ms:
             offset = (self._time() - self._current_seconds_counter()) * 1e3
         else:
-            median = numpy.median(self._time_offset_ms)
-            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
-            offset = numpy.mean([median, weighted_average])
+            # The estimation only changes when a sample is added, so it is not recalculated for every signed request
+            if self._estimated_time_offset_ms is None:
+                median = numpy.median(self._time_offset_ms)
+                weighted_average = numpy.average(self._time_offset_ms,
+                                                 weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
+                self._estimated_time_offset_ms = float(numpy.mean([median, weighted_average]))
+            offset = self._estimated_time_offset_ms
 
         return offset
 
     def add_time_offset_ms_sample(self, offset: float):
         self._time_offset_ms.append(offset)
+        self._estimated_time_offset_ms = None
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._estimated_time_offset_ms = None
 
     def time(self) -> float:
         """
@@ -0,0 +1,83 @@
+import csv
+import os
+import threading
+import time
+from shutil import move
+from typing import IO, Any, Dict, Optional, Sequence, Tuple
+
+import pandas as pd
+
+
+class _CSVFileState:
+    __slots__ = ("header", "file", "writer", "last_flush_timestamp")
+
+    def __init__(self, header: Tuple[str, ...], file: IO[str]):
+        self.header: Tuple[str, ...] = header
+        self.file: IO[str] = file
+        self.writer = csv.writer(file, lineterminator=os.linesep)
+        self.last_flush_timestamp: float = time.monotonic()
+
+
+class TradesCSVWriter:
+    """
+    Appends rows to CSV export files keeping the files open between writes.
+    The header of an existing file is checked only once, when the file is opened. If it does not match the expected
+    header the file is rotated (renamed with an _old_ suffix) and a new file is started.
+    Rows are flushed to disk after each write, or periodically if a flush interval is configured.
+    """
+
+    def __init__(self, flush_interval: Optional[float] = None):
+        """
+        :param flush_interval: minimum number of seconds between flushes to disk. If None every row is flushed
+            immediately
+        """
+        self._flush_interval: Optional[float] = flush_interval
+        self._files: Dict[str, _CSVFileState] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def file_matches_header(file_path: str, header: Sequence[str]) -> bool:
+        with open(file_path, newline="") as file:
+            first_row = next(csv.reader(file), None)
+        return first_row is not None and tuple(first_row) == tuple(header)
+
+    def write_row(self, file_path: str, header: Sequence[str], row: Sequence[Any]):
+        with self._lock:
+            header = tuple(header)
+            file_state = self._files.get(file_path)
+            if file_state is None or file_state.header != header:
+                file_state = self._open(file_path, header)
+            file_state.writer.writerow(row)
+            now = time.monotonic()
+            if self._flush_interval is None or now - file_state.last_flush_timestamp >= self._flush_interval:
+                file_state.file.flush()
+                file_state.last_flush_timestamp = now
+
+    def flush(self):
+        with self._lock:
+            for file_state in self._files.values():
+                file_state.file.flush()
+                file_state.last_flush_timestamp = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            for file_state in self._files.values():
+                file_state.file.close()
+            self._files.clear()
+
+    def _open(self, file_path: str, header: Tuple[str, ...]) -> _CSVFileState:
+        previous_state = self._files.pop(file_path, None)
+        if previous_state is not None:
+            previous_state.file.close()
+
+        if (os.path.exists(file_path)
+                and os.path.getsize(file_path) > 0
+                and not self.file_matches_header(file_path, header)):
+            move(file_path, file_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+
+        write_header = not os.path.exists(file_path) or os.path.getsize(file_path) == 0
+        file_state = _CSVFileState(header=header, file=open(file_path, mode="a", newline=""))
+        if write_header:
+            file_state.writer.writerow(header)
+        self._files[file_path] = file_state
+        return file_state
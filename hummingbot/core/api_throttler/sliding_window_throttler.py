@@ -0,0 +1,232 @@
+import asyncio
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import MAX_CAPACITY_REACHED_WARNING_INTERVAL
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+
+class LimitWindow:
+    """
+    Sliding window of the requests registered for a single RateLimit.
+    Keeps the registered (timestamp, weight) pairs in arrival order and a running total of the used capacity, so
+    expiring old requests and checking the capacity are amortized O(1) operations. It also counts the requests waiting
+    in the throttler for this limit, that new requests for the limit have to queue behind.
+    """
+
+    __slots__ = ("rate_limit", "limit", "window", "entries", "used", "waiting")
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.rate_limit: RateLimit = rate_limit
+        self.limit: int = int(rate_limit.limit)
+        self.window: float = float(rate_limit.time_interval) * (1 + safety_margin_pct)
+        self.entries: Deque[Tuple[float, int]] = deque()
+        self.used: int = 0
+        self.waiting: int = 0
+
+    def expire(self, now: float):
+        entries = self.entries
+        while entries and entries[0][0] + self.window <= now:
+            self.used -= entries.popleft()[1]
+
+    def has_capacity(self, weight: int) -> bool:
+        # A request heavier than the whole limit is still allowed once the window is empty, to avoid blocking forever
+        return self.used + weight <= self.limit or self.used == 0
+
+    def register(self, now: float, weight: int):
+        self.entries.append((now, weight))
+        self.used += weight
+
+    def next_release_time(self) -> float:
+        return self.entries[0][0] + self.window
+
+
+class SlidingWindowRequestContext:
+    """
+    An async context class ('async with' syntax) that waits until all the related limits have capacity for the
+    request. Unlike AsyncRequestContext it does not poll: the throttler wakes the waiting requests (in FIFO order for
+    each limit) at the exact time the capacity they need is released.
+    """
+
+    def __init__(self, throttler: "SlidingWindowThrottler", related_windows: List[Tuple[LimitWindow, int]]):
+        """
+        :param throttler: The throttler that created the context
+        :param related_windows: List of the windows of the related limits with the weight of the request in each one
+        """
+        self._throttler: SlidingWindowThrottler = throttler
+        self._related_windows: List[Tuple[LimitWindow, int]] = related_windows
+
+    def blocking_window(self, now: float) -> Optional[Tuple[LimitWindow, int]]:
+        """
+        :param now: current time, as returned by the throttler time function
+        :return: The first related window (and the request weight for it) without capacity for the request, or None
+            if the request can be executed
+        """
+        for window, weight in self._related_windows:
+            window.expire(now)
+            if not window.has_capacity(weight):
+                return window, weight
+        return None
+
+    def within_capacity(self) -> bool:
+        return self.blocking_window(self._throttler.time()) is None
+
+    def has_waiting_requests(self) -> bool:
+        """
+        :return: True if other requests are already waiting for any of the related limits
+        """
+        return any(window.waiting > 0 for window, _ in self._related_windows)
+
+    def shares_limits(self, windows: Set[LimitWindow]) -> bool:
+        return any(window in windows for window, _ in self._related_windows)
+
+    def add_limits_to(self, windows: Set[LimitWindow]):
+        windows.update(window for window, _ in self._related_windows)
+
+    def update_waiting(self, change: int):
+        for window, _ in self._related_windows:
+            window.waiting += change
+
+    def register(self, now: float):
+        for window, weight in self._related_windows:
+            window.register(now, weight)
+
+    async def acquire(self):
+        await self._throttler.acquire(self)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class SlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Rate limits handler with the same API as AsyncThrottler, but that keeps a sliding window per limit id instead of
+    a shared task log list. Checking the capacity and registering a request are amortized O(1) operations, and the
+    requests waiting for capacity are resumed at the moment the capacity is released (no polling). The waiting
+    requests keep their arrival order for each limit, but a request only waits behind the earlier requests that share
+    a limit with it.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None):
+        """
+        :param rate_limits: List of RateLimit(s).
+        :param retry_interval: Not used, kept for compatibility with AsyncThrottler.
+        :param safety_margin_pct: Percentage of limit to be added as a safety margin when calculating capacity to ensure calls are within the limit.
+        :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
+            bots operate with the same account)
+        """
+        super().__init__(
+            rate_limits=rate_limits,
+            retry_interval=retry_interval,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=limits_share_percentage,
+        )
+        self._windows: Dict[str, LimitWindow] = {
+            limit_id: LimitWindow(rate_limit=rate_limit, safety_margin_pct=self._safety_margin_pct)
+            for limit_id, rate_limit in self._id_to_limit_map.items()
+        }
+        self._related_windows: Dict[str, List[Tuple[LimitWindow, int]]] = {}
+        self._waiters: Deque[Tuple[SlidingWindowRequestContext, asyncio.Future]] = deque()
+        self._wake_up_handle: Optional[asyncio.TimerHandle] = None
+        self._last_max_cap_warning_ts: float = 0
+
+    def time(self) -> float:
+        return time.monotonic()
+
+    def execute_task(self, limit_id: str) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        related_windows = self._related_windows.get(limit_id)
+        if related_windows is None:
+            _, related_limits = self.get_related_limits(limit_id=limit_id)
+            related_windows = [(self._windows[rate_limit.limit_id], weight) for rate_limit, weight in related_limits]
+            self._related_windows[limit_id] = related_windows
+        return SlidingWindowRequestContext(throttler=self, related_windows=related_windows)
+
+    async def acquire(self, context: SlidingWindowRequestContext):
+        now = self.time()
+        if not context.has_waiting_requests():
+            blocking = context.blocking_window(now)
+            if blocking is None:
+                context.register(now)
+                return
+            self._log_capacity_reached(now, *blocking)
+
+        future = asyncio.get_event_loop().create_future()
+        self._waiters.append((context, future))
+        context.update_waiting(1)
+        self._process_waiters()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.done() or future.cancelled():
+                self._remove_waiter(future)
+            raise
+
+    def _remove_waiter(self, future: asyncio.Future):
+        for context, waiter_future in self._waiters:
+            if waiter_future is future:
+                context.update_waiting(-1)
+        self._waiters = deque(waiter for waiter in self._waiters if waiter[1] is not future)
+        self._process_waiters()
+
+    def _process_waiters(self):
+        """
+        Resumes the waiting requests that fit in the limits, in arrival order, and schedules the next wake up at the
+        earliest time a limit blocking a request releases capacity. A request is not resumed while an earlier waiting
+        request shares any limit with it, but requests for independent limits don't wait for each other.
+        """
+        if self._wake_up_handle is not None:
+            self._wake_up_handle.cancel()
+            self._wake_up_handle = None
+
+        now = self.time()
+        next_release_time: Optional[float] = None
+        reserved_windows: Set[LimitWindow] = set()
+        still_waiting: Deque[Tuple[SlidingWindowRequestContext, asyncio.Future]] = deque()
+        for context, future in self._waiters:
+            if future.done():
+                context.update_waiting(-1)
+                continue
+            if not context.shares_limits(reserved_windows):
+                blocking = context.blocking_window(now)
+                if blocking is None:
+                    context.update_waiting(-1)
+                    context.register(now)
+                    future.set_result(None)
+                    continue
+                window, _ = blocking
+                release_time = window.next_release_time()
+                if next_release_time is None or release_time < next_release_time:
+                    next_release_time = release_time
+            context.add_limits_to(reserved_windows)
+            still_waiting.append((context, future))
+        self._waiters = still_waiting
+
+        if next_release_time is not None:
+            delay = max(0.0, next_release_time - now)
+            self._wake_up_handle = asyncio.get_event_loop().call_later(delay, self._process_waiters)
+
+    def _log_capacity_reached(self, now: float, window: LimitWindow, weight: int):
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            rate_limit = window.rate_limit
+            msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                  f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                  f"is {window.used} in the last " \
+                  f"{rate_limit.time_interval} seconds"
+            self.logger().notify(msg)
+            self._last_max_cap_warning_ts = now
@@ -0,0 +1,39 @@
+from typing import Dict, List, Optional
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class BacktestOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Data source that does not connect to any exchange, the order books are updated by the backtest replay engine.
+    """
+
+    async def get_last_traded_prices(self,
+                                     trading_pairs: List[str],
+                                     domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return self.order_book_create_function()
+
+
+class BacktestOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker with an empty order book for each trading pair, ready right away and without network activity.
+    """
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(data_source=BacktestOrderBookTrackerDataSource(trading_pairs), trading_pairs=trading_pairs)
+        self._order_books: Dict[str, OrderBook] = {
+            trading_pair: CompositeOrderBook() for trading_pair in trading_pairs
+        }
+        self._order_books_initialized.set()
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
@@ -0,0 +1,235 @@
+import logging
+from typing import List, Optional
+
+import numpy as np
+
+from hummingbot.core.backtesting.market_data import MarketDataRecordType, MarketDataSide, validate_market_data_records
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.logger import HummingbotLogger
+
+
+class MarketDataFeed:
+    """
+    Replays the market data records of one trading pair into its order book.
+    """
+    SEARCH_WINDOW_SIZE = 1024
+
+    def __init__(self, trading_pair: str, order_book: OrderBook, records: np.ndarray):
+        validate_market_data_records(records)
+        self._trading_pair = trading_pair
+        self._order_book = order_book
+        self._records = records
+        self._timestamps = records["timestamp"]
+        self._position = 0
+        self._book_updates = 0
+        self._trades = 0
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def order_book(self) -> OrderBook:
+        return self._order_book
+
+    @property
+    def book_updates(self) -> int:
+        return self._book_updates
+
+    @property
+    def trades(self) -> int:
+        return self._trades
+
+    @property
+    def finished(self) -> bool:
+        return self._position >= len(self._records)
+
+    @property
+    def first_timestamp(self) -> float:
+        return float(self._timestamps[0]) if len(self._records) > 0 else float("nan")
+
+    @property
+    def last_timestamp(self) -> float:
+        return float(self._timestamps[-1]) if len(self._records) > 0 else float("nan")
+
+    def replay_until(self, timestamp: float):
+        """
+        Applies all the records up to the given timestamp (included), in order. Consecutive diffs are applied to the
+        order book as one batch (unless they can cross the book) and, out of consecutive snapshots, only the last one
+        is applied.
+        """
+        end = self._end_position(timestamp)
+        if end <= self._position:
+            return
+        batch = self._records[self._position:end]
+        self._position = end
+
+        record_types = batch["record_type"]
+        run_starts = np.flatnonzero(record_types[1:] != record_types[:-1]) + 1
+        run_bounds = zip([0] + run_starts.tolist(), run_starts.tolist() + [len(batch)])
+        for run_start, run_end in run_bounds:
+            run = batch[run_start:run_end]
+            record_type = record_types[run_start]
+            if record_type == MarketDataRecordType.DIFF:
+                # As in the order book tracker, diffs older than the last snapshot are discarded (recorded streams
+                # usually have some, received before the initial snapshot)
+                run = run[run["update_id"] >= self._order_book.snapshot_uid]
+                self._apply_diffs(run)
+                self._book_updates += len(run)
+            elif record_type == MarketDataRecordType.SNAPSHOT:
+                update_ids = run["update_id"]
+                run = run[update_ids == update_ids[-1]]
+                self._order_book.apply_numpy_snapshot(self._levels(run, MarketDataSide.BID),
+                                                      self._levels(run, MarketDataSide.ASK))
+                self._book_updates += len(run)
+            elif record_type == MarketDataRecordType.TRADE:
+                self._apply_trades(run)
+            else:
+                raise ValueError(f"Unknown market data record type {record_type}.")
+
+    def _apply_diffs(self, diffs: np.ndarray):
+        """
+        Applies the diffs as one batch when that gives the same order book as applying them one update id at a time,
+        as the order book tracker does live. The order book removes the crossed levels after each update, so the diffs
+        are applied in one batch only if no bid they add can reach the lowest ask and no ask they add can reach the
+        highest bid.
+        """
+        if len(diffs) == 0:
+            return
+        update_ids = diffs["update_id"]
+        if update_ids[0] == update_ids[-1] or not self._may_cross(diffs):
+            self._order_book.apply_numpy_diffs(self._levels(diffs, MarketDataSide.BID),
+                                               self._levels(diffs, MarketDataSide.ASK))
+            return
+        update_starts = (np.flatnonzero(update_ids[1:] != update_ids[:-1]) + 1).tolist()
+        for update_start, update_end in zip([0] + update_starts, update_starts + [len(diffs)]):
+            update = diffs[update_start:update_end]
+            self._order_book.apply_numpy_diffs(self._levels(update, MarketDataSide.BID),
+                                               self._levels(update, MarketDataSide.ASK))
+
+    def _may_cross(self, diffs: np.ndarray) -> bool:
+        added_levels = diffs[diffs["amount"] > 0]
+        bid_prices = added_levels["price"][added_levels["side"] == MarketDataSide.BID]
+        ask_prices = added_levels["price"][added_levels["side"] == MarketDataSide.ASK]
+        highest_bid = float(bid_prices.max()) if len(bid_prices) > 0 else float("-inf")
+        lowest_ask = float(ask_prices.min()) if len(ask_prices) > 0 else float("inf")
+        try:
+            highest_bid = max(highest_bid, self._order_book.get_price(False))
+        except EnvironmentError:
+            pass
+        try:
+            lowest_ask = min(lowest_ask, self._order_book.get_price(True))
+        except EnvironmentError:
+            pass
+        return highest_bid >= lowest_ask
+
+    def _end_position(self, timestamp: float) -> int:
+        # The timestamps are a strided view of the records (possibly memory mapped), searching the whole array would
+        # copy it. The search starts from the current position with a growing window instead.
+        start = self._position
+        window_size = self.SEARCH_WINDOW_SIZE
+        while True:
+            end = min(start + window_size, len(self._timestamps))
+            index = int(np.searchsorted(self._timestamps[start:end], timestamp, side="right"))
+            if start + index < end or end == len(self._timestamps):
+                return start + index
+            start = end
+            window_size *= 2
+
+    def _apply_trades(self, trades: np.ndarray):
+        for trade_timestamp, side, price, amount in zip(trades["timestamp"].tolist(),
+                                                        trades["side"].tolist(),
+                                                        trades["price"].tolist(),
+                                                        trades["amount"].tolist()):
+            self._order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=self._trading_pair,
+                timestamp=trade_timestamp,
+                type=TradeType.BUY if side == MarketDataSide.BID else TradeType.SELL,
+                price=price,
+                amount=amount,
+            ))
+        self._trades += len(trades)
+
+    @staticmethod
+    def _levels(records: np.ndarray, side: MarketDataSide) -> np.ndarray:
+        side_records = records[records["side"] == side]
+        levels = np.empty((len(side_records), 3), dtype=np.float64)
+        levels[:, 0] = side_records["price"]
+        levels[:, 1] = side_records["amount"]
+        levels[:, 2] = side_records["update_id"]
+        return levels
+
+
+class BacktestReplayEngine(PyTimeIterator):
+    """
+    Replays recorded market data (see market_data.py) into order books as a back testing clock advances.
+
+    The engine ticks before the markets and strategies (it has to be the first iterator added to the clock), applying
+    on each tick all the records up to the tick timestamp, so markets (e.g. a paper trade exchange created with
+    create_backtest_paper_trade_market) and strategies run unmodified against the replayed order books.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self):
+        super().__init__()
+        self._feeds: List[MarketDataFeed] = []
+
+    @property
+    def feeds(self) -> List[MarketDataFeed]:
+        return self._feeds
+
+    @property
+    def book_updates(self) -> int:
+        return sum(feed.book_updates for feed in self._feeds)
+
+    @property
+    def trades(self) -> int:
+        return sum(feed.trades for feed in self._feeds)
+
+    @property
+    def finished(self) -> bool:
+        return all(feed.finished for feed in self._feeds)
+
+    @property
+    def start_timestamp(self) -> float:
+        return min((feed.first_timestamp for feed in self._feeds if not feed.finished), default=float("nan"))
+
+    @property
+    def end_timestamp(self) -> float:
+        return max((feed.last_timestamp for feed in self._feeds), default=float("nan"))
+
+    def add_market_data(self, trading_pair: str, order_book: OrderBook, records: np.ndarray):
+        """
+        :param trading_pair: the trading pair of the records, used for the replayed trade events
+        :param order_book: the order book to update (e.g. market.order_books[trading_pair])
+        :param records: market data records in chronological order (MARKET_DATA_RECORD_DTYPE array, which can be
+            memory mapped with load_market_data)
+        """
+        self._feeds.append(MarketDataFeed(trading_pair, order_book, records))
+
+    def tick(self, timestamp: float):
+        for feed in self._feeds:
+            feed.replay_until(timestamp)
+
+    def run(self, clock: Clock, end_timestamp: Optional[float] = None):
+        """
+        Advances the back testing clock until the given timestamp, or until the last replayed record.
+        """
+        if clock.clock_mode is not ClockMode.BACKTEST:
+            raise ValueError("The backtest replay engine requires a clock in back testing mode.")
+        if len(clock.child_iterators) == 0 or clock.child_iterators[0] is not self:
+            raise ValueError("The backtest replay engine must be the first iterator of the clock.")
+        end_timestamp = self.end_timestamp if end_timestamp is None else end_timestamp
+        self.logger().info(f"Replaying market data until {end_timestamp}.")
+        clock.backtest_til(end_timestamp)
@@ -0,0 +1,54 @@
+from enum import IntEnum
+
+import numpy as np
+
+# Market data is stored as a sequence of records (one per order book level or trade) in chronological order.
+# For order book levels the side is the book side, for trades it is the side of the taker (BID for buys).
+MARKET_DATA_RECORD_DTYPE = np.dtype([
+    ("timestamp", np.float64),
+    ("update_id", np.int64),
+    ("record_type", np.uint8),
+    ("side", np.uint8),
+    ("price", np.float64),
+    ("amount", np.float64),
+])
+
+
+class MarketDataRecordType(IntEnum):
+    SNAPSHOT = 1
+    DIFF = 2
+    TRADE = 3
+
+
+class MarketDataSide(IntEnum):
+    BID = 0
+    ASK = 1
+
+
+def create_market_data_records(size: int) -> np.ndarray:
+    return np.zeros(size, dtype=MARKET_DATA_RECORD_DTYPE)
+
+
+def validate_market_data_records(records: np.ndarray):
+    if records.dtype != MARKET_DATA_RECORD_DTYPE:
+        raise ValueError(f"Invalid market data records type {records.dtype} (expected {MARKET_DATA_RECORD_DTYPE}).")
+    if records.ndim != 1:
+        raise ValueError(f"Market data records must be a one dimensional array (got {records.ndim} dimensions).")
+
+
+def save_market_data(path: str, records: np.ndarray):
+    """
+    Saves market data records to a .npy file.
+    """
+    validate_market_data_records(records)
+    np.save(path, records, allow_pickle=False)
+
+
+def load_market_data(path: str, memory_map: bool = True) -> np.ndarray:
+    """
+    Loads market data records saved with save_market_data. By default the file is memory mapped, so only the records
+    being replayed are read from disk.
+    """
+    records = np.load(path, mmap_mode="r" if memory_map else None, allow_pickle=False)
+    validate_market_data_records(records)
+    return records
@@ -0,0 +1,484 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.backtesting.market_data import MarketDataRecordType, MarketDataSide, create_market_data_records
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.logger import HummingbotLogger
+
+# Recorded market data files start with FILE_MAGIC, followed by blocks of messages. Each block starts with the length
+# of its JSON header (4 bytes, little endian) and the header, which lists the file trading pairs dictionary, the first
+# update id of each trading pair in the block and the columns stored after the header (aligned to 8 bytes):
+# - one row per message: receive timestamp, update id (delta from the previous message of the same trading pair),
+#   number of levels, trading pair index and message type
+# - one row per level (one level per trade): price, amount and side (for trades, the side of the taker)
+FILE_MAGIC = b"HBMKTREC"
+FILE_EXTENSION = ".hbmd"
+COLUMN_ALIGNMENT = 8
+
+RecordedBlock = NamedTuple("RecordedBlock", [("trading_pairs", List[str]),
+                                             ("first_update_ids", Dict[int, int]),
+                                             ("columns", Dict[str, np.ndarray])])
+
+
+def _padding(size: int) -> int:
+    return -size % COLUMN_ALIGNMENT
+
+
+class MarketDataRecorder:
+    """
+    Records order book messages (snapshots, diffs and trades) to rolling files in a compact binary format, that can
+    be read back with RecordedMarketDataReader.
+
+    Recording a message only queues it: the messages are encoded and written in batches by a writer thread, off the
+    event loop. If the writer falls behind and the queue is full the messages are dropped (and counted).
+    """
+    DROP_WARNING_INTERVAL = 60.0
+    _logger: Optional[HummingbotLogger] = None
+    _STOP = object()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 directory: str,
+                 file_prefix: str = "market_data",
+                 max_file_size: int = 64 * 1024 * 1024,
+                 max_file_duration: float = 3600.0,
+                 flush_interval: float = 1.0,
+                 max_block_messages: int = 10_000,
+                 max_queue_size: int = 100_000):
+        """
+        :param directory: the directory of the recorded files (created if it doesn't exist)
+        :param file_prefix: the prefix of the recorded file names
+        :param max_file_size: a new file is started when the current one reaches this size (in bytes)
+        :param max_file_duration: a new file is started when the current one spans this number of seconds
+        :param flush_interval: the maximum time (in seconds) a recorded message waits before being written
+        :param max_block_messages: the maximum number of messages written at once
+        :param max_queue_size: the maximum number of messages waiting to be written
+        """
+        self._directory = directory
+        self._file_prefix = file_prefix
+        self._max_file_size = max_file_size
+        self._max_file_duration = max_file_duration
+        self._flush_interval = flush_interval
+        self._max_block_messages = max_block_messages
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._writer_thread: Optional[threading.Thread] = None
+        self._recorded_messages = 0
+        self._dropped_messages = 0
+        self._last_drop_warning = 0.0
+
+        # Writer thread state
+        self._file = None
+        self._file_paths: List[str] = []
+        self._file_start_timestamp = 0.0
+        self._trading_pairs: Dict[str, int] = {}
+        self._last_update_ids: Dict[int, int] = {}
+        self._written_messages = 0
+        self._written_levels = 0
+        self._reset_block()
+
+    @property
+    def recorded_messages(self) -> int:
+        return self._recorded_messages
+
+    @property
+    def dropped_messages(self) -> int:
+        return self._dropped_messages
+
+    @property
+    def pending_messages(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def written_messages(self) -> int:
+        return self._written_messages
+
+    @property
+    def written_levels(self) -> int:
+        return self._written_levels
+
+    @property
+    def file_paths(self) -> List[str]:
+        """
+        The files written so far, in recording order
+        """
+        return list(self._file_paths)
+
+    @property
+    def is_running(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return
+        os.makedirs(self._directory, exist_ok=True)
+        self._writer_thread = threading.Thread(target=self._write_loop, name="MarketDataRecorder", daemon=True)
+        self._writer_thread.start()
+
+    def stop(self, timeout: Optional[float] = 10.0):
+        """
+        Writes the messages already recorded, closes the current file and stops the writer thread.
+        """
+        if self._writer_thread is None:
+            return
+        self._queue.put(self._STOP)
+        self._writer_thread.join(timeout)
+        self._writer_thread = None
+
+    def record(self, message: OrderBookMessage, timestamp: Optional[float] = None):
+        """
+        Queues an order book message to be written.
+
+        :param message: the snapshot, diff or trade message
+        :param timestamp: the time the message was received, the current time by default
+        """
+        try:
+            self._queue.put_nowait((time.time() if timestamp is None else timestamp, message))
+            self._recorded_messages += 1
+        except queue.Full:
+            self._dropped_messages += 1
+            now = time.time()
+            if now - self._last_drop_warning >= self.DROP_WARNING_INTERVAL:
+                self._last_drop_warning = now
+                self.logger().warning(f"The market data recorder queue is full, {self._dropped_messages} messages "
+                                      f"dropped so far.")
+
+    def _write_loop(self):
+        next_flush = time.monotonic() + self._flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, next_flush - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is self._STOP:
+                break
+            if item is not None:
+                try:
+                    self._add_message(*item)
+                except Exception:
+                    self.logger().error(f"Unexpected error recording market data message {item[1]}.", exc_info=True)
+            if len(self._block_pairs) >= self._max_block_messages or time.monotonic() >= next_flush:
+                self._flush()
+                next_flush = time.monotonic() + self._flush_interval
+        self._flush()
+        self._close_file()
+
+    def _reset_block(self):
+        self._block_timestamps: List[float] = []
+        self._block_update_ids: List[int] = []
+        self._block_levels: List[int] = []
+        self._block_pairs: List[int] = []
+        self._block_message_types: List[int] = []
+        self._block_prices: List[float] = []
+        self._block_amounts: List[float] = []
+        self._block_sides: List[int] = []
+
+    def _add_message(self, timestamp: float, message: OrderBookMessage):
+        if len(self._block_pairs) == 0 and self._file is not None and (
+                os.path.getsize(self._file_paths[-1]) >= self._max_file_size
+                or timestamp - self._file_start_timestamp >= self._max_file_duration):
+            self._close_file()
+        if self._file is None:
+            self._open_file(timestamp)
+
+        trading_pair = message.trading_pair
+        pair = self._trading_pairs.setdefault(trading_pair, len(self._trading_pairs))
+        # The levels are converted before updating the block, so a malformed message doesn't leave it inconsistent
+        if message.type is OrderBookMessageType.TRADE:
+            prices = [float(message.content["price"])]
+            amounts = [float(message.content["amount"])]
+            sides = [MarketDataSide.ASK
+                     if message.content["trade_type"] == float(TradeType.SELL.value)
+                     else MarketDataSide.BID]
+            # Trades don't have an update id, they are recorded with the last update id of the order book
+            update_id = self._last_update_ids.get(pair, 0)
+            record_type = MarketDataRecordType.TRADE
+        else:
+            if message.has_raw_levels:
+                bids = [(price, amount) for price, amount, *_ in message.raw_bids]
+                asks = [(price, amount) for price, amount, *_ in message.raw_asks]
+            else:
+                bids = [(row.price, row.amount) for row in message.bids]
+                asks = [(row.price, row.amount) for row in message.asks]
+            prices = [float(price) for price, _ in bids + asks]
+            amounts = [float(amount) for _, amount in bids + asks]
+            sides = [MarketDataSide.BID] * len(bids) + [MarketDataSide.ASK] * len(asks)
+            update_id = int(message.update_id)
+            record_type = (MarketDataRecordType.SNAPSHOT
+                           if message.type is OrderBookMessageType.SNAPSHOT
+                           else MarketDataRecordType.DIFF)
+        self._last_update_ids[pair] = update_id
+        self._block_timestamps.append(timestamp)
+        self._block_update_ids.append(update_id)
+        self._block_levels.append(len(prices))
+        self._block_pairs.append(pair)
+        self._block_message_types.append(record_type)
+        self._block_prices.extend(prices)
+        self._block_amounts.extend(amounts)
+        self._block_sides.extend(sides)
+
+    def _flush(self):
+        if len(self._block_pairs) == 0:
+            return
+        try:
+            self._file.write(self._encode_block())
+            self._file.flush()
+            self._written_messages += len(self._block_pairs)
+            self._written_levels += len(self._block_prices)
+        except Exception:
+            self.logger().error(f"Error writing {len(self._block_pairs)} market data messages to "
+                                f"{self._file_paths[-1]}.", exc_info=True)
+        self._reset_block()
+
+    def _encode_block(self) -> bytes:
+        pairs = np.array(self._block_pairs, dtype="<u2")
+        update_ids = np.array(self._block_update_ids, dtype=np.int64)
+        update_id_deltas = np.empty_like(update_ids)
+        first_update_ids = {}
+        for pair in np.unique(pairs).tolist():
+            mask = pairs == pair
+            pair_update_ids = update_ids[mask]
+            first_update_ids[pair] = int(pair_update_ids[0])
+            update_id_deltas[mask] = np.diff(pair_update_ids, prepend=pair_update_ids[0])
+        int32_info = np.iinfo(np.int32)
+        if int32_info.min <= update_id_deltas.min() and update_id_deltas.max() <= int32_info.max:
+            update_id_deltas = update_id_deltas.astype("<i4")
+
+        columns = [
+            ("timestamp", np.array(self._block_timestamps, dtype="<f8")),
+            ("update_id", update_id_deltas),
+            ("levels", np.array(self._block_levels, dtype="<u4")),
+            ("pair", pairs),
+            ("message_type", np.array(self._block_message_types, dtype="u1")),
+            ("price", np.array(self._block_prices, dtype="<f8")),
+            ("amount", np.array(self._block_amounts, dtype="<f8")),
+            ("side", np.array(self._block_sides, dtype="u1")),
+        ]
+        header = json.dumps({
+            "trading_pairs": list(self._trading_pairs),
+            "first_update_ids": list(first_update_ids.items()),
+            "columns": [[name, column.dtype.str, len(column)] for name, column in columns],
+        }).encode()
+        header += b" " * _padding(4 + len(header))
+        chunks = [len(header).to_bytes(4, "little"), header]
+        for _, column in columns:
+            data = column.tobytes()
+            chunks.append(data)
+            chunks.append(b"\0" * _padding(len(data)))
+        return b"".join(chunks)
+
+    def _open_file(self, timestamp: float):
+        file_name = (f"{self._file_prefix}_{time.strftime('%Y%m%d-%H%M%S', time.gmtime(timestamp))}_"
+                     f"{len(self._file_paths):06d}{FILE_EXTENSION}")
+        path = os.path.join(self._directory, file_name)
+        self._file = open(path, "wb")
+        self._file.write(FILE_MAGIC)
+        self._file.flush()
+        self._file_paths.append(path)
+        self._file_start_timestamp = timestamp
+        # Each file has its own trading pairs dictionary and update ids, so it can be read on its own
+        self._trading_pairs = {}
+        self._last_update_ids = {}
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RecordedMarketDataFile:
+    """
+    A file written by MarketDataRecorder. The file is memory mapped, the columns of the blocks are views of it.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        if os.path.getsize(path) < len(FILE_MAGIC):
+            raise ValueError(f"{path} is not a recorded market data file.")
+        self._data = np.memmap(path, dtype=np.uint8, mode="r")
+        if self._data[:len(FILE_MAGIC)].tobytes() != FILE_MAGIC:
+            raise ValueError(f"{path} is not a recorded market data file.")
+        self._blocks: List[RecordedBlock] = self._read_blocks()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def blocks(self) -> List[RecordedBlock]:
+        return self._blocks
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return list(self._blocks[-1].trading_pairs) if len(self._blocks) > 0 else []
+
+    def _read_blocks(self) -> List[RecordedBlock]:
+        blocks = []
+        position = len(FILE_MAGIC)
+        size = len(self._data)
+        while position + 4 <= size:
+            header_size = int.from_bytes(self._data[position:position + 4].tobytes(), "little")
+            position += 4
+            if position + header_size > size:
+                break
+            header = json.loads(self._data[position:position + header_size].tobytes())
+            position += header_size
+            columns = {}
+            for name, dtype, length in header["columns"]:
+                dtype = np.dtype(dtype)
+                column_size = dtype.itemsize * length
+                if position + column_size > size:
+                    # The last block is incomplete (the file is being written, or the recorder was interrupted)
+                    return blocks
+                columns[name] = self._data[position:position + column_size].view(dtype)
+                position += column_size + _padding(column_size)
+            blocks.append(RecordedBlock(header["trading_pairs"],
+                                        {pair: update_id for pair, update_id in header["first_update_ids"]},
+                                        columns))
+        return blocks
+
+
+def _decode_update_ids(block: RecordedBlock) -> np.ndarray:
+    columns = block.columns
+    update_ids = np.empty(len(columns["pair"]), dtype=np.int64)
+    for pair, first_update_id in block.first_update_ids.items():
+        mask = columns["pair"] == pair
+        update_ids[mask] = first_update_id + np.cumsum(columns["update_id"][mask], dtype=np.int64)
+    return update_ids
+
+
+class RecordedMarketDataReader:
+    """
+    Reads the files written by MarketDataRecorder, either as order book messages or as market data records batches
+    that can be replayed with BacktestReplayEngine.
+    """
+
+    def __init__(self, paths: List[str]):
+        self._files = [RecordedMarketDataFile(path) for path in paths]
+
+    @classmethod
+    def from_directory(cls, directory: str, file_prefix: str = "market_data") -> "RecordedMarketDataReader":
+        """
+        Reads all the files of a directory recorded with the given file prefix, in recording order.
+        """
+        file_names = sorted(file_name for file_name in os.listdir(directory)
+                            if file_name.startswith(f"{file_prefix}_") and file_name.endswith(FILE_EXTENSION))
+        return cls([os.path.join(directory, file_name) for file_name in file_names])
+
+    @property
+    def files(self) -> List[RecordedMarketDataFile]:
+        return self._files
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        trading_pairs = {}
+        for recorded_file in self._files:
+            trading_pairs.update(dict.fromkeys(recorded_file.trading_pairs))
+        return list(trading_pairs)
+
+    def iter_batches(self, trading_pair: Optional[str] = None) -> Iterator[Tuple[str, np.ndarray]]:
+        """
+        Yields the recorded messages of each block as market data records (see market_data.py), one array per trading
+        pair and block. The batches of each trading pair are in chronological order.
+
+        :param trading_pair: if set, only the batches of this trading pair are read
+        """
+        for recorded_file in self._files:
+            for block in recorded_file.blocks:
+                columns = block.columns
+                update_ids = None
+                for pair, pair_trading_pair in enumerate(block.trading_pairs):
+                    if pair not in block.first_update_ids or trading_pair not in (None, pair_trading_pair):
+                        continue
+                    if update_ids is None:
+                        update_ids = _decode_update_ids(block)
+                    message_mask = columns["pair"] == pair
+                    level_mask = np.repeat(message_mask, columns["levels"])
+                    levels = columns["levels"][message_mask]
+                    records = create_market_data_records(int(levels.sum()))
+                    records["timestamp"] = np.repeat(columns["timestamp"][message_mask], levels)
+                    records["update_id"] = np.repeat(update_ids[message_mask], levels)
+                    records["record_type"] = np.repeat(columns["message_type"][message_mask], levels)
+                    records["side"] = columns["side"][level_mask]
+                    records["price"] = columns["price"][level_mask]
+                    records["amount"] = columns["amount"][level_mask]
+                    yield pair_trading_pair, records
+
+    def market_data(self, trading_pair: str) -> np.ndarray:
+        """
+        Returns all the recorded market data records of a trading pair, to be replayed with
+        BacktestReplayEngine.add_market_data
+        """
+        batches = [records for _, records in self.iter_batches(trading_pair)]
+        return np.concatenate(batches) if len(batches) > 0 else create_market_data_records(0)
+
+    def iter_messages(self, trading_pair: Optional[str] = None) -> Iterator[OrderBookMessage]:
+        """
+        Yields the recorded messages in recording order, timestamped with the time they were received. Prices and
+        amounts are floats, and trade messages don't have trade ids (they are not recorded).
+
+        :param trading_pair: if set, only the messages of this trading pair are read
+        """
+        for recorded_file in self._files:
+            for block in recorded_file.blocks:
+                columns = block.columns
+                update_ids = _decode_update_ids(block).tolist()
+                level_ends = np.cumsum(columns["levels"], dtype=np.int64).tolist()
+                prices = columns["price"].tolist()
+                amounts = columns["amount"].tolist()
+                sides = columns["side"].tolist()
+                level_start = 0
+                for timestamp, update_id, level_end, pair, message_type in zip(columns["timestamp"].tolist(),
+                                                                               update_ids,
+                                                                               level_ends,
+                                                                               columns["pair"].tolist(),
+                                                                               columns["message_type"].tolist()):
+                    message_trading_pair = block.trading_pairs[pair]
+                    if trading_pair in (None, message_trading_pair):
+                        yield self._message(message_trading_pair,
+                                            timestamp,
+                                            update_id,
+                                            message_type,
+                                            prices[level_start:level_end],
+                                            amounts[level_start:level_end],
+                                            sides[level_start:level_end])
+                    level_start = level_end
+
+    @staticmethod
+    def _message(trading_pair: str,
+                 timestamp: float,
+                 update_id: int,
+                 message_type: int,
+                 prices: List[float],
+                 amounts: List[float],
+                 sides: List[int]) -> OrderBookMessage:
+        if message_type == MarketDataRecordType.TRADE:
+            return OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": trading_pair,
+                "trade_type": float(TradeType.BUY.value if sides[0] == MarketDataSide.BID else TradeType.SELL.value),
+                "price": prices[0],
+                "amount": amounts[0],
+            }, timestamp=timestamp)
+        return OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT if message_type == MarketDataRecordType.SNAPSHOT else OrderBookMessageType.DIFF,
+            {
+                "trading_pair": trading_pair,
+                "update_id": update_id,
+                "bids": [[price, amount] for price, amount, side in zip(prices, amounts, sides)
+                         if side == MarketDataSide.BID],
+                "asks": [[price, amount] for price, amount, side in zip(prices, amounts, sides)
+                         if side == MarketDataSide.ASK],
+            },
+            timestamp=timestamp)
@@ -10,3 +10,10 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        object _wake_up_future
+        bint _wake_up_requested
+        double _last_slow_tick_warning
+
+    cdef c_wake_up(self)
+    cdef double c_next_wake_up_time(self, list iterators, double now, double next_tick_time)
+    cdef c_tick_child_iterator(self, object child_iterator, bint real_time)
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import Dict, List
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
@@ -12,6 +12,19 @@ from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
+# Tolerance when comparing the clock time with the next tick of iterators with their own tick interval
+cdef double TICK_TIME_TOLERANCE = 1e-6
+# Minimum time between two warnings about iterators ticking slower than their tick interval
+cdef double SLOW_TICK_WARNING_INTERVAL = 60.0
+
+
+cdef inline bint c_is_tick_due(TimeIterator child_iterator, double timestamp, bint clock_tick):
+    if child_iterator._tick_requested:
+        return True
+    if child_iterator._tick_interval > 0:
+        return timestamp >= child_iterator._next_tick_timestamp - TICK_TIME_TOLERANCE
+    return clock_tick
+
 
 cdef class Clock:
     @classmethod
@@ -36,6 +49,9 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._wake_up_future = None
+        self._wake_up_requested = False
+        self._last_slow_tick_warning = -SLOW_TICK_WARNING_INTERVAL
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +73,13 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def tick_statistics(self) -> Dict[TimeIterator, "TickStatistics"]:
+        """
+        Tick duration and lag statistics of each child iterator (see TimeIterator.tick_statistics).
+        """
+        return {iterator: iterator.tick_statistics for iterator in self._child_iterators}
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -86,10 +109,19 @@ cdef class Clock:
         await self.run_til(float("nan"))
 
     async def run_til(self, timestamp: float):
+        """
+        Ticks the child iterators in real time until the given timestamp.
+        Iterators without a tick interval tick every tick_size seconds, in lockstep. Iterators with their own tick
+        interval (which can be shorter than tick_size) tick when their interval elapses, and iterators requesting a
+        tick (see TimeIterator.request_tick) wake the clock up and tick immediately.
+        """
         cdef:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double next_wake_up_time
+            bint clock_tick
+            bint woken_up
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -101,33 +133,112 @@ cdef class Clock:
                 child_iterator.c_start(self, self._current_tick)
             self._started = True
 
+        next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
         try:
             while True:
                 now = time.time()
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
-                self._current_tick = next_tick_time
+                # Sleep until the next tick of the clock or of any iterator, unless a tick was requested
+                woken_up = self._wake_up_requested
+                if not woken_up:
+                    next_wake_up_time = self.c_next_wake_up_time(self._current_context, now, next_tick_time)
+                    woken_up = await self._sleep(next_wake_up_time - now)
+                self._wake_up_requested = False
+                if woken_up:
+                    self._current_tick = max(time.time(), self._current_tick)
+                else:
+                    self._current_tick = next_wake_up_time
+                clock_tick = self._current_tick >= next_tick_time
 
-                # Run through all the child iterators.
+                # Run through the child iterators that are due.
                 for ci in self._current_context:
                     child_iterator = ci
+                    if not c_is_tick_due(child_iterator, self._current_tick, clock_tick):
+                        continue
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_child_iterator(child_iterator, True)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+
+                if clock_tick:
+                    next_tick_time = ((time.time() // self._tick_size) + 1) * self._tick_size
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    async def _sleep(self, delay: float) -> bool:
+        """
+        Sleeps for the given delay, or until an iterator requests a tick.
+
+        :return: True if the clock was woken up by an iterator
+        """
+        loop = asyncio.get_event_loop()
+        self._wake_up_future = loop.create_future()
+        timer = loop.call_later(delay, self._end_sleep, self._wake_up_future)
+        try:
+            return await self._wake_up_future
+        finally:
+            timer.cancel()
+            self._wake_up_future = None
+
+    @staticmethod
+    def _end_sleep(wake_up_future: asyncio.Future):
+        if not wake_up_future.done():
+            wake_up_future.set_result(False)
+
+    cdef c_wake_up(self):
+        self._wake_up_requested = True
+        if self._wake_up_future is not None and not self._wake_up_future.done():
+            self._wake_up_future.set_result(True)
+
+    cdef double c_next_wake_up_time(self, list iterators, double now, double next_tick_time):
+        cdef:
+            TimeIterator child_iterator
+            double next_wake_up_time = next_tick_time
+        for ci in iterators:
+            child_iterator = ci
+            if child_iterator._tick_interval > 0 and child_iterator._next_tick_timestamp < next_wake_up_time:
+                next_wake_up_time = child_iterator._next_tick_timestamp
+        # Iterators that just started, or whose tick is overdue, tick right away
+        return max(next_wake_up_time, now)
+
+    cdef c_tick_child_iterator(self, object ci, bint real_time):
+        cdef:
+            TimeIterator child_iterator = ci
+            double lag = time.time() - self._current_tick if real_time else 0
+            double start = time.perf_counter()
+            double duration
+            double interval = child_iterator._tick_interval if child_iterator._tick_interval > 0 else self._tick_size
+
+        child_iterator._tick_requested = False
+        if child_iterator._tick_interval > 0:
+            child_iterator._next_tick_timestamp = (
+                ((self._current_tick // child_iterator._tick_interval) + 1) * child_iterator._tick_interval
+            )
+        try:
+            child_iterator.c_tick(self._current_tick)
+        finally:
+            duration = time.perf_counter() - start
+            child_iterator.c_record_tick(duration, lag if lag > 0 else 0)
+            if (real_time
+                    and duration > interval
+                    and start - self._last_slow_tick_warning >= SLOW_TICK_WARNING_INTERVAL):
+                self._last_slow_tick_warning = start
+                self.logger().warning(f"{child_iterator.__class__.__name__} tick took {duration:.3f} seconds, "
+                                      f"longer than its tick interval ({interval} seconds).")
+
     def backtest_til(self, timestamp: float):
+        """
+        Ticks the child iterators until the given timestamp, advancing the time by tick_size on each clock tick.
+        Iterators with their own tick interval tick on the first clock tick after their interval elapses, and
+        iterators requesting a tick are ticked on the next clock tick.
+        """
         cdef TimeIterator child_iterator
 
         if not self._started:
@@ -141,8 +252,10 @@ cdef class Clock:
                 self._current_tick += self._tick_size
                 for ci in self._child_iterators:
                     child_iterator = ci
+                    if not c_is_tick_due(child_iterator, self._current_tick, True):
+                        continue
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_child_iterator(child_iterator, False)
                     except StopIteration:
                         raise
                     except Exception:
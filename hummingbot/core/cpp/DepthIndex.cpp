@@ -0,0 +1,265 @@
+#include "DepthIndex.h"
+
+DepthIndexLevel::DepthIndexLevel() {
+    this->found = false;
+    this->price = this->amount = 0;
+    this->cumulativeAmount = this->cumulativeQuote = 0;
+}
+
+DepthIndex::DepthIndex() {
+    this->root = -1;
+    this->randomState = 2463534242u;
+}
+
+uint32_t DepthIndex::nextPriority() {
+    // xorshift32
+    this->randomState ^= this->randomState << 13;
+    this->randomState ^= this->randomState >> 17;
+    this->randomState ^= this->randomState << 5;
+    return this->randomState;
+}
+
+int DepthIndex::newNode(double key, double price, double amount) {
+    int node;
+    if (!this->freeNodes.empty()) {
+        node = this->freeNodes.back();
+        this->freeNodes.pop_back();
+    } else {
+        node = (int) this->nodes.size();
+        this->nodes.push_back(Node());
+    }
+    Node &n = this->nodes[node];
+    n.key = key;
+    n.price = price;
+    n.amount = n.sumAmount = amount;
+    n.quote = n.sumQuote = amount * price;
+    n.priority = this->nextPriority();
+    n.left = n.right = -1;
+    return node;
+}
+
+void DepthIndex::freeSubtree(int node) {
+    std::vector<int> pending;
+    if (node >= 0) {
+        pending.push_back(node);
+    }
+    while (!pending.empty()) {
+        int current = pending.back();
+        pending.pop_back();
+        if (this->nodes[current].left >= 0) {
+            pending.push_back(this->nodes[current].left);
+        }
+        if (this->nodes[current].right >= 0) {
+            pending.push_back(this->nodes[current].right);
+        }
+        this->freeNodes.push_back(current);
+    }
+}
+
+void DepthIndex::update(int node) {
+    Node &n = this->nodes[node];
+    n.sumAmount = n.amount;
+    n.sumQuote = n.quote;
+    if (n.left >= 0) {
+        n.sumAmount += this->nodes[n.left].sumAmount;
+        n.sumQuote += this->nodes[n.left].sumQuote;
+    }
+    if (n.right >= 0) {
+        n.sumAmount += this->nodes[n.right].sumAmount;
+        n.sumQuote += this->nodes[n.right].sumQuote;
+    }
+}
+
+void DepthIndex::updateSubtree(int node) {
+    if (node < 0) {
+        return;
+    }
+    this->updateSubtree(this->nodes[node].left);
+    this->updateSubtree(this->nodes[node].right);
+    this->update(node);
+}
+
+// Splits the subtree into the keys lower than the given key (or lower or equal if inclusive) and the rest.
+void DepthIndex::split(int node, double key, bool inclusive, int &left, int &right) {
+    if (node < 0) {
+        left = right = -1;
+        return;
+    }
+    Node &n = this->nodes[node];
+    if (inclusive ? n.key <= key : n.key < key) {
+        this->split(n.right, key, inclusive, n.right, right);
+        left = node;
+    } else {
+        this->split(n.left, key, inclusive, left, n.left);
+        right = node;
+    }
+    this->update(node);
+}
+
+// Merges two subtrees, all the keys in the left one being lower than the keys in the right one.
+int DepthIndex::merge(int left, int right) {
+    if (left < 0) {
+        return right;
+    }
+    if (right < 0) {
+        return left;
+    }
+    if (this->nodes[left].priority > this->nodes[right].priority) {
+        int merged = this->merge(this->nodes[left].right, right);
+        this->nodes[left].right = merged;
+        this->update(left);
+        return left;
+    }
+    int merged = this->merge(left, this->nodes[right].left);
+    this->nodes[right].left = merged;
+    this->update(right);
+    return right;
+}
+
+void DepthIndex::clear() {
+    this->nodes.clear();
+    this->freeNodes.clear();
+    this->root = -1;
+}
+
+void DepthIndex::build(const std::vector<double> &keys,
+                       const std::vector<double> &prices,
+                       const std::vector<double> &amounts) {
+    std::vector<int> rightSpine;
+    this->clear();
+    this->nodes.reserve(keys.size());
+    // Cartesian tree construction over the sorted keys, linear in the number of levels
+    for (size_t i = 0; i < keys.size(); i++) {
+        int node = this->newNode(keys[i], prices[i], amounts[i]);
+        int last = -1;
+        while (!rightSpine.empty() && this->nodes[rightSpine.back()].priority < this->nodes[node].priority) {
+            last = rightSpine.back();
+            rightSpine.pop_back();
+        }
+        this->nodes[node].left = last;
+        if (!rightSpine.empty()) {
+            this->nodes[rightSpine.back()].right = node;
+        }
+        rightSpine.push_back(node);
+    }
+    this->root = rightSpine.empty() ? -1 : rightSpine.front();
+    this->updateSubtree(this->root);
+}
+
+void DepthIndex::set(double key, double price, double amount) {
+    int left, middle, right;
+    this->split(this->root, key, false, left, right);
+    this->split(right, key, true, middle, right);
+    if (middle >= 0) {
+        Node &n = this->nodes[middle];
+        n.price = price;
+        n.amount = amount;
+        n.quote = amount * price;
+        this->update(middle);
+    } else {
+        middle = this->newNode(key, price, amount);
+    }
+    this->root = this->merge(this->merge(left, middle), right);
+}
+
+void DepthIndex::erase(double key) {
+    int left, middle, right;
+    this->split(this->root, key, false, left, right);
+    this->split(right, key, true, middle, right);
+    this->freeSubtree(middle);
+    this->root = this->merge(left, right);
+}
+
+void DepthIndex::eraseBefore(double key) {
+    int left, right;
+    this->split(this->root, key, false, left, right);
+    this->freeSubtree(left);
+    this->root = right;
+}
+
+size_t DepthIndex::size() const {
+    return this->nodes.size() - this->freeNodes.size();
+}
+
+double DepthIndex::totalAmount() const {
+    return this->root >= 0 ? this->nodes[this->root].sumAmount : 0;
+}
+
+double DepthIndex::totalQuote() const {
+    return this->root >= 0 ? this->nodes[this->root].sumQuote : 0;
+}
+
+DepthIndexLevel DepthIndex::findByAmount(double amount) const {
+    DepthIndexLevel result;
+    int node = this->root;
+    while (node >= 0) {
+        const Node &n = this->nodes[node];
+        if (n.left >= 0 && result.cumulativeAmount + this->nodes[n.left].sumAmount >= amount) {
+            node = n.left;
+            continue;
+        }
+        if (n.left >= 0) {
+            result.cumulativeAmount += this->nodes[n.left].sumAmount;
+            result.cumulativeQuote += this->nodes[n.left].sumQuote;
+        }
+        if (result.cumulativeAmount + n.amount >= amount) {
+            result.found = true;
+            result.price = n.price;
+            result.amount = n.amount;
+            return result;
+        }
+        result.cumulativeAmount += n.amount;
+        result.cumulativeQuote += n.quote;
+        node = n.right;
+    }
+    return result;
+}
+
+DepthIndexLevel DepthIndex::findByQuote(double quote) const {
+    DepthIndexLevel result;
+    int node = this->root;
+    while (node >= 0) {
+        const Node &n = this->nodes[node];
+        if (n.left >= 0 && result.cumulativeQuote + this->nodes[n.left].sumQuote >= quote) {
+            node = n.left;
+            continue;
+        }
+        if (n.left >= 0) {
+            result.cumulativeAmount += this->nodes[n.left].sumAmount;
+            result.cumulativeQuote += this->nodes[n.left].sumQuote;
+        }
+        if (result.cumulativeQuote + n.quote >= quote) {
+            result.found = true;
+            result.price = n.price;
+            result.amount = n.amount;
+            return result;
+        }
+        result.cumulativeAmount += n.amount;
+        result.cumulativeQuote += n.quote;
+        node = n.right;
+    }
+    return result;
+}
+
+DepthIndexLevel DepthIndex::sumUpTo(double key) const {
+    DepthIndexLevel result;
+    int node = this->root;
+    while (node >= 0) {
+        const Node &n = this->nodes[node];
+        if (n.key <= key) {
+            if (n.left >= 0) {
+                result.cumulativeAmount += this->nodes[n.left].sumAmount;
+                result.cumulativeQuote += this->nodes[n.left].sumQuote;
+            }
+            result.cumulativeAmount += n.amount;
+            result.cumulativeQuote += n.quote;
+            result.found = true;
+            result.price = n.price;
+            result.amount = n.amount;
+            node = n.right;
+        } else {
+            node = n.left;
+        }
+    }
+    return result;
+}
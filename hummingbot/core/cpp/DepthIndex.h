@@ -0,0 +1,74 @@
+#ifndef _DEPTH_INDEX_H
+#define _DEPTH_INDEX_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <vector>
+
+// Result of a DepthIndex query.
+// For findByAmount / findByQuote: the level where the cumulative depth reaches the target, with the cumulative
+// amount and quote volume of the levels before it. If the target is deeper than the book, found is false and the
+// cumulative values are the totals of the book.
+// For sumUpTo: the last level with a key lower or equal than the queried key, with the cumulative amount and quote
+// volume up to and including that level.
+class DepthIndexLevel {
+    public:
+        bool found;
+        double price;
+        double amount;
+        double cumulativeAmount;
+        double cumulativeQuote;
+
+        DepthIndexLevel();
+};
+
+// Cumulative depth index of one side of an order book. Levels are ordered by ascending key (the price for asks, the
+// negated price for bids, so that the top of the book is always first), and kept in a treap where every node holds
+// the amount and quote volume of its subtree. Updates and cumulative depth lookups are O(log n).
+class DepthIndex {
+    struct Node {
+        double key;
+        double price;
+        double amount;
+        double quote;
+        double sumAmount;
+        double sumQuote;
+        uint32_t priority;
+        int left;
+        int right;
+    };
+
+    std::vector<Node> nodes;
+    std::vector<int> freeNodes;
+    int root;
+    uint32_t randomState;
+
+    uint32_t nextPriority();
+    int newNode(double key, double price, double amount);
+    void freeSubtree(int node);
+    void update(int node);
+    void split(int node, double key, bool inclusive, int &left, int &right);
+    int merge(int left, int right);
+    void updateSubtree(int node);
+
+    public:
+        DepthIndex();
+
+        void clear();
+        // Replaces the content of the index. The keys must be sorted in ascending order and unique.
+        void build(const std::vector<double> &keys, const std::vector<double> &prices, const std::vector<double> &amounts);
+        void set(double key, double price, double amount);
+        void erase(double key);
+        // Removes every level with a key lower than the given key.
+        void eraseBefore(double key);
+
+        size_t size() const;
+        double totalAmount() const;
+        double totalQuote() const;
+
+        DepthIndexLevel findByAmount(double amount) const;
+        DepthIndexLevel findByQuote(double quote) const;
+        DepthIndexLevel sumUpTo(double key) const;
+};
+
+#endif
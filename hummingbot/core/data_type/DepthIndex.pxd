@@ -0,0 +1,26 @@
+# distutils: language=c++
+
+from libcpp cimport bool
+from libcpp.vector cimport vector
+
+cdef extern from "../cpp/DepthIndex.h":
+    cdef cppclass DepthIndexLevel:
+        bool found
+        double price
+        double amount
+        double cumulativeAmount
+        double cumulativeQuote
+
+    cdef cppclass DepthIndex:
+        DepthIndex()
+        void clear()
+        void build(const vector[double] &keys, const vector[double] &prices, const vector[double] &amounts)
+        void set(double key, double price, double amount)
+        void erase(double key)
+        void eraseBefore(double key)
+        size_t size() const
+        double totalAmount() const
+        double totalQuote() const
+        DepthIndexLevel findByAmount(double amount) const
+        DepthIndexLevel findByQuote(double quote) const
+        DepthIndexLevel sumUpTo(double key) const
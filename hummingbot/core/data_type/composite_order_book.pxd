@@ -1,8 +1,23 @@
 # distutils: language=c++
+from libcpp.vector cimport vector
+cimport numpy as np
+
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef tuple c_fill_snapshot_arrays(self,
+                                      np.ndarray[np.float64_t, ndim=2] bids_array,
+                                      np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, vector[double] volumes)
+    cdef list c_get_volume_for_prices(self, bint is_buy, vector[double] prices)
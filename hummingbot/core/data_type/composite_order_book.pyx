@@ -1,16 +1,20 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from typing import Iterator, List
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from libcpp.set cimport set
 from libcpp.vector cimport vector
+cimport numpy as np
 
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
+NaN = float("nan")
+
 cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
@@ -192,3 +196,141 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    # The native depth walks of OrderBook read the original C++ books directly, so the composite book answers the
+    # depth queries by walking its composite entries instead.
+
+    cdef tuple c_fill_snapshot_arrays(self,
+                                      np.ndarray[np.float64_t, ndim=2] bids_array,
+                                      np.ndarray[np.float64_t, ndim=2] asks_array):
+        cdef:
+            Py_ssize_t bids_count = 0
+            Py_ssize_t asks_count = 0
+
+        for row in self.bid_entries():
+            if bids_count >= bids_array.shape[0]:
+                break
+            bids_array[bids_count, 0] = row.price
+            bids_array[bids_count, 1] = row.amount
+            bids_array[bids_count, 2] = row.update_id
+            bids_count += 1
+        for row in self.ask_entries():
+            if asks_count >= asks_array.shape[0]:
+                break
+            asks_array[asks_count, 0] = row.price
+            asks_array[asks_count, 1] = row.amount
+            asks_array[asks_count, 2] = row.update_id
+            asks_count += 1
+        return bids_count, asks_count
+
+    def simulate_buy(self, amount: float) -> List[OrderBookRow]:
+        return self._simulate_fill(self.ask_entries(), amount)
+
+    def simulate_sell(self, amount: float) -> List[OrderBookRow]:
+        return self._simulate_fill(self.bid_entries(), amount)
+
+    def _simulate_fill(self, entries: Iterator[OrderBookRow], amount: float) -> List[OrderBookRow]:
+        amount_left = amount
+        retval = []
+        for entry in entries:
+            if entry.amount < amount_left:
+                retval.append(entry)
+                amount_left -= entry.amount
+            else:
+                retval.append(OrderBookRow(entry.price, amount_left, entry.update_id))
+                break
+        return retval
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            cumulative_volume += order_book_row.amount
+            if cumulative_volume >= volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+            double incremental_amount
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if total_volume + order_book_row.amount >= volume:
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * order_book_row.price
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
+            total_cost += order_book_row.amount * order_book_row.price
+            total_volume += order_book_row.amount
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            if cumulative_volume >= quote_volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            row_amount = order_book_row.amount
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * order_book_row.price
+            if cumulative_base_amount >= base_amount:
+                break
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if (order_book_row.price > price) if is_buy else (order_book_row.price < price):
+                break
+            cumulative_volume += order_book_row.amount
+            result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if (order_book_row.price > price) if is_buy else (order_book_row.price < price):
+                break
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, vector[double] volumes):
+        return [self.c_get_vwap_for_volume(is_buy, volume) for volume in volumes]
+
+    cdef list c_get_volume_for_prices(self, bint is_buy, vector[double] prices):
+        return [self.c_get_volume_for_price(is_buy, price) for price in prices]
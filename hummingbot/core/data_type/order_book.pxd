@@ -3,6 +3,7 @@
 from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
+from hummingbot.core.data_type.DepthIndex cimport DepthIndex
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.pubsub cimport PubSub
 from .order_book_query_result cimport OrderBookQueryResult
@@ -20,20 +21,40 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef DepthIndex *_bid_depth_index
+    cdef DepthIndex *_ask_depth_index
+    cdef object _snapshot_bids_buffer
+    cdef object _snapshot_asks_buffer
+    cdef double _top_of_book_band
+    cdef double _top_of_book_volume_threshold
+    cdef double _notified_best_bid
+    cdef double _notified_best_ask
+    cdef double _notified_bid_band_volume
+    cdef double _notified_ask_band_volume
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_rebuild_depth_index(self)
+    cdef c_update_depth_index(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks)
+    cdef c_check_top_of_book_change(self, int64_t update_id)
+    cdef double c_get_band_volume(self, bint is_bid)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef tuple c_fill_snapshot_arrays(self,
+                                      np.ndarray[np.float64_t, ndim=2] bids_array,
+                                      np.ndarray[np.float64_t, ndim=2] asks_array)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef double c_get_amount_at_price(self, bint is_bid, double price)
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, vector[double] volumes)
+    cdef list c_get_volume_for_prices(self, bint is_buy, vector[double] prices)
@@ -1,5 +1,5 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/DepthIndex.cpp']
 import bisect
 import logging
 import time
@@ -8,6 +8,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
 )
 
@@ -20,25 +21,83 @@ from cython.operator cimport(
     dereference as deref,
     postincrement as inc,
 )
+from libc.math cimport isnan
+from libc.stdlib cimport strtod
+from libcpp.algorithm cimport sort
+from libcpp.utility cimport pair
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.DepthIndex cimport DepthIndexLevel
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
+from hummingbot.core.pubsub cimport EventsIterator
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookTopOfBookChangeEvent,
     OrderBookTradeEvent
 )
 
 cimport numpy as np
 
+cdef extern from "Python.h":
+    const char* PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t *size) except NULL
+
 ob_logger = None
 NaN = float("nan")
 
+cdef int64_t TOP_OF_BOOK_CHANGE_EVENT_TAG = OrderBookEvent.TopOfBookChangeEvent.value
+
+
+cdef inline double c_parse_level_value(object value) except? -1:
+    # Exchanges send prices and amounts as decimal strings. They are parsed from the string buffer without creating
+    # an intermediate float object, anything else (numbers, or strings strtod does not fully consume) goes through
+    # float().
+    cdef:
+        const char *start
+        char *end
+        Py_ssize_t size
+        double result
+    if isinstance(value, str):
+        start = PyUnicode_AsUTF8AndSize(value, &size)
+        result = strtod(start, &end)
+        if size > 0 and end == start + size:
+            return result
+    return float(value)
+
+
+cdef inline bint c_price_changed(double previous_price, double price):
+    return not (previous_price == price or (isnan(previous_price) and isnan(price)))
+
+
+cdef inline bint c_volume_changed(double previous_volume, double volume, double threshold):
+    if isnan(previous_volume):
+        return True
+    if previous_volume == 0:
+        return volume != 0
+    return abs(volume - previous_volume) > threshold * previous_volume
+
+
+cdef c_parse_raw_levels(object levels, int64_t update_id, vector[OrderBookEntry] *entries):
+    cdef:
+        np.ndarray[np.float64_t, ndim=2] levels_array
+        Py_ssize_t i
+
+    if isinstance(levels, np.ndarray):
+        levels_array = np.asarray(levels, dtype=np.float64)
+        for i in range(levels_array.shape[0]):
+            entries.push_back(OrderBookEntry(levels_array[i, 0], levels_array[i, 1], update_id))
+    else:
+        for level in levels:
+            entries.push_back(OrderBookEntry(c_parse_level_value(level[0]),
+                                             c_parse_level_value(level[1]),
+                                             update_id))
+
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_CHANGE_EVENT_TAG = OrderBookEvent.TopOfBookChangeEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -56,6 +115,16 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._snapshot_bids_buffer = None
+        self._snapshot_asks_buffer = None
+        self._top_of_book_band = -1
+        self._top_of_book_volume_threshold = 0
+        self._notified_best_bid = self._notified_best_ask = float("NaN")
+        self._notified_bid_band_volume = self._notified_ask_band_volume = float("NaN")
+
+    def __dealloc__(self):
+        del self._bid_depth_index
+        del self._ask_depth_index
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -94,9 +163,14 @@ cdef class OrderBook(PubSub):
             top_ask = deref(ask_iterator)
             self._best_ask = top_ask.getPrice()
 
+        if self._bid_depth_index != NULL:
+            self.c_update_depth_index(bids, asks)
+
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        self.c_check_top_of_book_change(update_id)
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -134,9 +208,178 @@ cdef class OrderBook(PubSub):
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
+        if self._bid_depth_index != NULL:
+            self.c_rebuild_depth_index()
+
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        self.c_check_top_of_book_change(update_id)
+
+    cdef c_rebuild_depth_index(self):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            vector[double] keys
+            vector[double] prices
+            vector[double] amounts
+
+        # Bids are indexed by their negated price, so both indexes start at the top of the book
+        while bid_it != self._bid_book.rend():
+            keys.push_back(-deref(bid_it).getPrice())
+            prices.push_back(deref(bid_it).getPrice())
+            amounts.push_back(deref(bid_it).getAmount())
+            inc(bid_it)
+        deref(self._bid_depth_index).build(keys, prices, amounts)
+
+        keys.clear()
+        prices.clear()
+        amounts.clear()
+        while ask_it != self._ask_book.end():
+            keys.push_back(deref(ask_it).getPrice())
+            prices.push_back(deref(ask_it).getPrice())
+            amounts.push_back(deref(ask_it).getAmount())
+            inc(ask_it)
+        deref(self._ask_depth_index).build(keys, prices, amounts)
+
+    cdef c_update_depth_index(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks):
+        cdef:
+            set[OrderBookEntry].iterator result
+
+        # The index mirrors the final state of every level touched by the diffs
+        for bid in bids:
+            result = self._bid_book.find(bid)
+            if result != self._bid_book.end():
+                deref(self._bid_depth_index).set(-bid.getPrice(), bid.getPrice(), deref(result).getAmount())
+            else:
+                deref(self._bid_depth_index).erase(-bid.getPrice())
+        for ask in asks:
+            result = self._ask_book.find(ask)
+            if result != self._ask_book.end():
+                deref(self._ask_depth_index).set(ask.getPrice(), ask.getPrice(), deref(result).getAmount())
+            else:
+                deref(self._ask_depth_index).erase(ask.getPrice())
+
+        # Entries removed when truncating overlapping books are always at the top of the book
+        if self._bid_book.empty():
+            deref(self._bid_depth_index).clear()
+        else:
+            deref(self._bid_depth_index).eraseBefore(-deref(self._bid_book.rbegin()).getPrice())
+        if self._ask_book.empty():
+            deref(self._ask_depth_index).clear()
+        else:
+            deref(self._ask_depth_index).eraseBefore(deref(self._ask_book.begin()).getPrice())
+
+    cdef c_check_top_of_book_change(self, int64_t update_id):
+        cdef:
+            EventsIterator it = self._events.find(TOP_OF_BOOK_CHANGE_EVENT_TAG)
+            bint changed
+            double bid_band_volume = 0
+            double ask_band_volume = 0
+
+        # Nothing is computed (or allocated) unless someone listens to the event
+        if it == self._events.end():
+            return
+
+        changed = (c_price_changed(self._notified_best_bid, self._best_bid) or
+                   c_price_changed(self._notified_best_ask, self._best_ask))
+        if self._top_of_book_band >= 0:
+            bid_band_volume = self.c_get_band_volume(True)
+            ask_band_volume = self.c_get_band_volume(False)
+            changed = (changed or
+                       c_volume_changed(self._notified_bid_band_volume,
+                                        bid_band_volume,
+                                        self._top_of_book_volume_threshold) or
+                       c_volume_changed(self._notified_ask_band_volume,
+                                        ask_band_volume,
+                                        self._top_of_book_volume_threshold))
+        if not changed:
+            return
+
+        self._notified_best_bid = self._best_bid
+        self._notified_best_ask = self._best_ask
+        self._notified_bid_band_volume = bid_band_volume
+        self._notified_ask_band_volume = ask_band_volume
+        self.c_trigger_event(TOP_OF_BOOK_CHANGE_EVENT_TAG,
+                             OrderBookTopOfBookChangeEvent(update_id,
+                                                           self._best_bid,
+                                                           self._best_ask,
+                                                           bid_band_volume,
+                                                           ask_band_volume))
+
+    cdef double c_get_band_volume(self, bint is_bid):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            double limit_price
+            double volume = 0
+
+        if is_bid:
+            if self._bid_book.empty():
+                return 0
+            limit_price = deref(bid_it).getPrice() * (1 - self._top_of_book_band)
+            if self._bid_depth_index != NULL:
+                return deref(self._bid_depth_index).sumUpTo(-limit_price).cumulativeAmount
+            while bid_it != self._bid_book.rend() and deref(bid_it).getPrice() >= limit_price:
+                volume += deref(bid_it).getAmount()
+                inc(bid_it)
+        else:
+            if self._ask_book.empty():
+                return 0
+            limit_price = deref(ask_it).getPrice() * (1 + self._top_of_book_band)
+            if self._ask_depth_index != NULL:
+                return deref(self._ask_depth_index).sumUpTo(limit_price).cumulativeAmount
+            while ask_it != self._ask_book.end() and deref(ask_it).getPrice() <= limit_price:
+                volume += deref(ask_it).getAmount()
+                inc(ask_it)
+        return volume
+
+    def configure_top_of_book_events(self, depth_band: Optional[float] = None, depth_change_threshold: float = 0.0):
+        """
+        Configures the OrderBookEvent.TopOfBookChangeEvent notifications. The event is triggered by diffs and snapshots
+        that change the best bid or the best ask price. If a depth band is set, the event is also triggered when the
+        volume of either side within the band (levels up to depth_band away from the best price of the side, as a
+        fraction of it, e.g. 0.001 for 0.1%) changes by more than depth_change_threshold (as a fraction of the volume
+        of the last notification). A band of 0 tracks the volume of the best levels.
+        The check only runs while the event has listeners.
+        """
+        if depth_band is not None and depth_band < 0:
+            raise ValueError(f"The depth band must be positive (got {depth_band}).")
+        if depth_change_threshold < 0:
+            raise ValueError(f"The depth change threshold must be positive (got {depth_change_threshold}).")
+        self._top_of_book_band = -1 if depth_band is None else depth_band
+        self._top_of_book_volume_threshold = depth_change_threshold
+        self._notified_bid_band_volume = self._notified_ask_band_volume = float("NaN")
+
+    @property
+    def top_of_book_depth_band(self) -> Optional[float]:
+        return None if self._top_of_book_band < 0 else self._top_of_book_band
+
+    @property
+    def top_of_book_depth_change_threshold(self) -> float:
+        return self._top_of_book_volume_threshold
+
+    def enable_depth_index(self):
+        """
+        Maintains a cumulative depth index for both sides of the book, so volume and price lookups (price for volume,
+        VWAP, volume for price...) take O(log n) instead of walking the book. The index is updated on every diff and
+        snapshot, which makes updates O(log n) per changed level.
+        """
+        if self._bid_depth_index == NULL:
+            self._bid_depth_index = new DepthIndex()
+            self._ask_depth_index = new DepthIndex()
+            self.c_rebuild_depth_index()
+
+    def disable_depth_index(self):
+        del self._bid_depth_index
+        del self._ask_depth_index
+        self._bid_depth_index = NULL
+        self._ask_depth_index = NULL
+
+    @property
+    def depth_index_enabled(self) -> bool:
+        return self._bid_depth_index != NULL
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -172,12 +415,80 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.snapshot_arrays()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64", copy=False)
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64", copy=False)
         return bids_df, asks_df
 
+    cdef tuple c_fill_snapshot_arrays(self,
+                                      np.ndarray[np.float64_t, ndim=2] bids_array,
+                                      np.ndarray[np.float64_t, ndim=2] asks_array):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            Py_ssize_t bids_count = 0
+            Py_ssize_t asks_count = 0
+            Py_ssize_t max_bids = bids_array.shape[0]
+            Py_ssize_t max_asks = asks_array.shape[0]
+
+        while bid_it != self._bid_book.rend() and bids_count < max_bids:
+            bids_array[bids_count, 0] = deref(bid_it).getPrice()
+            bids_array[bids_count, 1] = deref(bid_it).getAmount()
+            bids_array[bids_count, 2] = deref(bid_it).getUpdateId()
+            bids_count += 1
+            inc(bid_it)
+        while ask_it != self._ask_book.end() and asks_count < max_asks:
+            asks_array[asks_count, 0] = deref(ask_it).getPrice()
+            asks_array[asks_count, 1] = deref(ask_it).getAmount()
+            asks_array[asks_count, 2] = deref(ask_it).getUpdateId()
+            asks_count += 1
+            inc(ask_it)
+        return bids_count, asks_count
+
+    def fill_snapshot_arrays(self, bids_array: np.ndarray, asks_array: np.ndarray) -> Tuple[int, int]:
+        """
+        Copies the top of the book into preallocated float64 arrays with 3 columns [price, amount, update_id]. Bids
+        are written from the highest price and asks from the lowest price, up to the number of rows of each array.
+
+        :return: the number of bid and ask rows written
+        """
+        if bids_array.ndim != 2 or bids_array.shape[1] != 3 or asks_array.ndim != 2 or asks_array.shape[1] != 3:
+            raise ValueError("The snapshot arrays must have 3 columns: [price, amount, update_id].")
+        return self.c_fill_snapshot_arrays(bids_array, asks_array)
+
+    def snapshot_arrays(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the bids and asks as contiguous float64 arrays with 3 columns [price, amount, update_id], best prices
+        first, optionally limited to the given number of levels per side.
+        """
+        cdef:
+            size_t bids_size = self._bid_book.size()
+            size_t asks_size = self._ask_book.size()
+        if depth is not None:
+            bids_size = min(bids_size, depth)
+            asks_size = min(asks_size, depth)
+        bids_array = np.empty((bids_size, 3), dtype=np.float64)
+        asks_array = np.empty((asks_size, 3), dtype=np.float64)
+        bids_count, asks_count = self.c_fill_snapshot_arrays(bids_array, asks_array)
+        return bids_array[:bids_count], asks_array[:asks_count]
+
+    def top_of_book_views(self, levels: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns read-only views with up to the given number of levels per side, in the snapshot arrays format.
+        The views share buffers owned by the order book, which are reused by the next call, so they should be consumed
+        (or copied) before calling this method again.
+        """
+        if self._snapshot_bids_buffer is None or self._snapshot_bids_buffer.shape[0] < levels:
+            self._snapshot_bids_buffer = np.empty((levels, 3), dtype=np.float64)
+            self._snapshot_asks_buffer = np.empty((levels, 3), dtype=np.float64)
+        bids_count, asks_count = self.c_fill_snapshot_arrays(self._snapshot_bids_buffer[:levels],
+                                                             self._snapshot_asks_buffer[:levels])
+        bids_view = self._snapshot_bids_buffer[:bids_count]
+        asks_view = self._snapshot_asks_buffer[:asks_count]
+        bids_view.flags.writeable = False
+        asks_view.flags.writeable = False
+        return bids_view, asks_view
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -227,13 +538,19 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t update_id
+            Py_ssize_t i
+
+        for i in range(bids_array.shape[0]):
+            update_id = <int64_t>bids_array[i, 2]
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], update_id))
+            if update_id > last_update_id:
+                last_update_id = update_id
+        for i in range(asks_array.shape[0]):
+            update_id = <int64_t>asks_array[i, 2]
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], update_id))
+            if update_id > last_update_id:
+                last_update_id = update_id
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -254,15 +571,58 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t update_id
+            Py_ssize_t i
+
+        for i in range(bids_array.shape[0]):
+            update_id = <int64_t>bids_array[i, 2]
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], update_id))
+            if update_id > last_update_id:
+                last_update_id = update_id
+        for i in range(asks_array.shape[0]):
+            update_id = <int64_t>asks_array[i, 2]
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], update_id))
+            if update_id > last_update_id:
+                last_update_id = update_id
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
+    def apply_raw_diffs(self, bids: Sequence, asks: Sequence, update_id: int):
+        """
+        Applies diffs in the format sent by the exchanges, parsing the levels while copying them to the order book.
+        Each side is either a sequence of [price, amount, ...] rows, where price and amount are numbers or numeric
+        strings, or a 2D array with the price and amount in the first two columns.
+        All the levels are assigned the given update id.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_parse_raw_levels(bids, update_id, &cpp_bids)
+        c_parse_raw_levels(asks, update_id, &cpp_asks)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_raw_snapshot(self, bids: Sequence, asks: Sequence, update_id: int):
+        """
+        Applies a snapshot in the format sent by the exchanges. See apply_raw_diffs for the supported formats.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_parse_raw_levels(bids, update_id, &cpp_bids)
+        c_parse_raw_levels(asks, update_id, &cpp_asks)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        if message.has_raw_levels:
+            self.apply_raw_diffs(message.raw_bids, message.raw_asks, message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        if message.has_raw_levels:
+            self.apply_raw_snapshot(message.raw_bids, message.raw_asks, message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
+
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
             set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
@@ -282,31 +642,33 @@ cdef class OrderBook(PubSub):
             inc(it)
 
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
-        retval = []
-        for ask_entry in self.ask_entries():
-            ask_entry = ask_entry
-            if ask_entry.amount < amount_left:
-                retval.append(ask_entry)
-                amount_left -= ask_entry.amount
+        cdef:
+            set[OrderBookEntry].iterator it = self._ask_book.begin()
+            double amount_left = amount
+            list retval = []
+        while it != self._ask_book.end():
+            if deref(it).getAmount() < amount_left:
+                retval.append(OrderBookRow(deref(it).getPrice(), deref(it).getAmount(), deref(it).getUpdateId()))
+                amount_left -= deref(it).getAmount()
             else:
-                retval.append(OrderBookRow(ask_entry.price, amount_left, ask_entry.update_id))
-                amount_left = 0.0
+                retval.append(OrderBookRow(deref(it).getPrice(), amount_left, deref(it).getUpdateId()))
                 break
+            inc(it)
         return retval
 
     def simulate_sell(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
-        retval = []
-        for bid_entry in self.bid_entries():
-            bid_entry = bid_entry
-            if bid_entry.amount < amount_left:
-                retval.append(bid_entry)
-                amount_left -= bid_entry.amount
+        cdef:
+            set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
+            double amount_left = amount
+            list retval = []
+        while it != self._bid_book.rend():
+            if deref(it).getAmount() < amount_left:
+                retval.append(OrderBookRow(deref(it).getPrice(), deref(it).getAmount(), deref(it).getUpdateId()))
+                amount_left -= deref(it).getAmount()
             else:
-                retval.append(OrderBookRow(bid_entry.price, amount_left, bid_entry.update_id))
-                amount_left = 0.0
+                retval.append(OrderBookRow(deref(it).getPrice(), amount_left, deref(it).getUpdateId()))
                 break
+            inc(it)
         return retval
 
     cdef double c_get_price(self, bint is_buy) except? -1:
@@ -319,145 +681,338 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef double c_get_amount_at_price(self, bint is_bid, double price):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = deref(book).find(OrderBookEntry(price, 0, 0))
+        if it == deref(book).end():
+            return 0
+        return deref(it).getAmount()
+
+    def get_amount_at_price(self, is_bid: bool, price: float) -> float:
+        """
+        Returns the amount of the order book level at the given price, or 0 if there is no level at that price
+        """
+        return self.c_get_amount_at_price(is_bid, price)
+
+    # The depth queries below use the cumulative depth index when it is enabled. Otherwise they walk the C++ sets
+    # directly: asks from the lowest price up (begin to end) and bids from the highest price down (rbegin to rend),
+    # without creating a Python object per level.
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
             double cumulative_volume = 0
             double result_price = NaN
+            DepthIndex *depth_index = self._ask_depth_index if is_buy else self._bid_depth_index
+            DepthIndexLevel level
+
+        if depth_index != NULL:
+            level = deref(depth_index).findByAmount(volume)
+            if level.found:
+                return OrderBookQueryResult(NaN, volume, level.price, volume)
+            return OrderBookQueryResult(NaN, volume, NaN, min(level.cumulativeAmount, volume))
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
+            double incremental_amount
+            DepthIndex *depth_index = self._ask_depth_index if is_buy else self._bid_depth_index
+            DepthIndexLevel level
+
+        if depth_index != NULL:
+            level = deref(depth_index).findByAmount(volume)
+            if level.found:
+                incremental_amount = volume - level.cumulativeAmount
+                result_vwap = ((level.cumulativeQuote + incremental_amount * level.price)
+                               / (level.cumulativeAmount + incremental_amount))
+                return OrderBookQueryResult(NaN, volume, result_vwap, volume)
+            return OrderBookQueryResult(NaN, volume, NaN, min(level.cumulativeAmount, volume))
+
         if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
+            while ask_it != self._ask_book.end():
+                if total_volume + deref(ask_it).getAmount() >= volume:
                     incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
+                    total_cost += incremental_amount * deref(ask_it).getPrice()
                     total_volume += incremental_amount
                     result_vwap = total_cost / total_volume
                     break
+                total_cost += deref(ask_it).getAmount() * deref(ask_it).getPrice()
+                total_volume += deref(ask_it).getAmount()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
+            while bid_it != self._bid_book.rend():
+                if total_volume + deref(bid_it).getAmount() >= volume:
                     incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
+                    total_cost += incremental_amount * deref(bid_it).getPrice()
                     total_volume += incremental_amount
                     result_vwap = total_cost / total_volume
                     break
+                total_cost += deref(bid_it).getAmount() * deref(bid_it).getPrice()
+                total_volume += deref(bid_it).getAmount()
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
             double cumulative_volume = 0
             double result_price = NaN
+            DepthIndex *depth_index = self._ask_depth_index if is_buy else self._bid_depth_index
+            DepthIndexLevel level
+
+        if depth_index != NULL:
+            level = deref(depth_index).findByQuote(quote_volume)
+            if level.found:
+                return OrderBookQueryResult(NaN, quote_volume, level.price, quote_volume)
+            return OrderBookQueryResult(NaN, quote_volume, NaN, min(level.cumulativeQuote, quote_volume))
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
+            DepthIndex *depth_index = self._ask_depth_index if is_buy else self._bid_depth_index
+            DepthIndexLevel level
+
+        if depth_index != NULL:
+            level = deref(depth_index).findByAmount(base_amount)
+            if level.found:
+                cumulative_volume = level.cumulativeQuote + (base_amount - level.cumulativeAmount) * level.price
+            else:
+                cumulative_volume = level.cumulativeQuote
+            return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
+            while ask_it != self._ask_book.end():
+                row_amount = deref(ask_it).getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * deref(ask_it).getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
+            while bid_it != self._bid_book.rend():
+                row_amount = deref(bid_it).getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * deref(bid_it).getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
             double cumulative_volume = 0
             double result_price = NaN
+            DepthIndex *depth_index = self._ask_depth_index if is_buy else self._bid_depth_index
+            DepthIndexLevel level
+
+        if depth_index != NULL:
+            level = deref(depth_index).sumUpTo(price if is_buy else -price)
+            return OrderBookQueryResult(price, NaN, level.price if level.found else NaN, level.cumulativeAmount)
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+            while ask_it != self._ask_book.end() and deref(ask_it).getPrice() <= price:
+                cumulative_volume += deref(ask_it).getAmount()
+                result_price = deref(ask_it).getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+            while bid_it != self._bid_book.rend() and deref(bid_it).getPrice() >= price:
+                cumulative_volume += deref(bid_it).getAmount()
+                result_price = deref(bid_it).getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
             double cumulative_volume = 0
             double result_price = NaN
+            DepthIndex *depth_index = self._ask_depth_index if is_buy else self._bid_depth_index
+            DepthIndexLevel level
+
+        if depth_index != NULL:
+            level = deref(depth_index).sumUpTo(price if is_buy else -price)
+            return OrderBookQueryResult(price, NaN, level.price if level.found else NaN, level.cumulativeQuote)
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+            while ask_it != self._ask_book.end() and deref(ask_it).getPrice() <= price:
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
+                result_price = deref(ask_it).getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+            while bid_it != self._bid_book.rend() and deref(bid_it).getPrice() >= price:
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
+                result_price = deref(bid_it).getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, vector[double] volumes):
+        """
+        Answers a VWAP query for each of the volumes walking the book only once. The volumes are visited in ascending
+        order, and each result is computed exactly as c_get_vwap_for_volume would compute it.
+        """
+        cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            vector[pair[double, size_t]] queries
+            vector[double] result_vwaps = vector[double](volumes.size(), NaN)
+            vector[double] result_volumes = vector[double](volumes.size(), NaN)
+            size_t query_index = 0
+            size_t i
+            double total_cost = 0
+            double total_volume = 0
+            double level_price
+            double level_amount
+            double incremental_amount
+            double volume
+
+        if self._ask_depth_index != NULL:
+            return [self.c_get_vwap_for_volume(is_buy, volume) for volume in volumes]
+
+        for i in range(volumes.size()):
+            queries.push_back(pair[double, size_t](volumes[i], i))
+        sort(queries.begin(), queries.end())
+
+        while query_index < queries.size():
+            if is_buy:
+                if ask_it == self._ask_book.end():
+                    break
+                level_price = deref(ask_it).getPrice()
+                level_amount = deref(ask_it).getAmount()
+                inc(ask_it)
+            else:
+                if bid_it == self._bid_book.rend():
+                    break
+                level_price = deref(bid_it).getPrice()
+                level_amount = deref(bid_it).getAmount()
+                inc(bid_it)
+            while query_index < queries.size() and total_volume + level_amount >= queries[query_index].first:
+                volume = queries[query_index].first
+                incremental_amount = volume - total_volume
+                result_vwaps[queries[query_index].second] = ((total_cost + incremental_amount * level_price)
+                                                             / (total_volume + incremental_amount))
+                result_volumes[queries[query_index].second] = volume
+                query_index += 1
+            total_cost += level_amount * level_price
+            total_volume += level_amount
+
+        # Volumes deeper than the book can only be partially filled
+        while query_index < queries.size():
+            result_volumes[queries[query_index].second] = min(total_volume, queries[query_index].first)
+            query_index += 1
+
+        return [OrderBookQueryResult(NaN, volumes[i], result_vwaps[i], result_volumes[i]) for i in range(volumes.size())]
+
+    cdef list c_get_volume_for_prices(self, bint is_buy, vector[double] prices):
+        """
+        Answers a volume for price query for each of the prices walking the book only once. The prices are visited
+        from the top of the book (ascending for asks, descending for bids).
+        """
+        cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            vector[pair[double, size_t]] queries
+            vector[double] result_prices = vector[double](prices.size(), NaN)
+            vector[double] result_volumes = vector[double](prices.size(), 0)
+            size_t query_index = 0
+            size_t i
+            double cumulative_volume = 0
+            double last_price = NaN
+            double level_price
+            double level_amount
+            double direction = 1.0 if is_buy else -1.0
+
+        if self._ask_depth_index != NULL:
+            return [self.c_get_volume_for_price(is_buy, price) for price in prices]
+
+        # Sorting by direction * price makes both sides a walk over ascending keys
+        for i in range(prices.size()):
+            queries.push_back(pair[double, size_t](direction * prices[i], i))
+        sort(queries.begin(), queries.end())
+
+        while query_index < queries.size():
+            if is_buy:
+                if ask_it == self._ask_book.end():
+                    break
+                level_price = deref(ask_it).getPrice()
+                level_amount = deref(ask_it).getAmount()
+                inc(ask_it)
+            else:
+                if bid_it == self._bid_book.rend():
+                    break
+                level_price = deref(bid_it).getPrice()
+                level_amount = deref(bid_it).getAmount()
+                inc(bid_it)
+            # Every query above the level price is answered with the levels walked before this one
+            while query_index < queries.size() and direction * level_price > queries[query_index].first:
+                result_prices[queries[query_index].second] = last_price
+                result_volumes[queries[query_index].second] = cumulative_volume
+                query_index += 1
+            cumulative_volume += level_amount
+            last_price = level_price
+
+        while query_index < queries.size():
+            result_prices[queries[query_index].second] = last_price
+            result_volumes[queries[query_index].second] = cumulative_volume
+            query_index += 1
+
+        return [OrderBookQueryResult(prices[i], NaN, result_prices[i], result_volumes[i]) for i in range(prices.size())]
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -476,6 +1031,12 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_vwap_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_vwap_for_volumes(is_buy, volumes)
+
+    def get_volume_for_prices(self, is_buy: bool, prices: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_volume_for_prices(is_buy, prices)
+
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
         pass
@@ -487,6 +1048,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
@@ -1,7 +1,7 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -64,6 +64,24 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def raw_asks(self) -> Sequence:
+        return self.content.get("asks", [])
+
+    @property
+    def raw_bids(self) -> Sequence:
+        return self.content.get("bids", [])
+
+    @property
+    def has_raw_levels(self) -> bool:
+        """
+        True if the content asks and bids are [price, amount, ...] rows (or arrays with those columns), so they can be
+        applied to an order book without building the OrderBookRow lists. Messages that redefine asks and bids to
+        parse other formats don't have raw levels.
+        """
+        message_class = type(self)
+        return message_class.asks is OrderBookMessage.asks and message_class.bids is OrderBookMessage.bids
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -7,9 +7,11 @@ from typing import Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from hummingbot.core.backtesting.market_data_recorder import MarketDataRecorder
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -21,6 +23,22 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookMessageStream(asyncio.Queue):
+    """
+    Queue of the order book messages received from the data source. If a market data recorder is set the messages are
+    recorded as they arrive, in the order they reach the tracker.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.market_data_recorder: Optional[MarketDataRecorder] = None
+
+    def put_nowait(self, item: OrderBookMessage):
+        super().put_nowait(item)
+        if self.market_data_recorder is not None:
+            self.market_data_recorder.record(item)
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
     _obt_logger: Optional[HummingbotLogger] = None
@@ -31,20 +49,42 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 max_concurrent_initializations: Optional[int] = None,
+                 coalesce_diffs: bool = False):
+        """
+        :param data_source: the data source providing snapshots, diffs and trades
+        :param trading_pairs: the trading pairs to track
+        :param domain: the connector domain, if any
+        :param max_concurrent_initializations: if set, the initial snapshots are requested concurrently with at most
+            this number of requests in flight. The requests are then paced by the data source throttler instead of
+            a fixed delay between pairs. If None the order books are initialized sequentially.
+        :param coalesce_diffs: if True, when several diffs are pending for a trading pair they are merged by price
+            level (the last update of each level wins) and applied to the order book at once, unless they can cross
+            the book (they are then applied one by one)
+        """
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
+        self._max_concurrent_initializations: Optional[int] = max_concurrent_initializations
+        self._coalesce_diffs: bool = coalesce_diffs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_initialized_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = defaultdict(lambda: deque(maxlen=self.PAST_DIFF_WINDOW_SIZE))
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
+        self._order_book_diff_stream: OrderBookMessageStream = OrderBookMessageStream()
+        self._order_book_snapshot_stream: OrderBookMessageStream = OrderBookMessageStream()
+        self._order_book_trade_stream: OrderBookMessageStream = OrderBookMessageStream()
+        self._market_data_recorder: Optional[MarketDataRecorder] = None
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._diff_messages_processed: Dict[str, int] = defaultdict(int)
+        self._diff_applications: Dict[str, int] = defaultdict(int)
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +108,63 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Returns the trading pairs whose order book has already been initialized, even if the tracker as a whole is
+        not ready yet
+        """
+        return [trading_pair
+                for trading_pair, event in self._order_book_initialized_events.items()
+                if event.is_set()]
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return (trading_pair in self._order_book_initialized_events
+                and self._order_book_initialized_events[trading_pair].is_set())
+
+    async def wait_for_order_book(self, trading_pair: str):
+        """
+        Waits until the order book for the trading pair has been initialized
+
+        :param trading_pair: the trading pair to wait for
+        """
+        await self._order_book_initialized_events[trading_pair].wait()
+
+    @property
+    def queue_depths(self) -> Dict[str, int]:
+        """
+        Returns the number of messages waiting to be applied to each order book
+        """
+        return {
+            trading_pair: message_queue.qsize() + len(self._saved_message_queues.get(trading_pair, ()))
+            for trading_pair, message_queue in self._tracking_message_queues.items()
+        }
+
+    @property
+    def diff_coalescing_ratios(self) -> Dict[str, float]:
+        """
+        Returns, for each trading pair, the average number of diff messages merged in each update applied to the
+        order book. It is 1.0 when diffs are applied one by one, and grows when the tracking loop falls behind.
+        """
+        return {
+            trading_pair: self._diff_messages_processed[trading_pair] / applications
+            for trading_pair, applications in self._diff_applications.items()
+            if applications > 0
+        }
+
+    @property
+    def market_data_recorder(self) -> Optional[MarketDataRecorder]:
+        return self._market_data_recorder
+
+    def set_market_data_recorder(self, recorder: Optional[MarketDataRecorder]):
+        """
+        Records the diff, snapshot and trade messages received from the data source, and the initial snapshot of each
+        order book, with the given recorder (None stops recording). The recorder is started and stopped by the caller.
+        """
+        self._market_data_recorder = recorder
+        for stream in (self._order_book_diff_stream, self._order_book_snapshot_stream, self._order_book_trade_stream):
+            stream.market_data_recorder = recorder
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -138,6 +235,8 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for event in self._order_book_initialized_events.values():
+            event.clear()
 
     async def _update_last_trade_prices_loop(self):
         '''
@@ -173,15 +272,74 @@ class OrderBookTracker:
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+        if self._max_concurrent_initializations is not None:
+            await self._init_order_books_concurrently()
+        else:
+            for index, trading_pair in enumerate(self._trading_pairs):
+                order_book: OrderBook = await self._initial_order_book_for_trading_pair(trading_pair)
+                self._register_order_book(trading_pair, order_book)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index + 1}/{len(self._trading_pairs)} completed.")
+                await asyncio.sleep(1)
         self._order_books_initialized.set()
 
+    async def _init_order_books_concurrently(self):
+        """
+        Initialize order books requesting the snapshots concurrently. The number of requests in flight is bounded by
+        max_concurrent_initializations, and the pace of the requests is controlled by the data source throttler.
+        Each order book starts being tracked (and is reported as ready) as soon as its own snapshot is applied.
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max(1, self._max_concurrent_initializations))
+        completed: int = 0
+
+        async def _init_order_book(trading_pair: str):
+            nonlocal completed
+            while True:
+                try:
+                    async with semaphore:
+                        order_book: OrderBook = await self._initial_order_book_for_trading_pair(trading_pair)
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(
+                        f"Unexpected error initializing order book for {trading_pair}.",
+                        exc_info=True,
+                        app_warning_msg=f"Unexpected error initializing order book for {trading_pair}. "
+                                        f"Retrying after 5 seconds."
+                    )
+                    await asyncio.sleep(5.0)
+            self._register_order_book(trading_pair, order_book)
+            completed += 1
+            self.logger().info(f"Initialized order book for {trading_pair}. "
+                               f"{completed}/{len(self._trading_pairs)} completed.")
+
+        tasks: List[asyncio.Task] = [safe_ensure_future(_init_order_book(trading_pair))
+                                     for trading_pair in self._trading_pairs]
+        try:
+            await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _register_order_book(self, trading_pair: str, order_book: OrderBook):
+        self._order_books[trading_pair] = order_book
+        if self._market_data_recorder is not None:
+            self._market_data_recorder.record(self._initial_snapshot_message(trading_pair, order_book))
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_initialized_events[trading_pair].set()
+
+    @staticmethod
+    def _initial_snapshot_message(trading_pair: str, order_book: OrderBook) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": order_book.snapshot_uid,
+            "bids": [[row.price, row.amount] for row in order_book.bid_entries()],
+            "asks": [[row.price, row.amount] for row in order_book.ask_entries()],
+        }, timestamp=time.time())
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -257,21 +415,28 @@ class OrderBookTracker:
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
                 # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                if pending_message is not None:
+                    message, pending_message = pending_message, None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    diffs: List[OrderBookMessage] = [message]
+                    if self._coalesce_diffs:
+                        pending_message = self._collect_pending_diffs(trading_pair, diffs)
+                    past_diffs_window.extend(diffs)
+                    diff_messages_accepted += len(diffs)
+                    self._diff_messages_processed[trading_pair] += len(diffs)
+                    self._diff_applications[trading_pair] += self._apply_diff_messages(order_book, diffs)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -293,6 +458,78 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _collect_pending_diffs(self, trading_pair: str, diffs: List[OrderBookMessage]) -> Optional[OrderBookMessage]:
+        """
+        Moves the diffs already waiting for the trading pair into the diffs list, stopping at the first message that
+        is not a diff.
+
+        :return: the first message that is not a diff, which has to be processed after the collected diffs
+        """
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
+        while len(saved_messages) > 0 or not message_queue.empty():
+            message = saved_messages.popleft() if len(saved_messages) > 0 else message_queue.get_nowait()
+            if message.type is not OrderBookMessageType.DIFF:
+                return message
+            diffs.append(message)
+        return None
+
+    def _apply_diff_messages(self, order_book: OrderBook, diffs: List[OrderBookMessage]) -> int:
+        """
+        Applies the diffs to the order book, merged in a single update when that gives the same order book as
+        applying them one by one.
+
+        The order book removes the crossed levels after each diff. A merged update would skip the intermediate crossed
+        states, so the diffs are merged only if no bid they add can reach the lowest ask and no ask they add can reach
+        the highest bid.
+
+        :return: the number of updates applied to the order book
+        """
+        if len(diffs) > 1:
+            if not self._may_cross(order_book, diffs):
+                order_book.apply_diffs(*self._coalesced_diff(diffs))
+                return 1
+        for diff in diffs:
+            order_book.apply_diff_message(diff)
+        return len(diffs)
+
+    @staticmethod
+    def _may_cross(order_book: OrderBook, diffs: List[OrderBookMessage]) -> bool:
+        """
+        :return: False if the bid and ask books can't overlap after any of the diffs. Removing levels never makes the
+            books overlap, so only the levels added by the diffs (even if a later diff removes them) count.
+        """
+        highest_bid = max((row.price for diff in diffs for row in diff.bids if row.amount > 0),
+                          default=float("-inf"))
+        lowest_ask = min((row.price for diff in diffs for row in diff.asks if row.amount > 0),
+                         default=float("inf"))
+        try:
+            highest_bid = max(highest_bid, order_book.get_price(False))
+        except EnvironmentError:
+            pass
+        try:
+            lowest_ask = min(lowest_ask, order_book.get_price(True))
+        except EnvironmentError:
+            pass
+        return highest_bid >= lowest_ask
+
+    @staticmethod
+    def _coalesced_diff(diffs: List[OrderBookMessage]) -> Tuple[List[OrderBookRow], List[OrderBookRow], int]:
+        """
+        Merges diff messages by price level, in update id order, so that each level keeps its last update.
+
+        :return: the bids, asks and update id of the combined diff
+        """
+        bids: Dict[float, OrderBookRow] = {}
+        asks: Dict[float, OrderBookRow] = {}
+        ordered_diffs = sorted(diffs, key=lambda diff: diff.update_id)
+        for diff in ordered_diffs:
+            for row in diff.bids:
+                bids[row.price] = row
+            for row in diff.asks:
+                asks[row.price] = row
+        return list(bids.values()), list(asks.values()), ordered_diffs[-1].update_id
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Type
 
+import numpy as np
+
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, PriceType, TradeType
 
@@ -70,6 +72,28 @@ class TradeFeeSchema:
                 self.maker_fixed_fees[i].token, Decimal(self.maker_fixed_fees[i].amount)
             )
 
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "percent_fee_token": self.percent_fee_token,
+            "maker_percent_fee_decimal": str(self.maker_percent_fee_decimal),
+            "taker_percent_fee_decimal": str(self.taker_percent_fee_decimal),
+            "buy_percent_fee_deducted_from_returns": self.buy_percent_fee_deducted_from_returns,
+            "maker_fixed_fees": [token_amount.to_json() for token_amount in self.maker_fixed_fees],
+            "taker_fixed_fees": [token_amount.to_json() for token_amount in self.taker_fixed_fees],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]):
+        instance = TradeFeeSchema(
+            percent_fee_token=data["percent_fee_token"],
+            maker_percent_fee_decimal=Decimal(data["maker_percent_fee_decimal"]),
+            taker_percent_fee_decimal=Decimal(data["taker_percent_fee_decimal"]),
+            buy_percent_fee_deducted_from_returns=data["buy_percent_fee_deducted_from_returns"],
+            maker_fixed_fees=list(map(TokenAmount.from_json, data["maker_fixed_fees"])),
+            taker_fixed_fees=list(map(TokenAmount.from_json, data["taker_fixed_fees"])),
+        )
+        return instance
+
 
 @dataclass
 class TradeFeeBase(ABC):
@@ -227,6 +251,48 @@ class TradeFeeBase(ABC):
                 fee_amount += (flat_fee.amount * conversion_rate)
         return fee_amount
 
+    def fee_amounts_in_token(
+            self,
+            trading_pair: str,
+            prices: np.ndarray,
+            order_amounts: np.ndarray,
+            token: str,
+            exchange: Optional["ExchangeBase"] = None,
+            rate_source: Optional["RateOracle"] = None      # noqa: F821
+    ) -> np.ndarray:
+        """
+        Vectorized version of fee_amount_in_token, for many candidate orders at once (e.g. to compare the
+        profitability of several order amounts). The conversion rates are looked up once for all the candidates, and
+        the fee amounts are calculated as floats.
+
+        :param trading_pair: the trading pair of the orders
+        :param prices: the prices of the orders (a single price or an array broadcastable with the amounts)
+        :param order_amounts: the amounts of the orders, in base token
+        :param token: the token to express the fees in
+        :returns an array with the fee amount of each order
+        """
+        base, quote = split_hb_trading_pair(trading_pair)
+        prices = np.asarray(prices, dtype=np.float64)
+        order_amounts = np.asarray(order_amounts, dtype=np.float64)
+        fee_amounts = np.zeros(np.broadcast(prices, order_amounts).shape)
+        if self.percent != S_DECIMAL_0:
+            percent = float(self.percent)
+            if not self._are_tokens_interchangeable(quote, token):
+                conversion_pair: str = combine_to_hb_trading_pair(base=quote, quote=token)
+                percent *= float(self._get_exchange_rate(conversion_pair, exchange, rate_source))
+            fee_amounts += prices * order_amounts * percent
+        for flat_fee in self.flat_fees:
+            if self._are_tokens_interchangeable(flat_fee.token, token):
+                fee_amounts += float(flat_fee.amount)
+            elif (self._are_tokens_interchangeable(flat_fee.token, base)
+                  and (self._are_tokens_interchangeable(quote, token))):
+                fee_amounts += float(flat_fee.amount) * prices
+            else:
+                conversion_pair: str = combine_to_hb_trading_pair(base=flat_fee.token, quote=token)
+                conversion_rate: Decimal = self._get_exchange_rate(conversion_pair, exchange, rate_source)
+                fee_amounts += float(flat_fee.amount * conversion_rate)
+        return fee_amounts
+
     def _are_tokens_interchangeable(self, first_token: str, second_token: str):
         interchangeable_tokens = [
             {"WETH", "ETH"},
@@ -11,13 +11,21 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderFilledEvent
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    def __init__(self,
+                 event_source: Optional[str] = None,
+                 max_generic_events: int = 50,
+                 max_order_filled_events: Optional[int] = None):
+        """
+        :param event_source: the name of the events source
+        :param max_generic_events: the number of most recent events (other than order fills) kept
+        :param max_order_filled_events: the number of most recent order fill events kept, all of them if None (the
+            fills are used for the trades and PnL of the strategies)
+        """
         super().__init__()
         self._event_source = event_source
         # We limit the amount of events we keep reference to the most recent ones
-        # But we keep all references to order fill events, because they are required for PnL calculation
-        self._generic_logged_events = deque(maxlen=50)
-        self._order_filled_logged_events = deque()
+        self._generic_logged_events = deque(maxlen=max_generic_events)
+        self._order_filled_logged_events = deque(maxlen=max_order_filled_events)
         self._logged_events = {OrderFilledEvent: self._order_filled_logged_events}
         self._waiting = {}
         self._wait_returns = {}
@@ -30,6 +38,14 @@ cdef class EventLogger(EventListener):
     def event_source(self) -> str:
         return self._event_source
 
+    @property
+    def max_generic_events(self) -> int:
+        return self._generic_logged_events.maxlen
+
+    @property
+    def max_order_filled_events(self) -> Optional[int]:
+        return self._order_filled_logged_events.maxlen
+
     def clear(self):
         self._generic_logged_events.clear()
         self._order_filled_logged_events.clear()
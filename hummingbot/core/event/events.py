@@ -34,6 +34,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    TopOfBookChangeEvent = 902
 
 
 class TokenApprovalEvent(Enum):
@@ -136,6 +137,14 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookTopOfBookChangeEvent(NamedTuple):
+    update_id: int
+    best_bid: float
+    best_ask: float
+    bid_band_volume: float
+    ask_band_volume: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -1,5 +1,7 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.pubsub cimport PubSub
 
@@ -8,7 +10,18 @@ cdef class TimeIterator(PubSub):
     cdef:
         double _current_timestamp
         Clock _clock
+        double _tick_interval
+        double _next_tick_timestamp
+        bint _tick_requested
+        int64_t _tick_count
+        double _total_tick_duration
+        double _max_tick_duration
+        double _last_tick_duration
+        double _total_tick_lag
+        double _max_tick_lag
 
     cdef c_start(self, Clock clock, double timestamp)
     cdef c_stop(self, Clock clock)
     cdef c_tick(self, double timestamp)
+    cdef c_request_tick(self)
+    cdef c_record_tick(self, double duration, double lag)
@@ -1,15 +1,27 @@
 # distutils: language=c++
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from hummingbot.core.clock import Clock
 
 NaN = float("nan")
 
 
+TickStatistics = NamedTuple("TickStatistics", [("tick_count", int),
+                                               ("average_duration", float),
+                                               ("max_duration", float),
+                                               ("last_duration", float),
+                                               ("average_lag", float),
+                                               ("max_lag", float)])
+
+
 cdef class TimeIterator(PubSub):
     def __init__(self):
         self._current_timestamp = NaN
         self._clock = None
+        self._tick_interval = 0
+        self._next_tick_timestamp = 0
+        self._tick_requested = False
+        self.reset_tick_statistics()
 
     cdef c_start(self, Clock clock, double timestamp):
         self._clock = clock
@@ -22,9 +34,32 @@ cdef class TimeIterator(PubSub):
     cdef c_tick(self, double timestamp):
         self._current_timestamp = timestamp
 
+    cdef c_request_tick(self):
+        self._tick_requested = True
+        if self._clock is not None:
+            self._clock.c_wake_up()
+
+    cdef c_record_tick(self, double duration, double lag):
+        self._tick_count += 1
+        self._last_tick_duration = duration
+        self._total_tick_duration += duration
+        self._total_tick_lag += lag
+        if duration > self._max_tick_duration:
+            self._max_tick_duration = duration
+        if lag > self._max_tick_lag:
+            self._max_tick_lag = lag
+
     def tick(self, timestamp: float):
         self.c_tick(timestamp)
 
+    def request_tick(self):
+        """
+        Asks the clock to tick this iterator as soon as possible (in real time mode the clock wakes up before the next
+        scheduled tick, in back testing mode the iterator ticks on the next clock tick even if it is not due).
+        Must be called from the event loop running the clock.
+        """
+        self.c_request_tick()
+
     @property
     def current_timestamp(self) -> float:
         return self._current_timestamp
@@ -33,6 +68,43 @@ cdef class TimeIterator(PubSub):
     def clock(self) -> Optional[Clock]:
         return self._clock
 
+    @property
+    def tick_interval(self) -> float:
+        """
+        Time between two ticks of the iterator. 0 (the default) ticks the iterator on every tick of the clock.
+        """
+        return self._tick_interval
+
+    @tick_interval.setter
+    def tick_interval(self, value: float):
+        if value < 0:
+            raise ValueError(f"The tick interval can't be negative (got {value}).")
+        self._tick_interval = value
+        self._next_tick_timestamp = 0
+
+    @property
+    def tick_statistics(self) -> TickStatistics:
+        """
+        Duration of the ticks run by the clock and lag between the scheduled time of those ticks and the moment they
+        started (in back testing mode the lag is always 0), in seconds.
+        """
+        return TickStatistics(
+            tick_count=self._tick_count,
+            average_duration=self._total_tick_duration / self._tick_count if self._tick_count > 0 else 0,
+            max_duration=self._max_tick_duration,
+            last_duration=self._last_tick_duration,
+            average_lag=self._total_tick_lag / self._tick_count if self._tick_count > 0 else 0,
+            max_lag=self._max_tick_lag,
+        )
+
+    def reset_tick_statistics(self):
+        self._tick_count = 0
+        self._total_tick_duration = 0
+        self._max_tick_duration = 0
+        self._last_tick_duration = 0
+        self._total_tick_lag = 0
+        self._max_tick_lag = 0
+
     def start(self, clock: Clock):
         self.c_start(clock, clock.current_timestamp)
 
@@ -1,7 +1,7 @@
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
-from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, list_connector_configs
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
 
@@ -28,6 +28,7 @@ class TradingPairFetcher:
     def __init__(self, client_config_map: ClientConfigAdapter):
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
+        self._fetch_requested: Set[str] = set()
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
     def _fetch_pairs_from_connector_setting(
@@ -48,26 +49,50 @@ class TradingPairFetcher:
             safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
+        """
+        Fetches the trading pairs of the connected connectors, or of all the connectors if the client is configured
+        to fetch the pairs from all the exchanges. The pairs of the other connectors are fetched when first requested
+        (see fetch_trading_pairs), so their modules are not imported unless they are used.
+        """
         connector_settings = self._all_connector_settings()
-        for conn_setting in connector_settings.values():
-            # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
-            # data source module for them.
-            try:
-                if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
-                        connector_setting=connector_settings[conn_setting.parent_name],
-                        connector_name=conn_setting.name
-                    )
-                else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-            except ModuleNotFoundError:
-                continue
-            except Exception:
-                self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
-                                        "Please check the logs")
+        if client_config_map.fetch_pairs_from_all_exchanges:
+            connector_names = list(connector_settings.keys())
+        else:
+            connector_names = [name for name in self._connected_connector_names() if name in connector_settings]
+        for connector_name in connector_names:
+            self._fetch_pairs(connector_name, connector_settings)
 
         self.ready = True
 
+    def fetch_trading_pairs(self, connector_name: str):
+        """
+        Starts fetching the trading pairs of the connector, unless they have already been requested.
+        """
+        connector_settings = self._all_connector_settings()
+        if connector_name in connector_settings:
+            self._fetch_pairs(connector_name, connector_settings)
+
+    def _fetch_pairs(self, connector_name: str, connector_settings: Dict[str, ConnectorSetting]):
+        if connector_name in self._fetch_requested:
+            return
+        self._fetch_requested.add(connector_name)
+        conn_setting = connector_settings[connector_name]
+        # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
+        # data source module for them.
+        try:
+            if conn_setting.base_name().endswith("paper_trade"):
+                self._fetch_pairs_from_connector_setting(
+                    connector_setting=connector_settings[conn_setting.parent_name],
+                    connector_name=conn_setting.name
+                )
+            else:
+                self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+        except ModuleNotFoundError:
+            pass
+        except Exception:
+            self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
+                                    "Please check the logs")
+
     async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
         try:
             pairs = await fetch_fn
@@ -82,6 +107,10 @@ class TradingPairFetcher:
         # Method created to enabling patching in unit tests
         return AllConnectorSettings.get_connector_settings()
 
+    @staticmethod
+    def _connected_connector_names() -> List[str]:
+        return [connector_config_path.stem for connector_config_path in list_connector_configs()]
+
     @staticmethod
     def _get_client_config_map() -> "ClientConfigAdapter":
         from hummingbot.client.hummingbot_application import HummingbotApplication
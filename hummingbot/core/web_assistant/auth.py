@@ -9,7 +9,12 @@ class AuthBase(ABC):
     Hint: If the authentication requires a simple REST request to acquire information from the
     server that is required in the message signature, this class can be passed a `RESTConnection`
     object that it can use to that end.
+
+    Authentication classes that sign the request data set `authenticates_unserialized_data` to receive the data of
+    the requests sent with `RESTAssistant.execute_request` as a dictionary instead of a JSON string. They are then
+    responsible for setting the data in the form it has to be sent, which saves serializing the data twice.
     """
+    authenticates_unserialized_data: bool = False
 
     @abstractmethod
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
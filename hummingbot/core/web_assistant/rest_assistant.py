@@ -51,7 +51,14 @@ class RESTAssistant:
                              else "application/x-www-form-urlencoded")}
         local_headers.update(headers)
 
-        data = json.dumps(data) if data is not None else data
+        # The request is built here, so it is not deep-copied before being processed. Copying the parameters is
+        # enough to keep the caller's dictionaries unchanged by the authentication.
+        params = dict(params) if params is not None else params
+        if data is not None:
+            if is_auth_required and self._auth is not None and self._auth.authenticates_unserialized_data:
+                data = dict(data)
+            else:
+                data = json.dumps(data)
 
         request = RESTRequest(
             method=method,
@@ -64,7 +71,7 @@ class RESTAssistant:
         )
 
         async with self._throttler.execute_task(limit_id=throttler_limit_id):
-            response = await self.call(request=request, timeout=timeout)
+            response = await self._call(request=request, timeout=timeout)
 
             if 400 <= response.status:
                 if return_err:
@@ -79,6 +86,9 @@ class RESTAssistant:
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
         request = deepcopy(request)
+        return await self._call(request=request, timeout=timeout)
+
+    async def _call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         resp = await wait_for(self._connection.call(request), timeout)
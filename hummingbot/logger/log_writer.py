@@ -0,0 +1,177 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+FLOOD_POLICIES = ("drop", "sample")
+
+
+class LogWriter:
+    """
+    Writes the log records through their handlers from a dedicated thread, so the threads that log (the event loop
+    thread above all) never wait for the disk or the CLI log pane.
+
+    The records are passed to the writer thread through a bounded queue. A flood of low level records (DEBUG by
+    default) can't fill it up and block the logging threads: with the `drop` policy the flood records that don't fit
+    in the queue are dropped, with the `sample` policy only one flood record out of `sample_rate` is kept once the
+    queue is more than `sample_threshold` full. Records above the flood level are never dropped, they wait for room in
+    the queue instead.
+
+    The counters of dropped records and of records written more than `lag_threshold` seconds after being logged show
+    whether the writer keeps up with the logging activity.
+    """
+    _shared_instance: Optional["LogWriter"] = None
+    _sentinel = object()
+
+    @classmethod
+    def get_instance(cls) -> Optional["LogWriter"]:
+        return cls._shared_instance
+
+    @classmethod
+    def start_shared_instance(cls, **kwargs) -> "LogWriter":
+        cls.stop_shared_instance()
+        cls._shared_instance = LogWriter(**kwargs)
+        cls._shared_instance.start()
+        return cls._shared_instance
+
+    @classmethod
+    def stop_shared_instance(cls):
+        if cls._shared_instance is not None:
+            cls._shared_instance.stop()
+            cls._shared_instance = None
+
+    def __init__(self,
+                 max_queue_size: int = 10000,
+                 flood_level: Union[int, str] = logging.DEBUG,
+                 flood_policy: str = "drop",
+                 sample_rate: int = 10,
+                 sample_threshold: float = 0.5,
+                 lag_threshold: float = 1.0):
+        if flood_policy not in FLOOD_POLICIES:
+            raise ValueError(f"Invalid log flood policy {flood_policy}, please choose a value from {FLOOD_POLICIES}.")
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._flood_level = logging.getLevelName(flood_level) if isinstance(flood_level, str) else flood_level
+        self._flood_policy = flood_policy
+        self._sample_rate = sample_rate
+        self._sample_queue_size = int(max_queue_size * sample_threshold)
+        self._lag_threshold = lag_threshold
+        self._sampled_flood_records = 0
+        self._thread: Optional[threading.Thread] = None
+
+        # Updated by the logging threads
+        self.enqueued_records = 0
+        self.dropped_records = 0
+        # Updated by the writer thread
+        self.written_records = 0
+        self.lagged_records = 0
+        self.max_lag = 0.0
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def started(self) -> bool:
+        return self._thread is not None
+
+    def counters(self) -> Dict[str, float]:
+        return {
+            "enqueued_records": self.enqueued_records,
+            "dropped_records": self.dropped_records,
+            "written_records": self.written_records,
+            "lagged_records": self.lagged_records,
+            "max_lag": self.max_lag,
+            "queue_size": self.queue_size,
+        }
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._write_records, name="LogWriter", daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def stop(self):
+        """
+        Writes the records already in the queue and stops the writer thread.
+        """
+        if self._thread is not None:
+            self._queue.put(self._sentinel)
+            self._thread.join()
+            self._thread = None
+            atexit.unregister(self.stop)
+
+    def enqueue(self, handler: logging.Handler, record: logging.LogRecord):
+        item: Tuple[logging.Handler, logging.LogRecord, float] = (handler, record, time.monotonic())
+        if record.levelno > self._flood_level:
+            self._queue.put(item)
+        else:
+            if self._flood_policy == "sample" and self._queue.qsize() >= self._sample_queue_size:
+                self._sampled_flood_records += 1
+                if self._sampled_flood_records % self._sample_rate != 0:
+                    self.dropped_records += 1
+                    return
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self.dropped_records += 1
+                return
+        self.enqueued_records += 1
+
+    def _write_records(self):
+        while True:
+            item = self._queue.get()
+            if item is self._sentinel:
+                break
+            handler, record, enqueue_time = item
+            lag = time.monotonic() - enqueue_time
+            if lag > self._lag_threshold:
+                self.lagged_records += 1
+            self.max_lag = max(self.max_lag, lag)
+            try:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            except Exception:
+                handler.handleError(record)
+            self.written_records += 1
+
+
+class QueueLogHandler(QueueHandler):
+    """
+    Hands the records over to the log writer thread, which writes them through the target handler.
+    """
+
+    def __init__(self, target: logging.Handler, log_writer: LogWriter):
+        super().__init__(queue=None)
+        self.target = target
+        self.log_writer = log_writer
+        self.setLevel(target.level)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The record is formatted by the target handler in the writer thread. Only the message is merged with its
+        # arguments here, so it does not change if the logged objects change before the record is written.
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        self.log_writer.enqueue(self.target, record)
+
+
+def route_loggers_through_log_writer(logger_names: Iterable[str], log_writer: LogWriter):
+    """
+    Replaces the handlers of the loggers (and of the root logger) with handlers that write through the log writer.
+    """
+    queue_handlers: Dict[int, QueueLogHandler] = {}
+    loggers = [logging.getLogger()] + [logging.getLogger(logger_name) for logger_name in logger_names]
+    for logger in loggers:
+        for handler in list(logger.handlers):
+            if isinstance(handler, QueueLogHandler):
+                continue
+            if id(handler) not in queue_handlers:
+                queue_handlers[id(handler)] = QueueLogHandler(handler, log_writer)
+            logger.removeHandler(handler)
+            logger.addHandler(queue_handlers[id(handler)])
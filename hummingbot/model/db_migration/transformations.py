@@ -5,6 +5,8 @@ from sqlalchemy import (
 )
 
 from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
+from hummingbot.model.funding_payment import FundingPayment  # noqa: F401 — registers the table in the metadata
+from hummingbot.model.market_state import MarketState  # noqa: F401 — registers the table in the metadata
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 
 
@@ -134,3 +136,30 @@ class ConvertPriceAndAmountColumnsToBigint(DatabaseTransformation):
     @property
     def to_version(self):
         return 20220130
+
+
+class CreateMissingIndexesAndUseWALJournal(DatabaseTransformation):
+    """
+    Creates the indexes declared by the models that are missing in the database (the MarketState index was never
+    created because the model declared it in a misspelled attribute) and switches the database to WAL journaling.
+    """
+    market_state_duplicates_query = ('delete from MarketState where id not in '
+                                     '(select max(id) from MarketState group by config_file_path, market);')
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        # The MarketState index is unique, only the last saved state of each market is kept
+        db_handle.engine.execute(self.market_state_duplicates_query)
+        for table in db_handle.get_declarative_base().metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=db_handle.engine, checkfirst=True)
+        if db_handle.engine.dialect.name == "sqlite":
+            db_handle.engine.execute("PRAGMA journal_mode=WAL;")
+        return db_handle
+
+    @property
+    def name(self):
+        return "CreateMissingIndexesAndUseWALJournal"
+
+    @property
+    def to_version(self):
+        return 20221015
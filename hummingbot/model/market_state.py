@@ -14,8 +14,8 @@ from . import HummingbotBase
 
 class MarketState(HummingbotBase):
     __tablename__ = "MarketState"
-    __table_args = (Index("ms_config_market_index",
-                          "config_file_path", "market", unique=True),)
+    __table_args__ = (Index("ms_config_market_index",
+                            "config_file_path", "market", unique=True),)
 
     id = Column(Integer, primary_key=True, nullable=False)
     config_file_path = Column(Text, nullable=False)
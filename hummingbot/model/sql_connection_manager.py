@@ -1,10 +1,10 @@
 import logging
 from enum import Enum
 from os.path import join
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-from sqlalchemy import MetaData, create_engine, inspect
-from sqlalchemy.engine.base import Engine
+from sqlalchemy import MetaData, create_engine, event, inspect
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
 
@@ -27,7 +27,18 @@ class SQLConnectionManager(TransactionBase):
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20220130"
+    LOCAL_DB_VERSION_VALUE = "20221015"
+
+    # Storage profile applied to every connection to a SQLite database.
+    # With WAL journaling the reads (history, export) do not block the recorder writes, and with synchronous NORMAL
+    # only the checkpoints wait for the disk sync (commits can only be lost on power failure, never corrupted).
+    SQLITE_PRAGMAS: Dict[str, str] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": "-32000",  # 32 MB
+        "mmap_size": "268435456",  # 256 MB
+        "temp_store": "MEMORY",
+    }
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -73,6 +84,14 @@ class SQLConnectionManager(TransactionBase):
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            if self._engine.dialect.name == "sqlite":
+                event.listen(self._engine, "connect", self._set_sqlite_pragmas)
+                # pysqlite starts the transactions itself only before DML statements and commits on RELEASE SAVEPOINT,
+                # so SAVEPOINTs (session.begin_nested) do not work. SQLAlchemy takes over emitting BEGIN instead.
+                # See: https://docs.sqlalchemy.org/en/14/dialects/sqlite.html#serializable-isolation-savepoints-transactional-ddl
+                if self._engine.dialect.driver == "pysqlite":
+                    event.listen(self._engine, "connect", self._disable_pysqlite_transaction_handling)
+                    event.listen(self._engine, "begin", self._begin_sqlite_transaction)
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -96,6 +115,21 @@ class SQLConnectionManager(TransactionBase):
         if connection_type is SQLConnectionType.TRADE_FILLS and (not called_from_migrator):
             self.check_and_migrate_db(client_config_map)
 
+    @classmethod
+    def _set_sqlite_pragmas(cls, dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in cls.SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
+    @staticmethod
+    def _disable_pysqlite_transaction_handling(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @staticmethod
+    def _begin_sqlite_transaction(connection: Connection):
+        connection.exec_driver_sql("BEGIN")
+
     @property
     def engine(self) -> Engine:
         return self._engine
@@ -118,15 +152,15 @@ class SQLConnectionManager(TransactionBase):
                     version_info: LocalMetadata = LocalMetadata(key=self.LOCAL_DB_VERSION_KEY,
                                                                 value=self.LOCAL_DB_VERSION_VALUE)
                     session.add(version_info)
-                    session.commit()
-                else:
-                    # There's no past db version to upgrade from at this moment. So we'll just update the version value
-                    # if needed.
-                    if local_db_version.value < self.LOCAL_DB_VERSION_VALUE:
-                        was_migration_successful = Migrator().migrate_db_to_version(
-                            client_config_map, self, int(local_db_version.value), int(self.LOCAL_DB_VERSION_VALUE)
-                        )
-                        if was_migration_successful:
-                            # Cannot use variable local_db_version because reference is not valid
-                            # since Migrator changed it
-                            self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
+                    return
+                current_version = local_db_version.value
+
+        # The migrator replaces the database file, so no session can be open while it runs
+        if current_version < self.LOCAL_DB_VERSION_VALUE:
+            was_migration_successful = Migrator().migrate_db_to_version(
+                client_config_map, self, int(current_version), int(self.LOCAL_DB_VERSION_VALUE)
+            )
+            if was_migration_successful:
+                with self.get_new_session() as session:
+                    with session.begin():
+                        self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
@@ -4,17 +4,31 @@ cimport numpy as np
 
 cdef class RingBuffer:
     cdef:
+        np.ndarray _array
         np.float64_t[:] _buffer
         int64_t _delimiter
         int64_t _length
         bint _is_full
+        double _shift
+        double _shifted_sum
+        double _shifted_sum_of_squares
+        int64_t _non_finite_count
 
-    cdef void c_add_value(self, float val)
+    cdef void c_reset(self, int64_t length)
+    cdef void c_add_value(self, double val)
     cdef void c_increment_delimiter(self)
+    cdef void c_resync_statistics(self)
+    cdef void c_add_to_statistics(self, double val)
+    cdef void c_remove_from_statistics(self, double val)
     cdef double c_get_last_value(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
+    cdef int64_t c_size(self)
+    cdef double c_sum(self)
+    cdef double c_current_mean(self)
+    cdef double c_current_variance(self)
     cdef double c_mean_value(self)
     cdef double c_variance(self)
     cdef double c_std_dev(self)
+    cdef np.ndarray c_get_ordered_view(self)
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self)
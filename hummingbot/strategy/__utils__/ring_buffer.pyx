@@ -1,11 +1,23 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isfinite, sqrt
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of doubles keeping the last values added.
+
+    The values are written twice, at their position and at their position plus the buffer length, so the values in
+    insertion order are always a contiguous slice of the storage and can be read without copying.
+    Mean and variance are kept up to date in O(1) on every insertion using running sums of the values shifted by a
+    reference value close to the mean, which avoids the precision loss of plain sums of squares. The sums are
+    recalculated from the stored values every time the buffer wraps around, so rounding errors do not accumulate.
+    Non finite values (nan, inf) are only counted and left out of the sums: while the buffer holds any of them the
+    statistics are calculated from the stored values, and the sums are valid again as soon as they leave the buffer.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -13,68 +25,159 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+    def __cinit__(self, int64_t length):
+        self.c_reset(length)
 
     def __dealloc__(self):
+        self._array = None
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_reset(self, int64_t length):
+        self._length = length
+        self._array = np.zeros(2 * length, dtype=np.float64)
+        self._buffer = self._array
+        self._delimiter = 0
+        self._is_full = False
+        self._shift = 0
+        self._shifted_sum = 0
+        self._shifted_sum_of_squares = 0
+        self._non_finite_count = 0
+
+    cdef void c_add_value(self, double val):
+        if self._is_full:
+            self.c_remove_from_statistics(self._buffer[self._delimiter])
+        self.c_add_to_statistics(val)
         self._buffer[self._delimiter] = val
+        self._buffer[self._delimiter + self._length] = val
         self.c_increment_delimiter()
 
+        if self._delimiter == 0:
+            self.c_resync_statistics()
+
+    cdef void c_add_to_statistics(self, double val):
+        cdef:
+            double shifted_value
+
+        if not isfinite(val):
+            self._non_finite_count += 1
+            return
+        # When the buffer is full the value being replaced has already been removed from the statistics
+        if self.c_size() - self._is_full == self._non_finite_count:
+            # First finite value in the statistics
+            self._shift = val
+            self._shifted_sum = 0
+            self._shifted_sum_of_squares = 0
+        shifted_value = val - self._shift
+        self._shifted_sum += shifted_value
+        self._shifted_sum_of_squares += shifted_value * shifted_value
+
+    cdef void c_remove_from_statistics(self, double val):
+        cdef:
+            double shifted_value
+
+        if not isfinite(val):
+            self._non_finite_count -= 1
+            return
+        shifted_value = val - self._shift
+        self._shifted_sum -= shifted_value
+        self._shifted_sum_of_squares -= shifted_value * shifted_value
+
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_resync_statistics(self):
+        cdef:
+            int64_t i
+            int64_t size = self.c_size()
+            int64_t start = self._delimiter if self._is_full else 0
+            int64_t finite_count = size - self._non_finite_count
+            double shifted_value
+
+        if finite_count == 0:
+            return
+        # The mean of the finite values is the reference value, unless the sums overflowed
+        self._shift = self._shift + self._shifted_sum / finite_count
+        if not isfinite(self._shift):
+            for i in range(start, start + size):
+                if isfinite(self._buffer[i]):
+                    self._shift = self._buffer[i]
+                    break
+        self._shifted_sum = 0
+        self._shifted_sum_of_squares = 0
+        for i in range(start, start + size):
+            if isfinite(self._buffer[i]):
+                shifted_value = self._buffer[i] - self._shift
+                self._shifted_sum += shifted_value
+                self._shifted_sum_of_squares += shifted_value * shifted_value
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
-        return self._buffer[self._delimiter-1]
+        return self._buffer[self._delimiter + self._length - 1]
 
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_sum(self):
+        if self._non_finite_count > 0:
+            return np.sum(self.c_get_ordered_view())
+        return self._shift * self.c_size() + self._shifted_sum
+
+    cdef double c_current_mean(self):
+        cdef:
+            int64_t size = self.c_size()
+        if size == 0:
+            return np.nan
+        if self._non_finite_count > 0:
+            return np.mean(self.c_get_ordered_view())
+        return self._shift + self._shifted_sum / size
+
+    cdef double c_current_variance(self):
+        cdef:
+            int64_t size = self.c_size()
+            double variance
+        if size == 0:
+            return np.nan
+        if self._non_finite_count > 0:
+            return np.var(self.c_get_ordered_view())
+        variance = (self._shifted_sum_of_squares - self._shifted_sum * self._shifted_sum / size) / size
+        return max(variance, 0.0)
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_current_mean()
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_current_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_current_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
-
-        if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
-        else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+    cdef np.ndarray c_get_ordered_view(self):
+        cdef:
+            int64_t start = self._delimiter if self._is_full else 0
+            np.ndarray view = self._array[start:start + self.c_size()]
+        view.flags.writeable = False
+        return view
 
-    def __init__(self, length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
-        self._delimiter = 0
-        self._is_full = False
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return self.c_get_ordered_view().copy()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +185,13 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_ordered_view(self) -> np.ndarray:
+        """
+        Returns a read-only view of the values in insertion order, without copying them. The view shares the buffer
+        storage, so it is only valid until the next value is added.
+        """
+        return self.c_get_ordered_view()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +199,28 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
+    @property
+    def sum(self) -> float:
+        return self.c_sum()
+
+    @property
+    def current_mean(self) -> float:
+        """
+        Mean of the values in the buffer, even if it is not full yet (nan if empty)
+        """
+        return self.c_current_mean()
+
+    @property
+    def current_variance(self) -> float:
+        """
+        Population variance of the values in the buffer, even if it is not full yet (nan if empty)
+        """
+        return self.c_current_variance()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -109,10 +241,7 @@ cdef class RingBuffer:
     def length(self, value):
         data = self.get_as_numpy_array()
 
-        self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(value)
 
         for val in data[-value:]:
             self.add_value(val)
@@ -1,18 +1,34 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Log returns between consecutive samples of the sampling buffer, so their variance is updated in O(1)
+        self._log_returns_buffer = RingBuffer(max(sampling_length - 1, 1))
+
+    def add_sample(self, value: float):
+        if self._sampling_buffer.size > 0:
+            self._log_returns_buffer.add_value(np.log(float(value) / self._sampling_buffer.get_last_value()))
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        # The processing calculation treats the variance of less than one return as 0
+        if self._sampling_buffer.size < 2:
+            return 0.0
+        return self._log_returns_buffer.current_variance
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        if self._processing_buffer.size > 0:
+            mean = self._processing_buffer.current_mean
+            if not np.isfinite(mean):
+                mean = np.mean(np.nan_to_num(self._processing_buffer.get_ordered_view()))
+            return np.sqrt(mean)
+
+    def _sampling_length_changed(self):
+        prices = self._sampling_buffer.get_as_numpy_array()
+        self._log_returns_buffer = RingBuffer(max(self._sampling_buffer.length - 1, 1))
+        for log_return in np.diff(np.log(prices)):
+            self._log_returns_buffer.add_value(log_return)
@@ -1,19 +1,33 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Squared differences between consecutive samples of the sampling buffer, so their sum is updated in O(1)
+        self._squared_diffs_buffer = RingBuffer(max(sampling_length - 1, 1))
+
+    def add_sample(self, value: float):
+        if self._sampling_buffer.size > 0:
+            self._squared_diffs_buffer.add_value((float(value) - self._sampling_buffer.get_last_value()) ** 2)
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        squared_diffs_sum = self._squared_diffs_buffer.sum if self._sampling_buffer.size > 1 else 0.0
+        vol = np.sqrt(squared_diffs_sum / self._sampling_buffer.size)
         return vol
 
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
+
+    def _sampling_length_changed(self):
+        samples = self._sampling_buffer.get_as_numpy_array()
+        self._squared_diffs_buffer = RingBuffer(max(self._sampling_buffer.length - 1, 1))
+        for squared_diff in np.square(np.diff(samples)):
+            self._squared_diffs_buffer.add_value(squared_diff)
@@ -1,8 +1,11 @@
+import logging
+import threading
 from decimal import Decimal, InvalidOperation
-from typing import Optional
+from typing import Optional, Tuple
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.logger import HummingbotLogger
 from hummingbot.model.inventory_cost import InventoryCost
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 
@@ -10,29 +13,59 @@ s_decimal_0 = Decimal("0")
 
 
 class InventoryCostPriceDelegate:
+    """
+    Keeps the inventory cost (base and quote volume aggregate) of a trading pair in memory.
+    The aggregate is loaded from the database when the delegate is created and updated on every fill, so price lookups
+    do not access the database. The updated aggregate is written to the database by a background thread; when several
+    fills arrive before a write completes only the latest aggregate is written.
+    In-memory SQLite databases are only visible from the connection that created them, so for those the aggregate is
+    written synchronously.
+    Since the database is not read again, the inventory cost of a running strategy has to be changed with
+    `set_inventory_cost` (the next write would otherwise overwrite the new value).
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
     def __init__(self, sql: SQLConnectionManager, trading_pair: str) -> None:
         self.base_asset, self.quote_asset = trading_pair.split("-")
         self.sql_manager = sql
 
+        self._base_volume: Optional[Decimal] = None
+        self._quote_volume: Optional[Decimal] = None
+        self._pending_volumes: Optional[Tuple[Decimal, Decimal]] = None
+        self._write_in_progress: bool = False
+        self._stop_requested: bool = False
+        self._write_condition: threading.Condition = threading.Condition()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._write_in_background: bool = not self._is_in_memory_database(sql)
+
+        self._load_inventory_cost()
+
     @property
     def ready(self) -> bool:
         return True
 
-    def get_price(self) -> Optional[Decimal]:
-        with self.sql_manager.get_new_session() as session:
-            with session.begin():
-                record = InventoryCost.get_record(
-                    session, self.base_asset, self.quote_asset
-                )
+    @property
+    def base_volume(self) -> Optional[Decimal]:
+        return self._base_volume
 
-                if record is None or record.base_volume is None or record.base_volume is None:
-                    return None
+    @property
+    def quote_volume(self) -> Optional[Decimal]:
+        return self._quote_volume
 
-                try:
-                    price = record.quote_volume / record.base_volume
-                except InvalidOperation:
-                    return None
-                return Decimal(price)
+    def get_price(self) -> Optional[Decimal]:
+        if self._base_volume is None or self._quote_volume is None:
+            return None
+        try:
+            price = self._quote_volume / self._base_volume
+        except InvalidOperation:
+            return None
+        return Decimal(price)
 
     def process_order_fill_event(self, fill_event: OrderFilledEvent) -> None:
         base_asset, quote_asset = fill_event.trading_pair.split("-")
@@ -58,17 +91,96 @@ class InventoryCostPriceDelegate:
                     # Ok, some other asset used (like BNB), assume that we paid in base asset for simplicity
                     base_volume /= 1 + fill_event.trade_fee.percent
 
+        if fill_event.trade_type == TradeType.SELL:
+            if self._base_volume is None:
+                raise RuntimeError("Sold asset without having inventory price set. This should not happen.")
+
+            # We're keeping initial buy price intact. Profits are not changing inventory price intentionally.
+            quote_volume = -(Decimal(self._quote_volume / self._base_volume) * base_volume)
+            base_volume = -base_volume
+
+        self._base_volume = (self._base_volume or s_decimal_0) + base_volume
+        self._quote_volume = (self._quote_volume or s_decimal_0) + quote_volume
+        self._schedule_write(self._base_volume, self._quote_volume)
+
+    def set_inventory_cost(self, base_volume: Decimal, quote_volume: Decimal):
+        """
+        Replaces the inventory cost aggregate, and writes it to the database.
+        """
+        self._base_volume = base_volume
+        self._quote_volume = quote_volume
+        self._schedule_write(base_volume, quote_volume)
+
+    def flush(self):
+        """
+        Blocks until the last inventory cost update has been written to the database.
+        """
+        with self._write_condition:
+            while self._pending_volumes is not None or self._write_in_progress:
+                self._write_condition.wait()
+
+    def stop(self):
+        """
+        Writes the pending inventory cost update and stops the writer thread. The thread is started again by the next
+        fill.
+        """
+        if self._writer_thread is None:
+            return
+        with self._write_condition:
+            self._stop_requested = True
+            self._write_condition.notify_all()
+        self._writer_thread.join()
+        self._writer_thread = None
+        self._stop_requested = False
+
+    def _load_inventory_cost(self):
         with self.sql_manager.get_new_session() as session:
             with session.begin():
-                if fill_event.trade_type == TradeType.SELL:
-                    record = InventoryCost.get_record(session, base_asset, quote_asset)
-                    if not record:
-                        raise RuntimeError("Sold asset without having inventory price set. This should not happen.")
+                record = InventoryCost.get_record(session, self.base_asset, self.quote_asset)
+                if record is not None and record.base_volume is not None and record.quote_volume is not None:
+                    self._base_volume = Decimal(record.base_volume)
+                    self._quote_volume = Decimal(record.quote_volume)
+
+    @staticmethod
+    def _is_in_memory_database(sql: SQLConnectionManager) -> bool:
+        url = sql.engine.url
+        return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+    def _schedule_write(self, base_volume: Decimal, quote_volume: Decimal):
+        if not self._write_in_background:
+            self._write_volumes(base_volume, quote_volume)
+            return
+        with self._write_condition:
+            self._pending_volumes = (base_volume, quote_volume)
+            self._write_condition.notify_all()
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="InventoryCostWriter", daemon=True
+            )
+            self._writer_thread.start()
 
-                    # We're keeping initial buy price intact. Profits are not changing inventory price intentionally.
-                    quote_volume = -(Decimal(record.quote_volume / record.base_volume) * base_volume)
-                    base_volume = -base_volume
+    def _writer_loop(self):
+        while True:
+            with self._write_condition:
+                while self._pending_volumes is None and not self._stop_requested:
+                    self._write_condition.wait()
+                if self._pending_volumes is None:
+                    return
+                base_volume, quote_volume = self._pending_volumes
+                self._pending_volumes = None
+                self._write_in_progress = True
+            try:
+                self._write_volumes(base_volume, quote_volume)
+            except Exception:
+                self.logger().error("Unexpected error writing the inventory cost to the database.", exc_info=True)
+            finally:
+                with self._write_condition:
+                    self._write_in_progress = False
+                    self._write_condition.notify_all()
 
+    def _write_volumes(self, base_volume: Decimal, quote_volume: Decimal):
+        with self.sql_manager.get_new_session() as session:
+            with session.begin():
                 InventoryCost.add_volume(
-                    session, base_asset, quote_asset, base_volume, quote_volume
+                    session, self.base_asset, self.quote_asset, base_volume, quote_volume, overwrite=True
                 )
@@ -717,6 +717,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     cdef c_stop(self, Clock clock):
         self._hanging_orders_tracker.unregister_events(self.active_markets)
+        if self._inventory_cost_price_delegate is not None:
+            self._inventory_cost_price_delegate.stop()
         StrategyBase.c_stop(self, clock)
 
     cdef c_tick(self, double timestamp):
@@ -37,6 +37,7 @@ def main():
     package_data = {
         "hummingbot": [
             "core/cpp/*",
+            "connector/connector_manifest.json",
             "VERSION",
             "templates/*TEMPLATE.yml"
         ],
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+"""
+Compares the CPU cost of the AsyncThrottler and the SlidingWindowThrottler when executing a burst of requests across
+linked limits (a per endpoint limit linked to two shared pools, similar to the weights used by Binance).
+The limits are large enough for the requests to never wait, so the measured time is pure throttler overhead.
+
+Usage: python -m test.benchmark.benchmark_async_throttler [number_of_requests]
+"""
+
+import asyncio
+import sys
+import time
+from decimal import Decimal
+from typing import List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+
+REQUEST_WEIGHT_POOL = "REQUEST_WEIGHT"
+ORDERS_POOL = "ORDERS"
+CREATE_ORDER = "/order"
+CANCEL_ORDER = "/order/cancel"
+
+RATE_LIMITS: List[RateLimit] = [
+    RateLimit(limit_id=REQUEST_WEIGHT_POOL, limit=1_000_000, time_interval=60),
+    RateLimit(limit_id=ORDERS_POOL, limit=1_000_000, time_interval=10),
+    RateLimit(limit_id=CREATE_ORDER, limit=1_000_000, time_interval=60,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT_POOL, 1), LinkedLimitWeightPair(ORDERS_POOL, 1)]),
+    RateLimit(limit_id=CANCEL_ORDER, limit=1_000_000, time_interval=60,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT_POOL, 1), LinkedLimitWeightPair(ORDERS_POOL, 1)]),
+]
+
+
+async def run_requests(throttler: AsyncThrottlerBase, number_of_requests: int) -> float:
+    limit_ids = [CREATE_ORDER, CANCEL_ORDER]
+    start = time.perf_counter()
+    for i in range(number_of_requests):
+        async with throttler.execute_task(limit_id=limit_ids[i % 2]):
+            pass
+    return time.perf_counter() - start
+
+
+async def main(number_of_requests: int):
+    print(f"{number_of_requests} requests across linked limits")
+    for throttler_class in [SlidingWindowThrottler, AsyncThrottler]:
+        throttler = throttler_class(rate_limits=RATE_LIMITS, limits_share_percentage=Decimal("100"))
+        elapsed = await run_requests(throttler, number_of_requests)
+        print(f"{throttler_class.__name__:>24}: {elapsed:.3f}s total, "
+              f"{elapsed / number_of_requests * 1e6:.1f}us per request")
+
+
+if __name__ == "__main__":
+    requests_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    with patch("hummingbot.core.api_throttler.async_request_context_base.AsyncRequestContextBase.logger"):
+        asyncio.get_event_loop().run_until_complete(main(requests_count))
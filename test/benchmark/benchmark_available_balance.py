@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of the estimated available balance of a connector without real time balance updates, with the
+full calculation from the fill events and in flight orders (apply_balance_update_since_snapshot) and with the
+incremental balance ledger (get_available_balance), for a long running connector with many fills and open orders.
+
+Usage: python -m test.benchmark.benchmark_available_balance
+"""
+
+import time
+from decimal import Decimal
+from typing import Dict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+
+FILLS = 10000
+ORDERS = 40
+CALLS = 2000
+START_TIMESTAMP = 1640000000.0
+
+
+class BenchmarkConnector(ConnectorBase):
+    def __init__(self, client_config_map: ClientConfigAdapter):
+        super().__init__(client_config_map)
+        self._in_flight_orders = {}
+
+    @property
+    def in_flight_orders(self) -> Dict[str, InFlightOrder]:
+        return self._in_flight_orders
+
+    def estimate_fee_pct(self, is_maker: bool) -> Decimal:
+        return Decimal("0.001")
+
+
+def main():
+    connector = BenchmarkConnector(ClientConfigAdapter(ClientConfigMap()))
+    connector.real_time_balance_update = False
+    connector._account_available_balances = {"COINALPHA": Decimal("1000"), "HBOT": Decimal("1000000")}
+    connector.in_flight_orders_snapshot_timestamp = START_TIMESTAMP
+    for i in range(FILLS):
+        connector.trigger_event(MarketEvent.OrderFilled, OrderFilledEvent(
+            timestamp=START_TIMESTAMP + 1 + i,
+            order_id=f"FILLED{i}",
+            trading_pair="COINALPHA-HBOT",
+            trade_type=TradeType.BUY if i % 2 == 0 else TradeType.SELL,
+            order_type=OrderType.LIMIT,
+            price=Decimal("100") + Decimal(i % 10),
+            amount=Decimal("0.1"),
+            trade_fee=AddedToCostTradeFee(),
+        ))
+    for i in range(ORDERS):
+        order = InFlightOrder(
+            client_order_id=f"OID{i}",
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY if i % 2 == 0 else TradeType.SELL,
+            price=Decimal("100") + Decimal(i % 10),
+            amount=Decimal("1"),
+            creation_timestamp=START_TIMESTAMP,
+        )
+        connector.in_flight_orders[order.client_order_id] = order
+
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        full_balance = connector.apply_balance_update_since_snapshot("HBOT", Decimal("1000000"))
+    full_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        ledger_balance = connector.get_available_balance("HBOT")
+    ledger_time = time.perf_counter() - start
+    assert full_balance == ledger_balance
+
+    print(f"{FILLS} fills since the balance snapshot, {ORDERS} in flight orders")
+    print(f"{'full calculation':>24}: {full_time / CALLS * 1e6:10.2f} us/call")
+    print(f"{'balance ledger':>24}: {ledger_time / CALLS * 1e6:10.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
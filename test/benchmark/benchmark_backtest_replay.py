@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+
+"""
+Measures the throughput of the backtest replay engine (order book level updates replayed per second of wall time),
+replaying synthetic market data alone and with a paper trade market and a pure market making strategy, and compares
+it with applying the same diffs message by message as OrderBookRow lists.
+
+Usage: python -m test.benchmark.benchmark_backtest_replay
+"""
+
+import time
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade import create_backtest_paper_trade_market
+from hummingbot.core.backtesting.backtest_replay_engine import BacktestReplayEngine
+from hummingbot.core.backtesting.market_data import MarketDataRecordType, MarketDataSide, create_market_data_records
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+TRADING_PAIR = "ETH-USDT"
+START_TIMESTAMP = 1640000000.0
+DURATION = 3600
+MESSAGES_PER_SECOND = 50
+LEVELS_PER_MESSAGE = 20
+BOOK_LEVELS = 500
+
+
+def create_market_data() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    messages = DURATION * MESSAGES_PER_SECOND
+    records = create_market_data_records(2 * BOOK_LEVELS + messages * LEVELS_PER_MESSAGE)
+
+    snapshot = records[:2 * BOOK_LEVELS]
+    snapshot["timestamp"] = START_TIMESTAMP
+    snapshot["update_id"] = 1
+    snapshot["record_type"] = MarketDataRecordType.SNAPSHOT
+    snapshot["side"][:BOOK_LEVELS] = MarketDataSide.BID
+    snapshot["side"][BOOK_LEVELS:] = MarketDataSide.ASK
+    offsets = np.arange(1, BOOK_LEVELS + 1) * 0.1
+    snapshot["price"][:BOOK_LEVELS] = 1000 - offsets
+    snapshot["price"][BOOK_LEVELS:] = 1000 + offsets
+    snapshot["amount"] = 1
+
+    diffs = records[2 * BOOK_LEVELS:]
+    message_numbers = np.repeat(np.arange(messages), LEVELS_PER_MESSAGE)
+    diffs["timestamp"] = START_TIMESTAMP + (message_numbers + 1) / MESSAGES_PER_SECOND
+    diffs["update_id"] = message_numbers + 2
+    diffs["record_type"] = MarketDataRecordType.DIFF
+    sides = rng.integers(0, 2, len(diffs))
+    level_offsets = rng.integers(1, BOOK_LEVELS, len(diffs)) * 0.1
+    diffs["side"] = sides
+    diffs["price"] = np.where(sides == MarketDataSide.BID, 1000 - level_offsets, 1000 + level_offsets)
+    diffs["amount"] = rng.uniform(0, 2, len(diffs))
+    return records
+
+
+def replay(records: np.ndarray, with_strategy: bool) -> float:
+    clock = Clock(ClockMode.BACKTEST, 1.0, START_TIMESTAMP, START_TIMESTAMP + DURATION)
+    engine = BacktestReplayEngine()
+    clock.add_iterator(engine)
+    market = create_backtest_paper_trade_market("binance", ClientConfigAdapter(ClientConfigMap()), [TRADING_PAIR])
+    engine.add_market_data(TRADING_PAIR, market.order_books[TRADING_PAIR], records)
+    if with_strategy:
+        market.set_balance("ETH", 100)
+        market.set_balance("USDT", 100000)
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            MarketTradingPairTuple(market, TRADING_PAIR, "ETH", "USDT"),
+            bid_spread=Decimal("0.001"),
+            ask_spread=Decimal("0.001"),
+            order_amount=Decimal("0.1"),
+            order_refresh_time=10,
+        )
+        clock.add_iterator(market)
+        clock.add_iterator(strategy)
+    start = time.perf_counter()
+    engine.run(clock)
+    return time.perf_counter() - start
+
+
+def apply_messages(records: np.ndarray) -> float:
+    order_book = OrderBook()
+    snapshot = records[records["record_type"] == MarketDataRecordType.SNAPSHOT]
+    diffs = records[records["record_type"] == MarketDataRecordType.DIFF]
+    messages = []
+    for message in np.split(diffs, np.flatnonzero(np.diff(diffs["update_id"])) + 1):
+        bids = [OrderBookRow(price, amount, update_id)
+                for price, amount, update_id, side in zip(message["price"].tolist(),
+                                                          message["amount"].tolist(),
+                                                          message["update_id"].tolist(),
+                                                          message["side"].tolist())
+                if side == MarketDataSide.BID]
+        asks = [OrderBookRow(price, amount, update_id)
+                for price, amount, update_id, side in zip(message["price"].tolist(),
+                                                          message["amount"].tolist(),
+                                                          message["update_id"].tolist(),
+                                                          message["side"].tolist())
+                if side == MarketDataSide.ASK]
+        messages.append((bids, asks, int(message["update_id"][0])))
+    order_book.apply_snapshot([OrderBookRow(price, amount, 1)
+                               for price, amount, side in zip(snapshot["price"].tolist(),
+                                                              snapshot["amount"].tolist(),
+                                                              snapshot["side"].tolist())
+                               if side == MarketDataSide.BID],
+                              [OrderBookRow(price, amount, 1)
+                               for price, amount, side in zip(snapshot["price"].tolist(),
+                                                              snapshot["amount"].tolist(),
+                                                              snapshot["side"].tolist())
+                               if side == MarketDataSide.ASK],
+                              1)
+    start = time.perf_counter()
+    for bids, asks, update_id in messages:
+        order_book.apply_diffs(bids, asks, update_id)
+    return time.perf_counter() - start
+
+
+def main():
+    records = create_market_data()
+    updates = len(records)
+    print(f"{updates} level updates over {DURATION} seconds of market data, 1 second clock ticks")
+    for name, elapsed in [
+        ("message by message (OrderBookRow)", apply_messages(records)),
+        ("replay engine", replay(records, with_strategy=False)),
+        ("replay engine + pure market making", replay(records, with_strategy=True)),
+    ]:
+        print(f"{name:>36}: {elapsed:6.2f}s, {updates / elapsed:>12,.0f} updates/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of processing user stream events (order status updates resolved by exchange order id and trade
+updates resolved by client order id) in the ClientOrderTracker depending on the number of tracked orders, comparing the
+indexed tracker with the previous implementation (order dictionaries copied on each access and linear search by
+exchange order id).
+
+Usage: python -m test.benchmark.benchmark_client_order_tracker
+"""
+
+import asyncio
+import logging
+import time
+from decimal import Decimal
+from typing import Dict, Optional
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+
+TRACKED_ORDERS = [1_000, 10_000, 50_000]
+EVENTS = 2_000
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+class BenchmarkExchange(ExchangeBase):
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return dict()
+
+
+class PreviousClientOrderTracker(ClientOrderTracker):
+    """
+    Order lookups as implemented before the secondary indexes
+    """
+
+    @property
+    def cached_orders(self) -> Dict[str, InFlightOrder]:
+        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+
+    @property
+    def all_orders(self) -> Dict[str, InFlightOrder]:
+        return {**self.active_orders, **self.cached_orders}
+
+    @property
+    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+
+    @property
+    def lost_orders(self) -> Dict[str, InFlightOrder]:
+        return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
+
+    def fetch_order(self,
+                    client_order_id: Optional[str] = None,
+                    exchange_order_id: Optional[str] = None) -> Optional[InFlightOrder]:
+        found_order = None
+        if client_order_id in self.all_orders:
+            found_order = self.all_orders[client_order_id]
+        elif exchange_order_id is not None:
+            found_order = next(
+                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id),
+                None)
+        return found_order
+
+    def process_trade_update(self, trade_update: TradeUpdate):
+        tracked_order = self.all_fillable_orders.get(trade_update.client_order_id)
+        if tracked_order:
+            previous_executed_amount_base = tracked_order.executed_amount_base
+            if tracked_order.update_with_trade_update(trade_update):
+                self._trigger_order_fills(
+                    tracked_order=tracked_order,
+                    prev_executed_amount_base=previous_executed_amount_base,
+                    fill_amount=trade_update.fill_base_amount,
+                    fill_price=trade_update.fill_price,
+                    fill_fee=trade_update.fee,
+                    trade_id=trade_update.trade_id)
+
+
+def create_tracker(tracker_class, number_of_orders: int) -> ClientOrderTracker:
+    connector = BenchmarkExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    tracker = tracker_class(connector=connector)
+    for i in range(number_of_orders):
+        tracker.start_tracking_order(InFlightOrder(
+            client_order_id=f"OID{i}",
+            exchange_order_id=f"EOID{i}",
+            trading_pair=TRADING_PAIR,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1"),
+            initial_state=OrderState.OPEN,
+        ))
+    return tracker
+
+
+async def process_events(tracker: ClientOrderTracker, number_of_orders: int) -> float:
+    fee = AddedToCostTradeFee(percent=Decimal("0"))
+    start = time.perf_counter()
+    for i in range(EVENTS):
+        # Status updates in the user stream usually identify the order by its exchange id
+        order_number = (i * 7919) % number_of_orders
+        await tracker._process_order_update(OrderUpdate(
+            trading_pair=TRADING_PAIR,
+            update_timestamp=1640001113.0,
+            new_state=OrderState.OPEN,
+            exchange_order_id=f"EOID{order_number}",
+        ))
+        tracker.process_trade_update(TradeUpdate(
+            trade_id=f"T{i}",
+            client_order_id=f"OID{order_number}",
+            exchange_order_id=f"EOID{order_number}",
+            trading_pair=TRADING_PAIR,
+            fill_timestamp=1640001113.0,
+            fill_price=Decimal("1"),
+            fill_base_amount=Decimal("0.001"),
+            fill_quote_amount=Decimal("0.001"),
+            fee=fee,
+        ))
+    return (time.perf_counter() - start) / EVENTS
+
+
+async def main():
+    print(f"{'tracked orders':>15} {'previous (us/event)':>20} {'indexed (us/event)':>19}")
+    for number_of_orders in TRACKED_ORDERS:
+        previous_latency = await process_events(
+            create_tracker(PreviousClientOrderTracker, number_of_orders), number_of_orders)
+        indexed_latency = await process_events(
+            create_tracker(ClientOrderTracker, number_of_orders), number_of_orders)
+        print(f"{number_of_orders:>15} {previous_latency * 1e6:>20.1f} {indexed_latency * 1e6:>19.1f}")
+
+
+if __name__ == "__main__":
+    logging.getLogger("hummingbot.connector.client_order_tracker").setLevel(logging.WARNING)
+    asyncio.get_event_loop().run_until_complete(main())
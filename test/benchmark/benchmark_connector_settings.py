@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of creating the connector settings at startup from the connector manifest and by importing the utils
+module of every connector. Each mode runs in a fresh interpreter, so the imported modules and the peak RSS increase
+are those of the connector settings creation only.
+
+Usage: python -m test.benchmark.benchmark_connector_settings
+"""
+
+import resource
+import subprocess
+import sys
+import time
+
+
+def create_connector_settings(use_manifest: bool):
+    from hummingbot.client.settings import AllConnectorSettings
+
+    modules_before = len(sys.modules)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    connector_settings = AllConnectorSettings.create_connector_settings(use_manifest=use_manifest)
+    elapsed = time.perf_counter() - start
+    rss_increase = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+    print(f"{'manifest' if use_manifest else 'utils modules':>14}: {len(connector_settings)} connectors, "
+          f"{elapsed * 1e3:8.2f} ms, {len(sys.modules) - modules_before:4} modules imported, "
+          f"{rss_increase / 1024:6.2f} MB peak RSS increase")
+
+
+def main():
+    for use_manifest in (False, True):
+        subprocess.run(
+            [sys.executable, "-m", "test.benchmark.benchmark_connector_settings", str(use_manifest)], check=True
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        create_connector_settings(use_manifest=sys.argv[1] == "True")
+    else:
+        main()
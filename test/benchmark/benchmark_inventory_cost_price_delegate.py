@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+"""
+Measures the latency of the InventoryCostPriceDelegate price lookups and fill processing against a file based trades
+database, comparing the price lookup with the previous implementation (one database query per lookup).
+
+Usage: python -m test.benchmark.benchmark_inventory_cost_price_delegate
+"""
+
+import os
+import tempfile
+import time
+from decimal import Decimal, InvalidOperation
+from typing import Callable, Optional
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.model.inventory_cost import InventoryCost
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.strategy.pure_market_making.inventory_cost_price_delegate import InventoryCostPriceDelegate
+
+TRADING_PAIR = "BTC-USDT"
+PRICE_LOOKUPS = 5_000
+FILLS = 2_000
+
+
+def query_price(sql: SQLConnectionManager) -> Optional[Decimal]:
+    with sql.get_new_session() as session:
+        with session.begin():
+            record = InventoryCost.get_record(session, "BTC", "USDT")
+            if record is None:
+                return None
+            try:
+                return Decimal(record.quote_volume / record.base_volume)
+            except InvalidOperation:
+                return None
+
+
+def time_calls(function: Callable[[], None], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sql = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()),
+                                   SQLConnectionType.TRADE_FILLS,
+                                   db_path=os.path.join(temp_dir, "inventory_cost_benchmark.sqlite"))
+        delegate = InventoryCostPriceDelegate(sql, TRADING_PAIR)
+        fill_number = iter(range(FILLS))
+
+        def process_fill():
+            i = next(fill_number)
+            delegate.process_order_fill_event(OrderFilledEvent(
+                timestamp=i,
+                order_id=f"order{i}",
+                trading_pair=TRADING_PAIR,
+                trade_type=TradeType.SELL if i % 3 == 2 else TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal("41000") + i,
+                amount=Decimal("0.01"),
+                trade_fee=AddedToCostTradeFee(percent=Decimal("0"), flat_fees=[]),
+            ))
+
+        fill_latency = time_calls(process_fill, FILLS)
+        flush_start = time.perf_counter()
+        delegate.flush()
+        flush_time = time.perf_counter() - flush_start
+
+        query_latency = time_calls(lambda: query_price(sql), PRICE_LOOKUPS)
+        cached_latency = time_calls(delegate.get_price, PRICE_LOOKUPS)
+        delegate.stop()
+
+        print(f"fill processing: {fill_latency * 1e6:.1f}us per fill ({flush_time * 1e3:.1f}ms to flush after "
+              f"{FILLS} fills)")
+        print(f"price lookup with database query: {query_latency * 1e6:.1f}us")
+        print(f"price lookup from memory: {cached_latency * 1e6:.2f}us")
+
+
+if __name__ == "__main__":
+    main()
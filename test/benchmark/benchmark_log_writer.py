@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+"""
+Measures how long a burst of log records blocks the logging thread when the records are written synchronously through
+a handler with a slow disk, and when they are written from the log writer thread with the drop and sample policies
+for the DEBUG flood records.
+
+Usage: python -m test.benchmark.benchmark_log_writer
+"""
+
+import logging
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from hummingbot.logger.log_writer import LogWriter, QueueLogHandler
+
+RECORDS = 20000
+INFO_RECORD_EVERY = 20
+WRITE_LATENCY = 0.0001
+
+
+class SlowDiskHandler(logging.Handler):
+    def emit(self, record: logging.LogRecord):
+        self.format(record)
+        time.sleep(WRITE_LATENCY)
+
+
+def log_burst(log_writer: Optional[LogWriter]) -> List[float]:
+    logger = logging.Logger("benchmark_log_writer")
+    handler = SlowDiskHandler()
+    logger.addHandler(handler if log_writer is None else QueueLogHandler(handler, log_writer))
+    call_times = []
+    for i in range(RECORDS):
+        start = time.perf_counter()
+        if i % INFO_RECORD_EVERY == 0:
+            logger.info("Order %s filled", i)
+        else:
+            logger.debug("Order book diff %s applied", i)
+        call_times.append(time.perf_counter() - start)
+    if log_writer is not None:
+        log_writer.stop()
+    return call_times
+
+
+def main():
+    print(f"{RECORDS} records, one INFO record every {INFO_RECORD_EVERY}, {WRITE_LATENCY * 1e6:.0f} us per write")
+    for name, log_writer in (("synchronous", None),
+                             ("log writer, drop", LogWriter(max_queue_size=1000, flood_policy="drop")),
+                             ("log writer, sample", LogWriter(max_queue_size=1000, flood_policy="sample"))):
+        if log_writer is not None:
+            log_writer.start()
+        call_times = np.array(log_burst(log_writer)) * 1e6
+        dropped = log_writer.dropped_records if log_writer is not None else 0
+        lagged = log_writer.lagged_records if log_writer is not None else 0
+        print(f"{name:>20}: {call_times.sum() / 1e3:8.1f} ms blocked, mean {call_times.mean():7.2f} us, "
+              f"p99 {np.percentile(call_times, 99):7.2f} us, {dropped:6} dropped, {lagged:6} lagged")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of recording websocket diff messages with the market data recorder (time spent by the caller, on
+the event loop, and total time until the messages are written), the size of the recorded files compared with the
+messages JSON and with market data records, and the throughput of the recorded files readers.
+
+Usage: python -m test.benchmark.benchmark_market_data_recorder
+"""
+
+import json
+import os
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.backtesting.market_data import MARKET_DATA_RECORD_DTYPE
+from hummingbot.core.backtesting.market_data_recorder import MarketDataRecorder, RecordedMarketDataReader
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+TRADING_PAIRS = ["BTC-USDT", "ETH-USDT", "SOL-USDT"]
+MESSAGES = 100_000
+LEVELS_PER_SIDE = 10
+
+
+def create_messages() -> List[OrderBookMessage]:
+    rng = np.random.default_rng(0)
+    offsets = rng.integers(1, 1000, (MESSAGES, 2, LEVELS_PER_SIDE)) * 0.01
+    amounts = rng.uniform(0, 2, (MESSAGES, 2, LEVELS_PER_SIDE))
+    messages = []
+    for i in range(MESSAGES):
+        messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": TRADING_PAIRS[i % len(TRADING_PAIRS)],
+            "update_id": 1_000_000_000 + i,
+            "bids": [[f"{100 - offset:.2f}", f"{amount:.8f}"] for offset, amount in zip(offsets[i][0], amounts[i][0])],
+            "asks": [[f"{100 + offset:.2f}", f"{amount:.8f}"] for offset, amount in zip(offsets[i][1], amounts[i][1])],
+        }, timestamp=time.time()))
+    return messages
+
+
+def main():
+    messages = create_messages()
+    levels = MESSAGES * 2 * LEVELS_PER_SIDE
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = MarketDataRecorder(directory)
+        recorder.start()
+        start = time.perf_counter()
+        for message in messages:
+            recorder.record(message)
+        record_time = time.perf_counter() - start
+        recorder.stop(timeout=None)
+        total_time = time.perf_counter() - start
+
+        recorded_size = sum(os.path.getsize(path) for path in recorder.file_paths)
+        json_size = sum(len(json.dumps(message.content)) for message in messages)
+        records_size = levels * MARKET_DATA_RECORD_DTYPE.itemsize
+
+        reader = RecordedMarketDataReader.from_directory(directory)
+        start = time.perf_counter()
+        for trading_pair in TRADING_PAIRS:
+            reader.market_data(trading_pair)
+        batches_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in reader.iter_messages():
+            pass
+        messages_time = time.perf_counter() - start
+        del reader
+
+    print(f"{MESSAGES} diff messages, {LEVELS_PER_SIDE} levels per side, {len(TRADING_PAIRS)} trading pairs, "
+          f"{recorder.dropped_messages} dropped")
+    print(f"{'record (caller)':>24}: {record_time / MESSAGES * 1e6:8.2f} us/message")
+    print(f"{'record (until written)':>24}: {total_time / MESSAGES * 1e6:8.2f} us/message")
+    print(f"{'messages JSON':>24}: {json_size / levels:8.2f} bytes/level")
+    print(f"{'market data records':>24}: {records_size / levels:8.2f} bytes/level")
+    print(f"{'recorded files':>24}: {recorded_size / levels:8.2f} bytes/level")
+    print(f"{'read market data':>24}: {levels / batches_time:>12,.0f} levels/s")
+    print(f"{'read messages':>24}: {MESSAGES / messages_time:>12,.0f} messages/s")
+
+
+if __name__ == "__main__":
+    main()
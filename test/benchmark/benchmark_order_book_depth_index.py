@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+"""
+Compares the linear depth walk of OrderBook.c_get_price_for_volume with the lookup through the cumulative depth
+index, on books of increasing depth. Queries target the middle of the book. The cost of applying diffs with the index
+enabled is measured too, since the index has to be maintained on every update.
+
+Usage: python -m test.benchmark.benchmark_order_book_depth_index
+"""
+
+import time
+from typing import Callable
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+DEPTHS = [1_000, 10_000, 100_000]
+QUERIES = 1_000
+DIFFS = 1_000
+LEVELS_PER_DIFF = 10
+
+
+def create_order_book(levels: int, depth_index: bool) -> OrderBook:
+    prices_offsets = np.arange(1, levels + 1) * 0.01
+    amounts = np.random.default_rng(0).uniform(0.1, 2, levels)
+    bids = np.column_stack([100 - prices_offsets, amounts, np.ones(levels)])
+    asks = np.column_stack([100 + prices_offsets, amounts, np.ones(levels)])
+    order_book = OrderBook()
+    if depth_index:
+        order_book.enable_depth_index()
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def time_per_call(function: Callable[[int], object], calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        function(i)
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    rng = np.random.default_rng(1)
+    print(f"{'levels':>8} {'linear (us)':>12} {'indexed (us)':>13} {'speedup':>8} "
+          f"{'diff (us)':>10} {'indexed diff (us)':>18}")
+    for levels in DEPTHS:
+        linear_book = create_order_book(levels, depth_index=False)
+        indexed_book = create_order_book(levels, depth_index=True)
+        volume = linear_book.get_volume_for_price(True, 100 + levels * 0.01 / 2).result_volume
+
+        linear_time = time_per_call(lambda _: linear_book.get_price_for_volume(True, volume), QUERIES)
+        indexed_time = time_per_call(lambda _: indexed_book.get_price_for_volume(True, volume), QUERIES)
+
+        offsets = rng.integers(1, levels, (DIFFS, LEVELS_PER_DIFF)) * 0.01
+        diffs = [([OrderBookRow(100 - offset, 1.0, i + 2) for offset in offsets[i]],
+                  [OrderBookRow(100 + offset, 1.0, i + 2) for offset in offsets[i]])
+                 for i in range(DIFFS)]
+        linear_diff_time = time_per_call(lambda i: linear_book.apply_diffs(*diffs[i], i + 2), DIFFS)
+        indexed_diff_time = time_per_call(lambda i: indexed_book.apply_diffs(*diffs[i], i + 2), DIFFS)
+
+        print(f"{levels:>8} {linear_time * 1e6:>12.1f} {indexed_time * 1e6:>13.2f} "
+              f"{linear_time / indexed_time:>7.0f}x {linear_diff_time * 1e6:>10.1f} {indexed_diff_time * 1e6:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of applying a websocket diff message to an order book, comparing the OrderBookRow path (building
+message.bids / message.asks and calling apply_diffs) with the raw levels path (apply_diff_message, which parses the
+exchange [price, amount] strings while copying them to the order book).
+
+Usage: python -m test.benchmark.benchmark_order_book_diff_ingestion
+"""
+
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+LEVELS_PER_SIDE = [5, 20, 100]
+MESSAGES = 2_000
+BOOK_LEVELS = 1_000
+
+
+def create_order_book() -> OrderBook:
+    prices_offsets = np.arange(1, BOOK_LEVELS + 1) * 0.01
+    bids = np.column_stack([100 - prices_offsets, np.ones(BOOK_LEVELS), np.ones(BOOK_LEVELS)])
+    asks = np.column_stack([100 + prices_offsets, np.ones(BOOK_LEVELS), np.ones(BOOK_LEVELS)])
+    order_book = OrderBook()
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def create_messages(levels: int) -> List[OrderBookMessage]:
+    rng = np.random.default_rng(0)
+    messages = []
+    for i in range(MESSAGES):
+        offsets = rng.integers(1, BOOK_LEVELS, (2, levels)) * 0.01
+        amounts = rng.uniform(0, 2, (2, levels))
+        messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "BTC-USDT",
+            "update_id": i + 2,
+            "bids": [[f"{100 - offset:.2f}", f"{amount:.8f}"] for offset, amount in zip(offsets[0], amounts[0])],
+            "asks": [[f"{100 + offset:.2f}", f"{amount:.8f}"] for offset, amount in zip(offsets[1], amounts[1])],
+        }, timestamp=float(i)))
+    return messages
+
+
+def time_per_message(apply_function: Callable[[OrderBook, OrderBookMessage], None],
+                     messages: List[OrderBookMessage]) -> float:
+    order_book = create_order_book()
+    start = time.perf_counter()
+    for message in messages:
+        apply_function(order_book, message)
+    return (time.perf_counter() - start) / len(messages)
+
+
+def apply_rows(order_book: OrderBook, message: OrderBookMessage):
+    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+
+
+def apply_raw(order_book: OrderBook, message: OrderBookMessage):
+    order_book.apply_diff_message(message)
+
+
+def main():
+    print(f"{'levels per side':>16} {'rows (us)':>10} {'raw (us)':>9} {'speedup':>8}")
+    for levels in LEVELS_PER_SIDE:
+        messages = create_messages(levels)
+        rows_time = time_per_message(apply_rows, messages)
+        raw_time = time_per_message(apply_raw, messages)
+        print(f"{levels:>16} {rows_time * 1e6:>10.1f} {raw_time * 1e6:>9.1f} {rows_time / raw_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+"""
+Measures the depth queries of OrderBook on books with 5,000 levels per side. The queries walk the C++ books directly,
+and the figures are compared with the same walks done over the Python row generators (bid_entries/ask_entries), which
+is how the queries used to be implemented. The batched VWAP query is compared with the equivalent single queries.
+
+Usage: python -m test.benchmark.benchmark_order_book_queries
+"""
+
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+LEVELS = 5_000
+REPETITIONS = 200
+VWAP_CURVE_SIZES = 20
+
+
+def create_order_book() -> OrderBook:
+    prices_offsets = np.arange(1, LEVELS + 1) * 0.01
+    amounts = np.random.default_rng(0).uniform(0.1, 2, LEVELS)
+    bids = np.column_stack([100 - prices_offsets, amounts, np.ones(LEVELS)])
+    asks = np.column_stack([100 + prices_offsets, amounts, np.ones(LEVELS)])
+    order_book = OrderBook()
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def rows_vwap_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    total_cost = total_volume = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        if total_volume + row.amount >= volume:
+            incremental_amount = volume - total_volume
+            return (total_cost + incremental_amount * row.price) / (total_volume + incremental_amount)
+        total_cost += row.amount * row.price
+        total_volume += row.amount
+    return float("nan")
+
+
+def rows_volume_for_price(order_book: OrderBook, is_buy: bool, price: float) -> float:
+    cumulative_volume = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        if (row.price > price) if is_buy else (row.price < price):
+            break
+        cumulative_volume += row.amount
+    return cumulative_volume
+
+
+def rows_simulate_buy(order_book: OrderBook, amount: float) -> list:
+    amount_left = amount
+    retval = []
+    for row in order_book.ask_entries():
+        if row.amount < amount_left:
+            retval.append(row)
+            amount_left -= row.amount
+        else:
+            retval.append(row._replace(amount=amount_left))
+            break
+    return retval
+
+
+def time_per_call(function: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        function()
+    return (time.perf_counter() - start) / REPETITIONS
+
+
+def main():
+    order_book = create_order_book()
+    half_depth_volume = order_book.get_volume_for_price(True, 100 + LEVELS * 0.01 / 2).result_volume
+    half_depth_price = 100 - LEVELS * 0.01 / 2
+    curve_sizes: List[float] = list(np.linspace(half_depth_volume / VWAP_CURVE_SIZES, half_depth_volume,
+                                                VWAP_CURVE_SIZES))
+
+    cases = [
+        ("vwap for volume (half the book)",
+         lambda: rows_vwap_for_volume(order_book, True, half_depth_volume),
+         lambda: order_book.get_vwap_for_volume(True, half_depth_volume)),
+        ("volume for price (half the book)",
+         lambda: rows_volume_for_price(order_book, False, half_depth_price),
+         lambda: order_book.get_volume_for_price(False, half_depth_price)),
+        ("simulate buy (half the book)",
+         lambda: rows_simulate_buy(order_book, half_depth_volume),
+         lambda: order_book.simulate_buy(half_depth_volume)),
+        (f"vwap curve ({VWAP_CURVE_SIZES} sizes)",
+         lambda: [order_book.get_vwap_for_volume(True, size) for size in curve_sizes],
+         lambda: order_book.get_vwap_for_volumes(True, curve_sizes)),
+    ]
+
+    print(f"{LEVELS} levels per side")
+    print(f"{'query':>36} {'baseline (us)':>14} {'native (us)':>12} {'speedup':>8}")
+    for name, baseline, native in cases:
+        baseline_time = time_per_call(baseline)
+        native_time = time_per_call(native)
+        print(f"{name:>36} {baseline_time * 1e6:>14.1f} {native_time * 1e6:>12.1f} "
+              f"{baseline_time / native_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of exporting order book snapshots on deep books: the previous row based DataFrame snapshot (a list
+of OrderBookRow per side wrapped in DataFrames), the snapshot property, the snapshot arrays, and the read-only top of
+book views.
+
+Usage: python -m test.benchmark.benchmark_order_book_snapshot
+"""
+
+import time
+from typing import Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+DEPTHS = [1_000, 10_000, 50_000]
+TOP_LEVELS = 20
+REPETITIONS = 20
+
+
+def create_order_book(levels: int) -> OrderBook:
+    prices_offsets = np.arange(1, levels + 1) * 0.01
+    amounts = np.random.default_rng(0).uniform(0.1, 2, levels)
+    bids = np.column_stack([100 - prices_offsets, amounts, np.ones(levels)])
+    asks = np.column_stack([100 + prices_offsets, amounts, np.ones(levels)])
+    order_book = OrderBook()
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def rows_snapshot(order_book: OrderBook) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    bids_df = pd.DataFrame(data=list(order_book.bid_entries()), columns=OrderBookRow._fields, dtype="float64")
+    asks_df = pd.DataFrame(data=list(order_book.ask_entries()), columns=OrderBookRow._fields, dtype="float64")
+    return bids_df, asks_df
+
+
+def time_per_call(function: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        function()
+    return (time.perf_counter() - start) / REPETITIONS
+
+
+def main():
+    print(f"{'levels':>8} {'rows df (ms)':>13} {'snapshot (ms)':>14} {'arrays (ms)':>12} "
+          f"{f'top {TOP_LEVELS} views (us)':>18}")
+    for levels in DEPTHS:
+        order_book = create_order_book(levels)
+        rows_time = time_per_call(lambda: rows_snapshot(order_book))
+        snapshot_time = time_per_call(lambda: order_book.snapshot)
+        arrays_time = time_per_call(lambda: order_book.snapshot_arrays())
+        views_time = time_per_call(lambda: order_book.top_of_book_views(TOP_LEVELS))
+        print(f"{levels:>8} {rows_time * 1e3:>13.2f} {snapshot_time * 1e3:>14.3f} {arrays_time * 1e3:>12.3f} "
+              f"{views_time * 1e6:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of the top of book change notifications when applying websocket diff messages to an order book,
+and how many of the messages trigger a notification, depending on the configuration of the event.
+
+Usage: python -m test.benchmark.benchmark_order_book_top_of_book_events
+"""
+
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
+
+LEVELS_PER_SIDE = 20
+MESSAGES = 5_000
+BOOK_LEVELS = 1_000
+
+
+def create_order_book() -> OrderBook:
+    prices_offsets = np.arange(1, BOOK_LEVELS + 1) * 0.01
+    bids = np.column_stack([100 - prices_offsets, np.ones(BOOK_LEVELS), np.ones(BOOK_LEVELS)])
+    asks = np.column_stack([100 + prices_offsets, np.ones(BOOK_LEVELS), np.ones(BOOK_LEVELS)])
+    order_book = OrderBook()
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def create_messages() -> List[OrderBookMessage]:
+    rng = np.random.default_rng(0)
+    messages = []
+    for i in range(MESSAGES):
+        offsets = rng.integers(1, BOOK_LEVELS, (2, LEVELS_PER_SIDE)) * 0.01
+        # Most of the levels changed by a diff are deep in the book, 10% of them are removed
+        amounts = rng.uniform(0.5, 1.5, (2, LEVELS_PER_SIDE))
+        amounts[rng.uniform(size=amounts.shape) < 0.1] = 0
+        messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "BTC-USDT",
+            "update_id": i + 2,
+            "bids": [[f"{100 - offset:.2f}", f"{amount:.8f}"] for offset, amount in zip(offsets[0], amounts[0])],
+            "asks": [[f"{100 + offset:.2f}", f"{amount:.8f}"] for offset, amount in zip(offsets[1], amounts[1])],
+        }, timestamp=float(i)))
+    return messages
+
+
+def run(messages: List[OrderBookMessage],
+        listen: bool,
+        depth_band: Optional[float] = None,
+        depth_change_threshold: float = 0.0,
+        depth_index: bool = False):
+    order_book = create_order_book()
+    if depth_index:
+        order_book.enable_depth_index()
+    order_book.configure_top_of_book_events(depth_band=depth_band, depth_change_threshold=depth_change_threshold)
+    event_logger = EventLogger()
+    if listen:
+        order_book.add_listener(OrderBookEvent.TopOfBookChangeEvent, event_logger)
+    start = time.perf_counter()
+    for message in messages:
+        order_book.apply_diff_message(message)
+    elapsed = time.perf_counter() - start
+    return elapsed / len(messages), len(event_logger.event_log)
+
+
+def main():
+    messages = create_messages()
+    scenarios = [
+        ("no listener", dict(listen=False)),
+        ("best prices", dict(listen=True)),
+        ("band 0.1%, threshold 5%", dict(listen=True, depth_band=0.001, depth_change_threshold=0.05)),
+        ("band 1%, threshold 5%", dict(listen=True, depth_band=0.01, depth_change_threshold=0.05)),
+        ("band 1%, threshold 5%, depth index", dict(listen=True,
+                                                    depth_band=0.01,
+                                                    depth_change_threshold=0.05,
+                                                    depth_index=True)),
+    ]
+    print(f"{MESSAGES} diff messages, {LEVELS_PER_SIDE} levels per side")
+    print(f"{'scenario':>36} {'us/message':>11} {'events':>7}")
+    for name, kwargs in scenarios:
+        latency, events = run(messages, **kwargs)
+        print(f"{name:>36} {latency * 1e6:>11.1f} {events:>7}")
+
+
+if __name__ == "__main__":
+    main()
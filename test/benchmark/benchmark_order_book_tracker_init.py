@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+"""
+Measures the time needed by the OrderBookTracker to initialize all its order books, using a mocked data source that
+simulates the REST latency of the snapshot request and paces the requests with an AsyncThrottler.
+
+Usage: python -m test.benchmark.benchmark_order_book_tracker_init [--sequential]
+"""
+
+import asyncio
+import sys
+import time
+from decimal import Decimal
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+PAIR_COUNTS = [10, 100, 500]
+SNAPSHOT_LATENCY = 0.05
+SNAPSHOT_LIMIT_ID = "snapshot"
+SNAPSHOT_RATE_LIMIT = RateLimit(limit_id=SNAPSHOT_LIMIT_ID, limit=100, time_interval=1)
+MAX_CONCURRENT_INITIALIZATIONS = 10
+
+
+class BenchmarkOrderBookDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs=trading_pairs)
+        self._throttler = AsyncThrottler(rate_limits=[SNAPSHOT_RATE_LIMIT],
+                                         limits_share_percentage=Decimal("100"))
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        async with self._throttler.execute_task(limit_id=SNAPSHOT_LIMIT_ID):
+            await asyncio.sleep(SNAPSHOT_LATENCY)
+        order_book = OrderBook()
+        bids = [OrderBookRow(100 - i * 0.01, 1, 1) for i in range(100)]
+        asks = [OrderBookRow(100 + i * 0.01, 1, 1) for i in range(1, 101)]
+        order_book.apply_snapshot(bids, asks, 1)
+        return order_book
+
+    async def _order_book_snapshot(self, trading_pair: str):
+        raise NotImplementedError
+
+    async def _connected_websocket_assistant(self):
+        raise NotImplementedError
+
+    async def _subscribe_channels(self, ws):
+        raise NotImplementedError
+
+    def _channel_originating_message(self, event_message) -> str:
+        raise NotImplementedError
+
+
+async def time_initialization(pair_count: int, max_concurrent_initializations: Optional[int]) -> float:
+    trading_pairs = [f"COINALPHA{i}-HBOT" for i in range(pair_count)]
+    tracker = OrderBookTracker(data_source=BenchmarkOrderBookDataSource(trading_pairs=trading_pairs),
+                               trading_pairs=trading_pairs,
+                               max_concurrent_initializations=max_concurrent_initializations)
+    start = time.perf_counter()
+    await tracker._init_order_books()
+    elapsed = time.perf_counter() - start
+    tracker.stop()
+    return elapsed
+
+
+async def main(include_sequential: bool):
+    print(f"Snapshot latency: {SNAPSHOT_LATENCY * 1000:.0f}ms, "
+          f"throttler limit: {SNAPSHOT_RATE_LIMIT.limit} requests per {SNAPSHOT_RATE_LIMIT.time_interval}s")
+    print(f"{'pairs':>8} {'sequential (s)':>16} {'concurrent (s)':>16}")
+    for pair_count in PAIR_COUNTS:
+        sequential = "skipped"
+        if include_sequential:
+            sequential = f"{await time_initialization(pair_count, None):.3f}"
+        concurrent = await time_initialization(pair_count, MAX_CONCURRENT_INITIALIZATIONS)
+        print(f"{pair_count:>8} {sequential:>16} {concurrent:>16.3f}")
+
+
+if __name__ == "__main__":
+    with patch("hummingbot.core.data_type.order_book_tracker.OrderBookTracker.logger"), \
+            patch("hummingbot.core.api_throttler.async_request_context_base.AsyncRequestContextBase.logger"):
+        asyncio.get_event_loop().run_until_complete(main(include_sequential="--sequential" in sys.argv))
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+"""
+Measures the duration of one order status and fills reconciliation cycle of an ExchangePyBase connector, with a
+simulated REST round trip latency, executing the requests one at a time and with bounded concurrency.
+
+Usage: python -m test.benchmark.benchmark_order_reconciliation [number_of_orders]
+"""
+
+import asyncio
+import sys
+from decimal import Decimal
+from typing import List
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+
+REQUEST_LATENCY = 0.05
+TRADING_PAIR = "BTC-USDT"
+
+
+async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+    await asyncio.sleep(REQUEST_LATENCY)
+    return OrderUpdate(
+        client_order_id=tracked_order.client_order_id,
+        trading_pair=tracked_order.trading_pair,
+        update_timestamp=tracked_order.last_update_timestamp,
+        new_state=OrderState.OPEN,
+    )
+
+
+async def all_trade_updates_for_order(order: InFlightOrder) -> List[TradeUpdate]:
+    await asyncio.sleep(REQUEST_LATENCY)
+    return []
+
+
+def create_connector(number_of_orders: int, max_concurrency: int) -> BinanceExchange:
+    connector = BinanceExchange(
+        client_config_map=ClientConfigAdapter(ClientConfigMap()),
+        binance_api_key="",
+        binance_api_secret="",
+        trading_pairs=[TRADING_PAIR],
+    )
+    connector.ORDER_UPDATES_MAX_CONCURRENCY = max_concurrency
+    # Only the per order requests are measured
+    connector.BULK_ORDER_UPDATES_MIN_ORDERS = number_of_orders + 1
+    connector._request_order_status = request_order_status
+    connector._all_trade_updates_for_order = all_trade_updates_for_order
+    for i in range(number_of_orders):
+        connector.start_tracking_order(
+            order_id=f"OID{i}",
+            exchange_order_id=str(i),
+            trading_pair=TRADING_PAIR,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("1"),
+        )
+        connector.in_flight_orders[f"OID{i}"].update_with_order_update(OrderUpdate(
+            client_order_id=f"OID{i}",
+            trading_pair=TRADING_PAIR,
+            update_timestamp=i,
+            new_state=OrderState.OPEN,
+        ))
+    return connector
+
+
+async def main(number_of_orders: int):
+    print(f"{number_of_orders} open orders, {REQUEST_LATENCY * 1e3:.0f}ms per request")
+    for max_concurrency in [1, 5, 10, 20]:
+        connector = create_connector(number_of_orders, max_concurrency)
+        await connector._update_order_status()
+        print(f"max concurrency {max_concurrency:>3}: "
+              f"{connector.order_reconciliation_cycle_time:.3f}s per reconciliation cycle")
+
+
+if __name__ == "__main__":
+    orders_count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    asyncio.get_event_loop().run_until_complete(main(orders_count))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of the queue position simulation of the paper trade exchange: the time to match the replayed trades
+and to update the queue positions on each tick, with and without queue position fills, for many trading pairs with
+resting limit orders.
+
+Usage: python -m test.benchmark.benchmark_paper_trade_queue_position
+"""
+
+import time
+from decimal import Decimal
+from typing import List
+
+import numpy as np
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade import create_backtest_paper_trade_market
+from hummingbot.core.backtesting.backtest_replay_engine import BacktestReplayEngine
+from hummingbot.core.backtesting.market_data import MarketDataRecordType, MarketDataSide, create_market_data_records
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+
+TRADING_PAIRS = [f"COIN{i}-USDT" for i in range(50)]
+ORDERS_PER_SIDE = 10
+TRADES_PER_SECOND = 20
+DURATION = 600
+START_TIMESTAMP = 1640000000.0
+
+
+def create_market_data(rng: np.random.Generator) -> np.ndarray:
+    trades = DURATION * TRADES_PER_SECOND
+    records = create_market_data_records(2 * ORDERS_PER_SIDE + trades)
+    for i in range(ORDERS_PER_SIDE):
+        records[2 * i] = (START_TIMESTAMP + 0.5, 1, MarketDataRecordType.SNAPSHOT, MarketDataSide.BID, 99 - i, 50)
+        records[2 * i + 1] = (START_TIMESTAMP + 0.5, 1, MarketDataRecordType.SNAPSHOT, MarketDataSide.ASK, 101 + i, 50)
+    trade_records = records[2 * ORDERS_PER_SIDE:]
+    trade_records["timestamp"] = START_TIMESTAMP + 1 + np.sort(rng.uniform(0, DURATION - 1, trades))
+    trade_records["record_type"] = MarketDataRecordType.TRADE
+    trade_records["side"] = rng.choice([MarketDataSide.BID, MarketDataSide.ASK], trades)
+    offsets = rng.integers(0, ORDERS_PER_SIDE, trades)
+    trade_records["price"] = np.where(trade_records["side"] == MarketDataSide.BID, 101 + offsets, 99 - offsets)
+    trade_records["amount"] = rng.uniform(0.01, 2, trades)
+    return records
+
+
+def run(market_data: List[np.ndarray], queue_position_fills: bool):
+    clock = Clock(ClockMode.BACKTEST, 1.0, START_TIMESTAMP, START_TIMESTAMP + DURATION)
+    engine = BacktestReplayEngine()
+    market = create_backtest_paper_trade_market("binance", ClientConfigAdapter(ClientConfigMap()), TRADING_PAIRS)
+    market.set_queue_position_fills(queue_position_fills)
+    assert market.ready
+    fill_logger = EventLogger()
+    market.add_listener(MarketEvent.OrderFilled, fill_logger)
+    clock.add_iterator(engine)
+    clock.add_iterator(market)
+    for trading_pair, records in zip(TRADING_PAIRS, market_data):
+        market.set_balance(trading_pair.split("-")[0], 1_000_000)
+        engine.add_market_data(trading_pair, market.order_books[trading_pair], records)
+    market.set_balance("USDT", 1_000_000_000)
+
+    clock.backtest_til(START_TIMESTAMP + 1)
+    for trading_pair in TRADING_PAIRS:
+        for i in range(ORDERS_PER_SIDE):
+            market.buy(trading_pair, Decimal("100"), OrderType.LIMIT, Decimal(99 - i))
+            market.sell(trading_pair, Decimal("100"), OrderType.LIMIT, Decimal(101 + i))
+    start = time.perf_counter()
+    clock.backtest_til(START_TIMESTAMP + DURATION)
+    elapsed = time.perf_counter() - start
+    label = "queue position fills" if queue_position_fills else "complete fills"
+    print(f"{label:>24}: {elapsed:8.3f} s, {engine.trades / elapsed:>10,.0f} trades/s, "
+          f"{len(fill_logger.event_log):>7} fills, {len(market.limit_orders):>5} open orders")
+
+
+def main():
+    rng = np.random.default_rng(0)
+    market_data = [create_market_data(rng) for _ in TRADING_PAIRS]
+    print(f"{len(TRADING_PAIRS)} trading pairs, {ORDERS_PER_SIDE} limit orders per side, "
+          f"{TRADES_PER_SECOND} trades/s per trading pair during {DURATION} s")
+    run(market_data, False)
+    run(market_data, True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+"""
+Compares the time taken to calculate the performance metrics of a session depending on its number of fills, between
+PerformanceMetrics.create processing all the trade fills (as the kill switch did every 10 seconds, not counting the
+time to load the fills from the database) and a snapshot of the PerformanceTracker updated with each fill.
+
+Usage: python -m test.benchmark.benchmark_performance_tracker
+"""
+
+import asyncio
+import random
+import time
+from decimal import Decimal
+from typing import List
+
+from hummingbot.client.performance import PerformanceMetrics, PerformanceTracker
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.trade_fill import TradeFill
+
+FILLS_COUNTS = [1_000, 10_000, 50_000]
+TRADING_PAIR = "BTC-USDT"
+BALANCES = {"BTC": Decimal("10"), "USDT": Decimal("100000")}
+
+
+def trade_fills(count: int, position: str) -> List[TradeFill]:
+    random.seed(42)
+    trade_fee = AddedToCostTradeFee(percent=Decimal("0.001"), flat_fees=[TokenAmount("BNB", Decimal("0.0001"))])
+    fills = []
+    for i in range(count):
+        is_buy = i % 2 == 0
+        fills.append(TradeFill(
+            config_file_path="benchmark.yml",
+            strategy="pure_market_making",
+            market="binance",
+            symbol=TRADING_PAIR,
+            base_asset="BTC",
+            quote_asset="USDT",
+            timestamp=1640000000000 + i,
+            order_id=f"OID{i // 3}",
+            trade_type="BUY" if is_buy else "SELL",
+            order_type="LIMIT",
+            price=Decimal(str(round(40000 + random.uniform(-100, 100), 2))),
+            amount=Decimal("0.01"),
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"EID{i}",
+            position=position if position == "NIL" else ("OPEN" if (i // 3) % 2 == 0 else "CLOSE"),
+        ))
+    return fills
+
+
+async def main():
+    rate_oracle = RateOracle()
+    rate_oracle._prices[TRADING_PAIR] = Decimal("40000")
+    rate_oracle._prices["BNB-USDT"] = Decimal("300")
+    RateOracle._shared_instance = rate_oracle
+
+    print(f"{'fills':>8} {'position':>9} {'from trades (ms)':>18} {'tracker (ms)':>14}")
+    for count in FILLS_COUNTS:
+        for position in ["NIL", "OPEN"]:
+            fills = trade_fills(count, position)
+            start = time.perf_counter()
+            await PerformanceMetrics.create(TRADING_PAIR, fills, BALANCES)
+            from_trades = time.perf_counter() - start
+
+            tracker = PerformanceTracker()
+            for trade_fill in trade_fills(count, position):
+                tracker.add_trade_fill(trade_fill)
+            start = time.perf_counter()
+            await tracker.performance_metrics("binance", TRADING_PAIR, BALANCES)
+            from_tracker = time.perf_counter() - start
+
+            print(f"{count:>8} {position:>9} {from_trades * 1e3:>18.2f} {from_tracker * 1e3:>14.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
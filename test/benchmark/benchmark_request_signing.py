@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+"""
+Measures the latency added by the REST assistant and the Binance authentication to a signed order creation request,
+with the order data serialized to JSON and parsed again by the authentication (the former signing path) and with the
+data handed over to the authentication unserialized. The cost of the synchronized time used to sign the requests is
+measured with the clock offset estimation cached and recalculated for every call.
+
+Usage: python -m test.benchmark.benchmark_request_signing
+"""
+
+import asyncio
+import time
+from typing import Any, Dict
+
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+
+REQUESTS = 20000
+URL = "https://api.binance.com/api/v3/order"
+ORDER_DATA: Dict[str, Any] = {
+    "symbol": "BTCUSDT",
+    "side": "BUY",
+    "type": "LIMIT_MAKER",
+    "quantity": "0.00100000",
+    "price": "20000.00000000",
+    "newClientOrderId": "x-XEKWYICX-BBTCUT60b1ab4f8f6a25c5a3e",
+}
+
+
+class SerializedDataBinanceAuth(BinanceAuth):
+    authenticates_unserialized_data = False
+
+
+class NoLimitThrottler:
+    def execute_task(self, limit_id: str):
+        return self
+
+    async def __aenter__(self):
+        pass
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class EmptyResponse:
+    status = 200
+
+    async def json(self) -> Dict[str, Any]:
+        return {}
+
+
+class NoNetworkConnection:
+    async def call(self, request: RESTRequest) -> EmptyResponse:
+        return EmptyResponse()
+
+
+def time_synchronizer_with_samples() -> TimeSynchronizer:
+    time_synchronizer = TimeSynchronizer()
+    for offset in (-12.5, -11.0, -14.2, -10.8, -12.1):
+        time_synchronizer.add_time_offset_ms_sample(offset)
+    return time_synchronizer
+
+
+async def signed_requests_latency(auth: BinanceAuth) -> float:
+    rest_assistant = RESTAssistant(connection=NoNetworkConnection(), throttler=NoLimitThrottler(), auth=auth)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await rest_assistant.execute_request(
+            url=URL, throttler_limit_id=URL, data=ORDER_DATA, method=RESTMethod.POST, is_auth_required=True
+        )
+    return (time.perf_counter() - start) / REQUESTS
+
+
+def synchronized_time_latency(cached: bool) -> float:
+    time_synchronizer = time_synchronizer_with_samples()
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        if not cached:
+            time_synchronizer._estimated_time_offset_ms = None
+        time_synchronizer.time()
+    return (time.perf_counter() - start) / REQUESTS
+
+
+def main():
+    print(f"{REQUESTS} signed order creation requests")
+    loop = asyncio.new_event_loop()
+    for name, auth_class in (("serialized data", SerializedDataBinanceAuth), ("unserialized data", BinanceAuth)):
+        auth = auth_class(api_key="apiKey", secret_key="secretKey", time_provider=time_synchronizer_with_samples())
+        latency = loop.run_until_complete(signed_requests_latency(auth))
+        print(f"{name:>24}: {latency * 1e6:8.2f} us per request")
+    loop.close()
+    for name, cached in (("recalculated time offset", False), ("cached time offset", True)):
+        print(f"{name:>24}: {synchronized_time_latency(cached) * 1e6:8.2f} us per synchronized time")
+
+
+if __name__ == "__main__":
+    main()
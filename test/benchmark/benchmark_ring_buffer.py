@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of adding one sample to the volatility indicators and reading their value, depending on the
+sampling length, comparing a full recalculation of the window (as the indicators used to do) with the incremental
+update of the RingBuffer running statistics.
+
+Usage: python -m test.benchmark.benchmark_ring_buffer
+"""
+
+import time
+import warnings
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.trailing_indicators.historical_volatility import HistoricalVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
+
+SAMPLING_LENGTHS = [100, 1_000, 10_000, 100_000]
+MEASURED_SAMPLES = 2_000
+
+
+class FullWindowInstantVolatility(InstantVolatilityIndicator):
+    def _indicator_calculation(self) -> float:
+        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
+        return np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+
+
+class FullWindowHistoricalVolatility(HistoricalVolatilityIndicator):
+    def _indicator_calculation(self) -> float:
+        prices = self._sampling_buffer.get_as_numpy_array()
+        return np.var(np.diff(np.log(prices)))
+
+
+def time_samples(indicator, samples: np.ndarray) -> float:
+    start = time.perf_counter()
+    for sample in samples:
+        indicator.add_sample(sample)
+        indicator.current_value
+    return (time.perf_counter() - start) / samples.size
+
+
+def main():
+    print(f"{'sampling length':>16} {'indicator':>12} {'full window (us)':>18} {'incremental (us)':>18}")
+    for sampling_length in SAMPLING_LENGTHS:
+        prices = 100 * np.exp(np.cumsum(np.random.normal(0, 0.001, sampling_length + MEASURED_SAMPLES)))
+        for name, full_class, incremental_class in [
+            ("instant", FullWindowInstantVolatility, InstantVolatilityIndicator),
+            ("historical", FullWindowHistoricalVolatility, HistoricalVolatilityIndicator),
+        ]:
+            latencies = []
+            for indicator_class in (full_class, incremental_class):
+                indicator = indicator_class(sampling_length, 1)
+                for price in prices[:sampling_length]:
+                    indicator.add_sample(price)
+                latencies.append(time_samples(indicator, prices[sampling_length:]))
+            print(f"{sampling_length:>16} {name:>12} {latencies[0] * 1e6:>18.2f} {latencies[1] * 1e6:>18.2f}")
+
+
+if __name__ == "__main__":
+    # The full window calculation warns about the variance of an empty window for the first sample
+    warnings.simplefilter("ignore", RuntimeWarning)
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of building trade fees with the configured fee schemas compiled on each call and cached, and the
+cost of calculating the fee amounts of many candidate orders one by one and with the vectorized fee calculation.
+
+Usage: python -m test.benchmark.benchmark_trade_fee
+"""
+
+import time
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.utils.estimate_fee import build_trade_fee
+
+CALLS = 20000
+CANDIDATES = 10000
+
+
+def build_fees(invalidate: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        if invalidate:
+            TradeFeeSchemaLoader.invalidate()
+        build_trade_fee("binance", True, "ETH", "USDT", OrderType.LIMIT, TradeType.BUY, Decimal("1"), Decimal("1000"))
+    return time.perf_counter() - start
+
+
+def main():
+    build_trade_fee("binance", True, "ETH", "USDT", OrderType.LIMIT, TradeType.BUY, Decimal("1"), Decimal("1000"))
+    uncached_time = build_fees(invalidate=True)
+    cached_time = build_fees(invalidate=False)
+
+    rng = np.random.default_rng(0)
+    prices = rng.uniform(990, 1010, CANDIDATES)
+    amounts = rng.uniform(0.01, 10, CANDIDATES)
+    decimal_prices = [Decimal(str(price)) for price in prices]
+    decimal_amounts = [Decimal(str(amount)) for amount in amounts]
+    fee = AddedToCostTradeFee(percent=Decimal("0.001"), flat_fees=[TokenAmount("ETH", Decimal("0.0005"))])
+    start = time.perf_counter()
+    for price, amount in zip(decimal_prices, decimal_amounts):
+        fee.fee_amount_in_token("ETH-USDT", price, amount, "USDT")
+    scalar_time = time.perf_counter() - start
+    start = time.perf_counter()
+    fee.fee_amounts_in_token("ETH-USDT", prices, amounts, "USDT")
+    vectorized_time = time.perf_counter() - start
+
+    print(f"{'build_trade_fee (compiled)':>30}: {uncached_time / CALLS * 1e6:10.2f} us/call")
+    print(f"{'build_trade_fee (cached)':>30}: {cached_time / CALLS * 1e6:10.2f} us/call")
+    print(f"{'fee_amount_in_token':>30}: {scalar_time / CANDIDATES * 1e6:10.3f} us/candidate")
+    print(f"{'fee_amounts_in_token':>30}: {vectorized_time / CANDIDATES * 1e6:10.3f} us/candidate")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""
+Measures the latency of exporting one trade fill to the trades CSV file depending on the size of the file, comparing
+the previous pandas based export (read the whole file to check the header, then append through a DataFrame) with
+the TradesCSVWriter.
+
+Usage: python -m test.benchmark.benchmark_trades_csv_export
+"""
+
+import os
+import tempfile
+import time
+import warnings
+from typing import Callable, Sequence
+
+import pandas as pd
+
+from hummingbot.connector.trades_csv_writer import TradesCSVWriter
+from hummingbot.model.trade_fill import TradeFill
+
+CSV_SIZES = [1_000, 10_000, 100_000]
+MEASURED_FILLS = 50
+
+HEADER = tuple(TradeFill.attribute_names_for_file_export()) + ("age",)
+ROW = ("TID1", "conf_pure_mm_1.yml", "pure_market_making", "binance", "BTC-USDT", "BTC", "USDT", 1640001112223,
+       "buy-BTC-USDT-1640001112223", "BUY", "LIMIT", "41000.5", "0.015", 1,
+       '{"fee_type": "DeductedFromReturns", "percent": "0.001", "percent_token": null, "flat_fees": []}', "NIL",
+       "00:00:02")
+
+
+def pandas_append(csv_path: str, field_names: Sequence[str], field_data: Sequence):
+    df = pd.read_csv(csv_path, header=None)
+    if tuple(df.iloc[0].values) != tuple(field_names):
+        raise ValueError("Unexpected header")
+    pd.DataFrame([field_data]).to_csv(csv_path, mode='a', header=False, index=False)
+
+
+def prepare_file(csv_path: str, rows: int):
+    with open(csv_path, "w") as file:
+        file.write(",".join(HEADER) + os.linesep)
+    pd.DataFrame([ROW] * rows).to_csv(csv_path, mode='a', header=False, index=False)
+
+
+def time_fills(append_function: Callable[[str, Sequence[str], Sequence], None], csv_path: str) -> float:
+    start = time.perf_counter()
+    for _ in range(MEASURED_FILLS):
+        append_function(csv_path, HEADER, ROW)
+    return (time.perf_counter() - start) / MEASURED_FILLS
+
+
+def main():
+    print(f"{'rows in file':>14} {'pandas (ms/fill)':>18} {'csv writer (ms/fill)':>22}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = os.path.join(temp_dir, "trades_benchmark.csv")
+        for rows in CSV_SIZES:
+            prepare_file(csv_path, rows)
+            pandas_latency = time_fills(pandas_append, csv_path)
+
+            prepare_file(csv_path, rows)
+            writer = TradesCSVWriter()
+            writer_latency = time_fills(writer.write_row, csv_path)
+            writer.close()
+
+            print(f"{rows:>14} {pandas_latency * 1e3:>18.3f} {writer_latency * 1e3:>22.4f}")
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore", pd.errors.DtypeWarning)
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+"""
+Measures the throughput of the MarketsRecorder recording order fills into a SQLite trades database, with the default
+SQLite settings (rollback journal, full synchronous commits) and with the SQLConnectionManager storage profile
+(WAL journal, normal synchronous commits, larger cache and memory mapped I/O), both writing each fill synchronously
+and with the write-behind recorder.
+
+Usage: python -m test.benchmark.benchmark_trades_db [number_of_fills]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class BenchmarkMarket:
+    display_name = "binance"
+    tracking_states = {}
+
+    def add_trade_fills_from_market_recorder(self, _):
+        pass
+
+    def add_exchange_order_ids_from_market_recorder(self, _):
+        pass
+
+    def add_listener(self, *_):
+        pass
+
+    def remove_listener(self, *_):
+        pass
+
+
+def record_fills(db_path: str, number_of_fills: int, write_behind: bool) -> float:
+    manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                   db_path=db_path)
+    market = BenchmarkMarket()
+    recorder = MarketsRecorder(manager, [market], "benchmark.yml", "pure_market_making", write_behind=write_behind)
+    recorder._csv_writer.write_row = lambda *_: None
+    recorder.start()
+    events = [OrderFilledEvent(timestamp=1640000000 + i,
+                               order_id=f"OID{i}",
+                               trading_pair="BTC-USDT",
+                               trade_type=TradeType.BUY,
+                               order_type=OrderType.LIMIT,
+                               price=Decimal("40000"),
+                               amount=Decimal("0.01"),
+                               trade_fee=AddedToCostTradeFee(percent=Decimal("0.001")),
+                               exchange_trade_id=f"EID{i}")
+              for i in range(number_of_fills)]
+
+    start = time.perf_counter()
+    for event in events:
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, market, event)
+    recorder.stop()
+    elapsed = time.perf_counter() - start
+    manager.engine.dispose()
+    return number_of_fills / elapsed
+
+
+def main(number_of_fills: int):
+    print(f"{number_of_fills} fills")
+    print(f"{'storage':>16} {'synchronous (fills/s)':>22} {'write-behind (fills/s)':>23}")
+    for name, pragmas in [("default", {}), ("storage profile", SQLConnectionManager.SQLITE_PRAGMAS)]:
+        results = []
+        for write_behind in [False, True]:
+            with tempfile.TemporaryDirectory() as temp_dir, \
+                    patch.object(SQLConnectionManager, "SQLITE_PRAGMAS", pragmas):
+                results.append(record_fills(os.path.join(temp_dir, "benchmark.sqlite"), number_of_fills, write_behind))
+        print(f"{name:>16} {results[0]:>22.0f} {results[1]:>23.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
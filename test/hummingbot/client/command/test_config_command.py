@@ -4,7 +4,7 @@ from collections import Awaitable
 from decimal import Decimal
 from test.mock.mock_cli import CLIMockingAssistant
 from typing import Union
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from pydantic import Field
 
@@ -13,6 +13,7 @@ from hummingbot.client.config.config_data_types import BaseClientModel, BaseStra
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
 
 
 class ConfigCommandTest(unittest.TestCase):
@@ -239,3 +240,24 @@ class ConfigCommandTest(unittest.TestCase):
 
         self.assertEqual("another value", config_map.nested_model.nested_attr)
         save_to_yml_mock.assert_called_once()
+
+    @patch("hummingbot.client.command.config_command.UserBalances.instance")
+    def test_inventory_price_prompt_updates_running_strategy_inventory_cost(self, user_balances_mock):
+        user_balances_mock.return_value.balances = AsyncMock(return_value={"BTC": Decimal("2")})
+        inventory_cost_price_delegate = MagicMock(base_asset="BTC", quote_asset="USDT")
+        self.app.strategy = MagicMock(spec=PureMarketMakingStrategy)
+        self.app.strategy.inventory_cost_price_delegate = inventory_cost_price_delegate
+        self.app.trade_fill_db = MagicMock()
+        config_map = {"exchange": MagicMock(value="binance"),
+                      "market": MagicMock(value="BTC-USDT"),
+                      "inventory_price": MagicMock(value=None)}
+
+        async def set_inventory_price(config_var: ConfigVar):
+            config_var.value = Decimal("8000")
+
+        with patch.object(self.app, "prompt_a_config_legacy", side_effect=set_inventory_price):
+            self.async_run_with_timeout(self.app.inventory_price_prompt_legacy(config_map))
+
+        self.assertEqual(Decimal("8000"), config_map["inventory_price"].value)
+        inventory_cost_price_delegate.set_inventory_cost.assert_called_once_with(Decimal("2"), Decimal("16000"))
+        self.app.trade_fill_db.get_new_session.assert_not_called()
@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.performance import PerformanceMetrics, PerformanceTracker
 from hummingbot.connector.exchange.paper_trade import PaperTradeExchange
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.model.order import Order
@@ -106,6 +107,25 @@ class HistoryCommandTest(unittest.TestCase):
             )
         )
 
+    @patch("hummingbot.client.command.history_command.HistoryCommand.get_current_balances")
+    def test_calculate_profitability_reads_session_performance_tracker(self, get_current_balances_mock: AsyncMock):
+        get_current_balances_mock.return_value = {"BTC": Decimal("2"), "USDT": Decimal("100")}
+        # Setting the private attribute avoids creating the trades database, that is not required
+        self.app._strategy_file_name = f"{self.mock_strategy_name}.yml"
+        tracker = PerformanceTracker()
+        for trade in self.get_trades():
+            tracker.add_trade_fill(trade)
+        self.app.markets_recorder = MagicMock(config_file_path=self.app.strategy_file_name,
+                                              performance_tracker=tracker)
+        self.app._get_trades_from_session = MagicMock()
+
+        profitability = self.async_run_with_timeout(self.app.calculate_profitability())
+
+        expected_metrics = self.async_run_with_timeout(
+            PerformanceMetrics.create("BTC-USDT", self.get_trades(), get_current_balances_mock.return_value))
+        self.assertEqual(expected_metrics.return_pct, profitability)
+        self.app._get_trades_from_session.assert_not_called()
+
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
     def test_list_trades(self, notify_mock):
         self.client_config_map.db_mode = DBSqliteMode()
@@ -0,0 +1,58 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
+from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import TokenAmount
+from hummingbot.core.utils.estimate_fee import build_trade_fee
+
+
+class TradeFeeSchemaLoaderTest(unittest.TestCase):
+    exchange = "binance"
+
+    def tearDown(self) -> None:
+        for key in ("maker_percent_fee", "maker_fixed_fees"):
+            fee_overrides_config_map[f"{self.exchange}_{key}"].value = None
+        TradeFeeSchemaLoader.invalidate()
+        super().tearDown()
+
+    def test_configured_schema_is_cached(self):
+        schema = TradeFeeSchemaLoader.configured_schema_for_exchange(self.exchange)
+
+        self.assertIs(schema, TradeFeeSchemaLoader.configured_schema_for_exchange(self.exchange))
+
+        TradeFeeSchemaLoader.invalidate(self.exchange)
+        self.assertIsNot(schema, TradeFeeSchemaLoader.configured_schema_for_exchange(self.exchange))
+
+    def test_fee_override_change_invalidates_configured_schema(self):
+        settings_schema = AllConnectorSettings.get_connector_settings()[self.exchange].trade_fee_schema
+        default_maker_percent_fee = settings_schema.maker_percent_fee_decimal
+        TradeFeeSchemaLoader.configured_schema_for_exchange(self.exchange)
+
+        fee_overrides_config_map[f"{self.exchange}_maker_percent_fee"].value = Decimal("0.5")
+        fee_overrides_config_map[f"{self.exchange}_maker_fixed_fees"].value = [["BNB", Decimal("0.01")]]
+        schema = TradeFeeSchemaLoader.configured_schema_for_exchange(self.exchange)
+
+        self.assertEqual(Decimal("0.005"), schema.maker_percent_fee_decimal)
+        self.assertEqual([TokenAmount("BNB", Decimal("0.01"))], schema.maker_fixed_fees)
+        # The connector settings keep the exchange defaults
+        self.assertEqual(default_maker_percent_fee, settings_schema.maker_percent_fee_decimal)
+        self.assertEqual([], settings_schema.maker_fixed_fees)
+
+        fee = build_trade_fee(self.exchange, True, "COINALPHA", "HBOT", OrderType.LIMIT, TradeType.BUY,
+                              Decimal("1"), Decimal("100"))
+        self.assertEqual(Decimal("0.005"), fee.percent)
+        self.assertEqual([TokenAmount("BNB", Decimal("0.01"))], fee.flat_fees)
+
+        fee_overrides_config_map[f"{self.exchange}_maker_percent_fee"].value = None
+        fee_overrides_config_map[f"{self.exchange}_maker_fixed_fees"].value = None
+        schema = TradeFeeSchemaLoader.configured_schema_for_exchange(self.exchange)
+
+        self.assertEqual(default_maker_percent_fee, schema.maker_percent_fee_decimal)
+        self.assertEqual([], schema.maker_fixed_fees)
+
+    def test_invalid_connector_raises_error(self):
+        with self.assertRaisesRegex(Exception, "Invalid connector"):
+            TradeFeeSchemaLoader.configured_schema_for_exchange("does_not_exist")
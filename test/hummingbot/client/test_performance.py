@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, PerformanceTracker
 from hummingbot.core.data_type.common import PositionAction, OrderType, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
@@ -326,3 +326,124 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         expected_fee_amount += flat_fees[0].amount * Decimal("0.9") * Decimal("2")
         expected_fee_amount += flat_fees[1].amount * Decimal("2")
         self.assertEqual(expected_fee_amount, performance_metric.fee_in_quote)
+
+
+class PerformanceTrackerUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rate_oracle = RateOracle()
+        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    @staticmethod
+    def trade_fill(order_id: str, trade_type: str, price: str, amount: str, position: str, timestamp: int,
+                   market: str = "binance", percent_fee: str = "0.001", flat_fee: str = "0"):
+        trade_fee = AddedToCostTradeFee(percent=Decimal(percent_fee),
+                                        flat_fees=[TokenAmount("BNB", Decimal(flat_fee))])
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="perpetual_market_making",
+            market=market,
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"{order_id}-{timestamp}",
+            position=position,
+        )
+
+    def derivative_trades(self):
+        return [
+            self.trade_fill("OID1", "BUY", "10", "50", "OPEN", 1000),
+            self.trade_fill("OID2", "SELL", "21", "30", "OPEN", 1001, flat_fee="0.01"),
+            self.trade_fill("OID1", "BUY", "11", "50", "OPEN", 1002),
+            self.trade_fill("OID3", "SELL", "14", "40", "CLOSE", 1003),
+            self.trade_fill("OID4", "BUY", "18", "30", "CLOSE", 1004),
+            self.trade_fill("OID3", "SELL", "15", "60", "CLOSE", 1005),
+            self.trade_fill("OID5", "BUY", "12", "20", "OPEN", 1006),
+            self.trade_fill("OID6", "SELL", "13", "10", "CLOSE", 1007),
+            self.trade_fill("OID5", "BUY", "12.5", "20", "OPEN", 1008),
+        ]
+
+    def spot_trades(self):
+        return [
+            self.trade_fill("OID1", "BUY", "100", "10", "NIL", 1000),
+            self.trade_fill("OID2", "SELL", "120", "15", "NIL", 1001, flat_fee="0.02"),
+            self.trade_fill("OID2", "SELL", "121", "1.5", "NIL", 1002),
+            self.trade_fill("OID3", "BUY", "99", "3", "NIL", 1003, percent_fee="0"),
+        ]
+
+    def assert_same_metrics(self, expected: PerformanceMetrics, actual: PerformanceMetrics, include_fees: bool = True):
+        fields = ["num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base",
+                  "b_vol_quote", "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price", "avg_tot_price",
+                  "start_base_bal", "start_quote_bal", "cur_base_bal", "cur_quote_bal", "start_price",
+                  "cur_price", "hold_value", "cur_value", "trade_pnl"]
+        if include_fees:
+            fields.extend(["fee_in_quote", "total_pnl", "return_pct"])
+            self.assertEqual(dict(expected.fees), dict(actual.fees))
+        for field in fields:
+            self.assertEqual(getattr(expected, field), getattr(actual, field), field)
+
+    def test_derivative_metrics_match_metrics_from_trades(self):
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        tracker = PerformanceTracker()
+        for trade in self.derivative_trades():
+            tracker.add_trade_fill(trade)
+
+        expected = asyncio.get_event_loop().run_until_complete(
+            PerformanceMetrics.create(trading_pair, self.derivative_trades(), cur_bals))
+        actual = asyncio.get_event_loop().run_until_complete(
+            tracker.performance_metrics("binance", trading_pair, cur_bals))
+
+        self.assertTrue(tracker.accumulator("binance", trading_pair).is_derivative)
+        self.assertEqual(9, tracker.num_trades)
+        # PerformanceMetrics.create calculates the fees after aggregating the fills of each order into their first
+        # fill, counting them twice. The accumulator calculates the fees of each fill.
+        self.assert_same_metrics(expected, actual, include_fees=False)
+        self.assertEqual(Decimal("4.3"), actual.fees[quote])
+        self.assertEqual(Decimal("0.01"), actual.fees["BNB"])
+        self.assertEqual(Decimal("7.3"), actual.fee_in_quote)
+        self.assertEqual(actual.trade_pnl - Decimal("7.3"), actual.total_pnl)
+
+    def test_spot_metrics_match_metrics_from_trades(self):
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        tracker = PerformanceTracker()
+        for trade in self.spot_trades():
+            tracker.add_trade_fill(trade)
+
+        expected = asyncio.get_event_loop().run_until_complete(
+            PerformanceMetrics.create(trading_pair, self.spot_trades(), cur_bals))
+        actual = asyncio.get_event_loop().run_until_complete(
+            tracker.performance_metrics("binance", trading_pair, cur_bals))
+
+        self.assertFalse(tracker.accumulator("binance", trading_pair).is_derivative)
+        self.assert_same_metrics(expected, actual)
+
+    def test_fills_are_tracked_by_market_and_start_price_is_the_oldest_fill(self):
+        tracker = PerformanceTracker()
+        tracker.add_trade_fill(self.trade_fill("OID1", "BUY", "100", "1", "NIL", 2000, market="kucoin"))
+        tracker.add_trade_fill(self.trade_fill("OID2", "BUY", "101", "1", "NIL", 1000))
+        tracker.add_fill(market="binance", trading_pair=trading_pair, order_id="OID3", trade_type="SELL",
+                         position="NIL", price=Decimal("95"), amount=Decimal("2"),
+                         trade_fee=AddedToCostTradeFee().to_json(), timestamp=900)
+
+        self.assertEqual(3, tracker.num_trades)
+        self.assertEqual([("kucoin", trading_pair), ("binance", trading_pair)], tracker.markets)
+        accumulator = tracker.accumulator("binance", trading_pair)
+        self.assertEqual(2, accumulator.num_fills)
+        self.assertEqual(Decimal("95"), accumulator.start_price)
+        self.assertEqual(Decimal("101"), accumulator.last_price)
+        self.assertEqual(Decimal("1"), accumulator.b_vol_base)
+        self.assertEqual(Decimal("-2"), accumulator.s_vol_base)
@@ -1,13 +1,20 @@
 import unittest
+from unittest.mock import patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.connector_manifest import load_connector_manifest
+from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting, ConnectorType
+from hummingbot.connector.exchange.binance import binance_utils
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
 
 class SettingsTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        AllConnectorSettings.create_connector_settings()
+        super().tearDown()
+
     def test_non_trading_connector_instance_with_default_configuration_secrets_revealed(
         self
     ):
@@ -36,3 +43,43 @@ class SettingsTest(unittest.TestCase):
         self.assertEqual(api_key, connector.api_key)
         self.assertNotIsInstance(connector.secret_key, SecretStr)
         self.assertEqual(api_secret, connector.secret_key)
+
+    def test_connector_manifest_is_up_to_date(self):
+        # Regenerate the manifest with `python -m hummingbot.client.connector_manifest` if this test fails
+        self.assertEqual(AllConnectorSettings.generate_connector_manifest(), load_connector_manifest())
+
+    def test_connector_settings_from_manifest_match_utils_modules(self):
+        manifest_settings = dict(AllConnectorSettings.create_connector_settings())
+        utils_settings = AllConnectorSettings.create_connector_settings(use_manifest=False)
+
+        self.assertEqual(utils_settings.keys(), manifest_settings.keys())
+        for name, utils_setting in utils_settings.items():
+            manifest_setting = manifest_settings[name]
+            self.assertEqual(utils_setting._replace(config_keys=None), manifest_setting)
+            self.assertIs(utils_setting.config_keys, manifest_setting.get_config_keys())
+
+    @patch("hummingbot.client.settings.importlib.import_module")
+    def test_connector_settings_created_from_manifest_without_importing_utils_modules(self, import_module_mock):
+        connector_settings = AllConnectorSettings.create_connector_settings()
+
+        import_module_mock.assert_not_called()
+        self.assertEqual(ConnectorType.Exchange, connector_settings["binance"].type)
+        self.assertEqual("binance", connector_settings["binance_us"].parent_name)
+        self.assertIsNone(connector_settings["binance"].config_keys)
+        self.assertEqual(
+            ("hummingbot.connector.exchange.binance.binance_utils", "binance_us"),
+            connector_settings["binance_us"].config_keys_source,
+        )
+
+    @patch("hummingbot.client.settings.load_connector_manifest")
+    def test_connector_settings_of_changed_utils_module_created_from_utils_module(self, load_manifest_mock):
+        manifest = load_connector_manifest()
+        manifest["binance"]["utils_hash"] = "outdated"
+        manifest["binance"]["settings"][0]["example_pair"] = "OUTDATED-PAIR"
+        load_manifest_mock.return_value = manifest
+
+        connector_settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertEqual(binance_utils.EXAMPLE_PAIR, connector_settings["binance"].example_pair)
+        self.assertIs(binance_utils.KEYS, connector_settings["binance"].config_keys)
+        self.assertIsNone(connector_settings["kucoin"].config_keys)
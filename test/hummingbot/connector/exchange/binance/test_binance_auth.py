@@ -49,3 +49,24 @@ class BinanceAuthTests(TestCase):
         self.assertEqual(now * 1e3, configured_request.params["timestamp"])
         self.assertEqual(expected_signature, configured_request.params["signature"])
         self.assertEqual({"X-MBX-APIKEY": self._api_key}, configured_request.headers)
+
+    def test_rest_authenticate_post_with_unserialized_data(self):
+        now = 1234567890.000
+        mock_time_provider = MagicMock()
+        mock_time_provider.time.return_value = now
+
+        data = {"symbol": "LTCBTC", "side": "BUY", "quantity": 1}
+
+        auth = BinanceAuth(api_key=self._api_key, secret_key=self._secret, time_provider=mock_time_provider)
+        request = RESTRequest(method=RESTMethod.POST, data=copy(data), is_auth_required=True)
+        configured_request = self.async_run_with_timeout(auth.rest_authenticate(request))
+
+        encoded_data = "symbol=LTCBTC&side=BUY&quantity=1&timestamp=1234567890000"
+        expected_signature = hmac.new(
+            self._secret.encode("utf-8"),
+            encoded_data.encode("utf-8"),
+            hashlib.sha256).hexdigest()
+        self.assertTrue(auth.authenticates_unserialized_data)
+        self.assertEqual(dict(data, timestamp=1234567890000, signature=expected_signature),
+                         dict(configured_request.data))
+        self.assertEqual({"X-MBX-APIKEY": self._api_key}, configured_request.headers)
@@ -16,7 +16,7 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
 
@@ -981,6 +981,207 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 "misc_updates=None)")
         )
 
+    def _start_tracking_orders(self, order_ids: List[str]) -> List[InFlightOrder]:
+        for index, order_id in enumerate(order_ids):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=str(100234 + index),
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        return [self.exchange.in_flight_orders[order_id] for order_id in order_ids]
+
+    def _order_status_response(self, order: InFlightOrder, status: str) -> Dict[str, Any]:
+        return {
+            "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+            "orderId": int(order.exchange_order_id),
+            "orderListId": -1,
+            "clientOrderId": order.client_order_id,
+            "price": "10000.0",
+            "origQty": "1.0",
+            "executedQty": "0.0",
+            "cummulativeQuoteQty": "0.0",
+            "status": status,
+            "timeInForce": "GTC",
+            "type": "LIMIT",
+            "side": "BUY",
+            "stopPrice": "0.0",
+            "icebergQty": "0.0",
+            "time": 1640780000000,
+            "updateTime": 1640780001000,
+            "isWorking": True,
+            "origQuoteOrderQty": "10000.000000"
+        }
+
+    @aioresponses()
+    def test_update_orders_status_requests_open_orders_once_per_trading_pair(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.exchange_symbol_associated_to_pair = AsyncMock(
+            return_value=self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset))
+        open_order, closed_order = self._start_tracking_orders(["OID1", "OID2"])
+
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        mock_api.get(re.compile(f"^{open_orders_url}".replace(".", r"\.").replace("?", r"\?")),
+                     body=json.dumps([self._order_status_response(open_order, "PARTIALLY_FILLED")]))
+        order_url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        mock_api.get(re.compile(f"^{order_url}".replace(".", r"\.").replace("?", r"\?")),
+                     body=json.dumps(self._order_status_response(closed_order, "CANCELED")))
+
+        self.async_run_with_timeout(self.exchange._update_orders())
+
+        open_orders_requests = self._all_executed_requests(mock_api, open_orders_url)
+        self.assertEqual(1, len(open_orders_requests))
+        self.validate_auth_credentials_present(open_orders_requests[0])
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                         open_orders_requests[0].kwargs["params"]["symbol"])
+        order_requests = self._all_executed_requests(mock_api, order_url)
+        self.assertEqual(1, len(order_requests))
+        self.assertEqual(closed_order.client_order_id, order_requests[0].kwargs["params"]["origClientOrderId"])
+
+        self.assertEqual(OrderState.PARTIALLY_FILLED, open_order.current_state)
+        self.assertTrue(closed_order.is_cancelled)
+        self.assertNotIn(closed_order.client_order_id, self.exchange.in_flight_orders)
+
+    @aioresponses()
+    def test_update_orders_fills_requests_trades_once_per_trading_pair(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.exchange_symbol_associated_to_pair = AsyncMock(
+            return_value=self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset))
+        orders = self._start_tracking_orders(["OID1", "OID2"])
+
+        trades = [
+            {
+                "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                "id": 28457 + index,
+                "orderId": int(order.exchange_order_id),
+                "orderListId": -1,
+                "price": "10000",
+                "qty": "0.5",
+                "quoteQty": "5000",
+                "commission": "0.01",
+                "commissionAsset": self.quote_asset,
+                "time": 1640780001000,
+                "isBuyer": True,
+                "isMaker": False,
+                "isBestMatch": True
+            }
+            for index, order in enumerate(orders)
+        ]
+        # A trade of an order not being updated is ignored
+        trades.append(dict(trades[0], id=30000, orderId=999))
+        url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        mock_api.get(re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?")), body=json.dumps(trades))
+
+        self.async_run_with_timeout(self.exchange._update_orders_fills(orders=orders))
+
+        requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(requests))
+        self.validate_auth_credentials_present(requests[0])
+        request_params = requests[0].kwargs["params"]
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset), request_params["symbol"])
+        self.assertEqual(int(1640780000 * 1e3), request_params["startTime"])
+        self.assertNotIn("orderId", request_params)
+
+        self.assertEqual(2, len(self.order_filled_logger.event_log))
+        self.assertEqual({order.client_order_id for order in orders},
+                         {event.order_id for event in self.order_filled_logger.event_log})
+        for order in orders:
+            self.assertEqual(Decimal("0.5"), order.executed_amount_base)
+
+    @aioresponses()
+    def test_update_orders_fills_requests_each_order_when_trades_limit_is_reached(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.exchange_symbol_associated_to_pair = AsyncMock(
+            return_value=self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset))
+        orders = self._start_tracking_orders(["OID1", "OID2"])
+
+        url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        trade = {"id": 1, "orderId": 1, "price": "1", "qty": "1", "quoteQty": "1", "commission": "0",
+                 "commissionAsset": self.quote_asset, "time": 1640780001000}
+        mock_api.get(regex_url, body=json.dumps([trade] * CONSTANTS.MAX_MY_TRADES_LIMIT))
+        mock_api.get(regex_url, body=json.dumps([]), repeat=True)
+
+        self.async_run_with_timeout(self.exchange._update_orders_fills(orders=orders))
+
+        requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(3, len(requests))
+        self.assertEqual(
+            {order.exchange_order_id for order in orders},
+            {str(request.kwargs["params"]["orderId"]) for request in requests[1:]})
+        self.assertEqual(0, len(self.order_filled_logger.event_log))
+
+    @aioresponses()
+    def test_update_orders_fills_requests_each_order_older_than_trades_time_range(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.exchange_symbol_associated_to_pair = AsyncMock(
+            return_value=self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset))
+        orders = self._start_tracking_orders(["OID1", "OID2", "OID3"])
+        # The first order was created more than 24 hours ago, out of the time range of a single trades request
+        orders[0].creation_timestamp = 1640780000 - CONSTANTS.MAX_MY_TRADES_TIME_RANGE - 1
+        self.exchange.start_tracking_order(
+            order_id="OID4",
+            exchange_order_id=None,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("1"),
+        )
+        orders.append(self.exchange.in_flight_orders["OID4"])
+
+        url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(regex_url, body=json.dumps([]), repeat=True)
+
+        trade_updates, remaining_orders = self.async_run_with_timeout(
+            self.exchange._all_trade_updates_for_orders(orders))
+
+        self.assertEqual([], trade_updates)
+        self.assertEqual([orders[0], orders[3]], remaining_orders)
+        requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(requests))
+        self.assertEqual(int(1640780000 * 1e3), requests[0].kwargs["params"]["startTime"])
+
+    def test_order_status_requests_are_concurrent_and_prioritize_recent_orders(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.ORDER_UPDATES_MAX_CONCURRENCY = 2
+        self.exchange.BULK_ORDER_UPDATES_MIN_ORDERS = 100
+        orders = self._start_tracking_orders([f"OID{index}" for index in range(5)])
+        for index, order in enumerate(orders):
+            order.last_update_timestamp = 1640780000 + index
+
+        requested_order_ids = []
+        in_flight_requests = 0
+        max_in_flight_requests = 0
+
+        async def _request_order_status(tracked_order: InFlightOrder):
+            nonlocal in_flight_requests, max_in_flight_requests
+            requested_order_ids.append(tracked_order.client_order_id)
+            in_flight_requests += 1
+            max_in_flight_requests = max(max_in_flight_requests, in_flight_requests)
+            await asyncio.sleep(0.01)
+            in_flight_requests -= 1
+            return OrderUpdate(
+                client_order_id=tracked_order.client_order_id,
+                trading_pair=tracked_order.trading_pair,
+                update_timestamp=1640780010,
+                new_state=OrderState.OPEN,
+            )
+
+        self.exchange._request_order_status = _request_order_status
+        self.exchange._all_trade_updates_for_order = AsyncMock(return_value=[])
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertEqual(["OID4", "OID3", "OID2", "OID1", "OID0"], requested_order_ids)
+        self.assertEqual(2, max_in_flight_requests)
+        self.assertEqual(5, self.exchange._all_trade_updates_for_order.call_count)
+        self.assertIsNotNone(self.exchange.order_reconciliation_cycle_time)
+
     def test_user_stream_update_for_order_failure(self):
         self.exchange._set_current_timestamp(1640780000)
         self.exchange.start_tracking_order(
@@ -1,11 +1,23 @@
+from decimal import Decimal
+from typing import List, Tuple
 from unittest import TestCase
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
-from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade import (
+    create_backtest_paper_trade_market,
+    create_paper_trade_market,
+    get_order_book_tracker,
+)
+from hummingbot.core.backtesting.backtest_replay_engine import BacktestReplayEngine
+from hummingbot.core.backtesting.market_data import MarketDataRecordType, MarketDataSide, create_market_data_records
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -29,3 +41,87 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+
+class PaperTradeExchangeQueuePositionFillsTests(TestCase):
+    start_timestamp = 1640000000.0
+    trading_pair = "ETH-USDT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        self.engine = BacktestReplayEngine()
+        self.market = create_backtest_paper_trade_market(
+            "binance", ClientConfigAdapter(ClientConfigMap()), [self.trading_pair])
+        self.market.set_balance("ETH", 10)
+        self.market.set_balance("USDT", 10000)
+        self.market.set_queue_position_fills(True)
+        self.assertTrue(self.market.ready)
+        self.fill_logger = EventLogger()
+        self.completed_logger = EventLogger()
+        self.market.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        self.market.add_listener(MarketEvent.BuyOrderCompleted, self.completed_logger)
+        self.clock.add_iterator(self.engine)
+        self.clock.add_iterator(self.market)
+
+    def replay(self, trades: List[Tuple[float, float, float]]):
+        t = self.start_timestamp
+        records = [
+            (t + 0.5, 1, MarketDataRecordType.SNAPSHOT, MarketDataSide.BID, 999, 5),
+            (t + 0.5, 1, MarketDataRecordType.SNAPSHOT, MarketDataSide.ASK, 1001, 5),
+        ]
+        records.extend((t + offset, 0, MarketDataRecordType.TRADE, MarketDataSide.ASK, price, amount)
+                       for offset, price, amount in trades)
+        market_data = create_market_data_records(len(records))
+        for i, record in enumerate(records):
+            market_data[i] = record
+        self.engine.add_market_data(self.trading_pair, self.market.order_books[self.trading_pair], market_data)
+
+    def test_set_queue_position_fills_requires_no_limit_orders(self):
+        self.replay([])
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.market.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("999"))
+
+        self.assertTrue(self.market.queue_position_fills)
+        with self.assertRaises(ValueError):
+            self.market.set_queue_position_fills(False)
+
+    def test_limit_order_is_filled_after_the_amount_ahead_in_the_queue(self):
+        self.replay([(2.5, 999, 4), (3.5, 999, 2), (4.5, 999, 3)])
+        self.clock.backtest_til(self.start_timestamp + 1)
+        order_id = self.market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("999"))
+
+        # The first trade only consumes part of the 5 ETH queued ahead of the order
+        self.clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+        self.assertEqual(1, self.market.queue_position_simulator.get_order(order_id).queue_ahead)
+
+        self.clock.backtest_til(self.start_timestamp + 4)
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("1"), self.fill_logger.event_log[0].amount)
+        self.assertEqual(1, len(self.market.limit_orders))
+        self.assertEqual(0, len(self.completed_logger.event_log))
+        # The maker fee is paid in the base asset
+        self.assertEqual(Decimal("10.999"), self.market.get_balance("ETH"))
+        self.assertEqual(Decimal("9001"), self.market.get_balance("USDT"))
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.assertEqual(2, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("1"), self.fill_logger.event_log[1].amount)
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertIsNone(self.market.queue_position_simulator.get_order(order_id))
+        self.assertEqual(1, len(self.completed_logger.event_log))
+        self.assertEqual(Decimal("1.998"), self.completed_logger.event_log[0].base_asset_amount)
+        self.assertEqual(Decimal("1998"), self.completed_logger.event_log[0].quote_asset_amount)
+        self.assertEqual(Decimal("11.998"), self.market.get_balance("ETH"))
+        self.assertEqual(Decimal("8002"), self.market.get_balance("USDT"))
+
+    def test_cancelled_limit_order_is_removed_from_the_queue(self):
+        self.replay([])
+        self.clock.backtest_til(self.start_timestamp + 1)
+        order_id = self.market.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("999"))
+        self.assertIsNotNone(self.market.queue_position_simulator.get_order(order_id))
+
+        self.market.cancel(self.trading_pair, order_id)
+
+        self.assertIsNone(self.market.queue_position_simulator.get_order(order_id))
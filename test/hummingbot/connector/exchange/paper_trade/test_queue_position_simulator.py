@@ -0,0 +1,87 @@
+from decimal import Decimal
+from unittest import TestCase
+
+from hummingbot.connector.exchange.paper_trade.queue_position_simulator import (
+    QueuePositionSimulator,
+    SimulatedLimitOrder,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class QueuePositionSimulatorTests(TestCase):
+    trading_pair = "ETH-USDT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.simulator = QueuePositionSimulator()
+
+    def add_order(self, order_id: str, is_buy: bool, price: str, amount: str, queue_ahead: float):
+        order = SimulatedLimitOrder(order_id, self.trading_pair, is_buy, Decimal(price), Decimal(amount), queue_ahead)
+        self.simulator.add_order(order)
+        return order
+
+    def test_add_and_remove_orders(self):
+        first = self.add_order("OID1", True, "99", "1", 5)
+        self.add_order("OID2", True, "99", "1", 6)
+        self.add_order("OID3", False, "101", "1", 2)
+
+        self.assertEqual(first, self.simulator.get_order("OID1"))
+        self.assertEqual([self.trading_pair], self.simulator.trading_pairs)
+
+        self.assertEqual(first, self.simulator.remove_order("OID1"))
+        self.assertIsNone(self.simulator.get_order("OID1"))
+        self.assertIsNone(self.simulator.remove_order("OID1"))
+        self.simulator.remove_order("OID2")
+        self.simulator.remove_order("OID3")
+        self.assertEqual([], self.simulator.trading_pairs)
+        self.assertEqual([], self.simulator.match_trade(self.trading_pair, True, 99, 100))
+
+    def test_trade_at_order_price_consumes_queue_ahead_first(self):
+        order = self.add_order("OID1", True, "99", "2", 5)
+
+        self.assertEqual([], self.simulator.match_trade(self.trading_pair, True, 99, 3))
+        self.assertEqual(2, order.queue_ahead)
+
+        fills = self.simulator.match_trade(self.trading_pair, True, 99, 3)
+        self.assertEqual([(order, Decimal("1"))], fills)
+        self.assertEqual(0, order.queue_ahead)
+
+    def test_orders_at_same_price_are_filled_in_creation_order(self):
+        first = self.add_order("OID1", False, "101", "1", 1)
+        second = self.add_order("OID2", False, "101", "1", 3)
+
+        fills = self.simulator.match_trade(self.trading_pair, False, 101, 2.5)
+
+        # The trade consumes the amount ahead of the first order and fills it, the rest is taken from the amount ahead
+        # of the second order
+        self.assertEqual([(first, Decimal("1"))], fills)
+        self.assertEqual(1.5, second.queue_ahead)
+
+    def test_trade_through_order_price_fills_it_completely(self):
+        buy = self.add_order("OID1", True, "99", "2", 5)
+        buy.filled_amount = Decimal("0.5")
+        sell = self.add_order("OID2", False, "101", "1", 5)
+
+        self.assertEqual([(buy, Decimal("1.5"))], self.simulator.match_trade(self.trading_pair, True, 98, 0.1))
+        self.assertEqual([(sell, Decimal("1"))], self.simulator.match_trade(self.trading_pair, False, 102, 0.1))
+
+    def test_trade_on_other_side_or_worse_price_does_not_fill(self):
+        self.add_order("OID1", True, "99", "2", 0)
+
+        self.assertEqual([], self.simulator.match_trade(self.trading_pair, False, 99, 10))
+        self.assertEqual([], self.simulator.match_trade(self.trading_pair, True, 100, 10))
+        self.assertEqual([], self.simulator.match_trade("BTC-USDT", True, 99, 10))
+
+    def test_update_queue_positions_caps_queue_ahead_to_level_amount(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 3, 1)], [OrderBookRow(101, 4, 1)], 1)
+        buy = self.add_order("OID1", True, "99", "1", 5)
+        sell = self.add_order("OID2", False, "101", "1", 2)
+        missing_level = self.add_order("OID3", True, "98", "1", 5)
+
+        self.simulator.update_queue_positions(self.trading_pair, order_book)
+
+        self.assertEqual(3, buy.queue_ahead)
+        self.assertEqual(2, sell.queue_ahead)
+        self.assertEqual(0, missing_level.queue_ahead)
@@ -79,7 +79,9 @@ class GatewayCancelUnitTest(unittest.TestCase):
         cls._patch_stack.close()
 
     def tearDown(self) -> None:
-        self._connector._order_tracker.all_orders.clear()
+        order_tracker = self._connector._order_tracker
+        for client_order_id in list(order_tracker.active_orders):
+            order_tracker.stop_tracking_order(client_order_id)
 
     @classmethod
     async def wait_til_ready(cls):
@@ -1,7 +1,7 @@
 import asyncio
 import unittest
 from decimal import Decimal
-from typing import Awaitable, Dict
+from typing import Awaitable, Dict, Optional
 from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -1082,3 +1082,122 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         self.assertTrue(order.is_failure)
         self.assertIn(order.client_order_id, self.tracker.lost_orders)
+
+    def _create_order(self, client_order_id: str, exchange_order_id: Optional[str] = None,
+                      trading_pair: Optional[str] = None) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=trading_pair or self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+    def test_fetch_order_by_exchange_order_id_assigned_with_order_update(self):
+        order = self._create_order("OID1")
+        self.tracker.start_tracking_order(order)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID1"))
+
+        self.async_run_with_timeout(self.tracker.process_order_update(OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            update_timestamp=1640001113.0,
+            new_state=OrderState.OPEN,
+        )))
+
+        self.assertIn("EOID1", self.tracker._orders_by_exchange_order_id)
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="EOID1"))
+
+    def test_fetch_order_by_exchange_order_id_assigned_without_notifying_tracker(self):
+        order = self._create_order("OID1")
+        self.tracker.start_tracking_order(order)
+
+        order.update_exchange_order_id("EOID1")
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="EOID1"))
+        self.assertEqual(0, len(self.tracker._orders_without_exchange_order_id))
+
+    def test_fetch_order_by_exchange_order_id_for_cached_and_lost_orders(self):
+        self.tracker = ClientOrderTracker(connector=self.connector, lost_order_count_limit=0)
+        cached_order = self._create_order("OID1", exchange_order_id="EOID1")
+        lost_order = self._create_order("OID2", exchange_order_id="EOID2")
+        self.tracker.start_tracking_order(cached_order)
+        self.tracker.start_tracking_order(lost_order)
+
+        self.tracker.stop_tracking_order(cached_order.client_order_id)
+        self.async_run_with_timeout(self.tracker.process_order_not_found(lost_order.client_order_id))
+
+        self.assertIs(cached_order, self.tracker.fetch_order(exchange_order_id="EOID1"))
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID2"))
+        self.assertIs(cached_order, self.tracker.fetch_fillable_order(exchange_order_id="EOID1"))
+        self.assertIs(lost_order, self.tracker.fetch_fillable_order(exchange_order_id="EOID2"))
+        self.assertIs(lost_order, self.tracker.fetch_fillable_order(client_order_id="OID2"))
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.CACHED_ORDER_TTL", 0.1)
+    def test_fetch_order_by_exchange_order_id_ignores_expired_cached_orders(self):
+        tracker = ClientOrderTracker(self.connector)
+        order = self._create_order("OID1", exchange_order_id="EOID1")
+        tracker.start_tracking_order(order)
+        tracker.stop_tracking_order(order.client_order_id)
+        self.assertIs(order, tracker.fetch_order(exchange_order_id="EOID1"))
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+
+        self.assertIsNone(tracker.fetch_order(exchange_order_id="EOID1"))
+        self.assertIsNone(tracker.fetch_fillable_order(exchange_order_id="EOID1"))
+
+    def test_exchange_order_id_index_is_purged_of_untracked_orders(self):
+        for i in range(3 * ClientOrderTracker.MAX_CACHE_SIZE):
+            order = self._create_order(f"OID{i}", exchange_order_id=f"EOID{i}")
+            self.tracker.start_tracking_order(order)
+            self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertLessEqual(len(self.tracker._orders_by_exchange_order_id), 2 * ClientOrderTracker.MAX_CACHE_SIZE)
+        last_order_id = 3 * ClientOrderTracker.MAX_CACHE_SIZE - 1
+        self.assertIsNotNone(self.tracker.fetch_order(exchange_order_id=f"EOID{last_order_id}"))
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID0"))
+
+    def test_order_views_are_read_only_and_not_copied(self):
+        order = self._create_order("OID1", exchange_order_id="EOID1")
+        self.tracker.start_tracking_order(order)
+
+        views = [self.tracker.cached_orders,
+                 self.tracker.lost_orders,
+                 self.tracker.all_orders,
+                 self.tracker.all_fillable_orders,
+                 self.tracker.all_updatable_orders]
+        for view in views:
+            with self.assertRaises(TypeError):
+                view["OID2"] = order
+        self.assertIs(self.tracker.all_fillable_orders, self.tracker.all_fillable_orders)
+
+        self.assertEqual({"OID1": order}, dict(self.tracker.all_orders))
+        self.tracker.stop_tracking_order(order.client_order_id)
+        self.assertEqual({"OID1": order}, dict(self.tracker.cached_orders))
+        self.assertEqual({"OID1": order}, dict(self.tracker.all_fillable_orders))
+        self.assertEqual({}, dict(self.tracker.all_updatable_orders))
+
+    def test_active_orders_for_trading_pair(self):
+        other_trading_pair = f"{self.base_asset}-USDT"
+        first_order = self._create_order("OID1")
+        second_order = self._create_order("OID2")
+        other_pair_order = self._create_order("OID3", trading_pair=other_trading_pair)
+        for order in [first_order, second_order, other_pair_order]:
+            self.tracker.start_tracking_order(order)
+
+        self.assertEqual({"OID1": first_order, "OID2": second_order},
+                         dict(self.tracker.active_orders_for_trading_pair(self.trading_pair)))
+        self.assertEqual({"OID3": other_pair_order},
+                         dict(self.tracker.active_orders_for_trading_pair(other_trading_pair)))
+
+        self.tracker.stop_tracking_order(first_order.client_order_id)
+        self.tracker.stop_tracking_order(other_pair_order.client_order_id)
+
+        self.assertEqual({"OID2": second_order},
+                         dict(self.tracker.active_orders_for_trading_pair(self.trading_pair)))
+        self.assertEqual({}, dict(self.tracker.active_orders_for_trading_pair(other_trading_pair)))
+        self.assertNotIn(other_trading_pair, self.tracker._active_orders_by_trading_pair)
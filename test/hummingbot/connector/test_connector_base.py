@@ -9,8 +9,9 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.connector_base import ConnectorBase, OrderFilledEvent
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderCancelledEvent
 
 
 class InFightOrderTest(InFlightOrderBase):
@@ -570,3 +571,139 @@ class ConnectorBaseUnitTest(unittest.TestCase):
                                 + (current_sell_order.executed_amount_quote)
                                 - (extra_fill_event.amount * extra_fill_event.price))
         self.assertEqual(expected_hbot_amount, estimated_hbot_balance)
+
+    def _ledger_test_connector(self) -> MockTestConnector:
+        connector = MockTestConnector(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        connector.real_time_balance_update = False
+        connector._account_available_balances = {"COINALPHA": Decimal("10"), "HBOT": Decimal("100000")}
+        connector.in_flight_orders_snapshot = {}
+        connector.in_flight_orders_snapshot_timestamp = 1640000000
+        return connector
+
+    def _assert_available_balances_match_full_calculation(self, connector: MockTestConnector):
+        for currency, available_balance in connector._account_available_balances.items():
+            self.assertEqual(connector.apply_balance_update_since_snapshot(currency, available_balance),
+                             connector.get_available_balance(currency))
+
+    def test_available_balance_ledger_follows_order_events(self):
+        connector = self._ledger_test_connector()
+        self.assertEqual(Decimal("100000"), connector.get_available_balance("HBOT"))
+        self.assertTrue(connector.balance_ledger.synced)
+
+        buy_order = InFlightOrder(
+            client_order_id="OID1",
+            exchange_order_id="1234",
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("900"),
+            amount=Decimal("1"),
+            creation_timestamp=1640000001
+        )
+        connector._in_flight_orders[buy_order.client_order_id] = buy_order
+        connector.trigger_event(MarketEvent.BuyOrderCreated, BuyOrderCreatedEvent(
+            timestamp=1640000001,
+            type=buy_order.order_type,
+            trading_pair=buy_order.trading_pair,
+            amount=buy_order.amount,
+            price=buy_order.price,
+            order_id=buy_order.client_order_id,
+            creation_timestamp=1640000001,
+        ))
+        self.assertEqual(Decimal("99100"), connector.get_available_balance("HBOT"))
+        self._assert_available_balances_match_full_calculation(connector)
+
+        fill_event = OrderFilledEvent(
+            timestamp=1640000002,
+            order_id=buy_order.client_order_id,
+            trading_pair=buy_order.trading_pair,
+            trade_type=buy_order.trade_type,
+            order_type=buy_order.order_type,
+            price=Decimal("900"),
+            amount=Decimal("0.4"),
+            trade_fee=AddedToCostTradeFee(),
+        )
+        buy_order.executed_amount_base = fill_event.amount
+        buy_order.executed_amount_quote = fill_event.amount * fill_event.price
+        connector._event_logs.append(fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, fill_event)
+        self.assertEqual(Decimal("10.4"), connector.get_available_balance("COINALPHA"))
+        self.assertEqual(Decimal("99100"), connector.get_available_balance("HBOT"))
+        self._assert_available_balances_match_full_calculation(connector)
+
+        buy_order.current_state = OrderState.CANCELED
+        connector.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(
+            timestamp=1640000003, order_id=buy_order.client_order_id))
+        del connector._in_flight_orders[buy_order.client_order_id]
+        self.assertEqual(Decimal("10.4"), connector.get_available_balance("COINALPHA"))
+        self.assertEqual(Decimal("99640"), connector.get_available_balance("HBOT"))
+        self._assert_available_balances_match_full_calculation(connector)
+
+    def test_available_balance_ledger_discards_fills_older_than_new_snapshot(self):
+        connector = self._ledger_test_connector()
+        connector.get_available_balance("HBOT")
+
+        for timestamp in (1640000002, 1640000006):
+            fill_event = OrderFilledEvent(
+                timestamp=timestamp,
+                order_id="OID1",
+                trading_pair="COINALPHA-HBOT",
+                trade_type=TradeType.SELL,
+                order_type=OrderType.LIMIT,
+                price=Decimal("1000"),
+                amount=Decimal("1"),
+                trade_fee=AddedToCostTradeFee(),
+            )
+            connector._event_logs.append(fill_event)
+            connector.trigger_event(MarketEvent.OrderFilled, fill_event)
+        self.assertEqual(Decimal("102000"), connector.get_available_balance("HBOT"))
+
+        connector._account_available_balances = {"COINALPHA": Decimal("9"), "HBOT": Decimal("101000")}
+        connector.in_flight_orders_snapshot = {}
+        connector.in_flight_orders_snapshot_timestamp = 1640000005
+        self.assertEqual(Decimal("8"), connector.get_available_balance("COINALPHA"))
+        self.assertEqual(Decimal("102000"), connector.get_available_balance("HBOT"))
+        self._assert_available_balances_match_full_calculation(connector)
+
+        # A snapshot timestamp moving back synchronizes the fills from the event logs again
+        connector.in_flight_orders_snapshot_timestamp = 1640000000
+        self._assert_available_balances_match_full_calculation(connector)
+
+    def test_available_balance_ledger_reconciles_orders_tracked_without_events(self):
+        connector = self._ledger_test_connector()
+        connector.get_available_balance("COINALPHA")
+
+        sell_order = InFlightOrder(
+            client_order_id="OID1",
+            exchange_order_id="1234",
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.SELL,
+            price=Decimal("1100"),
+            amount=Decimal("0.5"),
+            creation_timestamp=1640000001
+        )
+        connector._in_flight_orders[sell_order.client_order_id] = sell_order
+        self.assertEqual(Decimal("9.5"), connector.get_available_balance("COINALPHA"))
+
+        connector._in_flight_orders.clear()
+        self.assertEqual(Decimal("10"), connector.get_available_balance("COINALPHA"))
+
+    def test_logged_order_fills_are_bounded(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.max_logged_order_fills = 2
+        connector = ConnectorBase(client_config_map=client_config_map)
+
+        for i in range(3):
+            connector.trigger_event(MarketEvent.OrderFilled, OrderFilledEvent(
+                timestamp=1640000000 + i,
+                order_id=f"OID{i}",
+                trading_pair="COINALPHA-HBOT",
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal("1000"),
+                amount=Decimal("1"),
+                trade_fee=AddedToCostTradeFee(),
+            ))
+
+        self.assertEqual(["OID1", "OID2"], [event.order_id for event in connector.event_logs])
@@ -1,3 +1,6 @@
+import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
 from unittest import TestCase
@@ -17,6 +20,7 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -42,13 +46,20 @@ class MarketsRecorderTests(TestCase):
         )
 
         self.tracking_states = dict()
+        self.recorded_trade_fills = set()
 
     def add_trade_fills_from_market_recorder(self, current_trade_fills):
-        pass
+        self.recorded_trade_fills.update(current_trade_fills)
 
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -266,3 +277,298 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def _create_file_db_manager(self, engine_mock) -> SQLConnectionManager:
+        # The writer thread needs a file database, in memory databases are not shared between threads
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(db_dir.name, 'test_db.sqlite')}")
+        return SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.append_to_csv")
+    def test_write_behind_records_events_in_order(self, _):
+        manager = self._create_file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        complete_event = BuyOrderCompletedEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            base_asset_amount=create_event.amount,
+            quote_asset_amount=create_event.amount * create_event.price,
+            order_type=create_event.type)
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+
+        # Fills are notified to the connector without waiting for the database write
+        self.assertEqual(1, len(self.recorded_trade_fills))
+
+        recorder.flush()
+
+        with manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            order_status = [status.status for status in orders[0].status]
+            trade_fills = orders[0].trade_fills
+
+        self.assertEqual(1, len(orders))
+        self.assertEqual(MarketEvent.BuyOrderCompleted.name, orders[0].last_status)
+        self.assertEqual([MarketEvent.BuyOrderCreated.name,
+                          MarketEvent.OrderFilled.name,
+                          MarketEvent.BuyOrderCompleted.name],
+                         order_status)
+        self.assertEqual(1, len(trade_fills))
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.logger")
+    def test_write_behind_failed_record_does_not_discard_the_rest_of_the_batch(self, logger_mock):
+        manager = self._create_file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+        self.addCleanup(recorder.stop)
+
+        # The second order has a duplicated id, so its insertion fails
+        for i, order_id in enumerate(["OID1", "OID1", "OID2"]):
+            event = BuyOrderCreatedEvent(
+                timestamp=1642010000 + i,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id=order_id,
+                creation_timestamp=1640001112.223,
+                exchange_order_id=f"EOID{i}",
+            )
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, event)
+        # The records are queued before the writer thread starts, so they are written in the same batch
+        recorder.start()
+        recorder.flush()
+
+        with manager.get_new_session() as session:
+            orders = session.query(Order).order_by(Order.id).all()
+
+        self.assertEqual(["OID1", "OID2"], [order.id for order in orders])
+        self.assertEqual("EOID0", orders[0].exchange_order_id)
+        logger_mock().error.assert_called_once()
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.append_to_csv")
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.logger")
+    def test_write_behind_failed_batch_does_not_commit_any_record(self, logger_mock, append_to_csv_mock):
+        manager = self._create_file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+        self.addCleanup(recorder.stop)
+
+        for i, order_id in enumerate(["OID1", "OID1", "OID2"]):
+            event = BuyOrderCreatedEvent(
+                timestamp=1642010000 + i,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id=order_id,
+                creation_timestamp=1640001112.223,
+                exchange_order_id=f"EOID{i}",
+            )
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, event)
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID2",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder._capture_market_states()
+
+        # The records are written in the same batch, and saving the market states at the end of it fails
+        with patch.object(recorder, "_save_market_states", side_effect=Exception("Test error")):
+            recorder.start()
+            recorder.flush()
+
+        with manager.get_new_session() as session:
+            self.assertEqual(0, session.query(Order).count())
+            self.assertEqual(0, session.query(TradeFill).count())
+        append_to_csv_mock.assert_not_called()
+        self.assertEqual(2, logger_mock().error.call_count)
+
+    def test_write_behind_saves_last_market_states_once_per_market(self):
+        manager = self._create_file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+        recorder.start()
+
+        for i in range(3):
+            self.tracking_states = {"order": i}
+            event = BuyOrderCreatedEvent(
+                timestamp=int(time.time()),
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id=f"OID{i}",
+                creation_timestamp=1640001112.223,
+                exchange_order_id=f"EOID{i}",
+            )
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, event)
+
+        self.assertEqual(1, len(recorder._markets_with_pending_states))
+
+        recorder.stop()
+
+        with manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(3, len(orders))
+        self.assertEqual(1, len(market_states))
+        self.assertEqual({"order": 2}, market_states[0].saved_state)
+        self.assertIsNone(recorder._writer_thread)
+
+    def test_performance_tracker_counts_session_fills_from_database_and_events(self):
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                for i, (timestamp, config_file_path) in enumerate([(1642000000000, self.config_file_path),
+                                                                   (1642010000000, self.config_file_path),
+                                                                   (1642010000000, "other_config")]):
+                    session.add(TradeFill(
+                        config_file_path=config_file_path,
+                        strategy=self.strategy_name,
+                        market=self.display_name,
+                        symbol=self.trading_pair,
+                        base_asset=self.base,
+                        quote_asset=self.quote,
+                        timestamp=timestamp,
+                        order_id=f"OID{i}",
+                        trade_type=TradeType.BUY.name,
+                        order_type=OrderType.LIMIT.name,
+                        price=Decimal(1000),
+                        amount=Decimal(1),
+                        leverage=1,
+                        trade_fee=AddedToCostTradeFee().to_json(),
+                        exchange_trade_id=f"EOID{i}",
+                        position=PositionAction.NIL.value))
+
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            session_start_time=1642005000,
+        )
+
+        tracker = recorder.performance_tracker
+        self.assertEqual(1, tracker.num_trades)
+
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID3",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.SELL,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(2),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01")),
+            exchange_trade_id="TradeId3"
+        )
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        self.assertEqual(2, tracker.num_trades)
+        self.assertEqual([(self.display_name, self.trading_pair)], tracker.markets)
+        accumulator = tracker.accumulator(self.display_name, self.trading_pair)
+        self.assertEqual(Decimal(1), accumulator.b_vol_base)
+        self.assertEqual(Decimal(-2), accumulator.s_vol_base)
+        self.assertEqual(Decimal(1000), accumulator.start_price)
+        self.assertEqual(Decimal(1010), accumulator.last_price)
+        self.assertEqual(Decimal("20.2"), accumulator.fees[self.quote])
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.append_to_csv")
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder.logger")
+    def test_performance_tracker_counts_duplicated_fill_once(self, logger_mock, append_to_csv_mock):
+        manager = self._create_file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder.flush()
+        # The stored fills are added to the performance tracker from the event loop
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))
+
+        with manager.get_new_session() as session:
+            self.assertEqual(1, session.query(TradeFill).count())
+        self.assertEqual(1, recorder.performance_tracker.num_trades)
+        accumulator = recorder.performance_tracker.accumulator(self.display_name, self.trading_pair)
+        self.assertEqual(Decimal(1), accumulator.b_vol_base)
+        append_to_csv_mock.assert_called_once()
+        logger_mock().error.assert_called_once()
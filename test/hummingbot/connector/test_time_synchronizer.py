@@ -1,4 +1,5 @@
 import asyncio
+import statistics
 from typing import Awaitable
 from unittest import TestCase
 from unittest.mock import patch
@@ -75,3 +76,23 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    @patch("hummingbot.connector.time_synchronizer.numpy.median")
+    def test_time_offset_recalculated_only_when_samples_change(self, median_mock):
+        median_mock.side_effect = statistics.median
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(1000)
+        time_provider.add_time_offset_ms_sample(3000)
+
+        self.assertEqual(2250, time_provider.time_offset_ms)
+        self.assertEqual(2250, time_provider.time_offset_ms)
+        self.assertEqual(1, median_mock.call_count)
+
+        time_provider.add_time_offset_ms_sample(5000)
+        self.assertAlmostEqual(3444.4444, time_provider.time_offset_ms, places=4)
+        self.assertEqual(2, median_mock.call_count)
+
+        time_provider.clear_time_offset_ms_samples()
+        time_provider.add_time_offset_ms_sample(500)
+        self.assertEqual(500, time_provider.time_offset_ms)
+        self.assertEqual(3, median_mock.call_count)
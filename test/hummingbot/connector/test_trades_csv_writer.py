@@ -0,0 +1,79 @@
+import csv
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from hummingbot.connector.trades_csv_writer import TradesCSVWriter
+
+
+class TradesCSVWriterTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "trades_test.csv")
+        self.header = ("exchange_trade_id", "price", "amount")
+        self.writer = TradesCSVWriter()
+
+    def tearDown(self) -> None:
+        self.writer.close()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _read_rows(self, file_path: str):
+        with open(file_path, newline="") as file:
+            return list(csv.reader(file))
+
+    def test_new_file_gets_header_and_rows(self):
+        self.writer.write_row(self.file_path, self.header, ("T1", 10, 1))
+        self.writer.write_row(self.file_path, self.header, ("T2", 11, 2))
+
+        self.assertEqual([list(self.header), ["T1", "10", "1"], ["T2", "11", "2"]], self._read_rows(self.file_path))
+
+    def test_existing_file_with_same_header_is_appended(self):
+        self.writer.write_row(self.file_path, self.header, ("T1", 10, 1))
+        self.writer.close()
+
+        writer = TradesCSVWriter()
+        writer.write_row(self.file_path, self.header, ("T2", 11, 2))
+        writer.close()
+
+        self.assertEqual([list(self.header), ["T1", "10", "1"], ["T2", "11", "2"]], self._read_rows(self.file_path))
+        self.assertEqual(["trades_test.csv"], os.listdir(self.temp_dir.name))
+
+    def test_header_is_checked_only_when_the_file_is_opened(self):
+        with patch.object(TradesCSVWriter, "file_matches_header", return_value=True) as matches_mock:
+            self.writer.write_row(self.file_path, self.header, ("T1", 10, 1))
+            self.writer.write_row(self.file_path, self.header, ("T2", 11, 2))
+            self.writer.close()
+
+            writer = TradesCSVWriter()
+            writer.write_row(self.file_path, self.header, ("T3", 12, 3))
+            writer.write_row(self.file_path, self.header, ("T4", 13, 4))
+            writer.close()
+
+        self.assertEqual(1, matches_mock.call_count)
+
+    def test_file_with_different_header_is_rotated(self):
+        self.writer.write_row(self.file_path, ("exchange_trade_id", "price"), ("T1", 10))
+        self.writer.write_row(self.file_path, self.header, ("T2", 11, 2))
+        self.writer.close()
+
+        files = os.listdir(self.temp_dir.name)
+        old_files = [file_name for file_name in files if file_name.startswith("trades_test_old_")]
+        self.assertEqual(2, len(files))
+        self.assertEqual(1, len(old_files))
+        self.assertEqual([["exchange_trade_id", "price"], ["T1", "10"]],
+                         self._read_rows(os.path.join(self.temp_dir.name, old_files[0])))
+        self.assertEqual([list(self.header), ["T2", "11", "2"]], self._read_rows(self.file_path))
+
+    def test_rows_are_buffered_until_flush_interval(self):
+        writer = TradesCSVWriter(flush_interval=60)
+        self.addCleanup(writer.close)
+
+        writer.write_row(self.file_path, self.header, ("T1", 10, 1))
+        self.assertEqual([], self._read_rows(self.file_path))
+
+        writer.flush()
+        self.assertEqual([list(self.header), ["T1", "10", "1"]], self._read_rows(self.file_path))
@@ -0,0 +1,222 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class SlidingWindowThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 1000.0
+        self.throttler = SlidingWindowThrottler(rate_limits=self.rate_limits,
+                                                safety_margin_pct=0,
+                                                limits_share_percentage=Decimal("100"))
+        self.throttler.time = lambda: self.now
+
+    def _execute(self, limit_id: str, timeout: float = 0.1):
+        async def _run():
+            async with self.throttler.execute_task(limit_id=limit_id):
+                pass
+        self.ev_loop.run_until_complete(asyncio.wait_for(_run(), timeout))
+
+    def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
+        throttler = SlidingWindowThrottler(rate_limits=[], limits_share_percentage=Decimal("100"))
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+
+    def test_request_registers_once_in_each_related_limit(self):
+        self._execute(TEST_PATH_URL)
+
+        self.assertEqual(1, self.throttler._windows[TEST_PATH_URL].used)
+        self.assertEqual(1, self.throttler._windows[TEST_POOL_ID].used)
+
+    def test_within_capacity_with_linked_limits(self):
+        self._execute(TEST_PATH_URL)
+
+        self.assertFalse(self.throttler.execute_task(TEST_PATH_URL).within_capacity())
+        self.assertTrue(self.throttler.execute_task(TEST_POOL_ID).within_capacity())
+
+        self._execute(TEST_POOL_ID)
+        self.assertFalse(self.throttler.execute_task(TEST_POOL_ID).within_capacity())
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        self._execute(TEST_WEIGHTED_TASK_1_ID)
+        self._execute(TEST_WEIGHTED_TASK_2_ID)
+
+        # Another Task 1 (weight=5) will exceed the capacity (11/10), but Task 2 (weight=1) will not (7/10)
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_capacity_is_released_after_time_interval(self):
+        self._execute(TEST_PATH_URL)
+        context = self.throttler.execute_task(TEST_PATH_URL)
+
+        self.now += 4.9
+        self.assertFalse(context.within_capacity())
+        self.now += 0.1
+        self.assertTrue(context.within_capacity())
+        self.assertEqual(0, self.throttler._windows[TEST_PATH_URL].used)
+        self.assertEqual(0, len(self.throttler._windows[TEST_PATH_URL].entries))
+
+    def test_safety_margin_extends_the_window(self):
+        throttler = SlidingWindowThrottler(rate_limits=self.rate_limits,
+                                           safety_margin_pct=0.1,
+                                           limits_share_percentage=Decimal("100"))
+        throttler.time = lambda: self.now
+        self.throttler = throttler
+        self._execute(TEST_PATH_URL)
+
+        self.now += 5.4
+        self.assertFalse(throttler.execute_task(TEST_PATH_URL).within_capacity())
+        self.now += 0.1
+        self.assertTrue(throttler.execute_task(TEST_PATH_URL).within_capacity())
+
+    def test_limits_share_percentage_is_applied(self):
+        throttler = SlidingWindowThrottler(rate_limits=[RateLimit(limit_id="ANOTHER_TEST", limit=10, time_interval=5)],
+                                           limits_share_percentage=Decimal("55"))
+        self.assertEqual(5, throttler._windows["ANOTHER_TEST"].limit)
+
+    @patch("hummingbot.core.api_throttler.async_throttler_base.AsyncThrottlerBase.logger")
+    def test_acquire_awaits_when_exceed_capacity(self, _):
+        self._execute(TEST_PATH_URL)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self._execute(TEST_PATH_URL)
+
+        self.assertEqual(0, len(self.throttler._waiters))
+        self.assertIsNone(self.throttler._wake_up_handle)
+
+    @patch("hummingbot.core.api_throttler.async_throttler_base.AsyncThrottlerBase.logger")
+    def test_waiting_request_is_resumed_when_capacity_is_released(self, _):
+        throttler = SlidingWindowThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.05)],
+            safety_margin_pct=0,
+            limits_share_percentage=Decimal("100"))
+        order = []
+
+        async def _request(request_id: int):
+            async with throttler.execute_task(limit_id=TEST_POOL_ID):
+                order.append((request_id, throttler.time()))
+
+        async def _run():
+            await asyncio.gather(*[_request(i) for i in range(3)])
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(_run(), 1))
+
+        self.assertEqual([0, 1, 2], [request_id for request_id, _ in order])
+        self.assertGreaterEqual(order[1][1] - order[0][1], 0.05)
+        self.assertGreaterEqual(order[2][1] - order[1][1], 0.05)
+        self.assertEqual(0, len(throttler._waiters))
+
+    @patch("hummingbot.core.api_throttler.async_throttler_base.AsyncThrottlerBase.logger")
+    def test_waiting_requests_keep_fifo_order(self, _):
+        self._execute(TEST_PATH_URL)
+        order = []
+
+        async def _request(limit_id: str):
+            async with self.throttler.execute_task(limit_id=limit_id):
+                order.append(limit_id)
+
+        async def _run():
+            first = asyncio.ensure_future(_request(TEST_PATH_URL))
+            second = asyncio.ensure_future(_request(TEST_POOL_ID))
+            await asyncio.sleep(0.01)
+            # The pool has capacity for the second request, but it has to wait for the first one
+            self.assertEqual([], order)
+            self.now += 5
+            self.throttler._process_waiters()
+            await asyncio.gather(first, second)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(_run(), 1))
+
+        self.assertEqual([TEST_PATH_URL, TEST_POOL_ID], order)
+
+    def test_request_heavier_than_limit_is_executed_when_window_is_empty(self):
+        throttler = SlidingWindowThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5, weight=3)],
+            limits_share_percentage=Decimal("100"))
+
+        self.assertTrue(throttler.execute_task(TEST_POOL_ID).within_capacity())
+
+    @patch("hummingbot.core.api_throttler.async_throttler_base.AsyncThrottlerBase.logger")
+    def test_waiting_request_does_not_block_requests_for_independent_limits(self, _):
+        self._execute(TEST_PATH_URL)
+        order = []
+
+        async def _request(limit_id: str):
+            async with self.throttler.execute_task(limit_id=limit_id):
+                order.append(limit_id)
+
+        async def _run():
+            blocked = asyncio.ensure_future(_request(TEST_PATH_URL))
+            await asyncio.sleep(0.01)
+            # The weighted pool does not share any limit with the waiting request, so it does not wait for it
+            await _request(TEST_WEIGHTED_TASK_1_ID)
+            self.assertEqual([TEST_WEIGHTED_TASK_1_ID], order)
+            self.assertEqual(1, len(self.throttler._waiters))
+            self.now += 5
+            self.throttler._process_waiters()
+            await blocked
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(_run(), 1))
+
+        self.assertEqual([TEST_WEIGHTED_TASK_1_ID, TEST_PATH_URL], order)
+        self.assertEqual(0, self.throttler._windows[TEST_POOL_ID].waiting)
+
+    @patch("hummingbot.core.api_throttler.async_throttler_base.AsyncThrottlerBase.logger")
+    def test_waiting_requests_for_independent_limits_are_resumed_when_their_capacity_is_released(self, _):
+        throttler = SlidingWindowThrottler(
+            rate_limits=[RateLimit(limit_id="A", limit=1, time_interval=2),
+                         RateLimit(limit_id="B", limit=1, time_interval=0.05)],
+            safety_margin_pct=0,
+            limits_share_percentage=Decimal("100"))
+        order = []
+
+        async def _request(limit_id: str):
+            async with throttler.execute_task(limit_id=limit_id):
+                order.append(limit_id)
+
+        async def _run():
+            await _request("A")
+            await _request("B")
+            blocked = asyncio.ensure_future(_request("A"))
+            await asyncio.sleep(0.01)
+            await _request("B")
+            blocked.cancel()
+            await asyncio.gather(blocked, return_exceptions=True)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(_run(), 1))
+
+        self.assertEqual(["A", "B", "B"], order)
+        self.assertEqual(0, len(throttler._waiters))
+        self.assertEqual(0, throttler._windows["A"].waiting)
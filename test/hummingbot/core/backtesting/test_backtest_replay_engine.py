@@ -0,0 +1,227 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import List, Tuple
+
+import numpy as np
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade import create_backtest_paper_trade_market
+from hummingbot.core.backtesting.backtest_replay_engine import BacktestReplayEngine, MarketDataFeed
+from hummingbot.core.backtesting.market_data import (
+    MarketDataRecordType,
+    MarketDataSide,
+    create_market_data_records,
+    load_market_data,
+    save_market_data,
+)
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
+from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+# (timestamp, update_id, record_type, side, price, amount)
+Record = Tuple[float, int, int, int, float, float]
+
+SNAPSHOT = MarketDataRecordType.SNAPSHOT
+DIFF = MarketDataRecordType.DIFF
+TRADE = MarketDataRecordType.TRADE
+BID = MarketDataSide.BID
+ASK = MarketDataSide.ASK
+
+
+def market_data(records: List[Record]) -> np.ndarray:
+    result = create_market_data_records(len(records))
+    for i, record in enumerate(records):
+        result[i] = record
+    return result
+
+
+class BacktestReplayEngineTest(unittest.TestCase):
+    start_timestamp = 1640000000.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        self.engine = BacktestReplayEngine()
+        self.clock.add_iterator(self.engine)
+
+    def test_save_and_load_market_data(self):
+        records = market_data([(self.start_timestamp, 1, SNAPSHOT, BID, 99, 1),
+                               (self.start_timestamp, 1, SNAPSHOT, ASK, 101, 2)])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "market_data.npy")
+            save_market_data(path, records)
+
+            loaded = load_market_data(path)
+            self.assertIsInstance(loaded, np.memmap)
+            self.assertEqual(records.tolist(), loaded.tolist())
+            del loaded
+
+            np.save(path, np.zeros(3))
+            with self.assertRaises(ValueError):
+                load_market_data(path)
+
+    def test_replay_snapshots_diffs_and_trades(self):
+        order_book = OrderBook()
+        trade_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, trade_logger)
+        t = self.start_timestamp
+        self.engine.add_market_data("COINALPHA-HBOT", order_book, market_data([
+            (t + 0.5, 1, SNAPSHOT, BID, 99, 1),
+            (t + 0.5, 1, SNAPSHOT, BID, 98, 2),
+            (t + 0.5, 1, SNAPSHOT, ASK, 101, 1),
+            (t + 0.5, 1, SNAPSHOT, ASK, 102, 2),
+            (t + 1.5, 2, DIFF, BID, 99, 0),
+            (t + 1.7, 3, DIFF, ASK, 100.5, 3),
+            (t + 1.7, 3, DIFF, BID, 97, 1),
+            (t + 2.5, 0, TRADE, ASK, 98, 0.5),
+            (t + 2.6, 4, DIFF, BID, 98.5, 1),
+        ]))
+
+        self.clock.backtest_til(t + 1)
+        self.assertEqual([OrderBookRow(99, 1, 1), OrderBookRow(98, 2, 1)], list(order_book.bid_entries()))
+        self.assertEqual(1, order_book.snapshot_uid)
+
+        self.clock.backtest_til(t + 2)
+        self.assertEqual([OrderBookRow(98, 2, 1), OrderBookRow(97, 1, 3)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(100.5, 3, 3), OrderBookRow(101, 1, 1), OrderBookRow(102, 2, 1)],
+                         list(order_book.ask_entries()))
+        self.assertEqual(3, order_book.last_diff_uid)
+        self.assertEqual(0, len(trade_logger.event_log))
+
+        self.clock.backtest_til(t + 3)
+        self.assertEqual(1, len(trade_logger.event_log))
+        trade = trade_logger.event_log[0]
+        self.assertEqual("COINALPHA-HBOT", trade.trading_pair)
+        self.assertEqual(TradeType.SELL, trade.type)
+        self.assertEqual(98, trade.price)
+        self.assertEqual(0.5, trade.amount)
+        self.assertEqual(98, order_book.last_trade_price)
+        self.assertEqual(98.5, order_book.get_price(False))
+
+        self.assertEqual(8, self.engine.book_updates)
+        self.assertEqual(1, self.engine.trades)
+        self.assertTrue(self.engine.finished)
+
+    def test_crossing_diffs_are_applied_one_update_at_a_time(self):
+        order_book = OrderBook()
+        t = self.start_timestamp
+        self.engine.add_market_data("COINALPHA-HBOT", order_book, market_data([
+            (t + 0.1, 1, SNAPSHOT, BID, 100, 1),
+            (t + 0.1, 1, SNAPSHOT, ASK, 100.5, 1),
+            (t + 0.1, 1, SNAPSHOT, ASK, 101, 1),
+            # The first diff crosses the book and removes the 100.5 ask, the second one removes the crossing bid
+            (t + 0.5, 2, DIFF, BID, 100.5, 1),
+            (t + 0.6, 3, DIFF, BID, 100.5, 0),
+        ]))
+
+        self.clock.backtest_til(t + 1)
+
+        self.assertEqual([OrderBookRow(100, 1, 1)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(101, 1, 1)], list(order_book.ask_entries()))
+        self.assertEqual(3, order_book.last_diff_uid)
+
+    def test_replayed_diffs_give_the_same_order_book_as_sequential_application(self):
+        rng = np.random.default_rng(42)
+        prices = [99 + 0.5 * i for i in range(9)]
+        t = self.start_timestamp
+        for _sequence in range(200):
+            records = [(t, 1, SNAPSHOT, BID, price, 1) for price in prices[:4]]
+            records += [(t, 1, SNAPSHOT, ASK, price, 1) for price in prices[5:]]
+            for update_id in range(2, int(rng.integers(3, 8))):
+                for _level in range(int(rng.integers(1, 4))):
+                    side = BID if rng.random() < 0.5 else ASK
+                    price = float(rng.choice(prices[:6] if side == BID else prices[3:]))
+                    records.append((t + 0.5, update_id, DIFF, side, price, float(rng.integers(0, 3))))
+            order_book = OrderBook()
+            MarketDataFeed("COINALPHA-HBOT", order_book, market_data(records)).replay_until(t + 1)
+
+            expected_order_book = OrderBook()
+            expected_order_book.apply_snapshot([OrderBookRow(price, 1, 1) for price in prices[:4]],
+                                               [OrderBookRow(price, 1, 1) for price in prices[5:]], 1)
+            diffs = [record for record in records if record[2] == DIFF]
+            for update_id in sorted({record[1] for record in diffs}):
+                update = [record for record in diffs if record[1] == update_id]
+                expected_order_book.apply_diffs(
+                    [OrderBookRow(price, amount, update_id) for _, _, _, side, price, amount in update if side == BID],
+                    [OrderBookRow(price, amount, update_id) for _, _, _, side, price, amount in update if side == ASK],
+                    update_id)
+
+            self.assertEqual(list(expected_order_book.bid_entries()), list(order_book.bid_entries()))
+            self.assertEqual(list(expected_order_book.ask_entries()), list(order_book.ask_entries()))
+
+    def test_only_last_consecutive_snapshot_is_applied(self):
+        order_book = OrderBook()
+        t = self.start_timestamp
+        self.engine.add_market_data("COINALPHA-HBOT", order_book, market_data([
+            (t + 0.1, 1, SNAPSHOT, BID, 99, 1),
+            (t + 0.1, 1, SNAPSHOT, ASK, 101, 1),
+            (t + 0.2, 2, SNAPSHOT, BID, 98, 1),
+            (t + 0.2, 2, SNAPSHOT, ASK, 102, 1),
+        ]))
+
+        self.clock.backtest_til(t + 1)
+
+        self.assertEqual([OrderBookRow(98, 1, 2)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(102, 1, 2)], list(order_book.ask_entries()))
+        self.assertEqual(2, self.engine.book_updates)
+
+    def test_run_validates_clock(self):
+        self.engine.add_market_data("COINALPHA-HBOT", OrderBook(), market_data([
+            (self.start_timestamp + 3, 1, SNAPSHOT, BID, 99, 1),
+        ]))
+        self.assertEqual(self.start_timestamp + 3, self.engine.end_timestamp)
+
+        other_clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp)
+        other_clock.add_iterator(TimeIterator())
+        other_clock.add_iterator(self.engine)
+        with self.assertRaises(ValueError):
+            self.engine.run(other_clock)
+        with self.assertRaises(ValueError):
+            self.engine.run(Clock(ClockMode.REALTIME))
+
+        self.engine.run(self.clock)
+        self.assertEqual(self.start_timestamp + 3, self.clock.current_timestamp)
+        self.assertTrue(self.engine.finished)
+
+    def test_pure_market_making_on_replayed_market_data(self):
+        trading_pair = "ETH-USDT"
+        market = create_backtest_paper_trade_market("binance", ClientConfigAdapter(ClientConfigMap()), [trading_pair])
+        market.set_balance("ETH", 10)
+        market.set_balance("USDT", 10000)
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            MarketTradingPairTuple(market, trading_pair, "ETH", "USDT"),
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=60,
+        )
+        fill_logger = EventLogger()
+        market.add_listener(MarketEvent.OrderFilled, fill_logger)
+        self.clock.add_iterator(market)
+        self.clock.add_iterator(strategy)
+
+        t = self.start_timestamp
+        self.engine.add_market_data(trading_pair, market.order_books[trading_pair], market_data([
+            (t + 0.5, 1, SNAPSHOT, BID, 999, 5),
+            (t + 0.5, 1, SNAPSHOT, ASK, 1001, 5),
+            # A sell trade below the strategy bid (990) fills it
+            (t + 5.5, 0, TRADE, ASK, 985, 2),
+        ]))
+
+        self.clock.backtest_til(t + 3)
+        self.assertEqual([Decimal("990"), Decimal("1010")], sorted(order.price for order in strategy.active_orders))
+
+        self.clock.backtest_til(t + 6)
+        self.assertEqual(1, len(fill_logger.event_log))
+        self.assertEqual(TradeType.BUY, fill_logger.event_log[0].trade_type)
+        self.assertEqual(Decimal("990"), fill_logger.event_log[0].price)
@@ -0,0 +1,233 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from test.hummingbot.core.data_type.test_order_book_tracker import MockOrderBookDataSource
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.backtesting.backtest_replay_engine import BacktestReplayEngine
+from hummingbot.core.backtesting.market_data import MarketDataRecordType, MarketDataSide
+from hummingbot.core.backtesting.market_data_recorder import (
+    FILE_EXTENSION,
+    MarketDataRecorder,
+    RecordedMarketDataFile,
+    RecordedMarketDataReader,
+)
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class MarketDataRecorderTest(unittest.TestCase):
+    start_timestamp = 1640000000.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.recorder = MarketDataRecorder(self.temp_dir.name, flush_interval=60)
+
+    def tearDown(self) -> None:
+        self.recorder.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def diff(trading_pair: str, update_id: int, bids: List, asks: List) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": asks,
+        }, timestamp=0)
+
+    @staticmethod
+    def snapshot(trading_pair: str, update_id: int, bids: List, asks: List) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": asks,
+        }, timestamp=0)
+
+    @staticmethod
+    def trade(trading_pair: str, trade_type: TradeType, price: float, amount: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": trading_pair, "trade_type": float(trade_type.value), "price": price, "amount": amount,
+        }, timestamp=0)
+
+    def record_messages(self):
+        t = self.start_timestamp
+        self.recorder.record(self.snapshot("COINALPHA-HBOT", 1_000_000_000_000,
+                                           [["99", "1"], ["98", "2"]], [["101", "1"]]), t)
+        self.recorder.record(self.snapshot("ETH-USDT", 5, [["999", "1"]], [["1001", "1"]]), t + 0.1)
+        self.recorder.record(self.diff("COINALPHA-HBOT", 1_000_000_000_002, [["99", "0"]], [["100.5", "3"]]), t + 1)
+        self.recorder.record(self.trade("COINALPHA-HBOT", TradeType.SELL, 98, 0.5), t + 2)
+        self.recorder.record(self.diff("ETH-USDT", 7, [], [["1000.5", "0.25"]]), t + 2.5)
+        self.recorder.record(self.diff("COINALPHA-HBOT", 1_000_000_000_003, [["98.5", "1"]], []), t + 3)
+
+    def test_record_and_read_messages(self):
+        self.recorder.start()
+        self.record_messages()
+        self.recorder.stop()
+
+        self.assertEqual(6, self.recorder.recorded_messages)
+        self.assertEqual(6, self.recorder.written_messages)
+        self.assertEqual(10, self.recorder.written_levels)
+        self.assertEqual(0, self.recorder.dropped_messages)
+        self.assertEqual(1, len(self.recorder.file_paths))
+        self.assertTrue(self.recorder.file_paths[0].endswith(FILE_EXTENSION))
+
+        reader = RecordedMarketDataReader.from_directory(self.temp_dir.name)
+        self.assertEqual(["COINALPHA-HBOT", "ETH-USDT"], reader.trading_pairs)
+        messages = list(reader.iter_messages())
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF,
+                          OrderBookMessageType.TRADE, OrderBookMessageType.DIFF, OrderBookMessageType.DIFF],
+                         [message.type for message in messages])
+        self.assertEqual([self.start_timestamp, self.start_timestamp + 0.1, self.start_timestamp + 1,
+                          self.start_timestamp + 2, self.start_timestamp + 2.5, self.start_timestamp + 3],
+                         [message.timestamp for message in messages])
+        self.assertEqual([OrderBookRow(99, 1, 1_000_000_000_000), OrderBookRow(98, 2, 1_000_000_000_000)],
+                         messages[0].bids)
+        self.assertEqual([OrderBookRow(101, 1, 1_000_000_000_000)], messages[0].asks)
+        self.assertEqual("ETH-USDT", messages[1].trading_pair)
+        self.assertEqual(1_000_000_000_002, messages[2].update_id)
+        self.assertEqual([OrderBookRow(99, 0, 1_000_000_000_002)], messages[2].bids)
+        self.assertEqual([OrderBookRow(100.5, 3, 1_000_000_000_002)], messages[2].asks)
+        self.assertEqual({"trading_pair": "COINALPHA-HBOT", "trade_type": float(TradeType.SELL.value),
+                          "price": 98, "amount": 0.5}, messages[3].content)
+        self.assertEqual(7, messages[4].update_id)
+        self.assertEqual([], messages[4].bids)
+        self.assertEqual([OrderBookRow(1000.5, 0.25, 7)], messages[4].asks)
+
+        eth_messages = list(reader.iter_messages("ETH-USDT"))
+        self.assertEqual([5, 7], [message.update_id for message in eth_messages])
+
+    def test_update_ids_are_delta_encoded(self):
+        self.recorder.start()
+        self.record_messages()
+        self.recorder.stop()
+
+        recorded_file = RecordedMarketDataFile(self.recorder.file_paths[0])
+        self.assertIsInstance(recorded_file.blocks[0].columns["price"], np.memmap)
+        update_ids = np.concatenate([block.columns["update_id"] for block in recorded_file.blocks])
+        self.assertEqual(np.int32, update_ids.dtype)
+        self.assertEqual([0, 0, 2, 0, 2, 1], update_ids.tolist())
+
+    def test_read_market_data_records(self):
+        self.recorder.start()
+        self.record_messages()
+        self.recorder.stop()
+
+        reader = RecordedMarketDataReader.from_directory(self.temp_dir.name)
+        records = reader.market_data("COINALPHA-HBOT")
+
+        t = self.start_timestamp
+        snapshot, diff, trade = MarketDataRecordType.SNAPSHOT, MarketDataRecordType.DIFF, MarketDataRecordType.TRADE
+        bid, ask = MarketDataSide.BID, MarketDataSide.ASK
+        self.assertEqual([
+            (t, 1_000_000_000_000, snapshot, bid, 99, 1),
+            (t, 1_000_000_000_000, snapshot, bid, 98, 2),
+            (t, 1_000_000_000_000, snapshot, ask, 101, 1),
+            (t + 1, 1_000_000_000_002, diff, bid, 99, 0),
+            (t + 1, 1_000_000_000_002, diff, ask, 100.5, 3),
+            (t + 2, 1_000_000_000_002, trade, ask, 98, 0.5),
+            (t + 3, 1_000_000_000_003, diff, bid, 98.5, 1),
+        ], records.tolist())
+        self.assertEqual(0, len(reader.market_data("BTC-USDT")))
+
+    def test_replay_recorded_market_data(self):
+        self.recorder.start()
+        self.record_messages()
+        self.recorder.stop()
+
+        reader = RecordedMarketDataReader.from_directory(self.temp_dir.name)
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        engine = BacktestReplayEngine()
+        clock.add_iterator(engine)
+        order_book = OrderBook()
+        engine.add_market_data("COINALPHA-HBOT", order_book, reader.market_data("COINALPHA-HBOT"))
+        engine.run(clock)
+
+        expected_order_book = OrderBook()
+        for message in reader.iter_messages("COINALPHA-HBOT"):
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                expected_order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+            elif message.type is OrderBookMessageType.DIFF:
+                expected_order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        self.assertEqual(list(expected_order_book.bid_entries()), list(order_book.bid_entries()))
+        self.assertEqual(list(expected_order_book.ask_entries()), list(order_book.ask_entries()))
+        self.assertEqual(98, order_book.last_trade_price)
+
+    def test_files_roll_over(self):
+        recorder = MarketDataRecorder(self.temp_dir.name, file_prefix="rolling", max_file_duration=1.5,
+                                      flush_interval=0.01, max_block_messages=1)
+        recorder.start()
+        recorder.record(self.diff("COINALPHA-HBOT", 1, [["99", "1"]], []), self.start_timestamp)
+        for i in range(4):
+            recorder.record(self.diff("ETH-USDT", 10 + i, [["999", str(i)]], []), self.start_timestamp + i)
+        recorder.stop()
+
+        self.assertEqual(2, len(recorder.file_paths))
+        reader = RecordedMarketDataReader.from_directory(self.temp_dir.name, file_prefix="rolling")
+        self.assertEqual(recorder.file_paths, [recorded_file.path for recorded_file in reader.files])
+        # Each file has its own trading pairs dictionary
+        self.assertEqual([["COINALPHA-HBOT", "ETH-USDT"], ["ETH-USDT"]],
+                         [recorded_file.trading_pairs for recorded_file in reader.files])
+        self.assertEqual([10, 11, 12, 13], [message.update_id for message in reader.iter_messages("ETH-USDT")])
+        self.assertEqual([10, 11, 12, 13], reader.market_data("ETH-USDT")["update_id"].tolist())
+        self.assertEqual([1], reader.market_data("COINALPHA-HBOT")["update_id"].tolist())
+
+    def test_incomplete_blocks_are_ignored(self):
+        self.recorder.start()
+        self.record_messages()
+        self.recorder.stop()
+        path = self.recorder.file_paths[0]
+        with open(path, "ab") as recorded_file:
+            recorded_file.write((100).to_bytes(4, "little") + b"{")
+
+        reader = RecordedMarketDataReader([path])
+
+        self.assertEqual(6, len(list(reader.iter_messages())))
+
+        invalid_path = os.path.join(self.temp_dir.name, f"invalid{FILE_EXTENSION}")
+        with open(invalid_path, "wb") as invalid_file:
+            invalid_file.write(b"not market data")
+        with self.assertRaises(ValueError):
+            RecordedMarketDataFile(invalid_path)
+
+    def test_messages_are_dropped_when_the_queue_is_full(self):
+        recorder = MarketDataRecorder(self.temp_dir.name, max_queue_size=2)
+
+        for update_id in range(5):
+            recorder.record(self.diff("ETH-USDT", update_id, [], []))
+
+        self.assertEqual(2, recorder.recorded_messages)
+        self.assertEqual(3, recorder.dropped_messages)
+        self.assertEqual(2, recorder.pending_messages)
+
+    def test_order_book_tracker_records_its_streams(self):
+        data_source = MockOrderBookDataSource(trading_pairs=["COINALPHA-HBOT"])
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=["COINALPHA-HBOT"])
+        tracker.set_market_data_recorder(self.recorder)
+        self.assertIs(self.recorder, tracker.market_data_recorder)
+        self.recorder.start()
+
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 1, 3)], [OrderBookRow(101, 1, 3)], 3)
+        asyncio.get_event_loop().run_until_complete(
+            tracker._order_book_diff_stream.put(self.diff("COINALPHA-HBOT", 2, [["99", "2"]], [])))
+        tracker._register_order_book("COINALPHA-HBOT", order_book)
+        tracker._order_book_diff_stream.put_nowait(self.diff("COINALPHA-HBOT", 4, [], [["101", "0"]]))
+        tracker._order_book_trade_stream.put_nowait(self.trade("COINALPHA-HBOT", TradeType.BUY, 101, 1))
+        tracker._order_book_snapshot_stream.put_nowait(self.snapshot("COINALPHA-HBOT", 5, [], []))
+        tracker.set_market_data_recorder(None)
+        tracker._order_book_diff_stream.put_nowait(self.diff("COINALPHA-HBOT", 6, [], []))
+        tracker.stop()
+        self.recorder.stop()
+
+        messages = list(RecordedMarketDataReader(self.recorder.file_paths).iter_messages())
+        self.assertEqual([(OrderBookMessageType.DIFF, 2), (OrderBookMessageType.SNAPSHOT, 3),
+                          (OrderBookMessageType.DIFF, 4), (OrderBookMessageType.TRADE, -1),
+                          (OrderBookMessageType.SNAPSHOT, 5)],
+                         [(message.type, message.update_id) for message in messages])
+        self.assertEqual([OrderBookRow(99, 1, 3)], messages[1].bids)
+        self.assertEqual([OrderBookRow(101, 1, 3)], messages[1].asks)
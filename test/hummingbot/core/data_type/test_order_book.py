@@ -1,8 +1,13 @@
 #!/usr/bin/env python
 
 import logging
+import math
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTopOfBookChangeEvent
 import numpy as np
 
 
@@ -50,6 +55,266 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def _depth_order_book(self) -> OrderBook:
+        order_book = OrderBook()
+        bids_array = np.array([[99, 1, 1], [98, 2, 1], [97, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 2, 1], [103, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        return order_book
+
+    def test_depth_queries(self):
+        order_book = self._depth_order_book()
+
+        self.assertEqual(102, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(98, order_book.get_price_for_volume(False, 2).result_price)
+        self.assertTrue(math.isnan(order_book.get_price_for_volume(True, 7).result_price))
+        self.assertEqual(6, order_book.get_price_for_volume(True, 7).result_volume)
+
+        self.assertAlmostEqual((101 + 102 * 2) / 3, order_book.get_vwap_for_volume(True, 3).result_price)
+        self.assertAlmostEqual((99 + 98 * 0.5) / 1.5, order_book.get_vwap_for_volume(False, 1.5).result_price)
+
+        self.assertEqual(3, order_book.get_volume_for_price(True, 102.5).result_volume)
+        self.assertEqual(102, order_book.get_volume_for_price(True, 102.5).result_price)
+        self.assertEqual(6, order_book.get_volume_for_price(False, 97).result_volume)
+        self.assertEqual(0, order_book.get_volume_for_price(False, 100).result_volume)
+
+        self.assertEqual(101 + 102 * 2, order_book.get_quote_volume_for_price(True, 102).result_volume)
+        self.assertEqual(99 + 98 * 0.5, order_book.get_quote_volume_for_base_amount(False, 1.5).result_volume)
+        self.assertEqual(102, order_book.get_price_for_quote_volume(True, 150).result_price)
+
+    def test_simulate_buy_and_sell(self):
+        order_book = self._depth_order_book()
+
+        self.assertEqual([OrderBookRow(101, 1, 1), OrderBookRow(102, 0.5, 1)], order_book.simulate_buy(1.5))
+        self.assertEqual([OrderBookRow(99, 1, 1), OrderBookRow(98, 2, 1), OrderBookRow(97, 3, 1)],
+                         order_book.simulate_sell(10))
+
+    def test_batched_queries_match_single_queries(self):
+        order_book = self._depth_order_book()
+        volumes = [3.5, 0.5, 10, 1, 6]
+        prices = [101.5, 97, 104, 100, 98]
+
+        for is_buy in [True, False]:
+            for volume, result in zip(volumes, order_book.get_vwap_for_volumes(is_buy, volumes)):
+                expected = order_book.get_vwap_for_volume(is_buy, volume)
+                self.assertEqual(volume, result.query_volume)
+                self.assertEqual(expected.result_volume, result.result_volume)
+                if math.isnan(expected.result_price):
+                    self.assertTrue(math.isnan(result.result_price))
+                else:
+                    self.assertEqual(expected.result_price, result.result_price)
+
+            for price, result in zip(prices, order_book.get_volume_for_prices(is_buy, prices)):
+                expected = order_book.get_volume_for_price(is_buy, price)
+                self.assertEqual(price, result.query_price)
+                self.assertEqual(expected.result_volume, result.result_volume)
+                if math.isnan(expected.result_price):
+                    self.assertTrue(math.isnan(result.result_price))
+                else:
+                    self.assertEqual(expected.result_price, result.result_price)
+
+    def _assert_query_results_equal(self, expected, result):
+        for attribute in ["query_price", "query_volume", "result_price", "result_volume"]:
+            expected_value = getattr(expected, attribute)
+            value = getattr(result, attribute)
+            if math.isnan(expected_value):
+                self.assertTrue(math.isnan(value), attribute)
+            else:
+                self.assertAlmostEqual(expected_value, value, places=9, msg=attribute)
+
+    def _assert_depth_queries_equal(self, expected_book: OrderBook, indexed_book: OrderBook):
+        for is_buy in [True, False]:
+            for volume in [0, 0.5, 1, 2.5, 6, 100]:
+                self._assert_query_results_equal(expected_book.get_price_for_volume(is_buy, volume),
+                                                 indexed_book.get_price_for_volume(is_buy, volume))
+                self._assert_query_results_equal(expected_book.get_vwap_for_volume(is_buy, volume or 0.1),
+                                                 indexed_book.get_vwap_for_volume(is_buy, volume or 0.1))
+                self._assert_query_results_equal(expected_book.get_quote_volume_for_base_amount(is_buy, volume),
+                                                 indexed_book.get_quote_volume_for_base_amount(is_buy, volume))
+                self._assert_query_results_equal(expected_book.get_price_for_quote_volume(is_buy, volume * 100),
+                                                 indexed_book.get_price_for_quote_volume(is_buy, volume * 100))
+            for price in [90, 97, 98.5, 99, 100, 101, 102.5, 110]:
+                self._assert_query_results_equal(expected_book.get_volume_for_price(is_buy, price),
+                                                 indexed_book.get_volume_for_price(is_buy, price))
+                self._assert_query_results_equal(expected_book.get_quote_volume_for_price(is_buy, price),
+                                                 indexed_book.get_quote_volume_for_price(is_buy, price))
+
+    def test_depth_index_matches_book_walk(self):
+        order_book = self._depth_order_book()
+        indexed_order_book = self._depth_order_book()
+        indexed_order_book.enable_depth_index()
+        self.assertTrue(indexed_order_book.depth_index_enabled)
+        self._assert_depth_queries_equal(order_book, indexed_order_book)
+
+        # Update, delete and insert levels, and cross the book (the overlapping asks are truncated)
+        bids = [OrderBookRow(99, 4, 2), OrderBookRow(98, 0, 2), OrderBookRow(102.5, 1, 2)]
+        asks = [OrderBookRow(103, 0, 2), OrderBookRow(104, 1.5, 2)]
+        for book in [order_book, indexed_order_book]:
+            book.apply_diffs(bids, asks, 2)
+        self._assert_depth_queries_equal(order_book, indexed_order_book)
+
+        bids = [OrderBookRow(95, 1, 3), OrderBookRow(96, 2, 3)]
+        asks = [OrderBookRow(100, 1, 3), OrderBookRow(100.5, 3, 3)]
+        for book in [order_book, indexed_order_book]:
+            book.apply_snapshot(bids, asks, 3)
+        self._assert_depth_queries_equal(order_book, indexed_order_book)
+
+        for book in [order_book, indexed_order_book]:
+            book.apply_diffs([OrderBookRow(95, 0, 4), OrderBookRow(96, 0, 4)], [], 4)
+        self._assert_depth_queries_equal(order_book, indexed_order_book)
+
+    def test_disable_depth_index(self):
+        order_book = self._depth_order_book()
+        order_book.enable_depth_index()
+        order_book.disable_depth_index()
+
+        self.assertFalse(order_book.depth_index_enabled)
+        self.assertEqual(102, order_book.get_price_for_volume(True, 2).result_price)
+
+    def test_snapshot_arrays(self):
+        order_book = self._depth_order_book()
+
+        bids_array, asks_array = order_book.snapshot_arrays()
+        self.assertEqual([[99, 1, 1], [98, 2, 1], [97, 3, 1]], bids_array.tolist())
+        self.assertEqual([[101, 1, 1], [102, 2, 1], [103, 3, 1]], asks_array.tolist())
+        self.assertEqual(np.float64, bids_array.dtype)
+        self.assertTrue(bids_array.flags.c_contiguous)
+
+        bids_array, asks_array = order_book.snapshot_arrays(depth=2)
+        self.assertEqual([[99, 1, 1], [98, 2, 1]], bids_array.tolist())
+        self.assertEqual([[101, 1, 1], [102, 2, 1]], asks_array.tolist())
+
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual([99, 98, 97], bids_df.price.tolist())
+        self.assertEqual([1, 2, 3], asks_df.amount.tolist())
+
+    def test_fill_snapshot_arrays(self):
+        order_book = self._depth_order_book()
+        bids_array = np.zeros((5, 3))
+        asks_array = np.zeros((2, 3))
+
+        self.assertEqual((3, 2), order_book.fill_snapshot_arrays(bids_array, asks_array))
+        self.assertEqual([[99, 1, 1], [98, 2, 1], [97, 3, 1], [0, 0, 0], [0, 0, 0]], bids_array.tolist())
+        self.assertEqual([[101, 1, 1], [102, 2, 1]], asks_array.tolist())
+
+        with self.assertRaises(ValueError):
+            order_book.fill_snapshot_arrays(np.zeros((5, 2)), asks_array)
+
+    def test_top_of_book_views(self):
+        order_book = self._depth_order_book()
+
+        bids_view, asks_view = order_book.top_of_book_views(2)
+        self.assertEqual([[99, 1, 1], [98, 2, 1]], bids_view.tolist())
+        self.assertEqual([[101, 1, 1], [102, 2, 1]], asks_view.tolist())
+        with self.assertRaises(ValueError):
+            bids_view[0, 0] = 0
+
+        order_book.apply_diffs([], [OrderBookRow(101, 0, 2)], 2)
+        bids_view, asks_view = order_book.top_of_book_views(5)
+        self.assertEqual(3, len(bids_view))
+        self.assertEqual([[102, 2, 1], [103, 3, 1]], asks_view.tolist())
+
+    def test_apply_raw_snapshot_and_diffs(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["99.5", "1.25"], ["99", "2", "extra field"]],
+                                      [["101", "1"], [102, 3.5]],
+                                      1)
+        self.assertEqual([OrderBookRow(99.5, 1.25, 1), OrderBookRow(99, 2, 1)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(101, 1, 1), OrderBookRow(102, 3.5, 1)], list(order_book.ask_entries()))
+        self.assertEqual(1, order_book.snapshot_uid)
+
+        order_book.apply_raw_diffs([["99.5", "0.000"], ["98.75", "4"]], [["1.005e2", "0.5"]], 2)
+        self.assertEqual([OrderBookRow(99, 2, 1), OrderBookRow(98.75, 4, 2)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(100.5, 0.5, 2), OrderBookRow(101, 1, 1), OrderBookRow(102, 3.5, 1)],
+                         list(order_book.ask_entries()))
+        self.assertEqual(2, order_book.last_diff_uid)
+
+        with self.assertRaises(ValueError):
+            order_book.apply_raw_diffs([["not a number", "1"]], [], 3)
+
+    def test_apply_raw_diffs_from_arrays(self):
+        order_book = self._depth_order_book()
+
+        order_book.apply_raw_diffs(np.array([[99, 0], [96, 1.5]]), np.array([[104, 2]]), 2)
+
+        self.assertEqual([OrderBookRow(98, 2, 1), OrderBookRow(97, 3, 1), OrderBookRow(96, 1.5, 2)],
+                         list(order_book.bid_entries()))
+        self.assertEqual(OrderBookRow(104, 2, 2), list(order_book.ask_entries())[-1])
+
+    def test_apply_messages(self):
+        order_book = OrderBook()
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                    {"update_id": 1, "bids": [["99", "1"]], "asks": [["101", "1"]]},
+                                    timestamp=1)
+        diff = OrderBookMessage(OrderBookMessageType.DIFF,
+                                {"update_id": 2, "bids": [["99", "0"], ["98", "2"]], "asks": []},
+                                timestamp=2)
+
+        order_book.restore_from_snapshot_and_diffs(snapshot, [diff])
+
+        self.assertEqual([OrderBookRow(98, 2, 2)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(101, 1, 1)], list(order_book.ask_entries()))
+
+    def test_top_of_book_change_events_on_best_price_change(self):
+        order_book = self._depth_order_book()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookChangeEvent, event_logger)
+
+        # The first update after subscribing notifies the current top of the book
+        order_book.apply_diffs([OrderBookRow(98, 5, 2)], [OrderBookRow(103, 1, 2)], 2)
+        self.assertEqual([OrderBookTopOfBookChangeEvent(2, 99, 101, 0, 0)], event_logger.event_log)
+
+        order_book.apply_diffs([OrderBookRow(97, 1, 3)], [OrderBookRow(102, 1, 3)], 3)
+        self.assertEqual(1, len(event_logger.event_log))
+
+        order_book.apply_diffs([OrderBookRow(99, 0, 4)], [], 4)
+        self.assertEqual(OrderBookTopOfBookChangeEvent(4, 98, 101, 0, 0), event_logger.event_log[-1])
+
+        order_book.apply_snapshot([OrderBookRow(98, 1, 5)], [OrderBookRow(100, 1, 5)], 5)
+        self.assertEqual(OrderBookTopOfBookChangeEvent(5, 98, 100, 0, 0), event_logger.event_log[-1])
+        self.assertEqual(3, len(event_logger.event_log))
+
+        order_book.remove_listener(OrderBookEvent.TopOfBookChangeEvent, event_logger)
+        order_book.apply_diffs([OrderBookRow(98.5, 1, 6)], [], 6)
+        self.assertEqual(3, len(event_logger.event_log))
+
+    def test_top_of_book_change_events_on_depth_change(self):
+        for use_depth_index in (False, True):
+            order_book = self._depth_order_book()
+            if use_depth_index:
+                order_book.enable_depth_index()
+            order_book.configure_top_of_book_events(depth_band=0.011, depth_change_threshold=0.2)
+            event_logger = EventLogger()
+            order_book.add_listener(OrderBookEvent.TopOfBookChangeEvent, event_logger)
+
+            # The first update notifies the band volumes: 99 and 98 for bids, 101 and 102 for asks
+            order_book.apply_diffs([OrderBookRow(97, 10, 2)], [], 2)
+            self.assertEqual([OrderBookTopOfBookChangeEvent(2, 99, 101, 3, 3)], event_logger.event_log)
+
+            # Changes outside of the band or below the threshold are ignored
+            order_book.apply_diffs([OrderBookRow(98, 2.5, 3)], [OrderBookRow(103, 1, 3)], 3)
+            self.assertEqual(1, len(event_logger.event_log))
+
+            order_book.apply_diffs([], [OrderBookRow(102, 4, 4)], 4)
+            self.assertEqual(OrderBookTopOfBookChangeEvent(4, 99, 101, 3.5, 5), event_logger.event_log[-1])
+            self.assertEqual(2, len(event_logger.event_log))
+
+    def test_configure_top_of_book_events(self):
+        order_book = OrderBook()
+        self.assertIsNone(order_book.top_of_book_depth_band)
+
+        order_book.configure_top_of_book_events(depth_band=0.001, depth_change_threshold=0.1)
+        self.assertEqual(0.001, order_book.top_of_book_depth_band)
+        self.assertEqual(0.1, order_book.top_of_book_depth_change_threshold)
+
+        order_book.configure_top_of_book_events()
+        self.assertIsNone(order_book.top_of_book_depth_band)
+
+        with self.assertRaises(ValueError):
+            order_book.configure_top_of_book_events(depth_band=-0.1)
+        with self.assertRaises(ValueError):
+            order_book.configure_top_of_book_events(depth_band=0.1, depth_change_threshold=-1)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
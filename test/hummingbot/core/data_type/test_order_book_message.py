@@ -119,6 +119,33 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_raw_bids_and_asks(self):
+        raw_asks = [["1", "2"], ["3", "4"]]
+        raw_bids = [["5", "6"]]
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 1, "asks": raw_asks, "bids": raw_bids},
+            timestamp=time.time(),
+        )
+
+        self.assertTrue(msg.has_raw_levels)
+        self.assertIs(raw_asks, msg.raw_asks)
+        self.assertIs(raw_bids, msg.raw_bids)
+
+    def test_has_raw_levels_false_when_levels_are_parsed_by_subclass(self):
+        class CustomOrderBookMessage(OrderBookMessage):
+            @property
+            def bids(self):
+                return [OrderBookRow(level["price"], level["size"], self.update_id) for level in self.content["bids"]]
+
+        msg = CustomOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 1, "asks": [], "bids": [{"price": 1, "size": 2}]},
+            timestamp=time.time(),
+        )
+
+        self.assertFalse(msg.has_raw_levels)
+
     def test_has_update_id(self):
         update_id = "someId"
 
@@ -0,0 +1,266 @@
+import asyncio
+import random
+import unittest
+from typing import Awaitable, Dict, List, Optional
+from unittest.mock import patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockOrderBookDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str], delays: Optional[Dict[str, float]] = None):
+        super().__init__(trading_pairs=trading_pairs)
+        self.delays = delays or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failures: Dict[str, int] = {}
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(trading_pair, 0))
+            if self.failures.get(trading_pair, 0) > 0:
+                self.failures[trading_pair] -= 1
+                raise IOError("Test error")
+        finally:
+            self.in_flight -= 1
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 1)
+        return order_book
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        raise NotImplementedError
+
+    async def _connected_websocket_assistant(self):
+        raise NotImplementedError
+
+    async def _subscribe_channels(self, ws):
+        raise NotImplementedError
+
+    def _channel_originating_message(self, event_message) -> str:
+        raise NotImplementedError
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.trading_pairs = [f"COINALPHA{i}-HBOT" for i in range(5)]
+        self.data_source = MockOrderBookDataSource(trading_pairs=self.trading_pairs)
+        self.tracker = OrderBookTracker(data_source=self.data_source,
+                                        trading_pairs=self.trading_pairs,
+                                        max_concurrent_initializations=2)
+        self.tracker.logger().setLevel(1)
+        self.tracker.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_concurrent_initialization_initializes_all_order_books(self):
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books.keys()))
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.ready_trading_pairs))
+        self.assertTrue(all(self.tracker.is_order_book_ready(trading_pair) for trading_pair in self.trading_pairs))
+        self.assertTrue(self._is_logged("INFO", f"Initialized order book for {self.trading_pairs[-1]}. 5/5 completed."))
+
+    def test_concurrent_initialization_respects_max_concurrency(self):
+        self.data_source.delays = {trading_pair: 0.01 for trading_pair in self.trading_pairs}
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertEqual(2, self.data_source.max_in_flight)
+
+    def test_order_books_are_ready_individually(self):
+        self.data_source.delays = {self.trading_pairs[0]: 10}
+
+        init_task = asyncio.get_event_loop().create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(self.tracker.wait_for_order_book(self.trading_pairs[1]))
+
+        self.assertFalse(self.tracker.ready)
+        self.assertFalse(self.tracker.is_order_book_ready(self.trading_pairs[0]))
+        self.assertTrue(self.tracker.is_order_book_ready(self.trading_pairs[1]))
+        self.assertIn(self.trading_pairs[1], self.tracker.order_books)
+
+        init_task.cancel()
+
+    def test_concurrent_initialization_retries_failed_snapshots(self):
+        self.data_source.failures = {self.trading_pairs[0]: 1}
+
+        real_sleep = asyncio.sleep
+        with patch("hummingbot.core.data_type.order_book_tracker.asyncio.sleep") as sleep_mock:
+            sleep_mock.side_effect = lambda _: real_sleep(0)
+            self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertTrue(self.tracker.is_order_book_ready(self.trading_pairs[0]))
+        self.assertTrue(
+            self._is_logged("NETWORK", f"Unexpected error initializing order book for {self.trading_pairs[0]}."))
+
+    def test_sequential_initialization_marks_each_book_ready(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:2])
+
+        real_sleep = asyncio.sleep
+        with patch("hummingbot.core.data_type.order_book_tracker.asyncio.sleep") as sleep_mock:
+            sleep_mock.side_effect = lambda _: real_sleep(0)
+            self.async_run_with_timeout(tracker._init_order_books())
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(set(self.trading_pairs[:2]), set(tracker.ready_trading_pairs))
+        self.assertEqual(1, self.data_source.max_in_flight)
+        tracker.stop()
+
+    def test_stop_clears_order_books_readiness(self):
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.tracker.stop()
+
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+    def _diff_message(self, update_id: int, bids: List, asks: List) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF,
+                                {"trading_pair": self.trading_pairs[0], "update_id": update_id,
+                                 "bids": bids, "asks": asks},
+                                timestamp=update_id)
+
+    def _track_messages(self, tracker: OrderBookTracker, messages: List[OrderBookMessage]) -> OrderBook:
+        trading_pair = self.trading_pairs[0]
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        tracker._order_books[trading_pair] = order_book
+        tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+        for message in messages:
+            tracker._tracking_message_queues[trading_pair].put_nowait(message)
+        self.assertEqual(len(messages), tracker.queue_depths[trading_pair])
+
+        tracking_task = asyncio.get_event_loop().create_task(tracker._track_single_book(trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        tracking_task.cancel()
+        return order_book
+
+    def test_pending_diffs_are_coalesced(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs,
+                                   coalesce_diffs=True)
+        trading_pair = self.trading_pairs[0]
+        messages = [
+            self._diff_message(2, [["99", "2"], ["98", "1"]], [["102", "1"]]),
+            self._diff_message(3, [["98", "0"]], [["101", "3"]]),
+            self._diff_message(4, [["97", "5"]], [["102", "4"]]),
+        ]
+
+        order_book = self._track_messages(tracker, messages)
+
+        self.assertEqual([OrderBookRow(99, 2, 2), OrderBookRow(97, 5, 4)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(101, 3, 3), OrderBookRow(102, 4, 4)], list(order_book.ask_entries()))
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual(messages, list(tracker._past_diffs_windows[trading_pair]))
+        self.assertEqual({trading_pair: 3.0}, tracker.diff_coalescing_ratios)
+        self.assertEqual(0, tracker.queue_depths[trading_pair])
+
+    def test_coalescing_stops_at_snapshots(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs,
+                                   coalesce_diffs=True)
+        trading_pair = self.trading_pairs[0]
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                    {"trading_pair": trading_pair, "update_id": 4,
+                                     "bids": [["95", "1"]], "asks": [["105", "1"]]},
+                                    timestamp=4)
+        messages = [
+            self._diff_message(2, [["98", "1"]], []),
+            self._diff_message(3, [["97", "1"]], []),
+            snapshot,
+            self._diff_message(5, [["96", "1"]], []),
+        ]
+
+        order_book = self._track_messages(tracker, messages)
+        expected_order_book = self._track_messages(
+            OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs), messages)
+
+        self.assertEqual(list(expected_order_book.bid_entries()), list(order_book.bid_entries()))
+        self.assertEqual(list(expected_order_book.ask_entries()), list(order_book.ask_entries()))
+        self.assertEqual(4, order_book.snapshot_uid)
+        self.assertEqual(5, order_book.last_diff_uid)
+        self.assertEqual({trading_pair: 1.5}, tracker.diff_coalescing_ratios)
+
+    def test_diffs_are_applied_one_by_one_without_coalescing(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        trading_pair = self.trading_pairs[0]
+        messages = [
+            self._diff_message(2, [["98", "1"]], []),
+            self._diff_message(3, [["98", "0"]], []),
+        ]
+
+        order_book = self._track_messages(tracker, messages)
+
+        self.assertEqual([OrderBookRow(99, 1, 1)], list(order_book.bid_entries()))
+        self.assertEqual({trading_pair: 1.0}, tracker.diff_coalescing_ratios)
+
+    def test_crossing_diffs_are_applied_one_by_one(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs,
+                                   coalesce_diffs=True)
+        trading_pair = self.trading_pairs[0]
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(100, 1, 1)], [OrderBookRow(100.5, 1, 1), OrderBookRow(101, 1, 1)], 1)
+        tracker._order_books[trading_pair] = order_book
+        tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+        # The first diff crosses the book and removes the 100.5 ask, the second one removes the crossing bid
+        for message in [self._diff_message(2, [["100.5", "1"]], []), self._diff_message(3, [["100.5", "0"]], [])]:
+            tracker._tracking_message_queues[trading_pair].put_nowait(message)
+
+        tracking_task = asyncio.get_event_loop().create_task(tracker._track_single_book(trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        tracking_task.cancel()
+
+        self.assertEqual(101, order_book.get_price(True))
+        self.assertEqual(100, order_book.get_price(False))
+        self.assertEqual({trading_pair: 1.0}, tracker.diff_coalescing_ratios)
+
+    def test_applied_diffs_give_the_same_order_book_as_sequential_application(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs,
+                                   coalesce_diffs=True)
+        rng = random.Random(42)
+        prices = [99 + 0.5 * i for i in range(9)]
+        for _ in range(500):
+            snapshot_bids = [OrderBookRow(price, 1, 1) for price in prices[:4]]
+            snapshot_asks = [OrderBookRow(price, 1, 1) for price in prices[5:]]
+            order_book = OrderBook()
+            order_book.apply_snapshot(snapshot_bids, snapshot_asks, 1)
+            expected_order_book = OrderBook()
+            expected_order_book.apply_snapshot(snapshot_bids, snapshot_asks, 1)
+            diffs = []
+            for update_id in range(2, rng.randint(3, 8)):
+                bids = [[str(rng.choice(prices[:6])), str(rng.choice([0, 1, 2]))] for _ in range(rng.randint(0, 2))]
+                asks = [[str(rng.choice(prices[3:])), str(rng.choice([0, 1, 2]))] for _ in range(rng.randint(0, 2))]
+                diffs.append(self._diff_message(update_id, bids, asks))
+
+            tracker._apply_diff_messages(order_book, diffs)
+            for diff in diffs:
+                expected_order_book.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+            self.assertEqual(list(expected_order_book.bid_entries()), list(order_book.bid_entries()))
+            self.assertEqual(list(expected_order_book.ask_entries()), list(order_book.ask_entries()))
+            self.assertEqual(expected_order_book.last_diff_uid, order_book.last_diff_uid)
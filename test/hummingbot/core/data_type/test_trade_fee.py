@@ -1,5 +1,8 @@
 from decimal import Decimal
 from unittest import TestCase
+from unittest.mock import MagicMock
+
+import numpy as np
 
 from hummingbot.core.data_type.common import TradeType, PositionAction
 from hummingbot.core.data_type.in_flight_order import TradeUpdate
@@ -248,6 +251,45 @@ class TradeFeeTests(TestCase):
 
         self.assertEqual(Decimal("0"), fee_amount)
 
+    def test_fee_amounts_in_token_match_fee_amount_in_token(self):
+        rate_source = MagicMock()
+        rate_source.get_pair_rate.side_effect = lambda trading_pair: {
+            "COINALPHA-BNB": Decimal("0.5"),
+            "HBOT-BNB": Decimal("500"),
+            "ETH-BNB": Decimal("4"),
+            "BNB-COINALPHA": Decimal("2"),
+            "ETH-COINALPHA": Decimal("8"),
+        }[trading_pair]
+        fee = AddedToCostTradeFee(
+            percent=Decimal("0.001"),
+            flat_fees=[TokenAmount("HBOT", Decimal("0.1")), TokenAmount("BNB", Decimal("0.01")),
+                       TokenAmount("ETH", Decimal("0.002"))],
+        )
+        prices = [Decimal("1000"), Decimal("1010.5"), Decimal("990.25")]
+        order_amounts = [Decimal("1"), Decimal("0.5"), Decimal("2.25")]
+
+        for token in ("COINALPHA", "BNB"):
+            fee_amounts = fee.fee_amounts_in_token(
+                trading_pair="HBOT-COINALPHA",
+                prices=np.array([float(price) for price in prices]),
+                order_amounts=np.array([float(amount) for amount in order_amounts]),
+                token=token,
+                rate_source=rate_source)
+            expected = [float(fee.fee_amount_in_token("HBOT-COINALPHA", price, amount, token, rate_source=rate_source))
+                        for price, amount in zip(prices, order_amounts)]
+            np.testing.assert_allclose(expected, fee_amounts)
+
+    def test_fee_amounts_in_token_broadcasts_a_single_price(self):
+        fee = DeductedFromReturnsTradeFee(percent=Decimal("0.01"))
+
+        fee_amounts = fee.fee_amounts_in_token(
+            trading_pair="HBOT-COINALPHA",
+            prices=100.0,
+            order_amounts=np.array([1.0, 2.0, 3.0]),
+            token="COINALPHA")
+
+        np.testing.assert_allclose([1.0, 2.0, 3.0], fee_amounts)
+
 
 class TokenAmountTests(TestCase):
 
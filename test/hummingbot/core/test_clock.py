@@ -7,9 +7,22 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class RecordingTimeIterator(PyTimeIterator):
+    def __init__(self, tick_duration: float = 0):
+        super().__init__()
+        self.tick_duration = tick_duration
+        self.ticks = []
+
+    def tick(self, timestamp: float):
+        self.ticks.append(timestamp)
+        if self.tick_duration > 0:
+            time.sleep(self.tick_duration)
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -124,3 +137,89 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_backtest_with_iterator_tick_interval(self):
+        every_tick_iterator = RecordingTimeIterator()
+        slow_iterator = RecordingTimeIterator()
+        slow_iterator.tick_interval = 5
+        self.clock_backtest.add_iterator(every_tick_iterator)
+        self.clock_backtest.add_iterator(slow_iterator)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 20)
+
+        self.assertEqual(20, len(every_tick_iterator.ticks))
+        self.assertEqual([self.backtest_start_timestamp + offset for offset in (1, 5, 10, 15, 20)], slow_iterator.ticks)
+
+    def test_backtest_with_requested_tick(self):
+        slow_iterator = RecordingTimeIterator()
+        slow_iterator.tick_interval = 60
+        self.clock_backtest.add_iterator(slow_iterator)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 5)
+        self.assertEqual([self.backtest_start_timestamp + 1], slow_iterator.ticks)
+
+        slow_iterator.request_tick()
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 10)
+        self.assertEqual([self.backtest_start_timestamp + 1, self.backtest_start_timestamp + 6], slow_iterator.ticks)
+
+    def test_run_til_with_sub_second_tick_interval(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=3600)
+        fast_iterator = RecordingTimeIterator()
+        fast_iterator.tick_interval = 0.1
+        clock.add_iterator(fast_iterator)
+        start = time.time()
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(start + 0.55))
+
+        self.assertGreaterEqual(len(fast_iterator.ticks), 4)
+        self.assertLessEqual(len(fast_iterator.ticks), 7)
+        self.assertTrue(all(earlier < later for earlier, later in zip(fast_iterator.ticks, fast_iterator.ticks[1:])))
+
+    def test_run_til_wakes_up_on_requested_tick(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=1)
+        iterator = RecordingTimeIterator()
+        clock.add_iterator(iterator)
+        # Start right after a clock tick, run_til returns after the next clock tick
+        time.sleep(1.01 - time.time() % 1)
+        start = time.time()
+
+        with clock:
+            self.ev_loop.call_later(0.2, iterator.request_tick)
+            self.ev_loop.run_until_complete(clock.run_til(start + 0.5))
+
+        self.assertEqual(2, len(iterator.ticks))
+        self.assertGreaterEqual(iterator.ticks[0], start + 0.2)
+        self.assertLess(iterator.ticks[0], start + 0.5)
+        self.assertEqual((start // 1) + 1, iterator.ticks[1])
+
+    def test_tick_statistics(self):
+        iterator = RecordingTimeIterator(tick_duration=0.01)
+        self.clock_backtest.add_iterator(iterator)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 3)
+
+        statistics = self.clock_backtest.tick_statistics[iterator]
+        self.assertEqual(statistics, iterator.tick_statistics)
+        self.assertEqual(3, statistics.tick_count)
+        self.assertGreaterEqual(statistics.average_duration, 0.01)
+        self.assertGreaterEqual(statistics.max_duration, statistics.average_duration)
+        self.assertGreaterEqual(statistics.last_duration, 0.01)
+        self.assertEqual(0, statistics.max_lag)
+
+        iterator.reset_tick_statistics()
+        self.assertEqual(0, iterator.tick_statistics.tick_count)
+
+    def test_run_til_records_tick_lag(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=3600)
+        slow_iterator = RecordingTimeIterator(tick_duration=0.05)
+        delayed_iterator = RecordingTimeIterator()
+        for iterator in (slow_iterator, delayed_iterator):
+            iterator.tick_interval = 0.1
+            clock.add_iterator(iterator)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.3))
+
+        self.assertGreaterEqual(delayed_iterator.tick_statistics.max_lag, 0.05)
+        self.assertLess(slow_iterator.tick_statistics.max_lag, 0.05)
@@ -58,3 +58,12 @@ class TimeIteratorUnitTest(unittest.TestCase):
         # c_tick is called within Clock
         self.clock.backtest_til(self.start_timestamp + self.tick_size)
         self.assertEqual(self.start_timestamp + self.tick_size, self.time_iterator.current_timestamp)
+
+    def test_tick_interval(self):
+        self.assertEqual(0, self.time_iterator.tick_interval)
+
+        self.time_iterator.tick_interval = 0.5
+        self.assertEqual(0.5, self.time_iterator.tick_interval)
+
+        with self.assertRaises(ValueError):
+            self.time_iterator.tick_interval = -1
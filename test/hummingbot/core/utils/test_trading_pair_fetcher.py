@@ -82,12 +82,44 @@ class TestTradingPairFetcher(unittest.TestCase):
         }
 
         client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
         trading_pair_fetcher = TradingPairFetcher(client_config_map)
         self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
         trading_pairs = trading_pair_fetcher.trading_pairs
         self.assertEqual(2, len(trading_pairs))
         self.assertEqual({"mockConnector": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, trading_pairs)
 
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._connected_connector_names")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_fetches_connected_connector_trading_pairs_only(self, _, mock_connector_settings, mock_connected_names):
+        connector_1 = AsyncMock()
+        connector_1.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        connector_2 = AsyncMock()
+        connector_2.all_trading_pairs.return_value = ["COINALPHA-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector_1),
+            "mock_exchange_2": self.MockConnectorSetting(name="mock_exchange_2", connector=connector_2),
+        }
+        mock_connected_names.return_value = ["mock_exchange_2", "not_a_connector"]
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.assertEqual({"mock_exchange_2": ["COINALPHA-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        connector_1.all_trading_pairs.assert_not_called()
+
+        trading_pair_fetcher.fetch_trading_pairs("mock_exchange_1")
+        trading_pair_fetcher.fetch_trading_pairs("mock_exchange_1")
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.assertEqual(
+            {"mock_exchange_1": ["MOCK-HBOT"], "mock_exchange_2": ["COINALPHA-HBOT"]}, trading_pair_fetcher.trading_pairs
+        )
+        connector_1.all_trading_pairs.assert_called_once()
+
     @aioresponses()
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
     @patch("hummingbot.core.gateway.gateway_http_client.GatewayHttpClient.get_perp_markets")
@@ -238,6 +270,7 @@ class TestTradingPairFetcher(unittest.TestCase):
         }
 
         client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
         fetcher = TradingPairFetcher(client_config_map)
         asyncio.get_event_loop().run_until_complete(fetcher._fetch_task)
         trading_pairs = fetcher.trading_pairs
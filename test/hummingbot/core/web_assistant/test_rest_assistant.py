@@ -2,12 +2,13 @@ import asyncio
 import json
 import unittest
 from typing import Awaitable, Optional
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -100,3 +101,45 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_execute_request_passes_unserialized_data_to_auth_signing_it(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_request: Optional[RESTRequest] = None
+        authenticated_data = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            return RESTResponse(MagicMock(status=200, json=AsyncMock(return_value={"one": 1})))
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            authenticates_unserialized_data = True
+
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                nonlocal authenticated_data
+                authenticated_data = request.data
+                request.data["signature"] = "signed"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=url, limit=10, time_interval=1)])
+        assistant = RESTAssistant(connection, throttler=throttler, auth=AuthDummy())
+        data = {"side": "BUY"}
+
+        self.async_run_with_timeout(assistant.execute_request(
+            url=url, throttler_limit_id=url, data=data, method=RESTMethod.POST, is_auth_required=True))
+
+        self.assertEqual({"side": "BUY", "signature": "signed"}, authenticated_data)
+        self.assertEqual({"side": "BUY", "signature": "signed"}, call_request.data)
+        self.assertEqual({"side": "BUY"}, data)
+
+        self.async_run_with_timeout(assistant.execute_request(
+            url=url, throttler_limit_id=url, data=data, method=RESTMethod.POST))
+
+        self.assertEqual(json.dumps(data), call_request.data)
@@ -0,0 +1,136 @@
+import logging
+import threading
+import time
+import unittest
+from typing import List
+
+from hummingbot.logger.log_writer import LogWriter, QueueLogHandler, route_loggers_through_log_writer
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.records: List[logging.LogRecord] = []
+        self.thread_names: List[str] = []
+        self.writing = threading.Event()
+        self.unblock = threading.Event()
+        self.unblock.set()
+
+    def emit(self, record: logging.LogRecord):
+        self.writing.set()
+        self.unblock.wait(timeout=5)
+        self.records.append(record)
+        self.thread_names.append(threading.current_thread().name)
+
+
+class LogWriterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.handler = RecordingHandler()
+        self.logger = logging.Logger("test_log_writer")
+        self.log_writers: List[LogWriter] = []
+
+    def tearDown(self) -> None:
+        self.handler.unblock.set()
+        for log_writer in self.log_writers:
+            log_writer.stop()
+        super().tearDown()
+
+    def start_log_writer(self, **kwargs) -> LogWriter:
+        log_writer = LogWriter(**kwargs)
+        log_writer.start()
+        self.log_writers.append(log_writer)
+        self.logger.addHandler(QueueLogHandler(self.handler, log_writer))
+        return log_writer
+
+    def block_writer(self):
+        self.handler.unblock.clear()
+        self.logger.warning("Blocking record")
+        self.assertTrue(self.handler.writing.wait(timeout=5))
+
+    def test_records_written_from_writer_thread(self):
+        log_writer = self.start_log_writer()
+        arguments = ["first"]
+
+        self.logger.info("Logged %s", arguments)
+        arguments.append("second")
+        log_writer.stop()
+
+        self.assertEqual(1, len(self.handler.records))
+        self.assertEqual("Logged ['first']", self.handler.records[0].getMessage())
+        self.assertEqual(["LogWriter"], self.handler.thread_names)
+        self.assertEqual(1, log_writer.written_records)
+        self.assertEqual(0, log_writer.dropped_records)
+
+    def test_drop_policy_drops_flood_records_when_queue_full(self):
+        log_writer = self.start_log_writer(max_queue_size=3)
+        self.block_writer()
+
+        for i in range(5):
+            self.logger.debug(f"Debug record {i}")
+        self.handler.unblock.set()
+        self.logger.warning("Warning record")
+        log_writer.stop()
+
+        self.assertEqual(2, log_writer.dropped_records)
+        self.assertEqual(
+            ["Blocking record", "Debug record 0", "Debug record 1", "Debug record 2", "Warning record"],
+            [record.getMessage() for record in self.handler.records]
+        )
+
+    def test_sample_policy_keeps_one_flood_record_out_of_sample_rate(self):
+        log_writer = self.start_log_writer(max_queue_size=10, flood_policy="sample", sample_rate=3,
+                                           sample_threshold=0.2)
+        self.block_writer()
+
+        for i in range(8):
+            self.logger.debug(f"Debug record {i}")
+        self.logger.info("Info record")
+        self.handler.unblock.set()
+        log_writer.stop()
+
+        # The first two records fill the queue up to the sampling threshold, then one record out of three is kept
+        self.assertEqual(4, log_writer.dropped_records)
+        self.assertEqual(
+            ["Blocking record", "Debug record 0", "Debug record 1", "Debug record 4", "Debug record 7", "Info record"],
+            [record.getMessage() for record in self.handler.records]
+        )
+
+    def test_lagged_records_counted(self):
+        log_writer = self.start_log_writer(lag_threshold=0.05)
+        self.block_writer()
+
+        self.logger.info("Lagged record")
+        time.sleep(0.1)
+        self.handler.unblock.set()
+        log_writer.stop()
+
+        self.assertEqual(1, log_writer.lagged_records)
+        self.assertGreater(log_writer.max_lag, 0.05)
+        self.assertEqual(2, log_writer.counters()["written_records"])
+
+    def test_invalid_flood_policy_raises_error(self):
+        with self.assertRaises(ValueError):
+            LogWriter(flood_policy="block")
+
+    def test_route_loggers_through_log_writer(self):
+        log_writer = LogWriter()
+        self.log_writers.append(log_writer)
+        root_logger = logging.getLogger()
+        root_handlers = list(root_logger.handlers)
+        logger = logging.getLogger("hummingbot.test_log_writer")
+        other_logger = logging.getLogger("hummingbot.test_log_writer.other")
+        logger.addHandler(self.handler)
+        other_logger.addHandler(self.handler)
+        try:
+            route_loggers_through_log_writer([logger.name, other_logger.name], log_writer)
+
+            self.assertEqual(1, len(logger.handlers))
+            queue_handler = logger.handlers[0]
+            self.assertIsInstance(queue_handler, QueueLogHandler)
+            self.assertIs(self.handler, queue_handler.target)
+            self.assertEqual([queue_handler], other_logger.handlers)
+        finally:
+            logger.handlers.clear()
+            other_logger.handlers.clear()
+            root_logger.handlers = root_handlers
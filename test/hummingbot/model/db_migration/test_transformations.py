@@ -1,7 +1,10 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from hummingbot.model.db_migration.transformations import ConvertPriceAndAmountColumnsToBigint
+from hummingbot.model.db_migration.transformations import (
+    ConvertPriceAndAmountColumnsToBigint,
+    CreateMissingIndexesAndUseWALJournal,
+)
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -33,3 +36,12 @@ class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
         self.assertIn("CAST(price * 1000000 AS INTEGER", executed_queries[9])
         self.assertEquals('drop table TradeFill;', executed_queries[10])
         self.assertEquals('alter table TradeFill_dg_tmp rename to TradeFill;', executed_queries[11])
+
+
+class CreateMissingIndexesAndUseWALJournalTests(TestCase):
+
+    def test_name(self):
+        self.assertEqual("CreateMissingIndexesAndUseWALJournal", CreateMissingIndexesAndUseWALJournal(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20221015, CreateMissingIndexesAndUseWALJournal(self).to_version)
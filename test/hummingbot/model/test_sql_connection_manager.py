@@ -0,0 +1,71 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.funding_payment import FundingPayment  # noqa: F401 — creates the table with the others
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLConnectionManagerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "test_trades.sqlite")
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _create_manager(self) -> SQLConnectionManager:
+        return SQLConnectionManager(self.client_config_map, SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+
+    @staticmethod
+    def _query(manager: SQLConnectionManager, query: str):
+        with manager.engine.connect() as connection:
+            return connection.exec_driver_sql(query).fetchall()
+
+    def test_sqlite_connections_use_storage_profile(self):
+        manager = self._create_manager()
+
+        self.assertEqual([("wal",)], self._query(manager, "PRAGMA journal_mode"))
+        self.assertEqual([(1,)], self._query(manager, "PRAGMA synchronous"))
+        self.assertEqual([(-32000,)], self._query(manager, "PRAGMA cache_size"))
+        self.assertEqual([(2,)], self._query(manager, "PRAGMA temp_store"))
+
+    def test_new_database_has_market_state_index(self):
+        manager = self._create_manager()
+
+        indexes = self._query(manager, "PRAGMA index_list('MarketState')")
+        self.assertIn("ms_config_market_index", [index[1] for index in indexes])
+
+    def test_old_database_is_migrated(self):
+        manager = self._create_manager()
+        with manager.engine.begin() as connection:
+            connection.exec_driver_sql("DROP INDEX ms_config_market_index")
+            connection.exec_driver_sql("DROP INDEX fp_config_timestamp_index")
+            connection.exec_driver_sql("PRAGMA journal_mode=DELETE")
+            for state in ["old", "new"]:
+                connection.exec_driver_sql(
+                    "INSERT INTO MarketState (config_file_path, market, timestamp, saved_state) "
+                    f"VALUES ('conf.yml', 'binance', 1, '\"{state}\"')")
+            connection.exec_driver_sql(
+                f"UPDATE Metadata SET value = '20220130' WHERE key = '{SQLConnectionManager.LOCAL_DB_VERSION_KEY}'")
+        manager.engine.dispose()
+
+        manager = self._create_manager()
+
+        with manager.get_new_session() as session:
+            self.assertEqual(SQLConnectionManager.LOCAL_DB_VERSION_VALUE, manager.get_local_db_version(session).value)
+            market_states = session.query(MarketState).all()
+        self.assertEqual(["new"], [market_state.saved_state for market_state in market_states])
+        self.assertIn("ms_config_market_index",
+                      [index[1] for index in self._query(manager, "PRAGMA index_list('MarketState')")])
+        self.assertIn("fp_config_timestamp_index",
+                      [index[1] for index in self._query(manager, "PRAGMA index_list('FundingPayment')")])
+        self.assertEqual([("wal",)], self._query(manager, "PRAGMA journal_mode"))
+        self.assertTrue(any(".backup_" in file_name for file_name in os.listdir(self.temp_dir.name)))
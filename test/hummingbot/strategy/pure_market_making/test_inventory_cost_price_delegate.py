@@ -1,5 +1,8 @@
+import os
+import tempfile
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -29,6 +32,27 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
             self.trade_fill_sql, self.trading_pair
         )
 
+    def tearDown(self):
+        self.delegate.stop()
+
+    def _restart_delegate(self):
+        self.delegate.stop()
+        self.delegate = InventoryCostPriceDelegate(
+            self.trade_fill_sql, self.trading_pair
+        )
+
+    def _buy_event(self, amount: Decimal, price: Decimal) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=1,
+            order_id="order1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=price,
+            amount=amount,
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0"), flat_fees=[]),
+        )
+
     def test_process_order_fill_event_buy(self):
         amount = Decimal("1")
         price = Decimal("9000")
@@ -44,12 +68,15 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         )
         # first event creates DB record
         self.delegate.process_order_fill_event(event)
+        self.delegate.flush()
         with self.trade_fill_sql.get_new_session() as session:
             count = session.query(InventoryCost).count()
             self.assertEqual(count, 1)
 
-            # second event causes update to existing record
-            self.delegate.process_order_fill_event(event)
+        # second event causes update to existing record
+        self.delegate.process_order_fill_event(event)
+        self.delegate.flush()
+        with self.trade_fill_sql.get_new_session() as session:
             record = InventoryCost.get_record(
                 session, self.base_asset, self.quote_asset
             )
@@ -72,6 +99,7 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
                     quote_volume=amount * price,
                 )
                 session.add(record)
+        self._restart_delegate()
 
         amount_sell = Decimal("0.5")
         price_sell = Decimal("10000")
@@ -87,6 +115,8 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         )
 
         self.delegate.process_order_fill_event(event)
+        self.assertEqual(price, self.delegate.get_price())
+        self.delegate.flush()
         with self.trade_fill_sql.get_new_session() as session:
             record = InventoryCost.get_record(
                 session, self.base_asset, self.quote_asset
@@ -128,6 +158,7 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
                     quote_volume=amount * price,
                 )
                 session.add(record)
+        self._restart_delegate()
 
         delegate_price = self.delegate.get_price()
         self.assertEqual(delegate_price, price)
@@ -145,4 +176,87 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
                     quote_volume=amount,
                 )
                 session.add(record)
-                self.assertIsNone(self.delegate.get_price())
+        self._restart_delegate()
+        self.assertIsNone(self.delegate.get_price())
+
+    def test_get_price_does_not_access_the_database(self):
+        self.delegate.process_order_fill_event(self._buy_event(Decimal("1"), Decimal("9000")))
+        self.delegate.process_order_fill_event(self._buy_event(Decimal("1"), Decimal("10000")))
+
+        with patch.object(self.trade_fill_sql, "get_new_session") as get_new_session_mock:
+            self.assertEqual(Decimal("9500"), self.delegate.get_price())
+            get_new_session_mock.assert_not_called()
+
+    def test_inventory_cost_is_restored_after_restart(self):
+        self.delegate.process_order_fill_event(self._buy_event(Decimal("2"), Decimal("9000")))
+        self.delegate.process_order_fill_event(self._buy_event(Decimal("1"), Decimal("12000")))
+        self._restart_delegate()
+
+        self.assertEqual(Decimal("3"), self.delegate.base_volume)
+        self.assertEqual(Decimal("30000"), self.delegate.quote_volume)
+        self.assertEqual(Decimal("10000"), self.delegate.get_price())
+
+    def test_stop_writes_pending_update(self):
+        self.delegate.process_order_fill_event(self._buy_event(Decimal("1"), Decimal("9000")))
+        self.delegate.stop()
+
+        with self.trade_fill_sql.get_new_session() as session:
+            record = InventoryCost.get_record(session, self.base_asset, self.quote_asset)
+            self.assertEqual(Decimal("1"), record.base_volume)
+            self.assertEqual(Decimal("9000"), record.quote_volume)
+
+    def test_set_inventory_cost_is_not_overwritten_by_next_fill(self):
+        self.delegate.process_order_fill_event(self._buy_event(Decimal("1"), Decimal("9000")))
+
+        # e.g. the inventory price changed with the config command while the strategy runs
+        self.delegate.set_inventory_cost(Decimal("2"), Decimal("16000"))
+        self.assertEqual(Decimal("8000"), self.delegate.get_price())
+
+        self.delegate.process_order_fill_event(self._buy_event(Decimal("1"), Decimal("11000")))
+        self.assertEqual(Decimal("9000"), self.delegate.get_price())
+        self.delegate.stop()
+
+        with self.trade_fill_sql.get_new_session() as session:
+            record = InventoryCost.get_record(session, self.base_asset, self.quote_asset)
+            self.assertEqual(Decimal("3"), record.base_volume)
+            self.assertEqual(Decimal("27000"), record.quote_volume)
+
+
+class TestInventoryCostPriceDelegateFileDatabase(TestInventoryCostPriceDelegate):
+    """
+    Runs the same tests against a database file, where the inventory cost is written by the background writer.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.trade_fill_sql = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()),
+            SQLConnectionType.TRADE_FILLS,
+            db_path=os.path.join(cls.temp_dir.name, "inventory_cost_test.sqlite"),
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.trade_fill_sql.engine.dispose()
+        cls.temp_dir.cleanup()
+        super().tearDownClass()
+
+    def test_fills_are_written_in_background(self):
+        self.assertTrue(self.delegate._write_in_background)
+
+        self.delegate.process_order_fill_event(self._buy_event(Decimal("1"), Decimal("9000")))
+
+        self.assertIsNotNone(self.delegate._writer_thread)
+        self.delegate.flush()
+        self.delegate.stop()
+        self.assertIsNone(self.delegate._writer_thread)
+
+    @patch("hummingbot.model.inventory_cost.InventoryCost.add_volume", side_effect=Exception("DB error"))
+    def test_write_errors_are_logged_and_do_not_affect_price(self, _):
+        with patch.object(InventoryCostPriceDelegate, "logger") as logger_mock:
+            self.delegate.process_order_fill_event(self._buy_event(Decimal("1"), Decimal("9000")))
+            self.delegate.flush()
+
+            logger_mock.return_value.error.assert_called_once()
+        self.assertEqual(Decimal("9000"), self.delegate.get_price())
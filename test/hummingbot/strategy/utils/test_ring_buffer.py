@@ -107,3 +107,94 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_values_keep_double_precision(self):
+        value = 41234.123456789
+        self.buffer.add_value(value)
+        self.assertEqual(value, self.buffer.get_last_value())
+        self.assertEqual(value, self.buffer.get_as_numpy_array()[0])
+
+    def test_length_over_int16_range(self):
+        length = 40000
+        buffer = RingBuffer(length)
+        for i in range(length + 5):
+            buffer.add_value(i)
+
+        self.assertTrue(buffer.is_full)
+        self.assertEqual(length, buffer.size)
+        self.assertEqual(5, buffer.get_as_numpy_array()[0])
+        self.assertEqual(length + 4, buffer.get_last_value())
+
+    def test_running_statistics_match_full_recalculation(self):
+        np.random.seed(123456789)
+        buffer = RingBuffer(50)
+        values = 40000 + np.random.normal(0, 0.5, 1000)
+        for i, value in enumerate(values):
+            buffer.add_value(value)
+            window = values[max(0, i - 49):i + 1]
+            self.assertEqual(window.size, buffer.size)
+            self.assertAlmostEqual(np.sum(window), buffer.sum, 6)
+            self.assertAlmostEqual(np.mean(window), buffer.current_mean, 9)
+            self.assertAlmostEqual(np.var(window), buffer.current_variance, 9)
+
+        self.assertAlmostEqual(np.mean(values[-50:]), buffer.mean_value, 9)
+        self.assertAlmostEqual(np.var(values[-50:]), buffer.variance, 9)
+        self.assertAlmostEqual(np.std(values[-50:]), buffer.std_dev, 9)
+
+    def test_current_statistics_when_not_full(self):
+        self.assertTrue(np.isnan(self.buffer.current_mean))
+        self.assertTrue(np.isnan(self.buffer.current_variance))
+        self.assertEqual(0, self.buffer.sum)
+
+        for value in [1, 2, 3, 4]:
+            self.buffer.add_value(value)
+
+        self.assertEqual(10, self.buffer.sum)
+        self.assertEqual(2.5, self.buffer.current_mean)
+        self.assertEqual(1.25, self.buffer.current_variance)
+        self.assertTrue(np.isnan(self.buffer.mean_value))
+
+    def test_statistics_recover_after_non_finite_values_leave_the_buffer(self):
+        buffer = RingBuffer(4)
+        buffer.add_value(1)
+        buffer.add_value(2)
+        for value in [np.nan, 3, np.inf, 4, 5, 6]:
+            buffer.add_value(value)
+            self.assertTrue(np.isnan(buffer.current_variance))
+
+        for value in range(7, 13):
+            buffer.add_value(value)
+            window = buffer.get_as_numpy_array()
+            self.assertTrue(np.all(np.isfinite(window)))
+            self.assertEqual(np.sum(window), buffer.sum)
+            self.assertEqual(np.mean(window), buffer.mean_value)
+            self.assertEqual(np.var(window), buffer.variance)
+
+    def test_ordered_view(self):
+        buffer = RingBuffer(4)
+        self.assertEqual(0, buffer.get_ordered_view().size)
+
+        for i in range(6):
+            buffer.add_value(i)
+
+        view = buffer.get_ordered_view()
+        self.assertTrue(np.array_equal(np.array([2, 3, 4, 5]), view))
+        self.assertFalse(view.flags.writeable)
+        self.assertFalse(view.flags.owndata)
+        with self.assertRaises(ValueError):
+            view[0] = 10
+
+    def test_change_length_keeps_last_values_and_statistics(self):
+        buffer = RingBuffer(5)
+        for i in range(8):
+            buffer.add_value(i)
+
+        buffer.length = 3
+        self.assertTrue(np.array_equal(np.array([5, 6, 7]), buffer.get_as_numpy_array()))
+        self.assertEqual(6, buffer.mean_value)
+
+        buffer.length = 6
+        self.assertFalse(buffer.is_full)
+        self.assertEqual(18, buffer.sum)
+        buffer.add_value(8)
+        self.assertEqual(26, buffer.sum)
@@ -66,3 +66,31 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_volatility_matches_full_window_calculation(self):
+        samples = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 300)))
+        self.indicator = HistoricalVolatilityIndicator(100, 1)
+        for sample in samples:
+            self.indicator.add_sample(sample)
+
+        self.assertAlmostEqual(np.sqrt(np.var(np.diff(np.log(samples[-100:])))), self.indicator.current_value, 9)
+
+        self.indicator.sampling_length = 30
+        self.indicator.add_sample(samples[-1])
+
+        window = np.append(samples[-29:], samples[-1])
+        self.assertAlmostEqual(np.sqrt(np.var(np.diff(np.log(window)))), self.indicator.current_value, 9)
+
+    def test_volatility_recovers_after_nan_sample(self):
+        samples = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 30)))
+        self.indicator = HistoricalVolatilityIndicator(10, 3)
+        for sample in samples[:15]:
+            self.indicator.add_sample(sample)
+        self.indicator.add_sample(np.nan)
+        self.assertTrue(np.isfinite(self.indicator.current_value))
+
+        for sample in samples[15:]:
+            self.indicator.add_sample(sample)
+
+        expected = np.mean([np.var(np.diff(np.log(samples[i - 10:i]))) for i in range(28, 31)])
+        self.assertAlmostEqual(np.sqrt(expected), self.indicator.current_value, 9)
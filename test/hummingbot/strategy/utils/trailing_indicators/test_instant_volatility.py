@@ -20,3 +20,16 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_volatility_after_sampling_length_change(self):
+        samples = np.random.normal(100, 10, 200)
+        self.indicator = InstantVolatilityIndicator(100, 1)
+        for sample in samples:
+            self.indicator.add_sample(sample)
+
+        self.indicator.sampling_length = 40
+        self.indicator.add_sample(101)
+
+        window = np.append(samples[-39:], 101)
+        expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+        self.assertAlmostEqual(expected, self.indicator.current_value, 9)